@@ -13,9 +13,12 @@ from .serializers import (
     PushLogSerializer
 )
 from church_core.unified_permissions import UnifiedPermission
+from church_core.church_context import ChurchContextMixin
+from church_core.stats import Dimension, StatsSpec
+from church_core.db_router import ReplicaReadMixin
 
 
-class AnnouncementViewSet(viewsets.ModelViewSet):
+class AnnouncementViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """공지사항 관리 API ViewSet"""
     resource_name = 'announcement'
     queryset = Announcement.objects.all()
@@ -38,7 +41,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         
         # 사용자 권한 확인
         try:
-            church_user = user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             user_role = church_user.role
             
             # visible_roles가 빈 배열이면 모든 권한에게 표시
@@ -113,7 +116,29 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class PushLogViewSet(viewsets.ReadOnlyModelViewSet):
+PUSH_LOG_STATS = StatsSpec(
+    'announcements.push_statistics',
+    measures={'total_logs': Count('pk')},
+    dimensions={
+        # 상태별 통계
+        'status_stats': Dimension(
+            'status', choices=PushLog.PushStatus, as_rows=True, include_empty=False, order_by='status'
+        ),
+        # 공지사항별 통계
+        'top_announcements': Dimension(
+            'announcement__title',
+            measures={
+                'total_sent': Count('pk'),
+                'read_count': Count('pk', filter=Q(status=PushLog.PushStatus.READ)),
+            },
+            as_rows=True, order_by='-total_sent', limit=10,
+        ),
+    },
+    cache_domains=['announcements'],
+)
+
+
+class PushLogViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """푸시 알림 로그 조회 API ViewSet"""
     resource_name = 'pushlog'
     queryset = PushLog.objects.all()
@@ -134,23 +159,10 @@ class PushLogViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def statistics(self, request, church_id=None):
         """푸시 알림 통계"""
-        queryset = self.get_queryset()
-        
-        # 상태별 통계
-        status_stats = queryset.values('status').annotate(
-            count=Count('id')
-        ).order_by('status')
-        
-        # 공지사항별 통계
-        announcement_stats = queryset.values(
-            'announcement__title'
-        ).annotate(
-            total_sent=Count('id'),
-            read_count=Count('id', filter=Q(status='READ'))
-        ).order_by('-total_sent')[:10]
+        stats = PUSH_LOG_STATS.evaluate(self.get_queryset(), church_id=church_id)
         
         return Response({
-            'status_stats': status_stats,
-            'top_announcements': announcement_stats,
-            'total_logs': queryset.count()
+            'status_stats': stats['status_stats'],
+            'top_announcements': stats['top_announcements'],
+            'total_logs': stats['total_logs']
         })
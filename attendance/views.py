@@ -13,10 +13,13 @@ from .serializers import (
     AttendanceTemplateSerializer, AttendanceTemplateListSerializer
 )
 from church_core.roles import SystemRole, Permission
+from church_core.church_context import ChurchContextMixin
+from church_core.db_router import ReplicaReadMixin
+from church_core.request_profiling import SerializerTimingMixin
 from users.models import ChurchUser
 
 
-class AttendanceViewSet(viewsets.ModelViewSet):
+class AttendanceViewSet(ChurchContextMixin, ReplicaReadMixin, SerializerTimingMixin, viewsets.ModelViewSet):
     """출석 관리 API ViewSet"""
     queryset = Attendance.objects.all()
     permission_classes = [IsAuthenticated]
@@ -38,17 +41,12 @@ class AttendanceViewSet(viewsets.ModelViewSet):
         return AttendanceSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        if user.is_superuser:
-            return self.queryset
-        
         # 사용자가 속한 교회의 출석 기록만 조회
-        user_churches = user.church_users.values_list('church', flat=True)
-        return self.queryset.filter(church__in=user_churches)
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
         """출석 기록 생성 시 추가 처리"""
-        church_user = self.request.user.church_users.first()
+        church_user = self.get_church_user()
         if church_user:
             serializer.save(
                 church=church_user.church,
@@ -63,7 +61,7 @@ class AttendanceViewSet(viewsets.ModelViewSet):
         if user.is_superuser:
             return True
         
-        church_user = user.church_users.first()
+        church_user = self.get_church_user()
         if church_user:
             return church_user.has_permission(permission_name)
         return False
@@ -111,7 +109,7 @@ class AttendanceViewSet(viewsets.ModelViewSet):
             group_id = serializer.validated_data.get('group_id')
             attendances_data = serializer.validated_data['attendances']
             
-            church_user = request.user.church_users.first()
+            church_user = self.get_church_user()
             if not church_user:
                 return Response(
                     {"detail": "교회에 속하지 않은 사용자입니다."}, 
@@ -322,7 +320,7 @@ class AttendanceViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class AttendanceTemplateViewSet(viewsets.ModelViewSet):
+class AttendanceTemplateViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """출석 템플릿 관리 API ViewSet"""
     queryset = AttendanceTemplate.objects.all()
     permission_classes = [IsAuthenticated]
@@ -338,17 +336,12 @@ class AttendanceTemplateViewSet(viewsets.ModelViewSet):
         return AttendanceTemplateSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        if user.is_superuser:
-            return self.queryset
-        
         # 사용자가 속한 교회의 템플릿만 조회
-        user_churches = user.church_users.values_list('church', flat=True)
-        return self.queryset.filter(church__in=user_churches)
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
         """템플릿 생성 시 추가 처리"""
-        church_user = self.request.user.church_users.first()
+        church_user = self.get_church_user()
         if church_user:
             serializer.save(
                 church=church_user.church,
@@ -363,7 +356,7 @@ class AttendanceTemplateViewSet(viewsets.ModelViewSet):
         if user.is_superuser:
             return True
         
-        church_user = user.church_users.first()
+        church_user = self.get_church_user()
         if church_user:
             return church_user.has_permission(permission_name)
         return False
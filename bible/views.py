@@ -16,10 +16,13 @@ from .serializers import (
     BibleBookmarkSerializer, BibleBookmarkCreateSerializer
 )
 from church_core.roles import SystemRole, Permission
+from church_core.church_context import ChurchContextMixin
+from church_core.conditional import ConditionalGetMixin, ImmutableCacheMixin
+from church_core.tenant_cache import tenant_cached
 from users.models import ChurchUser
 
 
-class BibleVersionViewSet(viewsets.ReadOnlyModelViewSet):
+class BibleVersionViewSet(ImmutableCacheMixin, viewsets.ReadOnlyModelViewSet):
     """성경 번역본 ViewSet"""
     queryset = BibleVersion.objects.filter(is_active=True)
     serializer_class = BibleVersionSerializer
@@ -29,7 +32,7 @@ class BibleVersionViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['name']
 
 
-class BibleBookViewSet(viewsets.ReadOnlyModelViewSet):
+class BibleBookViewSet(ImmutableCacheMixin, viewsets.ReadOnlyModelViewSet):
     """성경 책 ViewSet"""
     queryset = BibleBook.objects.all()
     serializer_class = BibleBookSerializer
@@ -40,7 +43,7 @@ class BibleBookViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['order']
 
 
-class BibleVerseViewSet(viewsets.ReadOnlyModelViewSet):
+class BibleVerseViewSet(ImmutableCacheMixin, viewsets.ReadOnlyModelViewSet):
     """성경 구절 ViewSet"""
     queryset = BibleVerse.objects.all()
     permission_classes = [IsAuthenticated]
@@ -71,7 +74,7 @@ class BibleVerseViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
-class SermonScriptureViewSet(viewsets.ModelViewSet):
+class SermonScriptureViewSet(ChurchContextMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """설교 본문 ViewSet"""
     queryset = SermonScripture.objects.all()
     permission_classes = [IsAuthenticated]
@@ -86,23 +89,10 @@ class SermonScriptureViewSet(viewsets.ModelViewSet):
         return SermonScriptureSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -113,7 +103,7 @@ class SermonScriptureViewSet(viewsets.ModelViewSet):
             serializer.save(created_by=self.request.user)
 
 
-class DailyVerseViewSet(viewsets.ModelViewSet):
+class DailyVerseViewSet(ChurchContextMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """일일 성경 구절 ViewSet"""
     queryset = DailyVerse.objects.all()
     serializer_class = DailyVerseSerializer
@@ -123,23 +113,10 @@ class DailyVerseViewSet(viewsets.ModelViewSet):
     ordering = ['-date']
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -150,11 +127,11 @@ class DailyVerseViewSet(viewsets.ModelViewSet):
             serializer.save(created_by=self.request.user)
     
     @action(detail=False, methods=['get'])
-    def today(self, request):
+    @tenant_cached('bible', vary_on=lambda request: date.today())
+    def today(self, request, church_id=None):
         """오늘의 말씀"""
         today = date.today()
-        church_id = self.kwargs.get('church_id')
-        
+
         daily_verse = self.get_queryset().filter(date=today).first()
         if daily_verse:
             serializer = self.get_serializer(daily_verse)
@@ -163,7 +140,7 @@ class DailyVerseViewSet(viewsets.ModelViewSet):
         return Response({"detail": "오늘의 말씀이 등록되지 않았습니다."}, status=status.HTTP_404_NOT_FOUND)
 
 
-class BibleStudyViewSet(viewsets.ModelViewSet):
+class BibleStudyViewSet(ChurchContextMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """성경 공부 ViewSet"""
     queryset = BibleStudy.objects.all()
     permission_classes = [IsAuthenticated]
@@ -178,23 +155,10 @@ class BibleStudyViewSet(viewsets.ModelViewSet):
         return BibleStudySerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -205,7 +169,7 @@ class BibleStudyViewSet(viewsets.ModelViewSet):
             serializer.save(created_by=self.request.user)
 
 
-class BibleBookmarkViewSet(viewsets.ModelViewSet):
+class BibleBookmarkViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """성경 책갈피 ViewSet"""
     queryset = BibleBookmark.objects.all()
     permission_classes = [IsAuthenticated]
@@ -220,23 +184,10 @@ class BibleBookmarkViewSet(viewsets.ModelViewSet):
         return BibleBookmarkSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(church=church_user.church)
@@ -7,9 +7,11 @@ from datetime import date, timedelta
 from .models import Bulletin
 from .serializers import BulletinListSerializer, BulletinDetailSerializer, BulletinCreateSerializer
 from church_core.unified_permissions import UnifiedPermission
+from church_core.conditional import ConditionalGetMixin
+from church_core.tenant_cache import tenant_cached
 
 
-class BulletinViewSet(viewsets.ModelViewSet):
+class BulletinViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """주보 관리 API ViewSet"""
     resource_name = 'bulletin'
     queryset = Bulletin.objects.all()
@@ -51,6 +53,7 @@ class BulletinViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @tenant_cached('bulletins')
     def latest(self, request, church_id=None):
         """최신 주보"""
         latest_bulletin = self.get_queryset().first()
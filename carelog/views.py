@@ -8,10 +8,27 @@ from datetime import date, timedelta
 from .models import CareLog
 from .serializers import CareLogSerializer, CareLogListSerializer, CareLogCreateSerializer
 from church_core.roles import SystemRole, Permission
+from church_core.church_context import ChurchContextMixin
+from church_core.db_router import ReplicaReadMixin
+from church_core.stats import Dimension, StatsSpec
 from users.models import ChurchUser
 
 
-class CareLogViewSet(viewsets.ModelViewSet):
+CARELOG_STATS = StatsSpec(
+    'carelog.statistics',
+    measures={
+        'total_logs': Count('pk'),
+        'today_logs': lambda: Count('pk', filter=Q(date=date.today())),
+        'this_week_logs': lambda: Count('pk', filter=Q(date__gte=date.today() - timedelta(days=7))),
+    },
+    dimensions={
+        'type_stats': Dimension('type', choices=CareLog.CareLogType, include_empty=False),
+    },
+    cache_domains=['carelog'],
+)
+
+
+class CareLogViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """생활소식/심방기록 ViewSet"""
     queryset = CareLog.objects.all()
     permission_classes = [IsAuthenticated]
@@ -28,23 +45,10 @@ class CareLogViewSet(viewsets.ModelViewSet):
         return CareLogSerializer
 
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
 
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -60,8 +64,7 @@ class CareLogViewSet(viewsets.ModelViewSet):
         if user.is_superuser:
             return True
         
-        church_id = self.kwargs.get('church_id')
-        church_user = user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         if church_user:
             return church_user.has_permission(permission_name)
         return False
@@ -94,23 +97,10 @@ class CareLogViewSet(viewsets.ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
     @action(detail=False, methods=['get'])
-    def statistics(self, request):
+    def statistics(self, request, church_id=None):
         """생활소식/심방기록 통계"""
         queryset = self.get_queryset()
-        
-        # 기본 통계
-        total_logs = queryset.count()
-        today_logs = queryset.filter(date=date.today()).count()
-        this_week_logs = queryset.filter(
-            date__gte=date.today() - timedelta(days=7)
-        ).count()
-        
-        # 유형별 통계
-        type_stats = {}
-        for log_type in CareLog.CareLogType.values:
-            count = queryset.filter(type=log_type).count()
-            if count > 0:
-                type_stats[log_type] = count
+        stats = CARELOG_STATS.evaluate(queryset, church_id=church_id)
         
         # 최근 기록
         recent_logs = CareLogListSerializer(
@@ -118,13 +108,7 @@ class CareLogViewSet(viewsets.ModelViewSet):
             many=True
         ).data
         
-        return Response({
-            'total_logs': total_logs,
-            'today_logs': today_logs,
-            'this_week_logs': this_week_logs,
-            'type_stats': type_stats,
-            'recent_logs': recent_logs
-        })
+        return Response(dict(stats, recent_logs=recent_logs))
 
     @action(detail=False, methods=['get'])
     def by_member(self, request):
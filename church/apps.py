@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ChurchConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'church'
+
+    def ready(self):
+        from church_core.tenant_cache import connect_signals
+        connect_signals()
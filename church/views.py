@@ -9,10 +9,12 @@ from .serializers import (
     ChurchSettingsSerializer
 )
 from church_core.roles import SystemRole
+from church_core.tenant_cache import tenant_cached
+from church_core.db_router import ReplicaReadMixin
 from users.models import ChurchUser
 
 
-class ChurchViewSet(viewsets.ModelViewSet):
+class ChurchViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """교회 관리 API ViewSet"""
     queryset = Church.objects.all()
     permission_classes = [IsAuthenticated]
@@ -112,6 +114,7 @@ class ChurchViewSet(viewsets.ModelViewSet):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     @action(detail=True, methods=['get'])
+    @tenant_cached('church', 'members', 'groups', church_kwarg='pk')
     def statistics(self, request, pk=None):
         """교회 통계 정보"""
         church = self.get_object()
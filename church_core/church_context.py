@@ -0,0 +1,176 @@
+"""
+요청 단위 교회 컨텍스트 - 교회/ChurchUser 조회를 요청당 한 번으로 통합
+"""
+from django.utils.deprecation import MiddlewareMixin
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ChurchContext:
+    """
+    요청 단위 교회 컨텍스트
+
+    URL의 church_id와 인증된 사용자로부터 ChurchUser(교회 포함)를 한 번만
+    조회하고, 봉사 할당과 소속 교회 목록은 처음 필요할 때 불러와 재사용합니다.
+    """
+
+    def __init__(self, user, church_id):
+        self.user = user
+        self.church_id = int(church_id) if church_id not in (None, '') else None
+        self._church_user = None
+        self._church_user_loaded = False
+        self._user_church_ids = None
+
+    @property
+    def user_id(self):
+        return getattr(self.user, 'pk', None)
+
+    @property
+    def is_loaded(self):
+        """ChurchUser 조회가 이미 끝났는지 여부"""
+        return self._church_user_loaded
+
+    @property
+    def church_user(self):
+        """현재 교회의 ChurchUser (없으면 None, 비활성 포함)"""
+        if not self._church_user_loaded:
+            self._church_user = self._load_church_user()
+            self._church_user_loaded = True
+        return self._church_user
+
+    @property
+    def church(self):
+        church_user = self.church_user
+        return church_user.church if church_user else None
+
+    @property
+    def is_member(self):
+        """현재 교회의 활성 사용자 여부"""
+        church_user = self.church_user
+        return bool(church_user and church_user.is_active)
+
+    @property
+    def assignments(self):
+        """활성 봉사 할당 목록 (ChurchUser 인스턴스에 메모이즈)"""
+        church_user = self.church_user
+        if church_user is None:
+            return []
+        if not hasattr(church_user, 'active_assignments'):
+            church_user.active_assignments = load_active_assignments(church_user)
+        return church_user.active_assignments
+
+    @property
+    def user_church_ids(self):
+        """사용자가 속한 교회 ID 목록"""
+        if self._user_church_ids is None:
+            snapshot = self.user_snapshot
+            self._user_church_ids = snapshot.church_ids if snapshot is not None else []
+        return self._user_church_ids
+
+    @property
+    def user_snapshot(self):
+        """인증 사용자 스냅샷 (소속 교회 목록 포함)"""
+        if self.user_id is None:
+            return None
+        from users.snapshot import get_request_user_snapshot
+        return get_request_user_snapshot(self.user)
+
+    def _load_church_user(self):
+        if self.user_id is None or self.church_id is None:
+            return None
+        snapshot = self.user_snapshot
+        if snapshot is not None and not snapshot.has_membership(self.church_id):
+            # 소속되지 않은 교회는 조회하지 않음
+            return None
+        from users.models import ChurchUser
+        return ChurchUser.objects.select_related('church', 'user').filter(
+            user_id=self.user_id, church_id=self.church_id
+        ).first()
+
+
+def load_active_assignments(church_user):
+    """ChurchUser의 활성 봉사 할당 조회 (역할/담당 그룹 포함)"""
+    return list(church_user.volunteer_assignments.filter(
+        is_active=True
+    ).select_related('volunteer_role').prefetch_related('volunteer_role__target_groups'))
+
+
+def _get_http_request(request):
+    """DRF Request이면 원본 HttpRequest 반환"""
+    return getattr(request, '_request', request)
+
+
+def get_url_church_id(request):
+    """URL 경로 인자에서 church_id 추출"""
+    http_request = _get_http_request(request)
+    if hasattr(http_request, 'church_id'):
+        return http_request.church_id
+    resolver_match = getattr(http_request, 'resolver_match', None)
+    if resolver_match is not None:
+        return resolver_match.kwargs.get('church_id')
+    return None
+
+
+def get_church_context(request, church_id=None):
+    """
+    요청에 메모이즈된 교회 컨텍스트 반환
+
+    church_id를 생략하면 URL의 church_id를 사용합니다.
+    인증 전후로 사용자가 바뀔 수 있으므로 (사용자, 교회) 쌍으로 메모이즈합니다.
+    """
+    http_request = _get_http_request(request)
+    if church_id is None:
+        church_id = get_url_church_id(http_request)
+
+    user = getattr(request, 'user', None)
+    contexts = http_request.__dict__.setdefault('_church_contexts', {})
+    key = (getattr(user, 'pk', None), str(church_id) if church_id is not None else None)
+    context = contexts.get(key)
+    if context is None:
+        context = ChurchContext(user, church_id)
+        contexts[key] = context
+    return context
+
+
+class ChurchContextMiddleware(MiddlewareMixin):
+    """
+    URL의 church_id를 요청에 기록하는 미들웨어
+
+    실제 ChurchUser 조회는 JWT 인증이 끝난 뒤 get_church_context()를
+    처음 호출할 때 지연 수행됩니다.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.church_id = view_kwargs.get('church_id')
+        return None
+
+
+class ChurchContextMixin:
+    """ViewSet에서 요청 단위 교회 컨텍스트를 사용하기 위한 믹스인"""
+
+    @property
+    def church_context(self):
+        return get_church_context(self.request, self.kwargs.get('church_id'))
+
+    def get_church_user(self):
+        """현재 교회의 ChurchUser (없으면 None)"""
+        return self.church_context.church_user
+
+    def filter_by_user_churches(self, queryset, field='church'):
+        """
+        사용자가 속한 교회의 데이터로 제한
+
+        URL에 church_id가 있으면 해당 교회 소속 여부만 확인하고,
+        없으면 사용자의 소속 교회 목록으로 필터링합니다.
+        """
+        user = self.request.user
+        context = self.church_context
+        if context.church_id is not None:
+            if not user.is_superuser and context.church_user is None:
+                return queryset.none()
+            return queryset.filter(**{field: context.church_id})
+
+        if user.is_superuser:
+            return queryset
+        return queryset.filter(**{f'{field}__in': context.user_church_ids})
@@ -0,0 +1,119 @@
+"""
+조건부 GET (ETag / Last-Modified) 지원
+
+교회 단위 읽기 API에서 데이터가 바뀌지 않았으면 직렬화 없이 304를 반환합니다.
+- 목록: 필터링된 쿼리셋의 (최대 updated_at, 건수)로 ETag 계산 (집계 쿼리 1회)
+- 상세: 객체의 updated_at으로 ETag / Last-Modified 계산
+- 직렬화기가 다른 테이블(그룹 멤버, 그룹장 이름 등)도 읽는 경우 conditional_domains에
+  해당 tenant_cache 도메인을 지정하면 교회별 도메인 버전을 ETag에 포함합니다.
+  (관련 테이블 변경은 updated_at을 바꾸지 않으므로 이때 Last-Modified는 보내지 않음)
+변경되지 않는 참조 데이터(성경 본문 등)는 ImmutableCacheMixin으로 장기 캐시를 허용합니다.
+"""
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+from church_core import tenant_cache
+import hashlib
+
+
+def make_etag(*parts):
+    """요청/데이터 버전으로 약한 ETag 생성"""
+    salt = getattr(settings, 'API_ETAG_SALT', '')
+    raw = ':'.join(str(part) for part in (salt,) + parts)
+    return 'W/' + quote_etag(hashlib.md5(raw.encode('utf-8')).hexdigest())
+
+
+def etag_matches(request, etag):
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    strip = lambda value: value[2:] if value.startswith('W/') else value
+    return strip(etag) in {strip(candidate) for candidate in parse_etags(header)}
+
+
+def not_modified_since(request, last_modified):
+    """If-Modified-Since 기준 변경 없음 여부 (If-None-Match가 없을 때만 사용)"""
+    if last_modified is None or request.META.get('HTTP_IF_NONE_MATCH'):
+        return False
+    since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    return since is not None and int(last_modified.timestamp()) <= since
+
+
+class ConditionalGetMixin:
+    """
+    목록/상세 조회에 ETag 기반 조건부 GET을 적용하는 ViewSet 믹스인
+
+    권한 검사(initial)와 필터링이 끝난 뒤 검증자만 계산하므로
+    304 응답에는 직렬화 비용이 들지 않습니다.
+    """
+    last_modified_field = 'updated_at'
+    # 직렬화기가 읽는 tenant_cache 도메인 (예: ('groups', 'members'))
+    conditional_domains = ()
+
+    def get_domain_versions(self, church_ids):
+        """교회별 conditional_domains 버전 [(교회 ID, [버전...])]"""
+        if not self.conditional_domains:
+            return []
+        return [
+            (church_id, tenant_cache.get_versions(church_id, self.conditional_domains))
+            for church_id in sorted(set(church_ids))
+        ]
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        version = queryset.aggregate(last_modified=Max(self.last_modified_field), count=Count('pk'))
+        domain_versions = self.get_domain_versions(
+            queryset.values_list('church_id', flat=True).distinct() if self.conditional_domains else []
+        )
+        etag = make_etag(
+            request.user.pk, request.get_full_path(), version['last_modified'], version['count'], *domain_versions
+        )
+        if etag_matches(request, etag):
+            return self._not_modified(etag)
+
+        response = super().list(request, *args, **kwargs)
+        return self._set_validators(response, etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        last_modified = getattr(instance, self.last_modified_field, None)
+        domain_versions = self.get_domain_versions([instance.church_id] if self.conditional_domains else [])
+        etag = make_etag(request.user.pk, request.get_full_path(), instance.pk, last_modified, *domain_versions)
+        if domain_versions:
+            last_modified = None
+        if etag_matches(request, etag) or not_modified_since(request, last_modified):
+            return self._not_modified(etag, last_modified)
+
+        serializer = self.get_serializer(instance)
+        return self._set_validators(Response(serializer.data), etag, last_modified)
+
+    def _not_modified(self, etag, last_modified=None):
+        return self._set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+
+    def _set_validators(self, response, etag, last_modified=None):
+        if response.status_code not in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            return response
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        # 사용자별 응답이므로 공유 캐시에는 저장하지 않고 매번 재검증
+        response['Cache-Control'] = 'private, no-cache'
+        patch_vary_headers(response, ['Authorization'])
+        return response
+
+
+class ImmutableCacheMixin:
+    """변경되지 않는 참조 데이터의 GET 응답에 장기 private 캐시 허용"""
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method == 'GET' and response.status_code == status.HTTP_200_OK:
+            max_age = getattr(settings, 'API_IMMUTABLE_MAX_AGE', 60 * 60 * 24 * 7)
+            response['Cache-Control'] = f'private, max-age={max_age}'
+        return response
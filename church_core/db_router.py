@@ -0,0 +1,135 @@
+"""
+읽기 전용 복제본(replica) 데이터베이스 라우팅
+
+통계/보고서/내보내기처럼 무거운 읽기 전용 액션은 복제본에서 조회하여
+주일 출석 체크 등 기본 DB 쓰기와 경합하지 않도록 합니다.
+
+- ReplicaRouter: 현재 컨텍스트에서 복제본 사용이 지정된 경우에만 읽기를 복제본으로 보냄
+- ReplicaReadMixin: statistics / overview / results / *_summary / export 액션을 복제본에서 실행
+- ReplicaStickinessMiddleware: 쓰기 요청 후 몇 초간 해당 사용자의 읽기를 기본 DB로 고정
+  (복제 지연 중에도 방금 쓴 데이터를 읽을 수 있도록 read-your-writes 보장)
+
+설정:
+    DATABASES = {'default': {...}, 'replica': {...}}
+    DATABASE_ROUTERS = ['church_core.db_router.ReplicaRouter']
+    MIDDLEWARE += ['church_core.db_router.ReplicaStickinessMiddleware']
+    DATABASE_REPLICA_ALIAS = 'replica'     # DATABASES에 없으면 항상 기본 DB 사용
+    DATABASE_REPLICA_STICKY_SECONDS = 5
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+STICKY_KEY = 'db_sticky_user_{user_id}'
+
+_read_alias = ContextVar('read_db_alias', default=None)
+
+
+def get_replica_alias():
+    """설정된 복제본 별칭 (DATABASES에 없으면 None)"""
+    alias = getattr(settings, 'DATABASE_REPLICA_ALIAS', 'replica')
+    return alias if alias in settings.DATABASES else None
+
+
+def get_sticky_seconds():
+    return getattr(settings, 'DATABASE_REPLICA_STICKY_SECONDS', 5)
+
+
+def mark_recent_write(user_id):
+    """사용자의 최근 쓰기 기록 (고정 시간 동안 기본 DB에서 읽음)"""
+    cache.set(STICKY_KEY.format(user_id=user_id), True, get_sticky_seconds())
+
+
+def has_recent_write(user_id):
+    return bool(cache.get(STICKY_KEY.format(user_id=user_id)))
+
+
+@contextmanager
+def read_from_replica(user=None):
+    """
+    블록 안의 읽기를 복제본으로 보냄
+
+    user가 최근에 쓰기를 했거나 복제본이 설정되지 않았으면 기본 DB를 사용합니다.
+    """
+    alias = get_replica_alias()
+    if alias is None or (user is not None and user.is_authenticated and has_recent_write(user.pk)):
+        alias = None
+    token = _read_alias.set(alias)
+    try:
+        yield alias or DEFAULT_DB_ALIAS
+    finally:
+        _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    """복제본 사용이 지정된 컨텍스트에서만 읽기를 복제본으로 보내는 라우터"""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB와 같은 데이터이므로 DB 간 관계 허용
+        aliases = {DEFAULT_DB_ALIAS, get_replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
+
+
+class ReplicaReadMixin:
+    """
+    읽기 전용 분석 액션을 복제본에서 실행하는 ViewSet 믹스인
+
+    인증/권한 검사는 기본 DB에서 수행한 뒤, 액션 본문의 조회만 복제본으로 보냅니다.
+    """
+    replica_actions = ('statistics', 'overview', 'results')
+    replica_action_suffixes = ('_summary', '_export')
+    replica_action_prefixes = ('export',)
+
+    def use_replica(self, request):
+        action = getattr(self, 'action', None)
+        if request.method not in SAFE_METHODS or not action:
+            return False
+        return (
+            action in self.replica_actions
+            or action.endswith(self.replica_action_suffixes)
+            or action.startswith(self.replica_action_prefixes)
+        )
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.use_replica(request):
+            self._replica_context = read_from_replica(request.user)
+            self._replica_context.__enter__()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        context = getattr(self, '_replica_context', None)
+        if context is not None:
+            self._replica_context = None
+            context.__exit__(None, None, None)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class ReplicaStickinessMiddleware:
+    """쓰기 요청을 보낸 사용자의 읽기를 잠시 기본 DB로 고정하는 미들웨어"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and get_replica_alias() is not None:
+            # DRF 인증 결과는 뷰 실행 후 request.user에 반영됨
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                mark_recent_write(user.pk)
+        return response
@@ -1,6 +1,10 @@
-from django.core.cache import cache
 from django.http import JsonResponse
+from django.utils import timezone
 from django.utils.deprecation import MiddlewareMixin
+from church_core.church_context import get_church_context
+from church_core.rate_limit import rate_limiter, resolve_policies, get_request_cost
+from security.activity_buffer import activity_log_buffer
+from users.snapshot import get_request_user_snapshot
 import time
 import logging
 
@@ -8,57 +12,85 @@ logger = logging.getLogger(__name__)
 
 
 class RateLimitMiddleware(MiddlewareMixin):
-    """API Rate Limiting Middleware"""
-    
-    def process_request(self, request):
+    """
+    API Rate Limiting Middleware
+
+    사용자(또는 IP)별, 교회별 버킷을 슬라이딩 윈도우 카운터로 제한하고
+    표준 RateLimit-* 헤더를 응답에 추가합니다. 정책과 경로별 비용은
+    church_core.rate_limit 설정을 따릅니다.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
         # API 경로에만 적용
         if not request.path.startswith('/api/'):
             return None
-            
-        # 인증된 사용자와 익명 사용자 구분
-        if request.user.is_authenticated:
-            identifier = f"user_{request.user.id}"
-            # 인증된 사용자: 분당 100 요청
-            max_requests = 100
-            window = 60  # 초
+
+        user = self.get_rate_limit_user(request)
+        church_id = view_kwargs.get('church_id')
+        role = None
+        if user is not None:
+            identifier = f"user_{user.pk}"
+            snapshot = get_request_user_snapshot(user) if church_id is not None else None
+            if snapshot is not None:
+                role = snapshot.get_role(church_id)
         else:
             # IP 기반 제한
-            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-            if x_forwarded_for:
-                ip = x_forwarded_for.split(',')[0]
-            else:
-                ip = request.META.get('REMOTE_ADDR')
-            identifier = f"ip_{ip}"
-            # 익명 사용자: 분당 20 요청
-            max_requests = 20
-            window = 60  # 초
-        
-        # 캐시 키
-        cache_key = f"ratelimit_{identifier}"
-        
-        # 현재 요청 수 가져오기
-        requests_data = cache.get(cache_key, {'count': 0, 'window_start': time.time()})
-        
-        # 시간 창 확인
-        if time.time() - requests_data['window_start'] > window:
-            # 새로운 시간 창 시작
-            requests_data = {'count': 1, 'window_start': time.time()}
-        else:
-            requests_data['count'] += 1
-        
-        # 제한 확인
-        if requests_data['count'] > max_requests:
-            return JsonResponse({
+            identifier = f"ip_{self.get_client_ip(request)}"
+
+        cost = get_request_cost(request.method, request.path)
+        results = []
+        for bucket, policy in resolve_policies(identifier, user is not None, church_id, role):
+            result = rate_limiter.hit(bucket, policy, cost)
+            results.append(result)
+            if not result.allowed:
+                # 앞선 버킷에서 소비한 카운트 반환
+                for previous in results[:-1]:
+                    rate_limiter.refund(previous)
+                break
+
+        # 가장 여유가 적은 버킷을 헤더로 보고
+        request._rate_limit = min(results, key=lambda r: (r.allowed, r.remaining))
+        if not request._rate_limit.allowed:
+            limit = request._rate_limit
+            response = JsonResponse({
                 'error': 'Rate limit exceeded',
-                'message': f'최대 {max_requests}개 요청/{window}초를 초과했습니다.',
-                'retry_after': int(window - (time.time() - requests_data['window_start']))
+                'message': f'최대 {limit.policy.limit}개 요청/{limit.policy.window}초를 초과했습니다.',
+                'retry_after': limit.reset,
             }, status=429)
-        
-        # 캐시 업데이트
-        cache.set(cache_key, requests_data, window)
-        
+            limit.apply_headers(response)
+            return response
+
         return None
 
+    def process_response(self, request, response):
+        limit = getattr(request, '_rate_limit', None)
+        if limit is not None and limit.allowed:
+            limit.apply_headers(response)
+        return response
+
+    def get_rate_limit_user(self, request):
+        """세션 또는 JWT로 인증된 사용자 (없으면 None)"""
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return user
+        if not request.META.get('HTTP_AUTHORIZATION'):
+            return None
+
+        from users.authentication import CustomJWTAuthentication
+        try:
+            # 블랙리스트/사용자 스냅샷 캐시를 사용하므로 DRF 인증 시 재조회 비용이 작음
+            result = CustomJWTAuthentication().authenticate(request)
+        except Exception:
+            # 유효하지 않은 토큰은 뷰에서 401로 처리
+            return None
+        return result[0] if result else None
+
+    def get_client_ip(self, request):
+        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        if x_forwarded_for:
+            return x_forwarded_for.split(',')[0]
+        return request.META.get('REMOTE_ADDR')
+
 
 class SecurityMiddleware(MiddlewareMixin):
     """보안 강화 미들웨어"""
@@ -71,7 +103,8 @@ class SecurityMiddleware(MiddlewareMixin):
         response['Referrer-Policy'] = 'strict-origin-when-cross-origin'
         
         # API 응답에 추가 보안 헤더
-        if request.path.startswith('/api/'):
+        # (뷰에서 ETag 재검증이나 장기 캐시를 지정한 경우는 유지)
+        if request.path.startswith('/api/') and not response.has_header('Cache-Control'):
             response['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
             response['Pragma'] = 'no-cache'
             
@@ -93,26 +126,29 @@ class ActivityLogMiddleware(MiddlewareMixin):
         return response
 
     def log_activity(self, request, response, duration):
-        """활동 로그 저장"""
+        """활동 로그 기록 (버퍼에 넣고 백그라운드에서 일괄 저장)"""
         try:
-            from security.models import ActivityLog
-            
-            # Church ID 추출
+            # Church ID 추출 (요청 중 이미 조회된 교회 컨텍스트 재사용)
             church_id = None
-            if hasattr(request.user, 'church_users'):
-                church_user = request.user.church_users.filter(is_active=True).first()
-                if church_user:
-                    church_id = church_user.church_id
-
-            ActivityLog.objects.create(
-                user=request.user,
-                church_id=church_id,
-                action=f"{request.method} {request.path}",
-                resource=self.extract_resource(request.path),
-                resource_id=self.extract_resource_id(request.path),
-                ip_address=self.get_client_ip(request),
-                user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
-            )
+            context = get_church_context(request)
+            if context.church_id is not None:
+                if context.church_user is not None:
+                    church_id = context.church_id
+            elif context.user_snapshot is not None:
+                active_church_ids = context.user_snapshot.active_church_ids
+                if active_church_ids:
+                    church_id = active_church_ids[0]
+
+            activity_log_buffer.add({
+                'user_id': request.user.pk,
+                'church_id': church_id,
+                'action': f"{request.method} {request.path}"[:100],
+                'resource': self.extract_resource(request.path),
+                'resource_id': self.extract_resource_id(request.path),
+                'ip_address': self.get_client_ip(request),
+                'user_agent': request.META.get('HTTP_USER_AGENT', '')[:500],
+                'created_at': timezone.now(),
+            })
         except Exception as e:
             # 로깅 실패해도 요청은 계속 처리
             logger.error(f"Activity logging failed: {e}")
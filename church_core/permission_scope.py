@@ -0,0 +1,190 @@
+"""
+권한 범위 컴파일러 - .all / .own_group / .own 권한을 하나의 Q 필터로 변환
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from church_core.tenant_cache import get_or_set
+import logging
+
+logger = logging.getLogger(__name__)
+
+SCOPE_CACHE_TIMEOUT = 300  # 5분 캐싱
+
+
+class PermissionScope:
+    """
+    컴파일된 권한 범위
+
+    사용자의 봉사 할당에서 특정 권한(예: member.view)에 대해
+    허용된 범위를 미리 계산해 둔 결과입니다.
+    - is_all: 교회 전체 데이터 접근 가능
+    - group_ids: 담당 그룹 ID 목록 (.own_group)
+    - is_own: 본인 데이터 접근 가능 (.own)
+    """
+    __slots__ = ('permission_base', 'user_id', 'is_all', 'group_ids', 'is_own')
+
+    def __init__(self, permission_base, user_id, is_all=False, group_ids=(), is_own=False):
+        self.permission_base = permission_base
+        self.user_id = user_id
+        self.is_all = is_all
+        self.group_ids = frozenset(group_ids)
+        self.is_own = is_own
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        return (
+            f"PermissionScope({self.permission_base!r}, all={self.is_all}, "
+            f"groups={sorted(self.group_ids)}, own={self.is_own})"
+        )
+
+    @property
+    def is_empty(self):
+        """허용된 범위가 전혀 없는지 여부"""
+        return not (self.is_all or self.group_ids or self.is_own)
+
+    def as_q(self, model):
+        """모델에 적용할 Q 필터 생성 (is_all이면 빈 Q)"""
+        if self.is_all:
+            return Q()
+
+        condition = Q(pk__in=[])
+        if self.group_ids:
+            condition |= _group_q(model, self.group_ids)
+        if self.is_own:
+            condition |= _own_q(model, self.user_id)
+        return condition
+
+    def filter_queryset(self, queryset):
+        """쿼리셋을 권한 범위로 제한"""
+        if self.is_all:
+            return queryset
+        if self.is_empty:
+            return queryset.none()
+        return queryset.filter(self.as_q(queryset.model))
+
+    def allows(self, obj):
+        """단일 객체가 권한 범위에 속하는지 확인 (최대 1회 쿼리)"""
+        if self.is_all:
+            return True
+        if self.is_empty or obj.pk is None:
+            return False
+        model = type(obj)
+        return model._default_manager.filter(pk=obj.pk).filter(self.as_q(model)).exists()
+
+
+def _get_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _group_q(model, group_ids):
+    """담당 그룹 데이터 조건 (UnifiedPermission._is_group_data와 동일한 경로)"""
+    group_ids = list(group_ids)
+    condition = Q(pk__in=[])
+
+    field = _get_field(model, 'group')
+    if field is not None and field.many_to_one:
+        condition |= Q(group_id__in=group_ids)
+
+    field = _get_field(model, 'member')
+    if field is not None and field.many_to_one and _get_field(field.related_model, 'groups'):
+        # 교인의 소속 그룹을 서브쿼리로 확인하여 중복 행 없이 한 번의 쿼리로 처리
+        member_model = field.related_model
+        member_ids = member_model._default_manager.filter(
+            groups__in=group_ids
+        ).values('pk')
+        condition |= Q(member_id__in=member_ids)
+
+    field = _get_field(model, 'groups')
+    if field is not None and field.many_to_many:
+        object_ids = model._default_manager.filter(groups__in=group_ids).values('pk')
+        condition |= Q(pk__in=object_ids)
+
+    return condition
+
+
+def _own_q(model, user_id):
+    """본인 데이터 조건 (UnifiedPermission._is_own_data와 동일한 경로)"""
+    condition = Q(pk__in=[])
+
+    for name in ('created_by', 'user'):
+        field = _get_field(model, name)
+        if field is not None and field.many_to_one:
+            condition |= Q(**{f'{name}_id': user_id})
+
+    field = _get_field(model, 'member')
+    if field is not None and field.many_to_one:
+        member_user = _get_field(field.related_model, 'user')
+        if member_user is not None and member_user.many_to_one:
+            condition |= Q(member__user_id=user_id)
+
+    return condition
+
+
+def compile_permission_scope(permission_base, user_id, assignments):
+    """봉사 할당 목록에서 특정 권한의 범위를 계산"""
+    resource = permission_base.split('.')[0]
+    is_all = False
+    group_ids = set()
+    is_own = False
+
+    for assignment in assignments:
+        permissions = assignment.all_permissions
+
+        if f"{permission_base}.all" in permissions or f"{resource}.manage.all" in permissions:
+            is_all = True
+            break
+
+        if f"{permission_base}.own_group" in permissions or f"{resource}.manage.own_group" in permissions:
+            # prefetch된 target_groups를 사용하므로 추가 쿼리 없음
+            group_ids.update(group.pk for group in assignment.volunteer_role.target_groups.all())
+
+        if f"{permission_base}.own" in permissions:
+            is_own = True
+
+    if is_all:
+        return PermissionScope(permission_base, user_id, is_all=True)
+    return PermissionScope(permission_base, user_id, group_ids=group_ids, is_own=is_own)
+
+
+def get_cached_permission_scope(church_user, permission_base, assignments_loader):
+    """교회 사용자별 권한 범위 조회 (교회 permissions 도메인 버전 캐시)"""
+    return get_or_set(
+        church_user.church_id, ['permissions'], f"scope:{church_user.id}:{permission_base}",
+        lambda: compile_permission_scope(
+            permission_base, church_user.user_id, assignments_loader(church_user)
+        ),
+        timeout=SCOPE_CACHE_TIMEOUT, trace_name='permission_scope',
+    )
+
+
+class PermissionScopedQuerysetMixin:
+    """
+    UnifiedPermission의 권한 범위를 목록 쿼리셋에 적용하는 ViewSet 믹스인
+
+    get_queryset에서 apply_permission_scope(queryset)를 호출하면
+    권한이 있는 행만 한 번의 쿼리로 조회됩니다.
+    """
+
+    def get_permission_scope(self):
+        """현재 요청에 대한 권한 범위 (제한이 없으면 None)"""
+        from church_core.unified_permissions import UnifiedPermission
+
+        for permission in self.get_permissions():
+            if isinstance(permission, UnifiedPermission):
+                return permission.get_permission_scope(self.request, self)
+        return None
+
+    def apply_permission_scope(self, queryset):
+        scope = self.get_permission_scope()
+        if scope is None:
+            return queryset
+        return scope.filter_queryset(queryset)
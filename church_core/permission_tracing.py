@@ -0,0 +1,229 @@
+"""
+권한 판정 추적 및 핫패스 프로파일링
+
+설정 PERMISSION_TRACING_ENABLED = True 이거나, DEBUG 모드에서
+X-Permission-Trace 헤더가 있는 요청에 대해서만 동작합니다.
+요청별 권한 판정 결과, 캐시 적중 여부, 권한 코드 안에서 실행된 쿼리 수와
+소요 시간을 기록하여 Server-Timing 헤더와 프로세스 내 집계로 제공합니다.
+"""
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import connection
+from django.utils.deprecation import MiddlewareMixin
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+import functools
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+TRACE_HEADER = 'HTTP_X_PERMISSION_TRACE'
+
+_current_trace = ContextVar('permission_trace', default=None)
+
+
+def is_tracing_enabled(request):
+    """요청에 대해 권한 추적이 활성화되었는지 확인"""
+    if getattr(settings, 'PERMISSION_TRACING_ENABLED', False):
+        return True
+    return bool(getattr(settings, 'DEBUG', False) and request.META.get(TRACE_HEADER))
+
+
+def append_server_timing(response, name, duration_ms, description=None):
+    """Server-Timing 헤더에 항목 추가"""
+    entry = f"{name};dur={duration_ms:.2f}"
+    if description:
+        entry += f';desc="{description}"'
+    existing = response.get('Server-Timing')
+    response['Server-Timing'] = f"{existing}, {entry}" if existing else entry
+
+
+class _QueryCounter:
+    """connection.execute_wrapper용 쿼리 카운터"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+
+class PermissionTrace:
+    """요청 단위 권한 판정 기록"""
+
+    def __init__(self):
+        self.decisions = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_events = []
+
+    def record_decision(self, check, view_name, permission, allowed, duration_ms, queries, query_ms):
+        self.decisions.append({
+            'check': check,
+            'view': view_name,
+            'permission': permission,
+            'allowed': allowed,
+            'duration_ms': duration_ms,
+            'queries': queries,
+            'query_ms': query_ms,
+        })
+
+    def record_cache(self, name, hit):
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        self.cache_events.append((name, hit))
+
+    @property
+    def total_ms(self):
+        return sum(d['duration_ms'] for d in self.decisions)
+
+    @property
+    def total_queries(self):
+        return sum(d['queries'] for d in self.decisions)
+
+    @property
+    def total_query_ms(self):
+        return sum(d['query_ms'] for d in self.decisions)
+
+
+class PermissionMetrics:
+    """프로세스 내 권한 판정 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._paths = {}
+        self._cache = {}
+
+    def add(self, trace):
+        with self._lock:
+            for decision in trace.decisions:
+                key = f"{decision['view']}.{decision['check']}"
+                stats = self._paths.setdefault(key, {
+                    'count': 0, 'allowed': 0, 'denied': 0,
+                    'total_ms': 0.0, 'max_ms': 0.0, 'queries': 0,
+                })
+                stats['count'] += 1
+                stats['allowed' if decision['allowed'] else 'denied'] += 1
+                stats['total_ms'] += decision['duration_ms']
+                stats['max_ms'] = max(stats['max_ms'], decision['duration_ms'])
+                stats['queries'] += decision['queries']
+            for name, hit in trace.cache_events:
+                stats = self._cache.setdefault(name, {'hits': 0, 'misses': 0})
+                stats['hits' if hit else 'misses'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            paths = {}
+            for key, stats in self._paths.items():
+                paths[key] = dict(
+                    stats,
+                    avg_ms=round(stats['total_ms'] / stats['count'], 3),
+                    avg_queries=round(stats['queries'] / stats['count'], 3),
+                )
+            cache = {}
+            for name, stats in self._cache.items():
+                total = stats['hits'] + stats['misses']
+                cache[name] = dict(stats, hit_rate=round(stats['hits'] / total, 3) if total else 0.0)
+            # 비용이 큰 경로가 먼저 오도록 정렬
+            ordered = dict(sorted(paths.items(), key=lambda item: item[1]['total_ms'], reverse=True))
+            return {'paths': ordered, 'cache': cache}
+
+    def reset(self):
+        with self._lock:
+            self._paths.clear()
+            self._cache.clear()
+
+
+permission_metrics = PermissionMetrics()
+
+
+def get_request_trace(request):
+    """요청에 연결된 권한 추적 객체 (비활성 시 None)"""
+    return getattr(request, '_permission_trace', None)
+
+
+def trace_cache(name, hit):
+    """현재 권한 판정 중의 캐시 적중/미스 기록"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record_cache(name, hit)
+
+
+def traced_permission(check):
+    """UnifiedPermission 판정 메서드 추적 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, request, view, *args):
+            trace = get_request_trace(request)
+            if trace is None:
+                return func(self, request, view, *args)
+
+            counter = _QueryCounter()
+            token = _current_trace.set(trace)
+            start = time.perf_counter()
+            try:
+                with connection.execute_wrapper(counter):
+                    result = func(self, request, view, *args)
+            finally:
+                _current_trace.reset(token)
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            trace.record_decision(
+                check=check,
+                view_name=type(view).__name__,
+                permission=self._get_required_permission(view, request.method),
+                allowed=bool(result),
+                duration_ms=duration_ms,
+                queries=counter.count,
+                query_ms=counter.duration * 1000,
+            )
+            return result
+        return wrapper
+    return decorator
+
+
+class PermissionTracingMiddleware(MiddlewareMixin):
+    """권한 추적 활성화 및 Server-Timing 헤더 출력 미들웨어"""
+
+    def process_request(self, request):
+        if request.path.startswith('/api/') and is_tracing_enabled(request):
+            request._permission_trace = PermissionTrace()
+        return None
+
+    def process_response(self, request, response):
+        trace = get_request_trace(request)
+        if trace is None or not trace.decisions:
+            return response
+
+        append_server_timing(
+            response, 'perm', trace.total_ms,
+            f"{len(trace.decisions)} checks, cache {trace.cache_hits}/{trace.cache_hits + trace.cache_misses}"
+        )
+        append_server_timing(
+            response, 'perm-db', trace.total_query_ms, f"{trace.total_queries} queries"
+        )
+        permission_metrics.add(trace)
+        return response
+
+
+class PermissionMetricsView(APIView):
+    """권한 판정 집계 조회 (관리자 전용, DELETE로 초기화)"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(permission_metrics.snapshot())
+
+    def delete(self, request):
+        permission_metrics.reset()
+        return Response(status=204)
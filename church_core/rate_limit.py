@@ -0,0 +1,183 @@
+"""
+API 요청 제한 엔진 (슬라이딩 윈도우 카운터)
+
+고정 윈도우 카운터 두 개(현재/직전)를 cache.incr로 원자적으로 증가시키고,
+직전 윈도우 카운트를 경과 비율만큼 가중해 슬라이딩 윈도우를 근사합니다.
+요청당 캐시 연산은 add + incr + get 세 번이며, 초과 시 decr로 되돌립니다.
+
+설정 (모두 선택 사항):
+    RATE_LIMIT_POLICIES = {
+        'anonymous': {'limit': 20, 'window': 60},
+        'authenticated': {'limit': 100, 'window': 60},
+        'roles': {'church_admin': {'limit': 300, 'window': 60}},
+        'churches': {'default': {'limit': 3000, 'window': 60}, 12: {...}},
+    }
+    RATE_LIMIT_COSTS = [
+        # (HTTP 메서드 또는 '*', 경로 정규식, 비용)
+        ('*', r'/export', 10),
+    ]
+
+cache.incr가 원자적인 백엔드(Redis, Memcached, LocMem)에서만 카운트가 정확합니다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+import math
+import re
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLICIES = {
+    'anonymous': {'limit': 20, 'window': 60},
+    'authenticated': {'limit': 100, 'window': 60},
+    'roles': {},
+    'churches': {},
+}
+
+DEFAULT_COSTS = [
+    ('*', r'/export', 10),
+    ('*', r'/generate', 5),
+]
+
+
+class RateLimitPolicy:
+    """요청 제한 정책 (limit 비용 / window 초)"""
+    __slots__ = ('name', 'limit', 'window')
+
+    def __init__(self, name, limit, window):
+        self.name = name
+        self.limit = int(limit)
+        self.window = int(window)
+
+    def __repr__(self):
+        return f"RateLimitPolicy({self.name!r}, {self.limit}/{self.window}s)"
+
+    @property
+    def header_value(self):
+        """RateLimit-Policy 헤더 값"""
+        return f"{self.limit};w={self.window}"
+
+
+class RateLimitResult:
+    """단일 버킷 판정 결과"""
+    __slots__ = ('key', 'cost', 'policy', 'allowed', 'remaining', 'reset')
+
+    def __init__(self, key, cost, policy, allowed, remaining, reset):
+        self.key = key
+        self.cost = cost
+        self.policy = policy
+        self.allowed = allowed
+        self.remaining = remaining
+        self.reset = reset
+
+    def apply_headers(self, response):
+        """표준 RateLimit-* 헤더 설정"""
+        response['RateLimit-Limit'] = str(self.policy.limit)
+        response['RateLimit-Remaining'] = str(self.remaining)
+        response['RateLimit-Reset'] = str(self.reset)
+        response['RateLimit-Policy'] = self.policy.header_value
+        if not self.allowed:
+            response['Retry-After'] = str(self.reset)
+
+
+class SlidingWindowRateLimiter:
+    """cache.incr 기반 슬라이딩 윈도우 요청 제한기"""
+
+    key_prefix = 'ratelimit'
+
+    def __init__(self, cache_backend=None, clock=time.time):
+        self.cache = cache_backend or cache
+        self.clock = clock
+
+    def _key(self, identifier, policy, window_index):
+        return f"{self.key_prefix}_{identifier}_{policy.window}_{window_index}"
+
+    def hit(self, identifier, policy, cost=1):
+        """비용만큼 카운트를 소비하고 허용 여부 반환"""
+        now = self.clock()
+        window_index = int(now // policy.window)
+        elapsed = now - window_index * policy.window
+        current_key = self._key(identifier, policy, window_index)
+        previous_key = self._key(identifier, policy, window_index - 1)
+
+        # 직전 윈도우도 가중치 계산에 쓰이므로 두 윈도우 동안 유지
+        self.cache.add(current_key, 0, policy.window * 2)
+        try:
+            current = self.cache.incr(current_key, cost)
+        except ValueError:
+            # add 직후 키가 만료/제거된 경우
+            self.cache.set(current_key, cost, policy.window * 2)
+            current = cost
+
+        previous = self.cache.get(previous_key) or 0
+        weight = (policy.window - elapsed) / policy.window
+        used = previous * weight + current
+
+        reset = max(int(math.ceil(policy.window - elapsed)), 1)
+        if used > policy.limit:
+            # 거부된 요청은 카운트에서 제외
+            try:
+                self.cache.decr(current_key, cost)
+            except ValueError:
+                pass
+            return RateLimitResult(current_key, cost, policy, False, 0, reset)
+
+        remaining = max(int(policy.limit - used), 0)
+        return RateLimitResult(current_key, cost, policy, True, remaining, reset)
+
+    def refund(self, result):
+        """허용된 판정의 카운트 반환 (다른 버킷에서 거부된 경우)"""
+        if result.allowed:
+            try:
+                self.cache.decr(result.key, result.cost)
+            except ValueError:
+                pass
+
+
+def get_policies():
+    policies = dict(DEFAULT_POLICIES)
+    policies.update(getattr(settings, 'RATE_LIMIT_POLICIES', {}))
+    return policies
+
+
+def get_request_cost(method, path):
+    """경로/메서드별 요청 비용 (일치하는 첫 규칙, 기본 1)"""
+    for rule_method, pattern, cost in getattr(settings, 'RATE_LIMIT_COSTS', DEFAULT_COSTS):
+        if rule_method in ('*', method) and re.search(pattern, path):
+            return int(cost)
+    return 1
+
+
+def _make_policy(name, config):
+    return RateLimitPolicy(name, config['limit'], config['window'])
+
+
+def resolve_policies(identifier, is_authenticated, church_id=None, role=None):
+    """
+    요청에 적용할 (식별자, 정책) 목록
+
+    - 사용자/IP 버킷: 교회 역할 정책 > 인증 사용자 기본 정책 > 익명 정책
+    - 교회 버킷: churches 설정이 있을 때 교회 전체 합산 제한
+    """
+    policies = get_policies()
+
+    role_config = policies['roles'].get(role) if role else None
+    if role_config:
+        policy = _make_policy(f"role:{role}", role_config)
+    elif is_authenticated:
+        policy = _make_policy('authenticated', policies['authenticated'])
+    else:
+        policy = _make_policy('anonymous', policies['anonymous'])
+    buckets = [(identifier, policy)]
+
+    if church_id is not None:
+        churches = policies['churches']
+        church_config = churches.get(int(church_id), churches.get(str(church_id), churches.get('default')))
+        if church_config:
+            buckets.append((f"church_{church_id}", _make_policy('church', church_config)))
+
+    return buckets
+
+
+rate_limiter = SlidingWindowRateLimiter()
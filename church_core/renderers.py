@@ -0,0 +1,110 @@
+"""
+orjson 기반 고속 JSON 렌더러/파서
+
+orjson이 설치되어 있으면 직렬화/파싱에 사용하고, 없으면 DRF 기본(stdlib json)
+구현으로 동작합니다. 출력 형태는 Decimal을 제외하면 DRF JSONRenderer와 동일합니다.
+- datetime/date/UUID는 orjson이 DRF JSONEncoder와 같은 형식으로 직접 출력하고,
+  그 밖의 타입(lazy 문자열, timedelta 등)은 DRF JSONEncoder 규칙을 그대로 사용
+- Decimal은 항상 숫자로 출력합니다. orjson.Fragment(3.9.15 이상)를 지원하면 원문 그대로
+  출력하여 DRF(float 변환)보다 정확하고, 지원하지 않으면 float로 손실 없이 표현 가능한
+  경우에만 orjson으로 출력하며 그 외에는 stdlib 경로(DRF와 동일한 float 출력)로 처리
+- 들여쓰기 요청, ASCII 출력 설정, orjson이 처리할 수 없는 값(64비트 초과 정수 등)은
+  stdlib 경로로 처리
+
+설정 예:
+    REST_FRAMEWORK = {
+        'DEFAULT_RENDERER_CLASSES': [
+            'church_core.renderers.FastJSONRenderer',
+            'rest_framework.renderers.BrowsableAPIRenderer',
+        ],
+        'DEFAULT_PARSER_CLASSES': [
+            'church_core.renderers.FastJSONParser',
+            'rest_framework.parsers.FormParser',
+            'rest_framework.parsers.MultiPartParser',
+        ],
+    }
+"""
+from decimal import Decimal
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+import io
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = 0
+if orjson is not None:
+    # DRF와 같이 UTC는 'Z'로 표기하고, 통계 응답의 정수 키(월, 연도 등)는
+    # stdlib json과 같이 문자열로 변환
+    ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# float 변환 후에도 값이 보존되는 최대 유효 자릿수
+FLOAT_EXACT_DIGITS = 15
+
+_drf_encoder = JSONEncoder()
+
+
+def encode_decimal(value):
+    """
+    Decimal을 JSON 숫자로 변환
+
+    orjson.Fragment가 없고 float로 정확히 표현할 수 없는 값이면 TypeError를 발생시켜
+    렌더러가 stdlib 경로(DRF JSONEncoder)로 처리하도록 합니다.
+    """
+    if not value.is_finite():
+        raise TypeError(f"JSON can't represent {value}")
+    fragment = getattr(orjson, 'Fragment', None)
+    if fragment is not None:
+        return fragment(format(value, 'f').encode())
+    # 문자열 길이가 짧으면 유효 자릿수도 적으므로 느린 as_tuple() 검사 생략
+    if len(str(value)) <= FLOAT_EXACT_DIGITS or len(value.as_tuple().digits) <= FLOAT_EXACT_DIGITS:
+        return float(value)
+    raise TypeError(f"Decimal {value} exceeds float precision")
+
+
+def orjson_default(obj):
+    """orjson이 직접 처리하지 않는 타입 변환"""
+    if isinstance(obj, Decimal):
+        return encode_decimal(obj)
+    return _drf_encoder.default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson을 사용하는 JSONRenderer (출력은 Decimal 정밀도를 제외하면 DRF JSONRenderer와 동일)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=orjson_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # DRF와 동일하게 U+2028, U+2029는 이스케이프 (JavaScript 호환)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """orjson을 사용하는 JSONParser (UTF-8 이외의 인코딩은 stdlib 사용)"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # 오류 메시지와 큰 정수 처리 등은 stdlib 동작을 따름
+            return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,262 @@
+"""
+요청 단위 SQL 예산 및 Server-Timing 계측
+
+설정 REQUEST_PROFILING_ENABLED = True 이거나, DEBUG 모드에서
+X-Request-Profile 헤더가 있는 요청에 대해서만 동작합니다.
+요청별 쿼리 수, DB 시간, 뷰 시간, 직렬화 시간을 Server-Timing 헤더로 내보내고
+경로(route)별 히스토그램을 프로세스 내에 집계합니다.
+직렬화 시간은 SerializerTimingMixin을 사용하는 ViewSet에서만 측정합니다.
+
+쿼리 예산 설정:
+    QUERY_BUDGETS = {'api/v1/churches/<int:church_id>/members/': 10}  # route 또는 URL 이름
+    QUERY_BUDGET_DEFAULT = None   # 기본 예산 (None이면 검사 안 함)
+    QUERY_BUDGET_MODE = 'log'     # 'log' | 'raise' (테스트에서 예산 초과 시 실패)
+"""
+from bisect import bisect_left
+from django.conf import settings
+from django.db import connection
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from church_core.permission_tracing import append_server_timing
+import functools
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'HTTP_X_REQUEST_PROFILE'
+
+DURATION_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """경로별 쿼리 예산 초과 (QUERY_BUDGET_MODE = 'raise')"""
+
+
+def is_profiling_enabled(request):
+    """요청에 대해 계측이 활성화되었는지 확인"""
+    if getattr(settings, 'REQUEST_PROFILING_ENABLED', False):
+        return True
+    return bool(getattr(settings, 'DEBUG', False) and request.META.get(PROFILE_HEADER))
+
+
+class RequestProfile:
+    """요청 단위 계측 결과"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.view_ms = 0.0
+        self.serializer_ms = None  # SerializerTimingMixin을 사용하는 뷰에서만 측정
+        self.query_count = 0
+        self.query_ms = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        """connection.execute_wrapper"""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_count += 1
+            self.query_ms += (time.perf_counter() - start) * 1000
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+
+class SerializerTimingMixin:
+    """
+    get_serializer로 만든 직렬화기의 to_representation 시간을 요청 계측에 누적하는 ViewSet 믹스인
+
+    DRF 클래스를 바꾸지 않고 이 뷰가 만든 직렬화기 인스턴스만 감쌉니다.
+    (중첩/하위 직렬화기 시간은 바깥 직렬화기 시간에 포함)
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        profile = getattr(self.request, '_request_profile', None)
+        if profile is not None:
+            serializer.to_representation = _timed_representation(profile, serializer.to_representation)
+        return serializer
+
+
+def _timed_representation(profile, to_representation):
+    if profile.serializer_ms is None:
+        profile.serializer_ms = 0.0
+
+    @functools.wraps(to_representation)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return to_representation(*args, **kwargs)
+        finally:
+            profile.serializer_ms += (time.perf_counter() - start) * 1000
+    return wrapper
+
+
+class Histogram:
+    """고정 구간 히스토그램"""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def snapshot(self):
+        buckets = {f"le_{bound}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets['le_inf'] = self.counts[-1]
+        return {
+            'count': self.count,
+            'avg': round(self.total / self.count, 3) if self.count else 0.0,
+            'max': round(self.max, 3),
+            'buckets': buckets,
+        }
+
+
+class RequestMetrics:
+    """경로별 요청 계측 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def add(self, route, profile, total_ms, over_budget):
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                stats = self._routes[route] = {
+                    'duration_ms': Histogram(DURATION_BUCKETS_MS),
+                    'db_ms': Histogram(DURATION_BUCKETS_MS),
+                    'serializer_ms': Histogram(DURATION_BUCKETS_MS),
+                    'queries': Histogram(QUERY_BUCKETS),
+                    'over_budget': 0,
+                }
+            stats['duration_ms'].observe(total_ms)
+            stats['db_ms'].observe(profile.query_ms)
+            if profile.serializer_ms is not None:
+                stats['serializer_ms'].observe(profile.serializer_ms)
+            stats['queries'].observe(profile.query_count)
+            if over_budget:
+                stats['over_budget'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            routes = {
+                route: {
+                    name: value.snapshot() if isinstance(value, Histogram) else value
+                    for name, value in stats.items()
+                }
+                for route, stats in self._routes.items()
+            }
+        # 쿼리가 많은 경로가 먼저 오도록 정렬
+        return dict(sorted(routes.items(), key=lambda item: item[1]['queries']['avg'], reverse=True))
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+
+request_metrics = RequestMetrics()
+
+
+def get_route(request):
+    """집계 키로 사용할 경로 패턴"""
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is None:
+        return request.path
+    return resolver_match.route or resolver_match.view_name or request.path
+
+
+def get_query_budget(request):
+    """경로의 쿼리 예산 (route, URL 이름 순으로 조회)"""
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is not None:
+        for key in (resolver_match.route, resolver_match.url_name, resolver_match.view_name):
+            if key and key in budgets:
+                return budgets[key]
+    return getattr(settings, 'QUERY_BUDGET_DEFAULT', None)
+
+
+class RequestProfilingMiddleware:
+    """쿼리 수/DB 시간/뷰 시간/직렬화 시간 계측 및 쿼리 예산 검사 미들웨어"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not request.path.startswith('/api/') or not is_profiling_enabled(request):
+            return self.get_response(request)
+
+        profile = RequestProfile()
+        request._request_profile = profile
+        with connection.execute_wrapper(profile):
+            response = self.get_response(request)
+
+        total_ms = profile.total_ms
+        append_server_timing(response, 'db', profile.query_ms, f"{profile.query_count} queries")
+        append_server_timing(response, 'view', profile.view_ms)
+        if profile.serializer_ms is not None:
+            append_server_timing(response, 'serialize', profile.serializer_ms)
+        append_server_timing(response, 'total', total_ms)
+
+        budget = get_query_budget(request)
+        over_budget = budget is not None and profile.query_count > budget
+        request_metrics.add(get_route(request), profile, total_ms, over_budget)
+        if over_budget:
+            self.handle_budget_exceeded(request, profile.query_count, budget)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = getattr(request, '_request_profile', None)
+        if profile is not None:
+            profile.view_started = time.perf_counter()
+        return None
+
+    def process_template_response(self, request, response):
+        # DRF 응답은 렌더링 전에 여기를 지나므로 뷰 시간 종료 시점으로 사용
+        self._finish_view(request)
+        return response
+
+    def process_exception(self, request, exception):
+        self._finish_view(request)
+        return None
+
+    def _finish_view(self, request):
+        profile = getattr(request, '_request_profile', None)
+        if profile is not None and profile.view_started is not None:
+            profile.view_ms = (time.perf_counter() - profile.view_started) * 1000
+            profile.view_started = None
+
+    def handle_budget_exceeded(self, request, query_count, budget):
+        message = (
+            f"Query budget exceeded for {request.method} {get_route(request)}: "
+            f"{query_count} queries (budget {budget})"
+        )
+        if getattr(settings, 'QUERY_BUDGET_MODE', 'log') == 'raise':
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+class RequestMetricsView(APIView):
+    """경로별 요청 계측 집계 조회 (관리자 전용, DELETE로 초기화)"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(request_metrics.snapshot())
+
+    def delete(self, request):
+        request_metrics.reset()
+        return Response(status=204)
@@ -0,0 +1,230 @@
+"""
+선언적 통계 집계
+
+StatsSpec에 지표(measures), 차원(dimensions), 시간 구간(time buckets), 필터를 선언하면
+evaluate()가 최소한의 쿼리로 변환하여 실행합니다.
+- 스칼라 지표와 선택지(choices)가 정해진 차원은 조건부 집계로 묶어 aggregate() 쿼리 1회
+- 선택지가 없는 차원과 시간 구간은 각각 GROUP BY 쿼리 1회
+
+'오늘' 기준처럼 평가 시점에 따라 달라지는 지표/필터는 호출 가능한 값(lambda)으로 선언합니다.
+cache_domains를 지정하면 교회 도메인 버전 캐시(tenant_cache)에 결과를 저장하며,
+필터링된 쿼리셋의 SQL이 키에 포함되므로 사용자별 권한 범위가 달라도 섞이지 않습니다.
+
+    PRAYER_STATS = StatsSpec(
+        'prayers',
+        measures={
+            'total': Count('pk'),
+            'overdue': lambda: Count('pk', filter=Q(target_date__lt=date.today())),
+        },
+        dimensions={'by_type': Dimension('prayer_type', choices=Prayer.PrayerType)},
+        cache_domains=['prayers'],
+    )
+    stats = PRAYER_STATS.evaluate(queryset, church_id=church_id)
+"""
+from datetime import date
+from django.db.models import Aggregate, Count, Q
+from django.db.models.functions import Extract, Trunc
+from church_core import tenant_cache
+import hashlib
+
+
+def _resolve(value):
+    """평가 시점에 값을 정하는 선언(lambda) 해석"""
+    return value() if callable(value) else value
+
+
+def _choice_values(choices):
+    """TextChoices / choices 튜플 목록 / 값 목록을 값 목록으로 변환"""
+    if hasattr(choices, 'values'):
+        return list(choices.values)
+    return [choice[0] if isinstance(choice, (list, tuple)) else choice for choice in choices]
+
+
+def _with_filter(aggregate, condition):
+    """집계식에 조건 추가 (기존 filter와 AND, Coalesce 등으로 감싼 경우 안쪽 집계에 적용)"""
+    aggregate = aggregate.copy()
+    if not isinstance(aggregate, Aggregate):
+        aggregate.set_source_expressions([
+            _with_filter(source, condition) if getattr(source, 'contains_aggregate', False) else source
+            for source in aggregate.get_source_expressions()
+        ])
+        return aggregate
+    aggregate.filter = condition if aggregate.filter is None else aggregate.filter & condition
+    return aggregate
+
+
+def _default_measures():
+    return {'count': Count('pk')}
+
+
+class Dimension:
+    """
+    범주별 집계
+
+    choices가 있으면 값마다 조건부 집계를 만들어 기본 aggregate() 쿼리에 포함하고,
+    없으면 별도의 GROUP BY 쿼리로 계산합니다.
+    - as_rows=False: {값: 지표} (지표가 하나면 값만, 여러 개면 dict)
+    - as_rows=True: [{field: 값, 지표명: 지표, ...}] (values().annotate()와 같은 형태)
+    """
+
+    def __init__(self, field, choices=None, measures=None, include_empty=True,
+                 as_rows=False, order_by=None, limit=None, filter=None):
+        self.field = field
+        self.choices = choices
+        self.measures = measures or _default_measures()
+        self.include_empty = include_empty
+        self.as_rows = as_rows
+        self.order_by = order_by
+        self.limit = limit
+        self.filter = filter
+
+    @property
+    def is_conditional(self):
+        return self.choices is not None
+
+    def aggregates(self, name):
+        """조건부 집계식 {별칭: 집계식}"""
+        condition = _resolve(self.filter)
+        result = {}
+        for index, value in enumerate(_choice_values(self.choices)):
+            value_condition = Q(**{self.field: value})
+            if condition is not None:
+                value_condition &= condition
+            for measure, aggregate in self.measures.items():
+                result[f"{name}__{index}__{measure}"] = _with_filter(_resolve(aggregate), value_condition)
+        return result
+
+    def from_aggregates(self, name, values):
+        """aggregate() 결과에서 차원 결과 구성"""
+        rows = []
+        for index, value in enumerate(_choice_values(self.choices)):
+            row = {measure: values[f"{name}__{index}__{measure}"] for measure in self.measures}
+            if self.include_empty or any(row.values()):
+                rows.append((value, row))
+        if self.order_by:
+            key = self.order_by.lstrip('-')
+            rows.sort(
+                key=lambda item: item[0] if key == self.field else item[1][key],
+                reverse=self.order_by.startswith('-'),
+            )
+        if self.limit is not None:
+            rows = rows[:self.limit]
+        return self._shape(rows)
+
+    def query(self, queryset):
+        """GROUP BY 쿼리로 차원 결과 계산"""
+        condition = _resolve(self.filter)
+        if condition is not None:
+            queryset = queryset.filter(condition)
+        measures = {measure: _resolve(aggregate) for measure, aggregate in self.measures.items()}
+        rows = queryset.values(self.field).annotate(**measures).order_by(self.order_by or self.field)
+        if self.limit is not None:
+            rows = rows[:self.limit]
+        return self._shape(
+            [(row[self.field], {measure: row[measure] for measure in measures}) for row in rows]
+        )
+
+    def _shape(self, rows):
+        if self.as_rows:
+            return [dict({self.field: value}, **row) for value, row in rows]
+        if len(self.measures) == 1:
+            measure = next(iter(self.measures))
+            return {value: row[measure] for value, row in rows}
+        return {value: row for value, row in rows}
+
+
+class TimeBucket(Dimension):
+    """
+    시간 구간별 집계
+
+    extract=False이면 구간 시작 시각(Trunc), True이면 구간 번호(Extract, 예: 월 1~12)를
+    key 이름으로 반환합니다. extract=True이고 values(예: range(1, 13))를 지정하면
+    GROUP BY 대신 조건부 집계로 기본 aggregate() 쿼리에 포함됩니다.
+    결과는 구간 순서로 정렬된 행 목록이며, 기본적으로 데이터가 없는 구간은 제외합니다.
+    """
+
+    def __init__(self, field, period='month', measures=None, key=None, extract=False,
+                 values=None, include_empty=False, filter=None):
+        super().__init__(
+            f"{field}__{period}", choices=values if extract else None, measures=measures,
+            include_empty=include_empty, as_rows=True, filter=filter,
+        )
+        self.date_field = field
+        self.period = period
+        self.key = key or period
+        self.extract = extract
+
+    def query(self, queryset):
+        condition = _resolve(self.filter)
+        if condition is not None:
+            queryset = queryset.filter(condition)
+        bucket = Extract(self.date_field, self.period) if self.extract else Trunc(self.date_field, self.period)
+        measures = {measure: _resolve(aggregate) for measure, aggregate in self.measures.items()}
+        return list(
+            queryset.annotate(**{self.key: bucket}).values(self.key).annotate(**measures).order_by(self.key)
+        )
+
+    def _shape(self, rows):
+        return [dict({self.key: value}, **row) for value, row in rows]
+
+
+class StatsSpec:
+    """
+    선언적 통계 명세
+
+    name은 캐시 키에 사용되므로 명세마다 고유해야 합니다.
+    annotations는 지표 계산 전에 쿼리셋에 추가할 주석(서브쿼리 등)입니다.
+    """
+
+    def __init__(self, name, measures=None, dimensions=None, filters=None, annotations=None,
+                 cache_domains=None, timeout=None):
+        self.name = name
+        self.measures = measures or {}
+        self.dimensions = dimensions or {}
+        self.filters = filters or []
+        self.annotations = annotations or {}
+        self.cache_domains = cache_domains
+        self.timeout = timeout
+
+    def evaluate(self, queryset, church_id=None):
+        """통계 계산 (church_id와 cache_domains가 있으면 캐싱)"""
+        queryset = self.prepare(queryset)
+        if church_id is None or not self.cache_domains:
+            return self.compute(queryset)
+
+        try:
+            sql = str(queryset.query)
+        except Exception:
+            # 빈 결과가 확정된 쿼리셋(.none()) 등은 캐싱하지 않음
+            return self.compute(queryset)
+        params = hashlib.md5(f"{sql}|{date.today().isoformat()}".encode('utf-8')).hexdigest()
+        return tenant_cache.get_or_set(
+            church_id, self.cache_domains, f"stats.{self.name}:{params}",
+            lambda: self.compute(queryset), timeout=self.timeout,
+        )
+
+    def prepare(self, queryset):
+        """필터와 주석 적용 (정렬은 집계에 영향을 주지 않도록 제거)"""
+        queryset = queryset.order_by()
+        for condition in self.filters:
+            queryset = queryset.filter(_resolve(condition))
+        if self.annotations:
+            queryset = queryset.annotate(
+                **{name: _resolve(expression) for name, expression in self.annotations.items()}
+            )
+        return queryset
+
+    def compute(self, queryset):
+        aggregates = {name: _resolve(aggregate) for name, aggregate in self.measures.items()}
+        for name, dimension in self.dimensions.items():
+            if dimension.is_conditional:
+                aggregates.update(dimension.aggregates(name))
+
+        values = queryset.aggregate(**aggregates) if aggregates else {}
+        result = {name: values[name] for name in self.measures}
+        for name, dimension in self.dimensions.items():
+            if dimension.is_conditional:
+                result[name] = dimension.from_aggregates(name, values)
+            else:
+                result[name] = dimension.query(queryset)
+        return result
@@ -0,0 +1,260 @@
+"""
+교회(테넌트) 단위 버전 캐시
+
+교회마다 데이터 도메인(members, groups, attendance, offerings 등)별 버전 카운터를 두고,
+캐시 키에 현재 버전을 포함합니다. 모델이 저장/삭제되면 시그널에서 해당 교회의
+도메인 버전을 올리므로 이전 키는 즉시 더 이상 조회되지 않습니다 (삭제 불필요).
+
+    키 형식: church:{id}:{domain}:v{n}:{params}
+    여러 도메인에 의존하는 경우: church:{id}:groups+members:v{n}.{m}:{params}
+
+트랜잭션 안에서 변경된 경우 커밋 시점에 한 번 더 버전을 올려, 커밋 전에 다른 요청이
+이전 데이터를 새 버전 키로 저장해 두었더라도 사용되지 않도록 합니다.
+
+설정 (모두 선택 사항):
+    TENANT_CACHE_TIMEOUT = 300           # 캐시 항목 TTL (초)
+    TENANT_CACHE_DOMAINS = {...}         # DEFAULT_DOMAINS 대체
+"""
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from rest_framework.response import Response
+from church_core.permission_tracing import trace_cache
+from users.snapshot import get_request_user_snapshot
+import functools
+import hashlib
+import time
+
+# 도메인별 (모델, 교회 ID 경로) 목록
+DEFAULT_DOMAINS = {
+    'church': [('church.Church', 'pk')],
+    'members': [
+        ('members.Member', 'church_id'),
+        ('members.FamilyRelationship', 'church_id'),
+        ('groups.GroupMember', 'group.church_id'),
+    ],
+    'groups': [
+        ('groups.Group', 'church_id'),
+        ('groups.GroupMember', 'group.church_id'),
+    ],
+    'attendance': [
+        ('attendance.Attendance', 'church_id'),
+        ('attendance.AttendanceTemplate', 'church_id'),
+    ],
+    'offerings': [('offerings.Offering', 'church_id')],
+    'bulletins': [('bulletins.Bulletin', 'church_id')],
+    'bible': [
+        ('bible.SermonScripture', 'church_id'),
+        ('bible.DailyVerse', 'church_id'),
+        ('bible.BibleStudy', 'church_id'),
+    ],
+    'prayers': [('prayers.Prayer', 'church_id')],
+    'carelog': [('carelog.CareLog', 'church_id')],
+    'announcements': [
+        ('announcements.Announcement', 'church_id'),
+        ('announcements.PushLog', 'announcement.church_id'),
+    ],
+    'surveys': [
+        ('surveys.Survey', 'church_id'),
+        ('surveys.Answer', 'question.survey.church_id'),
+    ],
+    'reports': [('reports.MinistryReport', 'church_id')],
+    'permissions': [
+        ('users.ChurchUser', 'church_id'),
+        ('volunteering.VolunteerRole', 'church_id'),
+        ('volunteering.VolunteerAssignment', 'church_user.church_id'),
+    ],
+}
+
+_signals_connected = False
+
+
+def get_domains():
+    return getattr(settings, 'TENANT_CACHE_DOMAINS', DEFAULT_DOMAINS)
+
+
+def get_cache_timeout():
+    return getattr(settings, 'TENANT_CACHE_TIMEOUT', 300)
+
+
+def _version_key(church_id, domain):
+    return f"church:{church_id}:{domain}:version"
+
+
+def _initial_version():
+    # 버전 키가 축출된 뒤 다시 만들어져도 이전 번호로 돌아가지 않도록 시각 기반 값 사용
+    return int(time.time() * 1000)
+
+
+def get_versions(church_id, domains):
+    """도메인별 현재 버전 (한 번의 캐시 왕복)"""
+    keys = {domain: _version_key(church_id, domain) for domain in domains}
+    found = cache.get_many(list(keys.values()))
+    versions = []
+    for domain, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            cache.add(key, _initial_version(), None)
+            version = cache.get(key)
+        versions.append(version)
+    return versions
+
+
+def get_version(church_id, domain):
+    return get_versions(church_id, [domain])[0]
+
+
+def bump_version(church_id, domain):
+    """도메인 버전 증가 (이전 버전의 캐시 항목은 즉시 무효)"""
+    key = _version_key(church_id, domain)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _initial_version()
+        if not cache.add(key, version, None):
+            return cache.incr(key)
+        return version
+
+
+def invalidate(church_id, *domains):
+    """교회의 도메인 캐시 무효화 (트랜잭션 중이면 커밋 시 한 번 더)"""
+    if church_id is None:
+        return
+    for domain in domains:
+        bump_version(church_id, domain)
+
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: [bump_version(church_id, domain) for domain in domains])
+
+
+def make_key(church_id, domains, params):
+    """church:{id}:{domain}:v{n}:{params} 형식의 캐시 키"""
+    domains = list(domains)
+    versions = get_versions(church_id, domains)
+    version = '.'.join(str(value) for value in versions)
+    return f"church:{church_id}:{'+'.join(domains)}:v{version}:{params}"
+
+
+def get_or_set(church_id, domains, params, loader, timeout=None, trace_name=None):
+    """버전 키로 캐시 조회, 없으면 loader 결과 저장"""
+    key = make_key(church_id, domains, params)
+    value = cache.get(key)
+    trace_cache(trace_name or f"tenant:{'+'.join(domains)}", value is not None)
+    if value is None:
+        value = loader()
+        cache.set(key, value, get_cache_timeout() if timeout is None else timeout)
+    return value
+
+
+def _params_digest(*parts):
+    raw = '|'.join(str(part) for part in parts)
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+def tenant_cached(*domains, timeout=None, per_user=False, church_kwarg='church_id', vary_on=None):
+    """
+    ViewSet 액션 응답을 교회 도메인 버전 키로 캐싱하는 데코레이터
+
+    캐시된 응답은 해당 교회 소속 사용자(또는 슈퍼유저)에게만 재사용하며,
+    그 외 사용자는 항상 뷰를 직접 실행합니다. 사용자별로 결과가 달라지는
+    액션은 per_user=True로, 날짜 등 요청 밖의 값에 따라 달라지는 액션은
+    vary_on(request -> 값)으로 지정합니다. 200 응답만 캐싱합니다.
+
+        @action(detail=False, methods=['get'])
+        @tenant_cached('groups', 'members')
+        def hierarchy(self, request, church_id=None): ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            church_id = kwargs.get(church_kwarg)
+            if request.method != 'GET' or not str(church_id).isdigit() or not _can_share(request, church_id):
+                return func(self, request, *args, **kwargs)
+
+            params = _params_digest(
+                sorted(kwargs.items()),
+                sorted(request.query_params.lists()),
+                request.user.pk if per_user else '',
+                vary_on(request) if vary_on else '',
+            )
+            key = make_key(church_id, domains, f"{self.basename}.{func.__name__}:{params}")
+            cached = cache.get(key)
+            trace_cache(f"tenant:{'+'.join(domains)}", cached is not None)
+            if cached is not None:
+                return Response(cached)
+
+            response = func(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, get_cache_timeout() if timeout is None else timeout)
+            return response
+        return wrapper
+    return decorator
+
+
+def _can_share(request, church_id):
+    """교회 단위로 공유되는 캐시 응답을 사용할 수 있는 사용자인지 확인"""
+    user = request.user
+    if not user or not user.is_authenticated:
+        return False
+    if user.is_superuser:
+        return True
+    return get_request_user_snapshot(user).has_membership(church_id)
+
+
+def _resolve_church_id(instance, path):
+    value = instance
+    try:
+        for attr in path.split('.'):
+            value = getattr(value, attr)
+    except Exception:
+        # 연쇄 삭제로 상위 객체가 이미 없는 경우 상위 모델 시그널에서 처리됨
+        return None
+    return value
+
+
+def connect_signals():
+    """DEFAULT_DOMAINS(또는 TENANT_CACHE_DOMAINS) 모델에 무효화 시그널 연결"""
+    global _signals_connected
+    if _signals_connected:
+        return
+    _signals_connected = True
+
+    routes = {}
+    model_domains = {}
+    for domain, entries in get_domains().items():
+        for label, path in entries:
+            routes.setdefault((label, path), []).append(domain)
+            model_domains.setdefault(apps.get_model(label), set()).add(domain)
+
+    for (label, path), domains in routes.items():
+        model = apps.get_model(label)
+        handler = _make_handler(path, domains)
+        post_save.connect(handler, sender=model, weak=False, dispatch_uid=f"tenant_cache_save_{label}_{path}")
+        post_delete.connect(handler, sender=model, weak=False, dispatch_uid=f"tenant_cache_delete_{label}_{path}")
+
+    for model, domains in model_domains.items():
+        for field in model._meta.local_many_to_many:
+            through = field.remote_field.through
+            # 연결 테이블 변경은 양쪽 모델과 연결 모델의 도메인 모두에 영향
+            related = model_domains.get(field.related_model, set()) | model_domains.get(through, set())
+            m2m_changed.connect(
+                _make_m2m_handler(sorted(domains | related)), sender=through, weak=False,
+                dispatch_uid=f"tenant_cache_m2m_{model._meta.label}_{field.name}",
+            )
+
+
+def _make_handler(path, domains):
+    def handler(sender, instance, **kwargs):
+        invalidate(_resolve_church_id(instance, path), *domains)
+    return handler
+
+
+def _make_m2m_handler(domains):
+    def handler(sender, instance, action, **kwargs):
+        if action.startswith('post_'):
+            # 정방향/역방향 모두 양쪽 모델이 church_id를 가짐
+            invalidate(getattr(instance, 'church_id', None), *domains)
+    return handler
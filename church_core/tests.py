@@ -0,0 +1,753 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework import mixins, serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from church.models import Church
+from church_core import db_router
+from users.models import User
+from church_core.rate_limit import RateLimitPolicy, SlidingWindowRateLimiter
+from church_core.renderers import FastJSONParser, FastJSONRenderer
+from church_core import church_context, permission_tracing, renderers, request_profiling, tenant_cache
+from church_core.conditional import ConditionalGetMixin
+from church_core.permission_scope import PermissionScopedQuerysetMixin, compile_permission_scope
+from church_core.request_profiling import QueryBudgetExceeded, SerializerTimingMixin
+from church_core.unified_permissions import UnifiedPermission
+from prayers.models import Prayer
+from utils.factories import ChurchFactory, ChurchUserFactory, GroupFactory, GroupMemberFactory, MemberFactory, PrayerFactory
+from volunteering.models import VolunteerAssignment, VolunteerRole
+from church_core.stats import Dimension, StatsSpec, TimeBucket
+from django.db import connection
+from django.db.models import Count, Q
+from django.test.utils import CaptureQueriesContext
+import io
+import json
+import pytest
+import uuid
+
+# 윈도우 경계에 걸리지 않도록 고정된 시각 (60초 윈도우의 30초 지점)
+FIXED_NOW = 1_700_000_010.0
+
+
+class TestSlidingWindowRateLimiter:
+    """슬라이딩 윈도우 요청 제한기 테스트"""
+
+    def setup_method(self):
+        self.cache = LocMemCache('ratelimit-test', {})
+        self.cache.clear()
+        self.limiter = SlidingWindowRateLimiter(cache_backend=self.cache, clock=lambda: FIXED_NOW)
+
+    def run_parallel(self, policy, workers, hits_per_worker, cost=1):
+        def worker(_):
+            return [self.limiter.hit('user_1', policy, cost).allowed for _ in range(hits_per_worker)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(worker, range(workers)))
+        return [allowed for worker_results in results for allowed in worker_results]
+
+    def current_count(self, policy):
+        window_index = int(FIXED_NOW // policy.window)
+        return self.cache.get(self.limiter._key('user_1', policy, window_index))
+
+    def test_parallel_counts_are_exact(self):
+        """병렬 요청에서도 카운트 손실 없음"""
+        policy = RateLimitPolicy('test', limit=100000, window=60)
+        results = self.run_parallel(policy, workers=32, hits_per_worker=50)
+
+        assert all(results)
+        assert self.current_count(policy) == 32 * 50
+
+    def test_parallel_requests_never_exceed_limit(self):
+        """병렬 요청에서도 정확히 limit 개수만 허용"""
+        policy = RateLimitPolicy('test', limit=100, window=60)
+        results = self.run_parallel(policy, workers=32, hits_per_worker=20)
+
+        assert results.count(True) == 100
+        # 거부된 요청은 카운트에 남지 않음
+        assert self.current_count(policy) == 100
+
+    def test_cost_weights(self):
+        """경로별 비용만큼 한도 소비"""
+        policy = RateLimitPolicy('test', limit=95, window=60)
+        results = self.run_parallel(policy, workers=8, hits_per_worker=5, cost=10)
+
+        assert results.count(True) == 9
+        assert self.current_count(policy) == 90
+
+    def test_previous_window_is_weighted(self):
+        """직전 윈도우 카운트가 경과 비율만큼 반영됨"""
+        policy = RateLimitPolicy('test', limit=10, window=60)
+        previous_index = int(FIXED_NOW // policy.window) - 1
+        self.cache.set(self.limiter._key('user_1', policy, previous_index), 10, 120)
+
+        # 윈도우의 절반이 지났으므로 직전 10건 중 5건만 반영
+        results = [self.limiter.hit('user_1', policy).allowed for _ in range(10)]
+        assert results.count(True) == 5
+
+    def test_rate_limit_headers(self):
+        """RateLimit-* 헤더 설정"""
+        policy = RateLimitPolicy('test', limit=2, window=60)
+        self.limiter.hit('user_1', policy)
+        self.limiter.hit('user_1', policy)
+        result = self.limiter.hit('user_1', policy)
+
+        response = HttpResponse()
+        result.apply_headers(response)
+        assert response['RateLimit-Limit'] == '2'
+        assert response['RateLimit-Remaining'] == '0'
+        assert response['RateLimit-Policy'] == '2;w=60'
+        assert response['Retry-After'] == response['RateLimit-Reset']
+
+
+class TestFastJSON:
+    """orjson 렌더러/파서가 DRF 기본 구현과 같은 결과를 내는지 테스트"""
+
+    payload = {
+        'id': 1,
+        'name': '홍길동',
+        'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'date': date(2024, 3, 1),
+        'utc': datetime(2024, 3, 1, 9, 30, tzinfo=dt_timezone.utc),
+        'seoul': datetime(2024, 3, 1, 9, 30, 0, 123456, tzinfo=dt_timezone(timedelta(hours=9))),
+        'naive': datetime(2024, 3, 1, 9, 30),
+        'duration': timedelta(minutes=90),
+        'label': gettext_lazy('교회'),
+        'monthly': {1: 10, 2: 20},
+        'note': 'line\u2028break',
+        'items': [{'present': True, 'score': 1.5, 'memo': None}],
+    }
+
+    def test_output_matches_stdlib_renderer(self):
+        assert FastJSONRenderer().render(self.payload) == JSONRenderer().render(self.payload)
+
+    def test_indent_output_matches_stdlib_renderer(self):
+        media_type = 'application/json; indent=2'
+        expected = JSONRenderer().render(self.payload, media_type)
+        assert FastJSONRenderer().render(self.payload, media_type) == expected
+
+    def test_decimal_amounts_are_exact(self):
+        data = {'total_amount': Decimal('12345678901.25'), 'average_amount': Decimal('35000.10')}
+        rendered = json.loads(FastJSONRenderer().render(data), parse_float=Decimal)
+        assert rendered == data
+
+    def test_decimal_beyond_float_precision_is_not_rounded(self):
+        orjson = pytest.importorskip('orjson')
+        if not hasattr(orjson, 'Fragment'):
+            pytest.skip('orjson.Fragment requires orjson 3.9.15+')
+        value = Decimal('1234567890123456789.01')
+        rendered = json.loads(FastJSONRenderer().render({'amount': value}), parse_float=Decimal)
+        assert rendered['amount'] == value
+
+    def test_decimal_beyond_float_precision_is_a_number(self):
+        data = {'amount': Decimal('1234567890123456789.01'), 'items': [Decimal('0.1234567890123456789')]}
+        rendered = json.loads(FastJSONRenderer().render(data))
+        assert isinstance(rendered['amount'], float) and isinstance(rendered['items'][0], float)
+        if not hasattr(renderers.orjson, 'Fragment'):
+            # Fragment가 없으면 stdlib 경로로 처리되어 DRF 출력과 같음
+            assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_parser_matches_stdlib_parser(self):
+        body = JSONRenderer().render(self.payload)
+        expected = JSONParser().parse(io.BytesIO(body))
+        assert FastJSONParser().parse(io.BytesIO(body)) == expected
+
+    def test_parser_rejects_invalid_json(self):
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"name": '))
+
+
+class TestTenantCache:
+    """교회 도메인 버전 캐시 테스트"""
+
+    church_id = 987654
+
+    def test_key_format(self):
+        version = tenant_cache.get_version(self.church_id, 'groups')
+        key = tenant_cache.make_key(self.church_id, ['groups'], 'hierarchy')
+        assert key == f"church:{self.church_id}:groups:v{version}:hierarchy"
+
+    def test_bump_invalidates_only_that_domain(self):
+        groups_key = tenant_cache.make_key(self.church_id, ['groups'], 'params')
+        members_key = tenant_cache.make_key(self.church_id, ['members'], 'params')
+
+        tenant_cache.invalidate(self.church_id, 'groups')
+
+        assert tenant_cache.make_key(self.church_id, ['groups'], 'params') != groups_key
+        assert tenant_cache.make_key(self.church_id, ['members'], 'params') == members_key
+
+    def test_get_or_set_reloads_after_invalidation(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return len(calls)
+
+        assert tenant_cache.get_or_set(self.church_id, ['offerings'], 'total', loader) == 1
+        assert tenant_cache.get_or_set(self.church_id, ['offerings'], 'total', loader) == 1
+        tenant_cache.invalidate(self.church_id, 'offerings')
+        assert tenant_cache.get_or_set(self.church_id, ['offerings'], 'total', loader) == 2
+
+
+@pytest.mark.django_db
+class TestStatsSpec:
+    """선언적 통계 집계 테스트"""
+
+    spec = StatsSpec(
+        'tests.churches',
+        measures={
+            'total': Count('pk'),
+            'active': Count('pk', filter=Q(is_active=True)),
+        },
+        dimensions={
+            'by_denomination': Dimension('denomination', choices=['장로회', '감리회', '침례회']),
+            'active_by_denomination': Dimension(
+                'denomination', filter=Q(is_active=True), as_rows=True, order_by='-count'
+            ),
+            'monthly': TimeBucket('created_at', 'month', extract=True, values=range(1, 13)),
+        },
+        cache_domains=['church'],
+    )
+
+    @pytest.fixture(autouse=True)
+    def churches(self):
+        Church.objects.create(name='가', code='STATS01', denomination='장로회')
+        Church.objects.create(name='나', code='STATS02', denomination='장로회')
+        Church.objects.create(name='다', code='STATS03', denomination='감리회', is_active=False)
+        self.church = Church.objects.first()
+
+    def test_matches_individual_queries(self):
+        stats = self.spec.evaluate(Church.objects.all())
+
+        assert stats['total'] == 3
+        assert stats['active'] == 2
+        assert stats['by_denomination'] == {'장로회': 2, '감리회': 1, '침례회': 0}
+        assert stats['active_by_denomination'] == [{'denomination': '장로회', 'count': 2}]
+        assert stats['monthly'] == [{'month': date.today().month, 'count': 3}]
+
+    def test_conditional_dimensions_share_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.spec.evaluate(Church.objects.all())
+        # 스칼라 지표 + choices/values 차원 1회, GROUP BY 차원 1회
+        assert len(queries) == 2
+
+    def test_cached_until_domain_changes(self):
+        assert self.spec.evaluate(Church.objects.all(), church_id=self.church.id)['total'] == 3
+        with CaptureQueriesContext(connection) as queries:
+            assert self.spec.evaluate(Church.objects.all(), church_id=self.church.id)['total'] == 3
+        assert len(queries) == 0
+
+        self.church.name = '변경'
+        self.church.save()
+        Church.objects.filter(code='STATS03').delete()
+        assert self.spec.evaluate(Church.objects.all(), church_id=self.church.id)['total'] == 2
+
+    def test_different_querysets_do_not_share_cache(self):
+        all_stats = self.spec.evaluate(Church.objects.all(), church_id=self.church.id)
+        active_stats = self.spec.evaluate(Church.objects.filter(is_active=True), church_id=self.church.id)
+        assert all_stats['total'] == 3
+        assert active_stats['total'] == 2
+
+
+@pytest.fixture(scope='class')
+def replica_database(django_db_setup, django_db_blocker):
+    """기본 DB와 분리된 인메모리 SQLite 'replica' 별칭을 추가하고 교회 테이블 생성"""
+    from django.db import connections
+
+    connections.settings['replica'] = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}
+    connections.configure_settings(connections.settings)
+    with django_db_blocker.unblock():
+        with connections['replica'].schema_editor() as schema_editor:
+            schema_editor.create_model(Church)
+    yield
+    with django_db_blocker.unblock():
+        with connections['replica'].schema_editor() as schema_editor:
+            schema_editor.delete_model(Church)
+    del connections.settings['replica']
+
+
+@pytest.mark.usefixtures('replica_database')
+@pytest.mark.django_db(databases=['default', 'replica'])
+class TestReplicaRouting:
+    """
+    복제본 라우팅 테스트
+
+    'replica'를 별도의 인메모리 SQLite 데이터베이스로 추가하므로 기본 DB에 쓴 데이터는
+    복제본에서 보이지 않으며, 이를 이용해 읽기가 어느 DB로 갔는지 확인합니다.
+    """
+
+    class ChurchCountViewSet(db_router.ReplicaReadMixin, viewsets.GenericViewSet):
+        queryset = Church.objects.all()
+
+        def list(self, request):
+            return Response({'count': self.get_queryset().count()})
+
+        @action(detail=False, methods=['get'])
+        def statistics(self, request):
+            return Response({'count': self.get_queryset().count()})
+
+    @pytest.fixture(autouse=True)
+    def setup_router(self, settings):
+        settings.DATABASE_ROUTERS = ['church_core.db_router.ReplicaRouter']
+        Church.objects.create(name='테스트교회', code='REPLICA01')
+        self.user = User.objects.create_user(username='replica', email='replica@example.com', password='pw')
+        cache.delete(db_router.STICKY_KEY.format(user_id=self.user.pk))
+
+    def get_count(self, action_name):
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=self.user)
+        view = self.ChurchCountViewSet.as_view({'get': action_name})
+        return view(request).data['count']
+
+    def test_reads_default_outside_replica_context(self):
+        assert Church.objects.count() == 1
+
+    def test_replica_context_routes_reads(self):
+        with db_router.read_from_replica() as alias:
+            assert alias == 'replica'
+            assert Church.objects.count() == 0
+        assert Church.objects.count() == 1
+
+    def test_analytics_actions_use_replica(self):
+        assert self.get_count('statistics') == 0
+        assert self.get_count('list') == 1
+
+    def test_recent_write_sticks_to_default(self):
+        request = APIRequestFactory().post('/')
+        request.user = self.user
+        db_router.ReplicaStickinessMiddleware(lambda request: Response(status=201))(request)
+
+        with db_router.read_from_replica(self.user) as alias:
+            assert alias == 'default'
+        assert self.get_count('statistics') == 1
+
+
+@pytest.mark.django_db
+class TestPermissionScope:
+    """봉사 권한 범위(.all / .own_group / .own) 목록 필터 테스트"""
+
+    class PrayerViewSet(PermissionScopedQuerysetMixin, viewsets.GenericViewSet):
+        resource_name = 'prayer'
+        permission_classes = [UnifiedPermission]
+
+        def get_queryset(self):
+            return self.apply_permission_scope(Prayer.objects.filter(church_id=self.kwargs['church_id']))
+
+        def list(self, request, church_id=None):
+            return Response(sorted(self.get_queryset().values_list('pk', flat=True)))
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.church = ChurchFactory()
+        self.group = GroupFactory(church=self.church)
+        self.church_user = ChurchUserFactory(church=self.church)
+        self.in_group = PrayerFactory(church=self.church)
+        GroupMemberFactory(group=self.group, member=self.in_group.member)
+        self.own = PrayerFactory(church=self.church, created_by=self.church_user.user)
+        self.other = PrayerFactory(church=self.church)
+
+    def grant(self, *permissions):
+        role = VolunteerRole.objects.create(
+            church=self.church, name='셀 리더', code=f'role{VolunteerRole.objects.count()}',
+            default_permissions=list(permissions),
+        )
+        role.target_groups.add(self.group)
+        VolunteerAssignment.objects.create(church_user=self.church_user, volunteer_role=role)
+
+    def visible(self):
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=self.church_user.user)
+        response = self.PrayerViewSet.as_view({'get': 'list'})(request, church_id=self.church.id)
+        return response.data if response.status_code == 200 else response.status_code
+
+    def test_compile_scope(self):
+        self.grant('prayer.view.own_group', 'prayer.view.own')
+        assignments = list(self.church_user.volunteer_assignments.all())
+
+        scope = compile_permission_scope('prayer.view', self.church_user.user_id, assignments)
+
+        assert (scope.is_all, scope.group_ids, scope.is_own) == (False, {self.group.pk}, True)
+        assert compile_permission_scope('prayer.update', self.church_user.user_id, assignments).is_empty
+
+    def test_all_sees_everything(self):
+        self.grant('prayer.view.all')
+        assert self.visible() == sorted([self.in_group.pk, self.own.pk, self.other.pk])
+
+    def test_own_group_sees_group_members_data(self):
+        self.grant('prayer.view.own_group')
+        assert self.visible() == [self.in_group.pk]
+
+    def test_own_sees_own_data(self):
+        self.grant('prayer.view.own')
+        assert self.visible() == [self.own.pk]
+
+    def test_without_grant_is_denied(self):
+        assert self.visible() == 403
+
+    def can_access_object(self, obj, method='get'):
+        request = getattr(APIRequestFactory(), method)('/')
+        force_authenticate(request, user=self.church_user.user)
+        view = self.PrayerViewSet(action_map={method: 'retrieve'}, kwargs={'church_id': self.church.id}, format_kwarg=None)
+        request = view.initialize_request(request)
+        return UnifiedPermission().has_object_permission(request, view, obj)
+
+    def test_admin_sees_everything(self):
+        self.church_user.role = 'church_admin'
+        self.church_user.save()
+        assert self.visible() == sorted([self.in_group.pk, self.own.pk, self.other.pk])
+        assert self.can_access_object(self.other, 'delete')
+
+    def test_staff_objects_and_list_follow_volunteer_scope(self):
+        # 스태프는 뷰에는 접근하지만 객체/목록은 봉사 권한 범위로 제한
+        self.church_user.role = 'church_staff'
+        self.church_user.save()
+        assert self.visible() == []
+        assert not self.can_access_object(self.other)
+        assert not self.can_access_object(self.other, 'delete')
+
+        self.grant('prayer.view.own')
+        assert self.visible() == [self.own.pk]
+        assert self.can_access_object(self.own)
+        assert not self.can_access_object(self.other)
+
+
+@pytest.mark.django_db
+class TestChurchContext:
+    """요청 단위 교회 컨텍스트 테스트"""
+
+    class PrayerViewSet(church_context.ChurchContextMixin, viewsets.GenericViewSet):
+        permission_classes = [UnifiedPermission]
+
+        def list(self, request, church_id=None):
+            # 권한 검사와 뷰 코드가 같은 컨텍스트를 여러 번 사용
+            assert self.get_church_user() is self.church_context.church_user
+            prayers = self.filter_by_user_churches(Prayer.objects.all())
+            return Response(sorted(prayers.values_list('pk', flat=True)))
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        cache.clear()
+        self.church = ChurchFactory()
+        self.church_user = ChurchUserFactory(church=self.church)
+        self.prayer = PrayerFactory(church=self.church)
+        PrayerFactory()
+        self.loads = []
+        load = church_context.ChurchContext._load_church_user
+        monkeypatch.setattr(
+            church_context.ChurchContext, '_load_church_user',
+            lambda context: self.loads.append(context.church_id) or load(context),
+        )
+
+    def call(self, church_id, user=None):
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=user or self.church_user.user)
+        return self.PrayerViewSet.as_view({'get': 'list'})(request, church_id=church_id)
+
+    def test_church_user_loaded_once_per_request(self):
+        response = self.call(self.church.id)
+
+        assert response.data == [self.prayer.pk]
+        assert self.loads == [self.church.id]
+
+    def test_other_church_is_denied(self):
+        other = ChurchFactory()
+
+        assert self.call(other.id).status_code == 403
+        assert self.loads == [other.id]
+
+    def test_middleware_records_url_church_id(self):
+        request = APIRequestFactory().get('/')
+        request.user = self.church_user.user
+        church_context.ChurchContextMiddleware(lambda request: None).process_view(
+            request, None, (), {'church_id': self.church.id}
+        )
+
+        context = church_context.get_church_context(request)
+        assert context is church_context.get_church_context(request, self.church.id)
+        assert context.church_user == self.church_user
+        assert self.loads == [self.church.id]
+
+
+@pytest.mark.django_db
+class TestPermissionTracing:
+    """권한 판정 추적 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        settings.PERMISSION_TRACING_ENABLED = True
+        cache.clear()
+        permission_tracing.permission_metrics.reset()
+        self.church = ChurchFactory()
+        self.church_user = ChurchUserFactory(church=self.church)
+        role = VolunteerRole.objects.create(
+            church=self.church, name='중보기도', code='prayer', default_permissions=['prayer.view.all'],
+        )
+        VolunteerAssignment.objects.create(church_user=self.church_user, volunteer_role=role)
+        self.middleware = permission_tracing.PermissionTracingMiddleware(lambda request: None)
+
+    def traced_request(self, path='/api/v1/prayers/'):
+        request = APIRequestFactory().get(path)
+        force_authenticate(request, user=self.church_user.user)
+        self.middleware.process_request(request)
+        response = TestPermissionScope.PrayerViewSet.as_view({'get': 'list'})(request, church_id=self.church.id)
+        return request, self.middleware.process_response(request, response)
+
+    def test_records_decisions_and_server_timing(self):
+        request, response = self.traced_request()
+
+        trace = permission_tracing.get_request_trace(request)
+        assert [decision['check'] for decision in trace.decisions] == ['has_permission']
+        assert trace.decisions[0]['permission'] == 'prayer.view'
+        assert trace.decisions[0]['allowed'] is True
+        assert trace.total_queries >= 1
+        timing = response['Server-Timing']
+        assert timing.startswith('perm;dur=') and ', perm-db;dur=' in timing
+
+    def test_disabled_outside_api_and_by_default(self, settings):
+        request, response = self.traced_request('/admin/')
+        assert permission_tracing.get_request_trace(request) is None
+        assert 'Server-Timing' not in response
+
+        settings.PERMISSION_TRACING_ENABLED = False
+        request, response = self.traced_request()
+        assert permission_tracing.get_request_trace(request) is None
+
+    def test_metrics_view_aggregates_and_resets(self):
+        self.traced_request()
+        self.traced_request()
+        admin = User.objects.create_user(username='metrics', email='metrics@example.com', password='pw', is_staff=True)
+        view = permission_tracing.PermissionMetricsView.as_view()
+
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=admin)
+        paths = view(request).data['paths']
+        assert paths['PrayerViewSet.has_permission']['count'] == 2
+        assert paths['PrayerViewSet.has_permission']['allowed'] == 2
+
+        request = APIRequestFactory().delete('/')
+        force_authenticate(request, user=admin)
+        assert view(request).status_code == 204
+        assert permission_tracing.permission_metrics.snapshot()['paths'] == {}
+
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=self.church_user.user)
+        assert view(request).status_code == 403
+
+
+@pytest.mark.django_db
+class TestRequestProfiling:
+    """요청 단위 SQL 예산 / Server-Timing 계측 테스트"""
+
+    class PrayerSerializer(serializers.ModelSerializer):
+        class Meta:
+            model = Prayer
+            fields = ['id', 'title']
+
+    class PlainPrayerViewSet(viewsets.GenericViewSet):
+        queryset = Prayer.objects.order_by('pk')
+        permission_classes = []
+        authentication_classes = []
+
+        def get_serializer_class(self):
+            return TestRequestProfiling.PrayerSerializer
+
+        def list(self, request, *args, **kwargs):
+            return Response(self.get_serializer(self.get_queryset(), many=True).data)
+
+    class PrayerViewSet(SerializerTimingMixin, PlainPrayerViewSet):
+        pass
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        settings.REQUEST_PROFILING_ENABLED = True
+        settings.QUERY_BUDGET_DEFAULT = None
+        settings.QUERY_BUDGET_MODE = 'log'
+        request_profiling.request_metrics.reset()
+        PrayerFactory.create_batch(3)
+
+    def profiled_request(self, path='/api/v1/prayers/', viewset=None):
+        middleware = request_profiling.RequestProfilingMiddleware(None)
+        view = (viewset or self.PrayerViewSet).as_view({'get': 'list'})
+
+        def get_response(request):
+            # Django 핸들러의 미들웨어 훅 순서 재현
+            middleware.process_view(request, view, (), {})
+            response = middleware.process_template_response(request, view(request))
+            return response.render()
+
+        middleware.get_response = get_response
+        request = APIRequestFactory().get(path)
+        return request, middleware(request)
+
+    def test_server_timing_reports_queries_and_phases(self):
+        request, response = self.profiled_request()
+
+        assert len(response.data) == 3
+        profile = request._request_profile
+        assert profile.query_count == 1
+        assert profile.serializer_ms > 0
+        entries = [entry.split(';')[0] for entry in response['Server-Timing'].split(', ')]
+        assert entries == ['db', 'view', 'serialize', 'total']
+        assert 'db;dur=' in response['Server-Timing'] and 'desc="1 queries"' in response['Server-Timing']
+
+    def test_serializer_time_only_for_views_with_mixin(self):
+        request, response = self.profiled_request(viewset=self.PlainPrayerViewSet)
+
+        assert request._request_profile.serializer_ms is None
+        assert 'serialize;' not in response['Server-Timing']
+        stats = request_profiling.request_metrics.snapshot()['/api/v1/prayers/']
+        assert stats['serializer_ms']['count'] == 0
+        assert stats['queries']['count'] == 1
+
+    def test_serializer_classes_are_not_patched(self):
+        self.profiled_request()
+        assert 'to_representation' not in vars(self.PrayerSerializer)
+        assert serializers.ListSerializer.to_representation.__module__ == 'rest_framework.serializers'
+
+    def test_disabled_outside_api_and_by_default(self, settings):
+        request, response = self.profiled_request('/admin/')
+        assert not hasattr(request, '_request_profile')
+        assert 'Server-Timing' not in response
+
+        settings.REQUEST_PROFILING_ENABLED = False
+        settings.DEBUG = False
+        request, response = self.profiled_request()
+        assert 'Server-Timing' not in response
+
+    def test_query_budget_logs_by_default(self, settings, caplog):
+        settings.QUERY_BUDGET_DEFAULT = 0
+
+        with caplog.at_level('WARNING', logger='church_core.request_profiling'):
+            self.profiled_request()
+
+        assert 'Query budget exceeded for GET /api/v1/prayers/: 1 queries (budget 0)' in caplog.text
+        assert request_profiling.request_metrics.snapshot()['/api/v1/prayers/']['over_budget'] == 1
+
+    def test_query_budget_raise_mode(self, settings):
+        settings.QUERY_BUDGET_MODE = 'raise'
+        settings.QUERY_BUDGET_DEFAULT = 1
+        self.profiled_request()
+
+        settings.QUERY_BUDGET_DEFAULT = 0
+        with pytest.raises(QueryBudgetExceeded):
+            self.profiled_request()
+
+    def test_metrics_view_aggregates_and_resets(self):
+        self.profiled_request()
+        self.profiled_request()
+        admin = User.objects.create_user(username='requests', email='requests@example.com', password='pw', is_staff=True)
+        view = request_profiling.RequestMetricsView.as_view()
+
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=admin)
+        stats = view(request).data['/api/v1/prayers/']
+        assert stats['duration_ms']['count'] == 2
+        assert stats['queries']['avg'] == 1
+        assert stats['queries']['buckets']['le_1'] == 2
+
+        request = APIRequestFactory().delete('/')
+        force_authenticate(request, user=admin)
+        assert view(request).status_code == 204
+        assert request_profiling.request_metrics.snapshot() == {}
+
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=ChurchUserFactory().user)
+        assert view(request).status_code == 403
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """조건부 GET (ETag) 테스트 - 관련 테이블 도메인 버전 반영"""
+
+    class GroupViewSet(ConditionalGetMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+        # groups.views.GroupViewSet과 같은 직렬화기/도메인 구성
+        conditional_domains = ('groups', 'members')
+        pagination_class = None
+
+        def get_queryset(self):
+            from groups.models import Group
+            return Group.objects.filter(church__in=self.request.user.church_users.values('church')).order_by('pk')
+
+        def get_serializer_class(self):
+            from groups.serializers import GroupDetailSerializer, GroupListSerializer
+            return GroupListSerializer if self.action == 'list' else GroupDetailSerializer
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.church = ChurchFactory()
+        self.user = ChurchUserFactory(church=self.church).user
+        self.leader = MemberFactory(church=self.church)
+        self.group = GroupFactory(church=self.church, leader=self.leader)
+        GroupMemberFactory(group=self.group)
+
+    def call(self, action, etag=None, **kwargs):
+        request = APIRequestFactory().get('/api/v1/groups/')
+        if etag:
+            request.META['HTTP_IF_NONE_MATCH'] = etag
+        force_authenticate(request, user=self.user)
+        return self.GroupViewSet.as_view({'get': action})(request, **kwargs)
+
+    def test_list_returns_304_until_groups_change(self):
+        response = self.call('list')
+        assert response.status_code == 200
+        etag = response['ETag']
+
+        assert self.call('list', etag=etag).status_code == 304
+
+        GroupFactory(church=self.church)
+        assert self.call('list', etag=etag).status_code == 200
+
+    def test_added_group_member_invalidates_list_and_detail(self):
+        from groups.models import GroupMember
+
+        list_etag = self.call('list')['ETag']
+        detail = self.call('retrieve', pk=self.group.pk)
+        # 관련 테이블 변경은 updated_at을 바꾸지 않으므로 Last-Modified를 보내지 않음
+        assert 'Last-Modified' not in detail
+        assert self.call('retrieve', etag=detail['ETag'], pk=self.group.pk).status_code == 304
+
+        # GroupViewSet.add_member와 같은 쓰기 (Group.updated_at은 그대로)
+        GroupMember.objects.create(group=self.group, member=MemberFactory(church=self.church), role='member')
+
+        response = self.call('list', etag=list_etag)
+        assert response.status_code == 200
+        assert response.data[0]['member_count'] == 2
+        response = self.call('retrieve', etag=detail['ETag'], pk=self.group.pk)
+        assert response.status_code == 200
+        assert len(response.data['group_members']) == 2
+
+    def test_removed_group_member_invalidates_detail(self):
+        etag = self.call('retrieve', pk=self.group.pk)['ETag']
+
+        self.group.group_members.get().delete()
+
+        response = self.call('retrieve', etag=etag, pk=self.group.pk)
+        assert response.status_code == 200
+        assert response.data['group_members'] == []
+
+    def test_leader_rename_invalidates_list(self):
+        etag = self.call('list')['ETag']
+
+        self.leader.name = '새 그룹장'
+        self.leader.save()
+
+        response = self.call('list', etag=etag)
+        assert response.status_code == 200
+        assert response.data[0]['leader_name'] == '새 그룹장'
+
+    def test_other_church_changes_keep_304(self):
+        etag = self.call('list')['ETag']
+
+        GroupMemberFactory(group=GroupFactory(church=ChurchFactory()))
+
+        assert self.call('list', etag=etag).status_code == 304
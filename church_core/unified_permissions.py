@@ -2,8 +2,10 @@
 통합 권한 시스템 - 모든 권한 체크를 하나로 통합
 """
 from rest_framework import permissions
-from django.core.cache import cache
-from django.db.models import Q
+from church_core.permission_scope import get_cached_permission_scope
+from church_core.church_context import get_church_context, load_active_assignments
+from church_core.permission_tracing import traced_permission, trace_cache
+from church_core.tenant_cache import get_or_set
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,7 @@ class UnifiedPermission(permissions.BasePermission):
     6. 개인 권한: 본인 데이터에 대한 권한
     """
 
+    @traced_permission('has_permission')
     def has_permission(self, request, view):
         """뷰 레벨 권한 체크"""
         if not request.user or not request.user.is_authenticated:
@@ -35,7 +38,7 @@ class UnifiedPermission(permissions.BasePermission):
             # 교회 컨텍스트가 없는 API는 개별적으로 처리
             return True 
 
-        church_user = self._get_church_user(request.user, church_id)
+        church_user = self._get_church_user(request, church_id)
         if not church_user or not church_user.is_active:
             return False
 
@@ -50,6 +53,7 @@ class UnifiedPermission(permissions.BasePermission):
 
         return self._has_volunteer_permission(church_user, required_permission)
 
+    @traced_permission('has_object_permission')
     def has_object_permission(self, request, view, obj):
         """객체 레벨 권한 체크"""
         if not request.user or not request.user.is_authenticated:
@@ -62,10 +66,11 @@ class UnifiedPermission(permissions.BasePermission):
         if not church_id:
             return False
 
-        church_user = self._get_church_user(request.user, church_id)
+        church_user = self._get_church_user(request, church_id)
         if not church_user or not church_user.is_active:
             return False
 
+        # 객체 단위로는 교회 관리자만 제한 없이 접근 (스태프는 봉사 권한 범위 적용)
         if church_user.is_admin:
             return True
 
@@ -92,19 +97,11 @@ class UnifiedPermission(permissions.BasePermission):
             return obj.program.church.id
         return None
 
-    def _get_church_user(self, user, church_id):
-        """사용자의 교회별 정보 조회 (캐싱)"""
-        cache_key = f"church_user_{user.id}_{church_id}"
-        church_user = cache.get(cache_key)
-        if church_user is None:
-            try:
-                church_user = user.church_users.select_related('church').get(
-                    church_id=church_id, is_active=True
-                )
-                cache.set(cache_key, church_user, 300)  # 5분 캐싱
-            except user.church_users.model.DoesNotExist:
-                church_user = None
-        return church_user
+    def _get_church_user(self, request, church_id):
+        """사용자의 교회별 정보 조회 (요청 단위 교회 컨텍스트 재사용)"""
+        context = get_church_context(request, church_id)
+        trace_cache('church_user', context.is_loaded)
+        return context.church_user
 
     def _get_required_permission(self, view, method):
         """뷰와 HTTP 메서드에 따른 필요 권한 문자열 생성"""
@@ -134,69 +131,60 @@ class UnifiedPermission(permissions.BasePermission):
         return False
 
     def _has_volunteer_object_permission(self, church_user, permission_base, obj):
-        """봉사 기반 객체 권한 확인"""
-        assignments = self._get_user_assignments(church_user)
+        """봉사 기반 객체 권한 확인 (컴파일된 권한 범위 재사용)"""
+        scope = self._get_permission_scope(church_user, permission_base)
+        return scope.allows(obj)
+
+    def _get_permission_scope(self, church_user, permission_base):
+        """권한 범위 조회 (target_groups ID를 미리 계산하여 캐싱)"""
+        return get_cached_permission_scope(
+            church_user, permission_base, self._get_user_assignments
+        )
+
+    def get_permission_scope(self, request, view):
+        """
+        목록 쿼리셋에 적용할 권한 범위 반환
+
+        has_object_permission과 같은 규칙을 따르며, 제한이 필요 없는 경우
+        (슈퍼유저, 교회 관리자, 권한이 정의되지 않은 뷰) None을 반환합니다.
+        결과는 요청 단위로 메모이즈됩니다.
+        """
+        if not request.user or not request.user.is_authenticated:
+            return None
+        if request.user.is_superuser:
+            return None
 
-        for assignment in assignments:
-            permissions = assignment.all_permissions
-            
-            # 전체 권한
-            if f"{permission_base}.all" in permissions or f"{self._get_resource_from_permission(permission_base)}.manage.all" in permissions:
-                return True
+        church_id = self._get_church_id(request, view)
+        required_permission = self._get_required_permission(view, request.method)
+        if not church_id or not required_permission:
+            return None
 
-            # 그룹 권한
-            if f"{permission_base}.own_group" in permissions or f"{self._get_resource_from_permission(permission_base)}.manage.own_group" in permissions:
-                if self._is_group_data(obj, assignment):
-                    return True
-            
-            # 개인 권한
-            if f"{permission_base}.own" in permissions:
-                if self._is_own_data(obj, church_user):
-                    return True
-        
-        return False
+        memo = request.__dict__.setdefault('_permission_scopes', {})
+        memo_key = (str(church_id), required_permission)
+        if memo_key not in memo:
+            church_user = self._get_church_user(request, church_id)
+            if not church_user or not church_user.is_active:
+                scope = None
+            elif church_user.is_admin:
+                scope = None
+            else:
+                scope = self._get_permission_scope(church_user, required_permission)
+            memo[memo_key] = scope
+        return memo[memo_key]
 
     def _get_user_assignments(self, church_user):
-        """사용자의 활성 봉사 할당 목록 조회 (캐싱)"""
-        cache_key = f"volunteer_assignments_{church_user.id}"
-        assignments = cache.get(cache_key)
-        if assignments is None:
-            assignments = list(church_user.volunteer_assignments.filter(
-                is_active=True
-            ).select_related('volunteer_role').prefetch_related('volunteer_role__target_groups'))
-            cache.set(cache_key, assignments, 300)
+        """사용자의 활성 봉사 할당 목록 조회 (요청 내 메모이즈 + 캐싱)"""
+        if hasattr(church_user, 'active_assignments'):
+            trace_cache('assignments', True)
+            return church_user.active_assignments
+
+        assignments = get_or_set(
+            church_user.church_id, ['permissions'], f"assignments:{church_user.id}",
+            lambda: load_active_assignments(church_user), timeout=300, trace_name='assignments',
+        )
+        church_user.active_assignments = assignments
         return assignments
 
-    def _is_own_data(self, obj, church_user):
-        """본인 데이터인지 확인"""
-        if hasattr(obj, 'created_by') and obj.created_by == church_user.user:
-            return True
-        if hasattr(obj, 'user') and obj.user == church_user.user:
-            return True
-        if hasattr(obj, 'member') and hasattr(obj.member, 'user') and obj.member.user == church_user.user:
-            return True
-        return False
-
-    def _is_group_data(self, obj, assignment):
-        """담당 그룹의 데이터인지 확인"""
-        target_groups = assignment.volunteer_role.target_groups.all()
-        if not target_groups.exists():
-            return False
-
-        if hasattr(obj, 'group') and obj.group in target_groups:
-            return True
-        
-        if hasattr(obj, 'member') and obj.member.groups.filter(pk__in=target_groups.values('pk')).exists():
-            return True
-
-        if hasattr(obj, 'groups') and obj.groups.filter(pk__in=target_groups.values('pk')).exists():
-            return True
-
-        return False
-    
-    def _get_resource_from_permission(self, permission_base):
-        return permission_base.split('.')[0]
-
 
 # 편의 클래스
 class ReadOnly(UnifiedPermission):
@@ -4,6 +4,8 @@ URL configuration for church_core project.
 from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from church_core.permission_tracing import PermissionMetricsView
+from church_core.request_profiling import RequestMetricsView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -11,6 +13,10 @@ urlpatterns = [
     # API v1 Routes
     path('api/v1/', include('church_core.api_urls')),
 
+    # 내부 메트릭
+    path('api/metrics/permissions/', PermissionMetricsView.as_view(), name='permission-metrics'),
+    path('api/metrics/requests/', RequestMetricsView.as_view(), name='request-metrics'),
+
     # API Schema & Docs
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import EducationProgram, EducationRegistration
+from church_core.church_context import get_church_context
 from members.serializers import MemberSerializer
 
 
@@ -71,7 +72,7 @@ class EducationProgramDetailSerializer(serializers.ModelSerializer):
         if request and hasattr(request, 'user'):
             # 관리자만 등록 목록 볼 수 있음
             try:
-                church_user = request.user.church_users.get(church_id=obj.church_id)
+                church_user = get_church_context(request, obj.church_id).church_user
                 if church_user.role in ['CHURCH_ADMIN', 'CHURCH_STAFF'] or request.user.is_superuser:
                     registrations = obj.educationregistration_set.select_related('member').all()
                     return [{
@@ -14,9 +14,12 @@ from .serializers import (
     EducationRegistrationCreateSerializer
 )
 from church_core.unified_permissions import UnifiedPermission
+from church_core.church_context import ChurchContextMixin
+from church_core.permission_scope import PermissionScopedQuerysetMixin
+from church_core.db_router import ReplicaReadMixin
 
 
-class EducationProgramViewSet(viewsets.ModelViewSet):
+class EducationProgramViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """교육 프로그램 관리 API ViewSet"""
     resource_name = 'educationprogram'
     queryset = EducationProgram.objects.all()
@@ -119,7 +122,7 @@ class EducationProgramViewSet(viewsets.ModelViewSet):
         
         # 사용자의 교회 멤버 정보 가져오기
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
@@ -153,7 +156,7 @@ class EducationProgramViewSet(viewsets.ModelViewSet):
         
         # 사용자의 교회 멤버 정보 가져오기
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
@@ -180,7 +183,7 @@ class EducationProgramViewSet(viewsets.ModelViewSet):
         return Response({"detail": "등록이 취소되었습니다."})
 
 
-class EducationRegistrationViewSet(viewsets.ModelViewSet):
+class EducationRegistrationViewSet(ChurchContextMixin, PermissionScopedQuerysetMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """교육 등록 관리 API ViewSet"""
     resource_name = 'educationregistration'
     queryset = EducationRegistration.objects.all()
@@ -199,8 +202,8 @@ class EducationRegistrationViewSet(viewsets.ModelViewSet):
             'program', 'member'
         )
         
-        # UnifiedPermission이 객체 수준 권한을 처리하므로, 수동 필터링 제거
-        return queryset
+        # UnifiedPermission의 권한 범위(.all/.own_group/.own)를 쿼리셋에 적용
+        return self.apply_permission_scope(queryset)
 
     def get_serializer_class(self):
         """액션별 시리얼라이저 선택"""
@@ -210,9 +213,8 @@ class EducationRegistrationViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """교육 등록 생성 시 멤버 정보 자동 설정"""
-        church_id = self.kwargs.get('church_id')
         try:
-            church_user = self.request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
             serializer.save(member=member)
         except:
@@ -224,7 +226,7 @@ class EducationRegistrationViewSet(viewsets.ModelViewSet):
     def my_registrations(self, request, church_id=None):
         """내 교육 등록 목록"""
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
@@ -3,20 +3,51 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Q
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from .models import Group, GroupMember
 from .serializers import (
     GroupSerializer, GroupListSerializer, GroupCreateSerializer,
     GroupDetailSerializer, GroupStatsSerializer, GroupMemberSerializer
 )
 from church_core.roles import SystemRole, Permission
+from church_core.conditional import ConditionalGetMixin
+from church_core.tenant_cache import tenant_cached
+from church_core.church_context import ChurchContextMixin
+from church_core.db_router import ReplicaReadMixin
+from church_core.request_profiling import SerializerTimingMixin
+from church_core.stats import Dimension, StatsSpec
 from users.models import ChurchUser
 
 
-class GroupViewSet(viewsets.ModelViewSet):
+GROUP_STATS = StatsSpec(
+    'groups.statistics',
+    annotations={
+        # 그룹별 활성 인원 (Group.member_count와 동일)
+        'active_member_count': Coalesce(Subquery(
+            GroupMember.objects.filter(group=OuterRef('pk'), is_active=True)
+            .order_by().values('group').annotate(count=Count('pk')).values('count')
+        ), 0),
+    },
+    measures={
+        'total_groups': Count('pk'),
+        'active_groups': Count('pk', filter=Q(is_active=True)),
+        'total_members': Coalesce(Sum('active_member_count'), 0),
+        'full_groups': Count('pk', filter=Q(max_members__gt=0, active_member_count__gte=F('max_members'))),
+    },
+    dimensions={
+        'group_types': Dimension('group_type', choices=Group.GroupType),
+    },
+    cache_domains=['groups', 'members'],
+)
+
+
+class GroupViewSet(ChurchContextMixin, ConditionalGetMixin, ReplicaReadMixin, SerializerTimingMixin, viewsets.ModelViewSet):
     """그룹 관리 API ViewSet"""
     queryset = Group.objects.all()
     permission_classes = [IsAuthenticated]
+    # 그룹 멤버 수/구성원, 그룹장 이름 등 관련 테이블 변경도 ETag에 반영
+    conditional_domains = ('groups', 'members')
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['group_type', 'management_type', 'is_active', 'parent_group']
     search_fields = ['name', 'code', 'description', 'leader__name']
@@ -37,18 +68,13 @@ class GroupViewSet(viewsets.ModelViewSet):
         return GroupSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        if user.is_superuser:
-            return self.queryset
-        
         # 사용자가 속한 교회의 그룹만 조회
-        user_churches = user.church_users.values_list('church', flat=True)
-        return self.queryset.filter(church__in=user_churches)
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
         """그룹 생성 시 추가 처리"""
         # 교회 정보 자동 설정
-        church_user = self.request.user.church_users.first()
+        church_user = self.get_church_user()
         if church_user:
             serializer.save(church=church_user.church, created_by=self.request.user)
         else:
@@ -60,7 +86,7 @@ class GroupViewSet(viewsets.ModelViewSet):
         if user.is_superuser:
             return True
         
-        church_user = user.church_users.first()
+        church_user = self.get_church_user()
         if church_user:
             return church_user.has_permission(permission_name)
         return False
@@ -199,56 +225,49 @@ class GroupViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'])
-    def hierarchy(self, request):
+    @tenant_cached('groups', 'members')
+    def hierarchy(self, request, church_id=None):
         """그룹 계층 구조 조회"""
         queryset = self.get_queryset().filter(is_active=True)
-        root_groups = queryset.filter(parent_group=None)
-        
-        def build_hierarchy(groups):
+        if church_id is not None:
+            queryset = queryset.filter(church_id=church_id)
+
+        # 한 번의 조회로 상위 그룹별 하위 그룹 목록 구성
+        children = {}
+        for group in queryset.select_related('parent_group', 'leader'):
+            children.setdefault(group.parent_group_id, []).append(group)
+
+        def build_hierarchy(parent_id):
             result = []
-            for group in groups:
+            for group in children.get(parent_id, []):
                 group_data = GroupListSerializer(group).data
-                sub_groups = queryset.filter(parent_group=group)
-                if sub_groups.exists():
-                    group_data['children'] = build_hierarchy(sub_groups)
+                if group.pk in children:
+                    group_data['children'] = build_hierarchy(group.pk)
                 result.append(group_data)
             return result
-        
-        hierarchy = build_hierarchy(root_groups)
+
+        hierarchy = build_hierarchy(None)
         return Response(hierarchy)
     
     @action(detail=False, methods=['get'])
-    def statistics(self, request):
+    def statistics(self, request, church_id=None):
         """그룹 통계"""
         queryset = self.get_queryset()
+        if church_id is not None:
+            queryset = queryset.filter(church_id=church_id)
+        stats = GROUP_STATS.evaluate(queryset, church_id=church_id)
         
-        # 기본 통계
-        total_groups = queryset.count()
-        active_groups = queryset.filter(is_active=True).count()
-        
-        # 그룹 유형별 통계
-        group_types = {}
-        for group_type in Group.GroupType.values:
-            group_types[group_type] = queryset.filter(group_type=group_type).count()
-        
-        # 멤버 관련 통계
-        total_members = GroupMember.objects.filter(
-            group__in=queryset,
-            is_active=True
-        ).count()
-        
+        active_groups = stats['active_groups']
+        total_members = stats['total_members']
         avg_members_per_group = total_members / active_groups if active_groups > 0 else 0
         
-        # 정원 초과 그룹 수
-        full_groups = sum(1 for group in queryset if group.is_full)
-        
         return Response({
-            'total_groups': total_groups,
+            'total_groups': stats['total_groups'],
             'active_groups': active_groups,
-            'group_types': group_types,
+            'group_types': stats['group_types'],
             'total_members': total_members,
             'avg_members_per_group': round(avg_members_per_group, 2),
-            'full_groups': full_groups
+            'full_groups': stats['full_groups']
         })
     
     @action(detail=False, methods=['post'])
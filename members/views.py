@@ -13,13 +13,19 @@ from .serializers import (
     FamilyRelationshipListSerializer, FamilyTreeSerializer, FamilyTreeCreateSerializer
 )
 from church_core.roles import SystemRole, Permission
+from church_core.church_context import ChurchContextMixin
+from church_core.conditional import ConditionalGetMixin
+from church_core.db_router import ReplicaReadMixin
+from church_core.request_profiling import SerializerTimingMixin
 from users.models import ChurchUser
 
 
-class MemberViewSet(viewsets.ModelViewSet):
+class MemberViewSet(ChurchContextMixin, ConditionalGetMixin, ReplicaReadMixin, SerializerTimingMixin, viewsets.ModelViewSet):
     """교인 관리 API ViewSet"""
     queryset = Member.objects.all()
     permission_classes = [IsAuthenticated]
+    # 가족 구성원, 소속 그룹 등 관련 테이블 변경도 ETag에 반영
+    conditional_domains = ('members', 'groups')
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'gender', 'position', 'is_active', 'household']
     search_fields = ['name', 'member_code', 'phone', 'email', 'address']
@@ -40,13 +46,8 @@ class MemberViewSet(viewsets.ModelViewSet):
         return MemberSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        if user.is_superuser:
-            return self.queryset
-        
         # 사용자가 속한 교회의 교인만 조회
-        user_churches = user.church_users.values_list('church', flat=True)
-        return self.queryset.filter(church__in=user_churches)
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
         """교인 생성 시 추가 처리"""
@@ -58,7 +59,7 @@ class MemberViewSet(viewsets.ModelViewSet):
         if user.is_superuser:
             return True
         
-        church_user = user.church_users.first()
+        church_user = self.get_church_user()
         if church_user:
             return church_user.has_permission(permission_name)
         return False
@@ -283,7 +284,7 @@ class MemberViewSet(viewsets.ModelViewSet):
         return Response(summary)
 
 
-class FamilyRelationshipViewSet(viewsets.ModelViewSet):
+class FamilyRelationshipViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """가족 관계 관리 ViewSet"""
     queryset = FamilyRelationship.objects.all()
     permission_classes = [IsAuthenticated]
@@ -300,23 +301,10 @@ class FamilyRelationshipViewSet(viewsets.ModelViewSet):
         return FamilyRelationshipSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -350,7 +338,7 @@ class FamilyRelationshipViewSet(viewsets.ModelViewSet):
         })
 
 
-class FamilyTreeViewSet(viewsets.ModelViewSet):
+class FamilyTreeViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """가족 계보 관리 ViewSet"""
     queryset = FamilyTree.objects.all()
     permission_classes = [IsAuthenticated]
@@ -365,23 +353,10 @@ class FamilyTreeViewSet(viewsets.ModelViewSet):
         return FamilyTreeSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Offering
+from church_core.church_context import get_church_context
 from members.serializers import MemberSerializer
 from users.serializers import UserSerializer
 
@@ -33,7 +34,7 @@ class OfferingListSerializer(serializers.ModelSerializer):
         try:
             church_id = self.context.get('church_id')
             if church_id:
-                church_user = request.user.church_users.get(church_id=church_id)
+                church_user = get_church_context(request, church_id).church_user
                 return church_user.role in ['CHURCH_ADMIN', 'CHURCH_STAFF']
         except:
             pass
@@ -72,7 +73,7 @@ class OfferingDetailSerializer(serializers.ModelSerializer):
         try:
             church_id = self.context.get('church_id')
             if church_id:
-                church_user = request.user.church_users.get(church_id=church_id)
+                church_user = get_church_context(request, church_id).church_user
                 return church_user.role in ['CHURCH_ADMIN', 'CHURCH_STAFF']
         except:
             pass
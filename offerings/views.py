@@ -7,6 +7,7 @@ from django.db.models import Count, Sum, Avg, Q
 from django.db.models.functions import TruncMonth, TruncYear
 from decimal import Decimal
 from datetime import date, timedelta
+from dateutil.relativedelta import relativedelta
 from .models import Offering
 from .serializers import (
     OfferingListSerializer,
@@ -16,9 +17,32 @@ from .serializers import (
     OfferingStatisticsSerializer
 )
 from church_core.unified_permissions import UnifiedPermission
+from church_core.db_router import ReplicaReadMixin
+from church_core.request_profiling import SerializerTimingMixin
+from reports import rollups
+from reports.models import MetricRollup
 
 
-class OfferingViewSet(viewsets.ModelViewSet):
+def _rollup_summary(total):
+    """집계 합계 -> 총액/건수/평균"""
+    amount = Decimal(total['value'])
+    return {
+        'total_amount': amount if total['count'] else Decimal('0.00'),
+        'total_count': total['count'],
+        'average_amount': (amount / total['count']).quantize(Decimal('0.01')) if total['count'] else Decimal('0.00')
+    }
+
+
+def _type_statistics(total):
+    """헌금 유형별 총액/건수 (총액 내림차순)"""
+    rows = [
+        {'offering_type': offering_type, 'total_amount': item['value'], 'count': item['count']}
+        for offering_type, item in total['breakdown'].items()
+    ]
+    return sorted(rows, key=lambda row: row['total_amount'], reverse=True)
+
+
+class OfferingViewSet(ReplicaReadMixin, SerializerTimingMixin, viewsets.ModelViewSet):
     """헌금 관리 API ViewSet"""
     resource_name = 'offering'
     queryset = Offering.objects.all()
@@ -120,47 +144,27 @@ class OfferingViewSet(viewsets.ModelViewSet):
         try:
             year = int(year)
             month = int(month)
+            start = date(year, month, 1)
         except ValueError:
             return Response(
                 {"detail": "올바른 연도와 월을 입력해주세요."}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        queryset = self.get_queryset().filter(
-            date__year=year,
-            date__month=month
-        )
-        
-        # 월별 통계
-        monthly_stats = queryset.aggregate(
-            total_amount=Sum('amount'),
-            total_count=Count('id'),
-            average_amount=Avg('amount')
-        )
-        
-        # 헌금 유형별 통계
-        type_stats = queryset.values('offering_type').annotate(
-            total_amount=Sum('amount'),
-            count=Count('id')
-        ).order_by('-total_amount')
-        
-        # 일별 통계
-        daily_stats = queryset.values('date').annotate(
-            total_amount=Sum('amount'),
-            count=Count('id')
-        ).order_by('date')
-        
-        # None 값 처리
-        for key, value in monthly_stats.items():
-            if value is None:
-                monthly_stats[key] = Decimal('0.00') if 'amount' in key else 0
+        # 지표 집계(MetricRollup)에서 읽음 (집계 전인 날짜만 원본에서 집계)
+        end = start + relativedelta(months=1) - timedelta(days=1)
+        daily = rollups.series(church_id, MetricRollup.Metric.OFFERINGS, 'day', start, end)
+        total = rollups.combine(daily)
         
         return Response({
             'year': year,
             'month': month,
-            'summary': monthly_stats,
-            'type_statistics': list(type_stats),
-            'daily_statistics': list(daily_stats)
+            'summary': _rollup_summary(total),
+            'type_statistics': _type_statistics(total),
+            'daily_statistics': [
+                {'date': row['period_start'], 'total_amount': row['value'], 'count': row['count']}
+                for row in daily if row['count']
+            ]
         })
 
     @action(detail=False, methods=['get'])
@@ -171,45 +175,26 @@ class OfferingViewSet(viewsets.ModelViewSet):
         
         try:
             year = int(year)
+            date(year, 1, 1)
         except ValueError:
             return Response(
                 {"detail": "올바른 연도를 입력해주세요."}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        queryset = self.get_queryset().filter(date__year=year)
-        
-        # 연도별 통계
-        yearly_stats = queryset.aggregate(
-            total_amount=Sum('amount'),
-            total_count=Count('id'),
-            average_amount=Avg('amount')
+        monthly = rollups.series(
+            church_id, MetricRollup.Metric.OFFERINGS, 'month', date(year, 1, 1), date(year, 12, 31)
         )
-        
-        # 월별 통계
-        monthly_stats = queryset.annotate(
-            month=TruncMonth('date')
-        ).values('month').annotate(
-            total_amount=Sum('amount'),
-            count=Count('id')
-        ).order_by('month')
-        
-        # 헌금 유형별 통계
-        type_stats = queryset.values('offering_type').annotate(
-            total_amount=Sum('amount'),
-            count=Count('id')
-        ).order_by('-total_amount')
-        
-        # None 값 처리
-        for key, value in yearly_stats.items():
-            if value is None:
-                yearly_stats[key] = Decimal('0.00') if 'amount' in key else 0
+        total = rollups.combine(monthly)
         
         return Response({
             'year': year,
-            'summary': yearly_stats,
-            'monthly_statistics': list(monthly_stats),
-            'type_statistics': list(type_stats)
+            'summary': _rollup_summary(total),
+            'monthly_statistics': [
+                {'month': row['period_start'], 'total_amount': row['value'], 'count': row['count']}
+                for row in monthly if row['count']
+            ],
+            'type_statistics': _type_statistics(total)
         })
 
     @action(detail=False, methods=['get'])
@@ -12,10 +12,32 @@ from .serializers import (
     PrayerGroupSerializer, PrayerGroupListSerializer, PrayerGroupMemberSerializer
 )
 from church_core.roles import SystemRole, Permission
+from church_core.church_context import ChurchContextMixin
+from church_core.db_router import ReplicaReadMixin
+from church_core.request_profiling import SerializerTimingMixin
+from church_core.stats import Dimension, StatsSpec
 from users.models import ChurchUser
 
 
-class PrayerViewSet(viewsets.ModelViewSet):
+PRAYER_STATS = StatsSpec(
+    'prayers.statistics',
+    measures={
+        'total_prayers': Count('pk'),
+        'active_prayers': Count('pk', filter=Q(status=Prayer.Status.ACTIVE)),
+        'answered_prayers': Count('pk', filter=Q(status=Prayer.Status.ANSWERED)),
+        'overdue_prayers': lambda: Count(
+            'pk', filter=Q(status=Prayer.Status.ACTIVE, target_date__lt=date.today())
+        ),
+    },
+    dimensions={
+        'prayer_types': Dimension('prayer_type', choices=Prayer.PrayerType, include_empty=False),
+        'priority_stats': Dimension('priority', choices=Prayer.Priority, include_empty=False),
+    },
+    cache_domains=['prayers'],
+)
+
+
+class PrayerViewSet(ChurchContextMixin, ReplicaReadMixin, SerializerTimingMixin, viewsets.ModelViewSet):
     """기도제목 관리 API ViewSet"""
     queryset = Prayer.objects.all()
     permission_classes = [IsAuthenticated]
@@ -40,22 +62,12 @@ class PrayerViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            # 사용자가 속한 교회의 기도제목만 조회
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        # church_id가 있으면 해당 교회로 필터링
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
+        # 사용자가 속한 교회의 기도제목만 조회
+        queryset = self.filter_by_user_churches(self.queryset)
         
         # 권한에 따른 필터링
         if not user.is_superuser:
-            church_user = user.church_users.filter(church_id=church_id).first()
+            church_user = self.get_church_user()
             if church_user and church_user.role == SystemRole.MEMBER:
                 # 일반 교인은 공개 기도제목과 자신의 기도제목만 조회
                 queryset = queryset.filter(
@@ -66,8 +78,7 @@ class PrayerViewSet(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         """기도제목 생성 시 추가 처리"""
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -83,8 +94,7 @@ class PrayerViewSet(viewsets.ModelViewSet):
         if user.is_superuser:
             return True
         
-        church_id = self.kwargs.get('church_id')
-        church_user = user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         if church_user:
             return church_user.has_permission(permission_name)
         return False
@@ -177,32 +187,10 @@ class PrayerViewSet(viewsets.ModelViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     @action(detail=False, methods=['get'])
-    def statistics(self, request):
+    def statistics(self, request, church_id=None):
         """기도제목 통계"""
         queryset = self.get_queryset()
-        
-        # 기본 통계
-        total_prayers = queryset.count()
-        active_prayers = queryset.filter(status=Prayer.Status.ACTIVE).count()
-        answered_prayers = queryset.filter(status=Prayer.Status.ANSWERED).count()
-        overdue_prayers = queryset.filter(
-            status=Prayer.Status.ACTIVE,
-            target_date__lt=date.today()
-        ).count()
-        
-        # 기도제목 유형별 통계
-        prayer_types = {}
-        for prayer_type in Prayer.PrayerType.values:
-            count = queryset.filter(prayer_type=prayer_type).count()
-            if count > 0:
-                prayer_types[prayer_type] = count
-        
-        # 우선순위별 통계
-        priority_stats = {}
-        for priority in Prayer.Priority.values:
-            count = queryset.filter(priority=priority).count()
-            if count > 0:
-                priority_stats[priority] = count
+        stats = PRAYER_STATS.evaluate(queryset, church_id=church_id)
         
         # 최근 기도제목
         recent_prayers = PrayerListSerializer(
@@ -210,15 +198,7 @@ class PrayerViewSet(viewsets.ModelViewSet):
             many=True
         ).data
         
-        return Response({
-            'total_prayers': total_prayers,
-            'active_prayers': active_prayers,
-            'answered_prayers': answered_prayers,
-            'overdue_prayers': overdue_prayers,
-            'prayer_types': prayer_types,
-            'priority_stats': priority_stats,
-            'recent_prayers': recent_prayers
-        })
+        return Response(dict(stats, recent_prayers=recent_prayers))
     
     @action(detail=False, methods=['get'])
     def my_prayers(self, request):
@@ -254,7 +234,7 @@ class PrayerViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class PrayerGroupViewSet(viewsets.ModelViewSet):
+class PrayerGroupViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """기도 그룹 관리 API ViewSet"""
     queryset = PrayerGroup.objects.all()
     permission_classes = [IsAuthenticated]
@@ -272,26 +252,11 @@ class PrayerGroupViewSet(viewsets.ModelViewSet):
         return PrayerGroupSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            # 사용자가 속한 교회의 기도 그룹만 조회
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        # church_id가 있으면 해당 교회로 필터링
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
         """기도 그룹 생성 시 추가 처리"""
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -3,7 +3,7 @@ from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from django.urls import reverse
 from .models import (
-    ReportTemplate, Report, Dashboard, StatisticsSummary,
+    ReportTemplate, Report, Dashboard, StatisticsSummary, MetricRollup,
     ReportSchedule, ExportLog, MinistryReport, 
     MinistryReportTemplate, MinistryReportComment
 )
@@ -156,6 +156,15 @@ class StatisticsSummaryAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(MetricRollup)
+class MetricRollupAdmin(admin.ModelAdmin):
+    list_display = ['church', 'metric', 'granularity', 'period_start', 'value', 'count']
+    list_filter = ['metric', 'granularity', 'church']
+    search_fields = ['church__name']
+    readonly_fields = ['calculated_at']
+    date_hierarchy = 'period_start'
+
+
 @admin.register(ReportSchedule)
 class ReportScheduleAdmin(admin.ModelAdmin):
     list_display = [
@@ -0,0 +1,120 @@
+"""
+리포트 시계열(series) 컬럼 저장 형식
+
+Report.data['series']는 행(dict) 목록이라 JSON으로 저장하면 행마다 키가 반복되고,
+목록/상세 조회 때마다 전체를 다시 파싱해야 합니다. 시계열은 열 단위 배열로 바꿔
+압축한 뒤 Report.series_blob에 따로 저장하고, data에는 요약(합계, 분류별 집계)만 남깁니다.
+
+형식 (버전 1):
+    b'\\x01' + zlib( 머리 길이(4바이트, little endian) + 머리 JSON + 열 데이터 )
+    머리: {'rows': 행 수, 'columns': [{'name', 'type', 'size'}, ...]}
+    열 종류: 'i' = int64 배열, 'd' = float64 배열, 'j' = JSON 목록(문자열, None 섞임 등)
+
+정수/실수 열은 고정 길이 배열이라 압축이 잘 되고 디코딩이 빠릅니다.
+"""
+from array import array
+from django.core.serializers.json import DjangoJSONEncoder
+import json
+import sys
+import zlib
+
+VERSION = b'\x01'
+
+
+class SeriesFormatError(ValueError):
+    pass
+
+
+def _column_type(values):
+    if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+        if all(-2 ** 63 <= value < 2 ** 63 for value in values):
+            return 'i'
+    elif all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        return 'd'
+    return 'j'
+
+
+def _pack(kind, values):
+    if kind == 'j':
+        return json.dumps(values, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    packed = array('q' if kind == 'i' else 'd', values)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(kind, raw):
+    if kind == 'j':
+        return json.loads(raw)
+    values = array('q' if kind == 'i' else 'd')
+    values.frombytes(raw)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values.tolist()
+
+
+def encode_series(rows):
+    """행(dict) 목록 -> 압축된 열 단위 bytes (빈 목록이면 None)"""
+    if not rows:
+        return None
+    names = list(dict.fromkeys(name for row in rows for name in row))
+    header = {'rows': len(rows), 'columns': []}
+    body = []
+    for name in names:
+        values = [row.get(name) for row in rows]
+        kind = _column_type(values)
+        raw = _pack(kind, values)
+        header['columns'].append({'name': name, 'type': kind, 'size': len(raw)})
+        body.append(raw)
+
+    head = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return VERSION + zlib.compress(len(head).to_bytes(4, 'little') + head + b''.join(body), 6)
+
+
+def decode_columns(blob, columns=None):
+    """bytes -> (행 수, {열 이름: 값 목록}). columns를 주면 해당 열만 디코딩"""
+    if not blob:
+        return 0, {}
+    blob = bytes(blob)
+    if blob[:1] != VERSION:
+        raise SeriesFormatError(f"지원하지 않는 시계열 형식입니다: {blob[:1]!r}")
+    raw = zlib.decompress(blob[1:])
+    size = int.from_bytes(raw[:4], 'little')
+    header = json.loads(raw[4:4 + size])
+
+    offset = 4 + size
+    values = {}
+    for column in header['columns']:
+        end = offset + column['size']
+        if columns is None or column['name'] in columns:
+            values[column['name']] = _unpack(column['type'], raw[offset:end])
+        offset = end
+    return header['rows'], values
+
+
+def decode_series(blob, columns=None):
+    """bytes -> 행(dict) 목록"""
+    return list(iter_series(blob, columns))
+
+
+def iter_series(blob, columns=None):
+    """행(dict)을 하나씩 생성"""
+    count, values = decode_columns(blob, columns)
+    names = list(values)
+    for index in range(count):
+        yield {name: values[name][index] for name in names}
+
+
+def stream_json_array(rows, chunk_size=500):
+    """행들을 JSON 배열 문자열 조각으로 (전체 응답을 한 번에 만들지 않음)"""
+    yield '['
+    buffer = []
+    first = True
+    for row in rows:
+        buffer.append(json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False))
+        if len(buffer) >= chunk_size:
+            yield ('' if first else ',') + ','.join(buffer)
+            buffer, first = [], False
+    if buffer:
+        yield ('' if first else ',') + ','.join(buffer)
+    yield ']'
@@ -0,0 +1,488 @@
+"""
+리포트 생성 엔진
+
+ReportTemplate.ReportType별 생성기(ReportGenerator)가 리포트 기간을 구간(월/주/일) 단위로
+나누어 집계하고, 결과를 Report.data / Report.summary에 저장합니다 (시계열은 Report.series_blob, reports.columnar 참고).
+- 구간마다 범위가 제한된 집계 쿼리를 실행하므로 여러 해에 걸친 리포트도 한 번에 전체를 훑지 않습니다.
+- 생성은 Celery 태스크(utils.tasks.generate_report)에서 실행되며 진행 상황을 캐시와 태스크 상태에 기록합니다.
+- 같은 템플릿/기간의 생성이 이미 진행 중이면 새로 시작하지 않고 진행 중인 리포트를 돌려줍니다.
+
+구간 단위는 템플릿 config의 granularity('day' | 'week' | 'month', 기본 'month')로 지정합니다.
+생성기 교체/추가:
+    REPORT_GENERATORS = {'custom': 'myapp.reports.CustomReportGenerator'}
+    REPORT_GENERATION_LOCK_TIMEOUT = 1800   # 중복 생성 방지 잠금 유지 시간 (초)
+"""
+from datetime import timedelta
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Count, DecimalField, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from church_core.db_router import read_from_replica
+from church_core.stats import Dimension, StatsSpec
+from attendance.models import Attendance
+from education.models import EducationProgram, EducationRegistration
+from groups.models import Group, GroupMember
+from members.models import Member
+from offerings.models import Offering
+from prayers.models import Prayer
+from .models import MetricRollup, Report, ReportTemplate
+from .rendering import get_render_settings
+from decimal import Decimal
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = 'report_generation_{template_id}_{start}_{end}'
+PROGRESS_KEY = 'report_progress_{report_id}'
+
+GENERATORS = {}
+
+
+class ReportGenerationError(Exception):
+    """리포트를 생성할 수 없는 경우 (지원하지 않는 유형 등)"""
+
+
+def get_lock_timeout():
+    return getattr(settings, 'REPORT_GENERATION_LOCK_TIMEOUT', 1800)
+
+
+def register(report_type):
+    """리포트 유형 생성기 등록 데코레이터"""
+    def decorator(cls):
+        GENERATORS[report_type] = cls
+        return cls
+    return decorator
+
+
+def get_generator(report_type):
+    overrides = getattr(settings, 'REPORT_GENERATORS', {})
+    if report_type in overrides:
+        return import_string(overrides[report_type])
+    if report_type not in GENERATORS:
+        raise ReportGenerationError(f"지원하지 않는 리포트 유형입니다: {report_type}")
+    return GENERATORS[report_type]
+
+
+def iter_periods(start, end, granularity='month'):
+    """[start, end] 기간을 (구간 시작, 구간 끝, 라벨) 목록으로 분할"""
+    if granularity == 'day':
+        step, label = relativedelta(days=1), '%Y-%m-%d'
+        cursor = start
+    elif granularity == 'week':
+        step, label = relativedelta(weeks=1), '%Y-%m-%d'
+        cursor = start - timedelta(days=start.weekday())
+    elif granularity == 'month':
+        step, label = relativedelta(months=1), '%Y-%m'
+        cursor = start.replace(day=1)
+    else:
+        raise ReportGenerationError(f"지원하지 않는 구간 단위입니다: {granularity}")
+
+    while cursor <= end:
+        following = cursor + step
+        yield max(cursor, start), min(following - timedelta(days=1), end), cursor.strftime(label)
+        cursor = following
+
+
+def get_progress(report_id):
+    return cache.get(PROGRESS_KEY.format(report_id=report_id))
+
+
+def set_progress(report_id, current, total, step):
+    cache.set(
+        PROGRESS_KEY.format(report_id=report_id),
+        {'current': current, 'total': total, 'step': step,
+         'percent': round(current / total * 100) if total else 0},
+        get_lock_timeout(),
+    )
+
+
+def _lock_key(report):
+    return LOCK_KEY.format(template_id=report.template_id, start=report.start_date, end=report.end_date)
+
+
+def enqueue_report(report):
+    """
+    리포트 생성 예약
+
+    같은 템플릿/기간의 생성이 진행 중이면 (진행 중인 리포트, False)를,
+    새로 예약하면 (report, True)를 반환합니다.
+    """
+    key = _lock_key(report)
+    if not cache.add(key, report.pk, get_lock_timeout()):
+        holder = cache.get(key)
+        running = Report.objects.filter(pk=holder, status=Report.Status.GENERATING).first()
+        if running is not None:
+            return running, False
+        # 작업자가 비정상 종료되어 남은 잠금
+        cache.set(key, report.pk, get_lock_timeout())
+
+    Report.objects.filter(pk=report.pk).update(status=Report.Status.GENERATING, error_message='')
+    report.status = Report.Status.GENERATING
+    set_progress(report.pk, 0, 1, 'queued')
+
+    from utils.tasks import generate_report
+    transaction.on_commit(lambda: generate_report.delay(report.pk))
+    return report, True
+
+
+def enqueue_render(report):
+    """완료된 리포트의 PDF/Excel 렌더링 예약 (REPORT_RENDER_FORMATS가 비어 있으면 생략)"""
+    formats = get_render_settings()['formats']
+    if not formats:
+        return
+
+    def send():
+        from utils.tasks import render_report_files
+        try:
+            render_report_files.delay([report.pk], list(formats))
+        except Exception:
+            # 렌더링 예약 실패가 생성 결과를 실패로 만들지 않도록
+            logger.exception(f"Report {report.pk} render enqueue failed")
+
+    transaction.on_commit(send)
+
+
+def run_report(report_id, progress=None):
+    """리포트 데이터 생성 및 저장 (Celery 태스크 본문)"""
+    report = Report.objects.select_related('template').get(pk=report_id)
+
+    def on_progress(current, total, step):
+        set_progress(report.pk, current, total, step)
+        if progress:
+            progress(current, total, step)
+
+    try:
+        generator = get_generator(report.template.report_type)(report, progress=on_progress)
+        with read_from_replica():
+            data, summary = generator.run()
+
+        report.set_data(json.loads(json.dumps(data, cls=DjangoJSONEncoder)))
+        report.summary = summary
+        report.status = Report.Status.COMPLETED
+        report.error_message = ''
+        report.completed_at = timezone.now()
+        report.save(update_fields=['data', 'series_blob', 'summary', 'status', 'error_message', 'completed_at'])
+        ReportTemplate.objects.filter(pk=report.template_id).update(last_generated=report.completed_at)
+        enqueue_render(report)
+        return report.status
+    except Exception as e:
+        if isinstance(e, ReportGenerationError):
+            logger.warning(f"Report {report_id} cannot be generated: {e}")
+        else:
+            logger.exception(f"Report generation failed for report {report_id}")
+        report.mark_failed(str(e))
+        on_progress(0, 0, 'failed')
+        return report.status
+    finally:
+        if cache.get(_lock_key(report)) == report.pk:
+            cache.delete(_lock_key(report))
+        if report.schedule_id:
+            from .schedules import record_result
+            record_result(report)
+
+
+class Source:
+    """
+    생성기 집계 대상
+
+    model의 church_field로 교회를 한정하고, date_field가 있으면 구간/기간으로 범위를 제한합니다.
+    date_field가 None이면 기간과 무관한 현재 시점 스냅샷입니다.
+    """
+
+    def __init__(self, model, spec, date_field=None, church_field='church_id'):
+        self.model = model
+        self.spec = spec
+        self.date_field = date_field
+        self.church_field = church_field
+
+    def evaluate(self, church_id, start=None, end=None):
+        queryset = self.model.objects.filter(**{self.church_field: church_id})
+        if self.date_field and start is not None:
+            queryset = queryset.filter(**{f"{self.date_field}__range": (start, end)})
+        return self.spec.evaluate(queryset)
+
+
+class RollupSource:
+    """
+    지표 집계(reports.rollups) 대상
+
+    measures: {이름: (MetricRollup 지표, 'value' | 'count')}
+    구간을 저장된 일/주/월/분기/연 집계 행으로 나눠 읽으므로 원본 테이블을 다시 훑지 않으며,
+    생성기는 bind()로 리포트의 모든 구간을 지표마다 한 번에 읽어 둡니다.
+    """
+
+    def __init__(self, measures):
+        self.measures = measures
+
+    def _pick(self, totals):
+        return {name: totals[metric][field] for name, (metric, field) in self.measures.items()}
+
+    def evaluate(self, church_id, start=None, end=None):
+        from .rollups import aggregate
+
+        metrics = {metric for metric, _ in self.measures.values()}
+        return self._pick({metric: aggregate(church_id, metric, start, end) for metric in metrics})
+
+    def bind(self, church_id, periods):
+        """구간 목록 [(시작, 끝)]을 미리 집계한 대상"""
+        from .rollups import aggregate_ranges
+
+        ranges = {(start, end): (start, end) for start, end in periods}
+        results = {
+            metric: aggregate_ranges(church_id, metric, ranges)
+            for metric in {metric for metric, _ in self.measures.values()}
+        }
+        return _BoundRollupSource(self, results)
+
+
+class _BoundRollupSource:
+    def __init__(self, source, results):
+        self.source = source
+        self.results = results
+
+    def evaluate(self, church_id, start=None, end=None):
+        return self.source._pick({metric: values[(start, end)] for metric, values in self.results.items()})
+
+
+class ReportGenerator:
+    """
+    리포트 유형별 생성기 기반 클래스
+
+    - series: 구간마다 집계하여 data['series']에 행으로 추가 (지표는 합산 가능해야 함)
+    - breakdown: 기간 전체(또는 스냅샷)를 한 번 집계하여 data에 병합
+    series 지표의 합계는 data['totals']에 들어가며, finalize()에서 비율 등 파생 값을 계산합니다.
+    """
+    series = []
+    breakdown = []
+
+    def __init__(self, report, progress=None):
+        self.report = report
+        self.church_id = report.church_id
+        self.start = report.start_date
+        self.end = report.end_date
+        self.config = report.template.config or {}
+        self.progress = progress or (lambda current, total, step: None)
+
+    def run(self):
+        periods = list(iter_periods(self.start, self.end, self.config.get('granularity', 'month')))
+        total_steps = len(periods) + 1
+
+        spans = [(period_start, period_end) for period_start, period_end, _ in periods]
+        series = [
+            source.bind(self.church_id, spans) if hasattr(source, 'bind') else source for source in self.series
+        ]
+
+        rows = []
+        for index, (period_start, period_end, label) in enumerate(periods):
+            row = {'period': label}
+            for source in series:
+                row.update(source.evaluate(self.church_id, period_start, period_end))
+            rows.append(row)
+            self.progress(index + 1, total_steps, 'aggregate')
+
+        data = {
+            'report_type': self.report.template.report_type,
+            'period': {'start': self.start, 'end': self.end},
+            'series': rows,
+            'totals': self.sum_rows(rows),
+        }
+        for source in self.breakdown:
+            data.update(source.evaluate(self.church_id, self.start, self.end))
+        self.finalize(data)
+        self.progress(total_steps, total_steps, 'finalize')
+        return data, self.summarize(data)
+
+    @staticmethod
+    def sum_rows(rows):
+        totals = {}
+        for row in rows:
+            for name, value in row.items():
+                if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+                    totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def finalize(self, data):
+        """파생 지표 계산 (하위 클래스에서 확장)"""
+
+    def summarize(self, data):
+        return ''
+
+
+def _rate(part, whole):
+    return round(part / whole * 100, 1) if whole else 0.0
+
+
+def _amount_sum(field='amount'):
+    return Coalesce(Sum(field), Value(0), output_field=DecimalField(max_digits=15, decimal_places=2))
+
+
+ATTENDED = [
+    Attendance.AttendanceStatus.PRESENT,
+    Attendance.AttendanceStatus.LATE,
+    Attendance.AttendanceStatus.EARLY_LEAVE,
+]
+
+
+@register(ReportTemplate.ReportType.ATTENDANCE)
+class AttendanceReportGenerator(ReportGenerator):
+    series = [Source(Attendance, StatsSpec('reports.attendance.series', measures={
+        'records': Count('pk'),
+        'attended': Count('pk', filter=Q(status__in=ATTENDED)),
+        'services': Count('date', distinct=True),
+    }), date_field='date')]
+    breakdown = [Source(Attendance, StatsSpec('reports.attendance.breakdown', dimensions={
+        'by_status': Dimension('status', choices=Attendance.AttendanceStatus),
+        'by_worship_type': Dimension('worship_type', include_empty=False),
+    }), date_field='date')]
+
+    def finalize(self, data):
+        totals = data['totals']
+        totals['attendance_rate'] = _rate(totals.get('attended', 0), totals.get('records', 0))
+        totals['average_per_service'] = round(totals['attended'] / totals['services'], 1) if totals.get('services') else 0
+        for row in data['series']:
+            row['attendance_rate'] = _rate(row['attended'], row['records'])
+
+    def summarize(self, data):
+        totals = data['totals']
+        return f"출석 {totals['attended']}건 / 기록 {totals['records']}건 (출석률 {totals['attendance_rate']}%)"
+
+
+@register(ReportTemplate.ReportType.MEMBER)
+class MemberReportGenerator(ReportGenerator):
+    series = [RollupSource({'new_members': (MetricRollup.Metric.NEW_MEMBERS, 'count')})]
+    breakdown = [Source(Member, StatsSpec('reports.member.breakdown', measures={
+        'total_members': Count('pk'),
+        'active_members': Count('pk', filter=Q(status=Member.MemberStatus.ACTIVE)),
+    }, dimensions={
+        'by_status': Dimension('status', choices=Member.MemberStatus),
+        'by_gender': Dimension('gender', choices=Member.Gender),
+        'by_position': Dimension('position', include_empty=False),
+    }))]
+
+    def summarize(self, data):
+        return f"전체 교인 {data['total_members']}명 (활동 {data['active_members']}명), 기간 중 신규 {data['totals'].get('new_members', 0)}명"
+
+
+@register(ReportTemplate.ReportType.FINANCIAL)
+class FinancialReportGenerator(ReportGenerator):
+    series = [RollupSource({
+        'total_amount': (MetricRollup.Metric.OFFERINGS, 'value'),
+        'offering_count': (MetricRollup.Metric.OFFERINGS, 'count'),
+    })]
+    breakdown = [Source(Offering, StatsSpec('reports.financial.breakdown', measures={
+        'giver_count': Count('member', distinct=True),
+    }, dimensions={
+        'by_type': Dimension(
+            'offering_type', choices=Offering.OfferingType,
+            measures={'amount': _amount_sum(), 'count': Count('pk')},
+        ),
+    }), date_field='date')]
+
+    def summarize(self, data):
+        totals = data['totals']
+        return f"헌금 총액 {totals.get('total_amount', 0):,}원 ({totals.get('offering_count', 0)}건, 헌금자 {data['giver_count']}명)"
+
+
+@register(ReportTemplate.ReportType.GROWTH)
+class GrowthReportGenerator(ReportGenerator):
+    series = [
+        RollupSource({
+            'new_members': (MetricRollup.Metric.NEW_MEMBERS, 'count'),
+            'offering_amount': (MetricRollup.Metric.OFFERINGS, 'value'),
+        }),
+        Source(Attendance, StatsSpec('reports.growth.attendance', measures={
+            'attended': Count('pk', filter=Q(status__in=ATTENDED)),
+            'services': Count('date', distinct=True),
+        }), date_field='date'),
+    ]
+
+    def finalize(self, data):
+        counts = Member.objects.filter(church_id=self.church_id).aggregate(
+            at_start=Count('pk', filter=Q(registration_date__lt=self.start)),
+            at_end=Count('pk', filter=Q(registration_date__lte=self.end)),
+        )
+        data['members_at_start'] = counts['at_start']
+        data['members_at_end'] = counts['at_end']
+        data['growth_rate'] = _rate(counts['at_end'] - counts['at_start'], counts['at_start'])
+        for row in data['series']:
+            row['average_attendance'] = round(row['attended'] / row['services'], 1) if row['services'] else 0
+
+    def summarize(self, data):
+        return f"교인 {data['members_at_start']}명 → {data['members_at_end']}명 (성장률 {data['growth_rate']}%)"
+
+
+@register(ReportTemplate.ReportType.PRAYER)
+class PrayerReportGenerator(ReportGenerator):
+    series = [Source(Prayer, StatsSpec('reports.prayer.series', measures={
+        'prayers': Count('pk'),
+        'answered': Count('pk', filter=Q(status=Prayer.Status.ANSWERED)),
+    }), date_field='prayer_date')]
+    breakdown = [Source(Prayer, StatsSpec('reports.prayer.breakdown', dimensions={
+        'by_type': Dimension('prayer_type', include_empty=False),
+        'by_status': Dimension('status', choices=Prayer.Status),
+        'by_priority': Dimension('priority', choices=Prayer.Priority),
+    }), date_field='prayer_date')]
+
+    def finalize(self, data):
+        data['totals']['answer_rate'] = _rate(data['totals'].get('answered', 0), data['totals'].get('prayers', 0))
+
+    def summarize(self, data):
+        totals = data['totals']
+        return f"기도제목 {totals.get('prayers', 0)}건 중 응답 {totals.get('answered', 0)}건 ({totals['answer_rate']}%)"
+
+
+@register(ReportTemplate.ReportType.EDUCATION)
+class EducationReportGenerator(ReportGenerator):
+    series = [
+        Source(EducationProgram, StatsSpec('reports.education.programs', measures={
+            'programs': Count('pk'),
+        }), date_field='date'),
+        Source(EducationRegistration, StatsSpec('reports.education.registrations', measures={
+            'registrations': Count('pk'),
+            'completed': Count('pk', filter=Q(status=EducationRegistration.RegistrationStatus.COMPLETED)),
+        }), date_field='program__date', church_field='program__church_id'),
+    ]
+    breakdown = [Source(EducationRegistration, StatsSpec('reports.education.breakdown', measures={
+        'participants': Count('member', distinct=True),
+    }, dimensions={
+        'by_status': Dimension('status', choices=EducationRegistration.RegistrationStatus),
+        'top_programs': Dimension('program__title', as_rows=True, order_by='-count', limit=10),
+    }), date_field='program__date', church_field='program__church_id')]
+
+    def finalize(self, data):
+        data['totals']['completion_rate'] = _rate(data['totals'].get('completed', 0), data['totals'].get('registrations', 0))
+
+    def summarize(self, data):
+        totals = data['totals']
+        return f"교육 {totals.get('programs', 0)}개, 신청 {totals.get('registrations', 0)}건 (수료율 {totals['completion_rate']}%)"
+
+
+@register(ReportTemplate.ReportType.GROUP)
+class GroupReportGenerator(ReportGenerator):
+    series = [Source(GroupMember, StatsSpec('reports.group.series', measures={
+        'joined': Count('pk'),
+    }), date_field='joined_date', church_field='group__church_id')]
+    breakdown = [
+        Source(Group, StatsSpec('reports.group.groups', measures={
+            'total_groups': Count('pk'),
+            'active_groups': Count('pk', filter=Q(is_active=True)),
+        }, dimensions={
+            'by_type': Dimension('group_type', include_empty=False),
+        })),
+        Source(GroupMember, StatsSpec('reports.group.members', measures={
+            'active_memberships': Count('pk', filter=Q(is_active=True)),
+        }, dimensions={
+            'largest_groups': Dimension(
+                'group__name', filter=Q(is_active=True), as_rows=True, order_by='-count', limit=10,
+            ),
+        }), church_field='group__church_id'),
+    ]
+
+    def summarize(self, data):
+        return f"그룹 {data['total_groups']}개 (활성 {data['active_groups']}개), 활동 소속 {data['active_memberships']}건"
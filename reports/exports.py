@@ -0,0 +1,365 @@
+"""
+데이터 내보내기 엔진 (ExportLog)
+
+데이터셋을 기본키 순서로 EXPORT_CHUNK_ROWS 행씩 나누어 읽고(청크 안에서는 iterator()로
+서버 측 커서 스트리밍), 청크마다 gzip으로 압축한 조각 파일을 저장소(default_storage)에 씁니다.
+조각을 저장할 때마다 ExportLog.checkpoint에 데이터셋별 마지막 기본키를 기록하므로
+작업자가 중단되어도 다시 실행하면 마지막 조각 다음부터 이어서 처리합니다.
+
+모든 조각이 끝나면 최종 파일로 합칩니다. 합치는 동안에도 임시 파일을 거쳐 스트리밍하므로
+메모리 사용량은 청크 크기에만 비례합니다.
+- csv: 단일 데이터셋은 gzip 조각을 그대로 이어 붙인 .csv.gz,
+       전체 백업은 데이터셋별 CSV를 담은 .zip
+- ndjson: 모든 조각을 이어 붙인 .ndjson.gz (전체 백업은 행마다 "_dataset" 포함)
+- xlsx: 데이터셋별 시트 (openpyxl write-only 모드, 선택 의존성)
+
+설정 (모두 선택 사항):
+    EXPORT_CHUNK_ROWS = 50000        # 조각당 행 수
+    EXPORT_LOCK_TIMEOUT = 1800       # 내보내기 작업 잠금 유지 시간 (초)
+    EXPORT_STALLED_AFTER = 900       # 체크포인트 갱신이 이보다 오래 없으면 중단된 작업으로 간주 (초)
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from datetime import datetime, timedelta
+import csv
+import gzip
+import io
+import json
+import logging
+import shutil
+import tempfile
+import zipfile
+
+from .models import ExportLog
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = 'export_running_{export_id}'
+
+
+class ExportError(Exception):
+    """내보내기 설정 오류 (재시도해도 성공할 수 없는 경우)"""
+
+
+class Dataset:
+    """
+    내보내기 데이터셋
+
+    columns는 {열 이름: values() 경로}, date_field가 있으면 filters의 start_date/end_date로
+    범위를 제한하고, filter_fields에 있는 키는 같은 값으로 필터링합니다.
+    """
+
+    def __init__(self, name, model, columns, date_field=None, filter_fields=(), church_field='church_id'):
+        self.name = name
+        self.model = model
+        self.columns = columns
+        self.date_field = date_field
+        self.filter_fields = filter_fields
+        self.church_field = church_field
+
+    def get_model(self):
+        from django.apps import apps
+        return apps.get_model(self.model)
+
+    def queryset(self, church_id, filters):
+        queryset = self.get_model().objects.filter(**{self.church_field: church_id})
+        if self.date_field:
+            if filters.get('start_date'):
+                queryset = queryset.filter(**{f"{self.date_field}__gte": filters['start_date']})
+            if filters.get('end_date'):
+                queryset = queryset.filter(**{f"{self.date_field}__lte": filters['end_date']})
+        for field in self.filter_fields:
+            if filters.get(field) not in (None, ''):
+                queryset = queryset.filter(**{field: filters[field]})
+        return queryset
+
+    def iter_chunk(self, church_id, filters, after_pk, limit):
+        """after_pk 다음부터 limit행 (기본키 순, 서버 측 커서로 스트리밍)"""
+        rows = (
+            self.queryset(church_id, filters).filter(pk__gt=after_pk).order_by('pk')
+            .values_list('pk', *self.columns.values())
+        )
+        return rows[:limit].iterator(chunk_size=2000)
+
+
+DATASETS = {
+    'members': Dataset('members', 'members.Member', {
+        'id': 'id', 'member_code': 'member_code', 'name': 'name', 'gender': 'gender',
+        'birth_date': 'birth_date', 'phone': 'phone', 'email': 'email', 'address': 'address',
+        'household_id': 'household_id', 'family_role': 'family_role', 'position': 'position',
+        'status': 'status', 'baptism_date': 'baptism_date', 'registration_date': 'registration_date',
+        'is_active': 'is_active', 'created_at': 'created_at',
+    }, date_field='registration_date', filter_fields=('status', 'is_active', 'position')),
+    'family_relationships': Dataset('family_relationships', 'members.FamilyRelationship', {
+        'id': 'id', 'from_member_id': 'from_member_id', 'to_member_id': 'to_member_id',
+        'relationship': 'relationship', 'is_confirmed': 'is_confirmed',
+    }),
+    'groups': Dataset('groups', 'groups.Group', {
+        'id': 'id', 'name': 'name', 'code': 'code', 'group_type': 'group_type',
+        'parent_group_id': 'parent_group_id', 'leader_id': 'leader_id', 'is_active': 'is_active',
+    }),
+    'group_members': Dataset('group_members', 'groups.GroupMember', {
+        'id': 'id', 'group_id': 'group_id', 'member_id': 'member_id', 'role': 'role',
+        'joined_date': 'joined_date', 'is_active': 'is_active',
+    }, church_field='group__church_id'),
+    'attendance': Dataset('attendance', 'attendance.Attendance', {
+        'id': 'id', 'date': 'date', 'member_id': 'member_id', 'member_name': 'member__name',
+        'worship_type': 'worship_type', 'status': 'status', 'group_id': 'group_id',
+        'arrival_time': 'arrival_time', 'notes': 'notes',
+    }, date_field='date', filter_fields=('worship_type', 'status', 'group_id')),
+    'offerings': Dataset('offerings', 'offerings.Offering', {
+        'id': 'id', 'date': 'date', 'member_id': 'member_id', 'member_name': 'member__name',
+        'offering_type': 'offering_type', 'amount': 'amount',
+    }, date_field='date', filter_fields=('offering_type', 'member_id')),
+    'prayers': Dataset('prayers', 'prayers.Prayer', {
+        'id': 'id', 'member_id': 'member_id', 'member_name': 'member__name', 'title': 'title',
+        'prayer_type': 'prayer_type', 'priority': 'priority', 'status': 'status',
+        'is_public': 'is_public', 'prayer_date': 'prayer_date', 'answered_date': 'answered_date',
+    }, date_field='prayer_date', filter_fields=('status', 'prayer_type', 'is_public')),
+}
+
+# 내보내기 유형별 데이터셋 (순서대로 처리)
+EXPORT_DATASETS = {
+    ExportLog.ExportType.MEMBER: ['members'],
+    ExportLog.ExportType.ATTENDANCE: ['attendance'],
+    ExportLog.ExportType.FINANCIAL: ['offerings'],
+    ExportLog.ExportType.PRAYER: ['prayers'],
+    ExportLog.ExportType.FULL_BACKUP: [
+        'members', 'family_relationships', 'groups', 'group_members', 'attendance', 'offerings', 'prayers',
+    ],
+}
+
+
+def get_chunk_rows():
+    return getattr(settings, 'EXPORT_CHUNK_ROWS', 50000)
+
+
+def get_lock_timeout():
+    return getattr(settings, 'EXPORT_LOCK_TIMEOUT', 1800)
+
+
+def get_stalled_after():
+    return getattr(settings, 'EXPORT_STALLED_AFTER', 900)
+
+
+def _base_path(export):
+    return f"exports/{export.church_id}/{export.pk}"
+
+
+def _part_format(export):
+    # xlsx는 형식을 보존하도록 NDJSON 조각을 모아 마지막에 변환
+    return 'csv' if export.file_format == ExportLog.FileFormat.CSV else 'ndjson'
+
+
+def _part_name(export, dataset, number):
+    return f"{_base_path(export)}/parts/{dataset}-{number:05d}.{_part_format(export)}.gz"
+
+
+def _final_name(export, multiple):
+    stamp = timezone.localtime(export.requested_at).strftime('%Y%m%d%H%M')
+    name = f"{_base_path(export)}/{export.export_type}-{stamp}"
+    if export.file_format == ExportLog.FileFormat.XLSX:
+        return f"{name}.xlsx"
+    if export.file_format == ExportLog.FileFormat.CSV and multiple:
+        return f"{name}.zip"
+    return f"{name}.{export.file_format}.gz"
+
+
+def _save(name, content):
+    """같은 이름으로 덮어쓰기 (재시도 시 이전에 남은 조각 대체)"""
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    return default_storage.save(name, content)
+
+
+def _encode_rows(export, dataset, rows, header):
+    """행 목록을 gzip 조각으로 압축 (bytes, 행 수, 마지막 기본키)"""
+    buffer = io.BytesIO()
+    count, last_pk = 0, None
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as compressed:
+        text = io.TextIOWrapper(compressed, encoding='utf-8', newline='')
+        columns = list(dataset.columns)
+        if _part_format(export) == 'csv':
+            writer = csv.writer(text)
+            if header:
+                writer.writerow(columns)
+            for row in rows:
+                last_pk = row[0]
+                writer.writerow(row[1:])
+                count += 1
+        else:
+            tag = {'_dataset': dataset.name} if len(EXPORT_DATASETS[export.export_type]) > 1 else {}
+            for row in rows:
+                last_pk = row[0]
+                text.write(json.dumps(dict(tag, **dict(zip(columns, row[1:]))), cls=DjangoJSONEncoder, ensure_ascii=False))
+                text.write('\n')
+                count += 1
+        text.flush()
+        text.detach()
+    return buffer.getvalue(), count, last_pk
+
+
+def _save_checkpoint(export, checkpoint):
+    checkpoint['updated_at'] = timezone.now().isoformat()
+    export.checkpoint = checkpoint
+    export.record_count = sum(state['records'] for state in checkpoint['datasets'].values())
+    ExportLog.objects.filter(pk=export.pk).update(checkpoint=checkpoint, record_count=export.record_count)
+
+
+def write_parts(export, progress=None):
+    """체크포인트 이후의 모든 조각 저장"""
+    names = EXPORT_DATASETS[export.export_type]
+    checkpoint = export.checkpoint or {}
+    checkpoint.setdefault('datasets', {})
+    for name in names:
+        checkpoint['datasets'].setdefault(name, {'last_pk': 0, 'parts': 0, 'records': 0, 'done': False})
+
+    chunk_rows = get_chunk_rows()
+    lock_key = LOCK_KEY.format(export_id=export.pk)
+    for name in names:
+        dataset = DATASETS[name]
+        state = checkpoint['datasets'][name]
+        while not state['done']:
+            rows = dataset.iter_chunk(export.church_id, export.filters or {}, state['last_pk'], chunk_rows)
+            content, count, last_pk = _encode_rows(export, dataset, rows, header=state['parts'] == 0)
+            if count or state['parts'] == 0:
+                # 빈 데이터셋도 헤더만 있는 조각 하나는 남김
+                _save(_part_name(export, name, state['parts'] + 1), ContentFile(content))
+                state['parts'] += 1
+            state['records'] += count
+            state['last_pk'] = last_pk or state['last_pk']
+            state['done'] = count < chunk_rows
+            _save_checkpoint(export, checkpoint)
+            cache.touch(lock_key, get_lock_timeout())
+            if progress:
+                progress(name, state['records'])
+    return checkpoint
+
+
+def _copy_part(name, destination, decompress=False):
+    with default_storage.open(name, 'rb') as part:
+        shutil.copyfileobj(gzip.GzipFile(fileobj=part) if decompress else part, destination)
+
+
+def _iter_part_records(name):
+    with default_storage.open(name, 'rb') as part:
+        for line in io.TextIOWrapper(gzip.GzipFile(fileobj=part), encoding='utf-8'):
+            yield json.loads(line)
+
+
+def _write_xlsx(export, checkpoint, destination):
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise ExportError('Excel 내보내기에는 openpyxl 패키지가 필요합니다.')
+
+    workbook = Workbook(write_only=True)
+    for name, state in checkpoint['datasets'].items():
+        columns = list(DATASETS[name].columns)
+        sheet = workbook.create_sheet(title=name[:31])
+        sheet.append(columns)
+        for number in range(1, state['parts'] + 1):
+            for record in _iter_part_records(_part_name(export, name, number)):
+                sheet.append([record.get(column) for column in columns])
+    workbook.save(destination)
+
+
+def assemble(export, checkpoint):
+    """조각을 최종 파일로 합쳐 저장 (경로, 크기)"""
+    datasets = checkpoint['datasets']
+    multiple = len(datasets) > 1
+    with tempfile.TemporaryFile() as destination:
+        if export.file_format == ExportLog.FileFormat.XLSX:
+            _write_xlsx(export, checkpoint, destination)
+        elif export.file_format == ExportLog.FileFormat.CSV and multiple:
+            with zipfile.ZipFile(destination, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                for name, state in datasets.items():
+                    with archive.open(f"{name}.csv", 'w', force_zip64=True) as entry:
+                        for number in range(1, state['parts'] + 1):
+                            _copy_part(_part_name(export, name, number), entry, decompress=True)
+        else:
+            # gzip 멤버를 이어 붙인 파일도 하나의 유효한 gzip 스트림
+            for name, state in datasets.items():
+                for number in range(1, state['parts'] + 1):
+                    _copy_part(_part_name(export, name, number), destination)
+
+        size = destination.tell()
+        destination.seek(0)
+        path = _save(_final_name(export, multiple), File(destination))
+    return path, size
+
+
+def delete_parts(export):
+    for name, state in (export.checkpoint or {}).get('datasets', {}).items():
+        for number in range(1, state['parts'] + 1):
+            part = _part_name(export, name, number)
+            if default_storage.exists(part):
+                default_storage.delete(part)
+
+
+def run_export(export_id, progress=None):
+    """내보내기 실행 (Celery 태스크 본문). 같은 내보내기가 이미 실행 중이면 None"""
+    lock_key = LOCK_KEY.format(export_id=export_id)
+    if not cache.add(lock_key, 1, get_lock_timeout()):
+        return None
+
+    export = ExportLog.objects.get(pk=export_id)
+    try:
+        if export.status in (ExportLog.Status.COMPLETED, ExportLog.Status.EXPIRED):
+            return export.status
+        if export.export_type not in EXPORT_DATASETS:
+            raise ExportError(f"지원하지 않는 내보내기 유형입니다: {export.export_type}")
+
+        ExportLog.objects.filter(pk=export.pk).update(status=ExportLog.Status.PROCESSING, error_message='')
+        checkpoint = write_parts(export, progress=progress)
+        path, size = assemble(export, checkpoint)
+        export.mark_completed(path, size, export.record_count)
+        delete_parts(export)
+        return export.status
+    except Exception as e:
+        if isinstance(e, ExportError):
+            logger.warning(f"Export {export_id} cannot be produced: {e}")
+        else:
+            logger.exception(f"Export {export_id} failed")
+        # 저장된 조각과 체크포인트는 남겨 두어 재시도 시 이어서 처리
+        export.refresh_from_db(fields=['checkpoint', 'record_count'])
+        export.mark_failed(str(e))
+        return export.status
+    finally:
+        cache.delete(lock_key)
+
+
+def find_stalled_exports(now=None):
+    """처리중 상태인데 체크포인트 갱신이 멈춘 내보내기 (작업자 중단)"""
+    now = now or timezone.now()
+    cutoff = now - timedelta(seconds=get_stalled_after())
+    stalled = []
+    for export in ExportLog.objects.filter(status=ExportLog.Status.PROCESSING).only('pk', 'checkpoint', 'requested_at'):
+        updated_at = (export.checkpoint or {}).get('updated_at')
+        last_seen = datetime.fromisoformat(updated_at) if updated_at else export.requested_at
+        if last_seen < cutoff and not cache.get(LOCK_KEY.format(export_id=export.pk)):
+            stalled.append(export.pk)
+    return stalled
+
+
+def purge_expired_exports(now=None):
+    """만료된 내보내기 파일 삭제, 오래된 실패 작업의 조각 정리"""
+    now = now or timezone.now()
+    purged = 0
+    for export in ExportLog.objects.filter(status=ExportLog.Status.COMPLETED, expires_at__lt=now):
+        if export.file_path and default_storage.exists(export.file_path):
+            default_storage.delete(export.file_path)
+        ExportLog.objects.filter(pk=export.pk).update(status=ExportLog.Status.EXPIRED, file_path='')
+        purged += 1
+
+    for export in ExportLog.objects.filter(
+        status=ExportLog.Status.FAILED, requested_at__lt=now - timedelta(days=7)
+    ).exclude(checkpoint={}):
+        delete_parts(export)
+        ExportLog.objects.filter(pk=export.pk).update(checkpoint={})
+    return purged
@@ -0,0 +1,38 @@
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from church.models import Church
+from reports.statistics import backfill_summaries
+
+
+class Command(BaseCommand):
+    help = '기간별 일별 통계 요약(StatisticsSummary)을 다시 계산하여 upsert합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=date.fromisoformat, required=True, help='시작일 (YYYY-MM-DD)')
+        parser.add_argument(
+            '--end', type=date.fromisoformat, default=None,
+            help='종료일 (기본: 어제)',
+        )
+        parser.add_argument('--church', type=int, action='append', default=[], help='대상 교회 ID (기본: 활성 교회 전체)')
+        parser.add_argument('--async', dest='use_celery', action='store_true', help='교회별 Celery 태스크로 실행')
+
+    def handle(self, *args, **options):
+        start = options['start']
+        end = options['end'] or date.today() - timedelta(days=1)
+        if start > end:
+            raise CommandError('시작일이 종료일보다 늦습니다.')
+
+        churches = Church.objects.filter(is_active=True)
+        if options['church']:
+            churches = Church.objects.filter(pk__in=options['church'])
+
+        for church in churches:
+            if options['use_celery']:
+                from utils.tasks import backfill_statistics_summaries
+                backfill_statistics_summaries.delay(church.pk, start.isoformat(), end.isoformat())
+                self.stdout.write(f'{church.name}: 백필 태스크 등록')
+                continue
+            written = backfill_summaries(church, start, end)
+            self.stdout.write(f'{church.name}: {written}일 계산')
+
+        self.stdout.write(self.style.SUCCESS('통계 요약 백필 완료'))
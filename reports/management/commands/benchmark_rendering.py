@@ -0,0 +1,99 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+import random
+import time
+from django.core.management.base import BaseCommand
+from reports.rendering import get_render_settings, init_worker, render_payload
+
+
+def attendance_payload(report_id, days, seed=0):
+    """일별 출석 리포트와 같은 모양의 합성 payload (DB 불필요)"""
+    rng = random.Random(seed + report_id)
+    start = date(2020, 1, 1)
+    series = []
+    for offset in range(days):
+        records = rng.randint(80, 400)
+        attended = rng.randint(records // 2, records)
+        series.append({
+            'period': (start + timedelta(days=offset)).isoformat(),
+            'records': records,
+            'attended': attended,
+            'services': rng.randint(1, 4),
+            'attendance_rate': round(attended / records * 100, 1),
+        })
+    totals = {
+        name: sum(row[name] for row in series) for name in ('records', 'attended', 'services')
+    }
+    totals['attendance_rate'] = round(totals['attended'] / totals['records'] * 100, 1)
+    totals['average_per_service'] = round(totals['attended'] / totals['services'], 1)
+    end = start + timedelta(days=days - 1)
+    return {
+        'report_id': report_id,
+        'title': f'출석 현황 리포트 #{report_id}',
+        'church': '벤치마크 교회',
+        'start_date': start.isoformat(),
+        'end_date': end.isoformat(),
+        'summary': f"출석 {totals['attended']}건 / 기록 {totals['records']}건 (출석률 {totals['attendance_rate']}%)",
+        'data': {
+            'report_type': 'attendance',
+            'period': {'start': start.isoformat(), 'end': end.isoformat()},
+            'series': series,
+            'totals': totals,
+            'by_status': {'present': totals['attended'], 'absent': totals['records'] - totals['attended']},
+            'by_worship_type': {'주일예배': totals['attended'] // 2, '수요예배': totals['attended'] // 4},
+        },
+    }
+
+
+class Command(BaseCommand):
+    help = '리포트 PDF/Excel 렌더링 속도를 측정합니다 (현재 프로세스 vs 프로세스 풀, 합성 출석 리포트).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=1950, help='일별 행 수 (기본 1950 ≈ PDF 50쪽)')
+        parser.add_argument('--reports', type=int, default=8, help='배치 리포트 수')
+        parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: REPORT_RENDER_WORKERS)')
+        parser.add_argument('--formats', default='pdf,xlsx', help='렌더링 형식 (쉼표 구분)')
+
+    def handle(self, *args, **options):
+        render_settings = get_render_settings()
+        workers = options['workers'] or render_settings['workers'] or 1
+        formats = tuple(options['formats'].split(','))
+        payloads = [attendance_payload(index, options['days']) for index in range(options['reports'])]
+
+        started = time.perf_counter()
+        init_worker(render_settings['font_path'])
+        setup = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = render_payload(payloads[0], formats)
+        single = time.perf_counter() - started
+        pages = result.get('pages', 0)
+        self.stdout.write(f"글꼴/스타일 준비: {setup * 1000:.0f}ms (프로세스당 한 번)")
+        self.stdout.write(
+            f"단일 리포트 ({options['days']}행, {pages}쪽): {single * 1000:.0f}ms "
+            f"(PDF {len(result.get('pdf', b'')) // 1024}KB, XLSX {len(result.get('xlsx', b'')) // 1024}KB)"
+        )
+
+        started = time.perf_counter()
+        for payload in payloads:
+            render_payload(payload, formats)
+        sequential = time.perf_counter() - started
+        self._report('순차 (현재 프로세스)', sequential, len(payloads), pages)
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(render_settings['font_path'],)
+        ) as executor:
+            # 작업자 기동과 글꼴 준비는 측정에서 제외 (실행 중인 워커에서는 이미 끝나 있음)
+            list(executor.map(render_payload, payloads[:workers], [('xlsx',)] * workers))
+            started = time.perf_counter()
+            list(executor.map(render_payload, payloads, [formats] * len(payloads)))
+            parallel = time.perf_counter() - started
+        self._report(f'프로세스 풀 ({workers}개)', parallel, len(payloads), pages)
+
+        self.stdout.write(self.style.SUCCESS(f'속도 향상: {sequential / parallel:.2f}배'))
+
+    def _report(self, label, elapsed, count, pages):
+        self.stdout.write(
+            f"{label}: {count}개 {elapsed:.2f}s, 리포트당 {elapsed / count * 1000:.0f}ms, "
+            f"{count * pages / elapsed:.0f}쪽/s"
+        )
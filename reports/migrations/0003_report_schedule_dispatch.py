@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-19 01:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='schedule',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reports', to='reports.reportschedule', verbose_name='생성 스케줄'),
+        ),
+        migrations.AddIndex(
+            model_name='reportschedule',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_running', False)), fields=['next_run'], name='report_schedule_due_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-19 01:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0003_report_schedule_dispatch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exportlog',
+            name='checkpoint',
+            field=models.JSONField(blank=True, default=dict, verbose_name='진행 체크포인트'),
+        ),
+        migrations.AddField(
+            model_name='exportlog',
+            name='file_format',
+            field=models.CharField(choices=[('csv', 'CSV (gzip)'), ('ndjson', 'NDJSON (gzip)'), ('xlsx', 'Excel')], default='csv', max_length=10, verbose_name='파일 형식'),
+        ),
+        migrations.AlterField(
+            model_name='exportlog',
+            name='status',
+            field=models.CharField(choices=[('pending', '대기중'), ('processing', '처리중'), ('completed', '완료'), ('failed', '실패'), ('expired', '만료됨')], default='pending', max_length=20, verbose_name='상태'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.1 on 2026-10-19 01:33
+
+from django.db import migrations, models
+
+
+def move_series_to_blob(apps, schema_editor):
+    """기존 리포트의 data['series']를 열 단위 압축 blob으로 옮김"""
+    from reports.columnar import encode_series
+
+    Report = apps.get_model('reports', 'Report')
+    for report in Report.objects.filter(data__has_key='series').only('pk', 'data').iterator(chunk_size=200):
+        data = dict(report.data)
+        series = data.pop('series') or []
+        Report.objects.filter(pk=report.pk).update(data=data, series_blob=encode_series(series))
+
+
+def restore_series(apps, schema_editor):
+    from reports.columnar import decode_series
+
+    Report = apps.get_model('reports', 'Report')
+    for report in Report.objects.exclude(series_blob=None).only('pk', 'data', 'series_blob').iterator(chunk_size=200):
+        data = {**report.data, 'series': decode_series(report.series_blob)}
+        Report.objects.filter(pk=report.pk).update(data=data, series_blob=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0004_export_checkpoints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='series_blob',
+            field=models.BinaryField(blank=True, null=True, verbose_name='시계열 데이터'),
+        ),
+        migrations.RunPython(move_series_to_blob, restore_series),
+    ]
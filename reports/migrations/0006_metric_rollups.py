@@ -0,0 +1,36 @@
+# Generated by Django 5.2.1 on 2026-10-19 01:38
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('church', '0001_initial'),
+        ('reports', '0005_report_series_blob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MetricRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(choices=[('attendance', '출석'), ('offerings', '헌금'), ('new_members', '신규 교인'), ('prayers_answered', '응답된 기도제목'), ('care_visits', '심방/돌봄 기록')], max_length=30, verbose_name='지표')),
+                ('granularity', models.CharField(choices=[('day', '일'), ('week', '주'), ('month', '월'), ('quarter', '분기'), ('year', '연')], max_length=10, verbose_name='집계 단위')),
+                ('period_start', models.DateField(verbose_name='구간 시작일')),
+                ('value', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='값')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='기록 수')),
+                ('breakdown', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='분류별 값')),
+                ('calculated_at', models.DateTimeField(auto_now=True, verbose_name='계산일시')),
+                ('church', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='metric_rollups', to='church.church', verbose_name='교회')),
+            ],
+            options={
+                'verbose_name': '지표 집계',
+                'verbose_name_plural': '지표 집계들',
+                'db_table': 'metric_rollups',
+                'unique_together': {('church', 'metric', 'granularity', 'period_start')},
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-19 01:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0006_metric_rollups'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ministryreport',
+            index=models.Index(condition=models.Q(('status__in', ['submitted', 'reviewed'])), fields=['church', 'submitted_at', 'id'], name='ministry_report_review_idx'),
+        ),
+    ]
@@ -0,0 +1,186 @@
+"""
+사역 보고서 템플릿 일괄 생성
+
+템플릿 하나와 대상 집합(봉사 역할 담당자 전체, 그룹 유형의 그룹장 전체)을 받아
+해당 기간의 임시저장(draft) MinistryReport를 한 트랜잭션에서 bulk_create로 만듭니다.
+같은 기간에 이미 같은 분류의 보고서가 있는 대상(작성자 + 그룹)은 건너뛰므로 여러 번 실행해도 안전합니다.
+
+기간은 템플릿의 자동 생성 주기(없으면 분류: 주간/월간)로 정하며, 둘 다 없으면 보고일 하루입니다.
+
+대상:
+- 봉사 역할: 활성 VolunteerAssignment의 교회 사용자 (할당 기간이 보고일을 포함하는 경우)
+- 그룹: 그룹장(Member)과 이메일 또는 전화번호가 같은 활성 교회 사용자, 보고서의 부서는 해당 그룹
+- 대상을 지정하지 않으면 템플릿의 적용 봉사 역할(target_roles)과 적용 그룹(target_groups)
+
+Celery beat 예시 (settings.CELERY_BEAT_SCHEDULE):
+    'create-scheduled-ministry-reports': {
+        'task': 'utils.tasks.create_scheduled_ministry_reports',
+        'schedule': crontab(hour=1, minute=0),
+    }
+"""
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from zoneinfo import ZoneInfo
+
+from church_core import tenant_cache
+from .models import MinistryReport, MinistryReportTemplate
+from .rollups import Granularity, period_end, period_start
+
+# 자동 생성 주기 / 보고서 분류 -> 기간 단위
+PERIOD_GRANULARITIES = {
+    'weekly': Granularity.WEEK,
+    'monthly': Granularity.MONTH,
+    'quarterly': Granularity.QUARTER,
+}
+
+
+def get_period(template, report_date):
+    """보고일이 속한 보고 기간 (시작일, 끝일)"""
+    granularity = PERIOD_GRANULARITIES.get(
+        template.auto_create_schedule or template.category, Granularity.DAY
+    )
+    return period_start(granularity, report_date), period_end(granularity, report_date)
+
+
+def role_targets(church, role_ids, report_date):
+    """봉사 역할 담당자들 -> [(교회 사용자, 그룹, 봉사 역할)]"""
+    from volunteering.models import VolunteerAssignment
+
+    assignments = VolunteerAssignment.objects.filter(
+        volunteer_role__church=church,
+        volunteer_role_id__in=role_ids,
+        is_active=True,
+        church_user__is_active=True,
+    ).filter(
+        Q(start_date__isnull=True) | Q(start_date__lte=report_date),
+        Q(end_date__isnull=True) | Q(end_date__gte=report_date),
+    ).select_related('church_user', 'volunteer_role').order_by('volunteer_role_id', 'church_user_id')
+    return [(assignment.church_user, None, assignment.volunteer_role) for assignment in assignments]
+
+
+def leader_targets(church, groups):
+    """그룹장들 -> [(교회 사용자, 그룹, 봉사 역할)]. 교회 사용자로 연결되지 않는 그룹장은 제외"""
+    from users.models import ChurchUser
+
+    groups = list(groups.filter(church=church, is_active=True, leader__isnull=False).select_related('leader'))
+    emails = {group.leader.email.lower() for group in groups if group.leader.email}
+    phones = {group.leader.phone for group in groups if group.leader.phone}
+    if not emails and not phones:
+        return []
+
+    by_email, by_phone = {}, {}
+    # 이메일은 대소문자 구분 없이 비교
+    for church_user in ChurchUser.objects.filter(church=church, is_active=True).annotate(
+        email_lower=Lower('user__email')
+    ).filter(
+        Q(email_lower__in=emails) | Q(phone__in=phones)
+    ).select_related('user').order_by('pk'):
+        by_email.setdefault(church_user.user.email.lower(), church_user)
+        if church_user.phone:
+            by_phone.setdefault(church_user.phone, church_user)
+
+    targets = []
+    for group in groups:
+        leader = group.leader
+        church_user = (leader.email and by_email.get(leader.email.lower())) or (leader.phone and by_phone.get(leader.phone))
+        if church_user:
+            targets.append((church_user, group, None))
+    return targets
+
+
+def resolve_targets(template, report_date, volunteer_role_ids=None, group_type=None):
+    """대상 집합 (지정하지 않으면 템플릿의 적용 역할/그룹)"""
+    from groups.models import Group
+
+    if volunteer_role_ids is None and group_type is None:
+        volunteer_role_ids = [role.pk for role in template.target_roles.all()]
+        groups = template.target_groups.all()
+    else:
+        groups = Group.objects.filter(group_type=group_type) if group_type else Group.objects.none()
+
+    targets = []
+    if volunteer_role_ids:
+        targets += role_targets(template.church, volunteer_role_ids, report_date)
+    targets += leader_targets(template.church, groups)
+    return targets
+
+
+def create_reports(template, report_date=None, volunteer_role_ids=None, group_type=None):
+    """
+    템플릿으로 대상별 임시저장 보고서 일괄 생성
+
+    같은 기간, 같은 분류의 보고서가 이미 있으면 건너뜁니다
+    (그룹장 대상은 작성자 + 그룹, 봉사 역할 대상은 작성자 기준).
+    {'period': [시작일, 끝일], 'created': 생성 수, 'skipped': 건너뛴 수, 'report_ids': [...]}
+    """
+    report_date = report_date or timezone.localdate(timezone=ZoneInfo(template.church.timezone))
+    start, end = get_period(template, report_date)
+    targets = resolve_targets(template, report_date, volunteer_role_ids, group_type)
+
+    with transaction.atomic():
+        # 같은 템플릿의 동시 실행은 순서대로 처리 (중복 생성 방지)
+        MinistryReportTemplate.objects.select_for_update().filter(pk=template.pk).first()
+        existing = set(MinistryReport.objects.filter(
+            church=template.church,
+            category=template.category,
+            reporter_id__in={church_user.pk for church_user, _, _ in targets},
+            report_date__range=(start, end),
+        ).values_list('reporter_id', 'department_id'))
+        reporters = {reporter_id for reporter_id, _ in existing}
+
+        reports = []
+        for church_user, group, role in targets:
+            if group is None:
+                if church_user.pk in reporters:
+                    continue
+            elif (church_user.pk, group.pk) in existing:
+                continue
+            existing.add((church_user.pk, group.pk if group else None))
+            reporters.add(church_user.pk)
+            reports.append(MinistryReport(
+                church=template.church,
+                title=f"{template.name} - {group.name if group else church_user.name} ({start})",
+                category=template.category,
+                report_date=report_date,
+                start_date=start,
+                end_date=end,
+                reporter=church_user,
+                department=group,
+                volunteer_role=role,
+                summary='',
+                content='',
+                custom_data=template.fields_config,
+            ))
+        created = MinistryReport.objects.bulk_create(reports)
+
+        # bulk_create는 post_save 신호를 보내지 않으므로 교회 캐시를 직접 무효화
+        if created:
+            transaction.on_commit(lambda: tenant_cache.invalidate(template.church_id, 'reports'))
+
+    return {
+        'period': [start.isoformat(), end.isoformat()],
+        'created': len(created),
+        'skipped': len(targets) - len(created),
+        'report_ids': [report.pk for report in created if report.pk],
+    }
+
+
+def due_templates(today):
+    """자동 생성 템플릿 중 오늘이 보고 기간 첫날인 것"""
+    templates = MinistryReportTemplate.objects.filter(
+        is_active=True, auto_create=True, auto_create_schedule__isnull=False, church__is_active=True,
+    ).select_related('church')
+    for template in templates:
+        church_today = today or timezone.localdate(timezone=ZoneInfo(template.church.timezone))
+        if get_period(template, church_today)[0] == church_today:
+            yield template, church_today
+
+
+def create_scheduled_reports(today=None):
+    """기간이 시작된 자동 생성 템플릿들의 보고서 일괄 생성 -> {템플릿 ID: 생성 수}"""
+    return {
+        template.pk: create_reports(template, church_today)['created']
+        for template, church_today in due_templates(today)
+    }
@@ -1,3 +1,4 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 from django.core.exceptions import ValidationError
@@ -113,11 +114,17 @@ class Report(models.Model):
     start_date = models.DateField(verbose_name='시작일')
     end_date = models.DateField(verbose_name='종료일')
     
-    # 리포트 데이터
+    # 리포트 데이터 (요약: 합계, 분류별 집계). 시계열은 series_blob에 열 단위로 압축 저장
     data = models.JSONField(
         default=dict,
         verbose_name='리포트 데이터'
     )
+    series_blob = models.BinaryField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='시계열 데이터'
+    )
     summary = models.TextField(blank=True, verbose_name='요약')
     
     # 생성 정보
@@ -147,6 +154,14 @@ class Report(models.Model):
     )
     
     # 시스템 필드
+    schedule = models.ForeignKey(
+        'ReportSchedule',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='reports',
+        verbose_name='생성 스케줄'
+    )
     generated_by = models.ForeignKey(
         'users.User',
         on_delete=models.SET_NULL,
@@ -185,6 +200,35 @@ class Report(models.Model):
         self.status = self.Status.FAILED
         self.error_message = error_message
         self.save(update_fields=['status', 'error_message'])
+    
+    def set_data(self, data):
+        """리포트 데이터 저장 준비 (series는 열 단위 압축 blob으로 분리)"""
+        from .columnar import encode_series
+        data = dict(data)
+        series = data.pop('series', None) or []
+        self.data = data
+        self.series_blob = encode_series(series)
+        self._series = series
+    
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._series = None
+    
+    @property
+    def series(self):
+        """시계열 행 목록 (처음 접근할 때 blob 디코딩, 이전 형식은 data['series'])"""
+        if getattr(self, '_series', None) is None:
+            from .columnar import decode_series
+            if self.series_blob:
+                self._series = decode_series(self.series_blob)
+            else:
+                self._series = self.data.get('series', [])
+        return self._series
+    
+    @property
+    def full_data(self):
+        """요약과 시계열을 합친 전체 데이터"""
+        return {**self.data, 'series': self.series}
 
 
 class Dashboard(models.Model):
@@ -318,6 +362,55 @@ class StatisticsSummary(models.Model):
         return f"{self.church.name} - {self.date} 통계"
 
 
+class MetricRollup(models.Model):
+    """교회별 지표 기간 집계 (일 단위를 저장하고 주/월/분기/연 단위는 하위 단위를 합산)"""
+    
+    class Metric(models.TextChoices):
+        ATTENDANCE = 'attendance', '출석'
+        OFFERINGS = 'offerings', '헌금'
+        NEW_MEMBERS = 'new_members', '신규 교인'
+        PRAYERS_ANSWERED = 'prayers_answered', '응답된 기도제목'
+        CARE_VISITS = 'care_visits', '심방/돌봄 기록'
+    
+    class Granularity(models.TextChoices):
+        DAY = 'day', '일'
+        WEEK = 'week', '주'
+        MONTH = 'month', '월'
+        QUARTER = 'quarter', '분기'
+        YEAR = 'year', '연'
+    
+    church = models.ForeignKey(
+        'church.Church',
+        on_delete=models.CASCADE,
+        related_name='metric_rollups',
+        verbose_name='교회'
+    )
+    metric = models.CharField(max_length=30, choices=Metric.choices, verbose_name='지표')
+    granularity = models.CharField(max_length=10, choices=Granularity.choices, verbose_name='집계 단위')
+    period_start = models.DateField(verbose_name='구간 시작일')
+    
+    # 지표 값 (출석: 출석 인원 / 헌금: 금액 / 그 외: 건수)과 원본 기록 수
+    value = models.DecimalField(max_digits=15, decimal_places=2, default=0, verbose_name='값')
+    count = models.PositiveIntegerField(default=0, verbose_name='기록 수')
+    breakdown = models.JSONField(
+        default=dict,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        verbose_name='분류별 값'
+    )
+    
+    calculated_at = models.DateTimeField(auto_now=True, verbose_name='계산일시')
+    
+    class Meta:
+        db_table = 'metric_rollups'
+        verbose_name = '지표 집계'
+        verbose_name_plural = '지표 집계들'
+        unique_together = [['church', 'metric', 'granularity', 'period_start']]
+    
+    def __str__(self):
+        return f"{self.church_id} - {self.metric} {self.granularity} {self.period_start}"
+
+
 class ReportSchedule(models.Model):
     """리포트 스케줄 모델"""
     
@@ -382,6 +475,14 @@ class ReportSchedule(models.Model):
         verbose_name = '리포트 스케줄'
         verbose_name_plural = '리포트 스케줄들'
         ordering = ['next_run']
+        indexes = [
+            # 디스패처의 실행 대상 조회 (활성 + 대기 중인 스케줄만 담는 부분 인덱스)
+            models.Index(
+                fields=['next_run'],
+                name='report_schedule_due_idx',
+                condition=models.Q(is_active=True, is_running=False),
+            ),
+        ]
     
     def __str__(self):
         return f"{self.template.name} - {self.cron_expression}"
@@ -408,6 +509,12 @@ class ExportLog(models.Model):
         PROCESSING = 'processing', '처리중'
         COMPLETED = 'completed', '완료'
         FAILED = 'failed', '실패'
+        EXPIRED = 'expired', '만료됨'
+    
+    class FileFormat(models.TextChoices):
+        CSV = 'csv', 'CSV (gzip)'
+        NDJSON = 'ndjson', 'NDJSON (gzip)'
+        XLSX = 'xlsx', 'Excel'
     
     church = models.ForeignKey(
         'church.Church',
@@ -434,6 +541,12 @@ class ExportLog(models.Model):
     )
     
     # 결과 파일
+    file_format = models.CharField(
+        max_length=10,
+        choices=FileFormat.choices,
+        default=FileFormat.CSV,
+        verbose_name='파일 형식'
+    )
     file_path = models.CharField(
         max_length=500,
         blank=True,
@@ -454,6 +567,13 @@ class ExportLog(models.Model):
         verbose_name='오류 메시지'
     )
     
+    # 진행 상황 (중단된 작업을 이어서 처리하기 위한 데이터셋별 마지막 위치)
+    checkpoint = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='진행 체크포인트'
+    )
+    
     # 시스템 필드
     requested_by = models.ForeignKey(
         'users.User',
@@ -711,6 +831,11 @@ class MinistryReport(models.Model):
             models.Index(fields=['reporter', 'status']),
             models.Index(fields=['department', 'report_date']),
             models.Index(fields=['category', 'report_date']),
+            # 검토 대기열 (제출/검토 상태 보고서만 교회별 제출 순서대로 조회)
+            models.Index(
+                fields=['church', 'submitted_at', 'id'], name='ministry_report_review_idx',
+                condition=models.Q(status__in=['submitted', 'reviewed']),
+            ),
         ]
     
     def __str__(self):
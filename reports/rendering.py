@@ -0,0 +1,330 @@
+"""
+리포트 파일(PDF/Excel) 렌더링
+
+완료된 Report.data를 PDF(reportlab)와 XLSX(openpyxl)로 변환합니다. 렌더링은 CPU를 많이 쓰므로
+웹/IO 작업자가 아닌 별도 프로세스 풀에서 실행하며, 여러 리포트를 요청하면 병렬로 렌더링합니다.
+- 프로세스마다 initializer(init_worker)에서 글꼴(한글 포함)과 문단/표 스타일을 한 번만 준비
+- 풀 작업자는 DB에 접근하지 않음: 부모 프로세스가 리포트를 읽어 payload(dict)로 넘기고,
+  결과 bytes를 받아 Report.pdf_file / excel_file에 저장
+
+글꼴은 REPORT_PDF_FONT_PATH(TTF, 예: NanumGothic.ttf)가 있으면 포함(embed)하고,
+없으면 reportlab 내장 한국어 CID 글꼴(HYGothic-Medium)을 사용합니다.
+
+설정 (모두 선택 사항):
+    REPORT_RENDER_WORKERS = 4         # 프로세스 수 (0이면 현재 프로세스에서 렌더링)
+    REPORT_RENDER_FORMATS = ['pdf', 'xlsx']   # 리포트 완료 후 자동 렌더링할 형식 (빈 목록이면 안 함)
+    REPORT_PDF_FONT_PATH = None       # 한글 TTF 글꼴 경로
+
+Celery prefork 작업자는 데몬 프로세스라 자식 프로세스를 만들 수 없으므로, 그 안에서는 풀 없이
+현재 프로세스에서 렌더링합니다. 그래서 render_report_files 태스크는 rendering 큐로 보내고
+(CELERY_TASK_ROUTES로 바꿀 수 있음) 리포트마다 태스크를 나눠 작업자 수만큼 병렬로 렌더링합니다.
+rendering 큐 작업자를 threads/solo 풀로 띄우면 태스크 안에서도 프로세스 풀을 사용합니다:
+    celery -A church_core worker -Q rendering -P threads -c 4
+
+이 모듈의 렌더링 함수는 Django 모델을 불러오지 않으므로 spawn 방식 프로세스에서도 동작합니다.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+from decimal import Decimal
+from xml.sax.saxutils import escape
+import io
+import logging
+import multiprocessing
+import os
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('pdf', 'xlsx')
+
+# 표 제목 (없으면 키 그대로 사용)
+SECTION_LABELS = {
+    'totals': '합계',
+    'series': '기간별 추이',
+    'overview': '개요',
+    'by_status': '상태별',
+    'by_worship_type': '예배별',
+    'by_type': '유형별',
+    'by_category': '분류별',
+    'by_priority': '우선순위별',
+}
+
+# 프로세스별 렌더링 자원 (init_worker에서 한 번 준비)
+_resources = None
+
+
+def init_worker(font_path=None):
+    """글꼴 등록과 스타일 준비 (프로세스마다 한 번)"""
+    global _resources
+    if _resources is not None:
+        return _resources
+
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.pdfbase import pdfmetrics
+
+    if font_path and os.path.exists(font_path):
+        from reportlab.pdfbase.ttfonts import TTFont
+        font_name = 'ReportFont'
+        pdfmetrics.registerFont(TTFont(font_name, font_path))
+    else:
+        from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+        font_name = 'HYGothic-Medium'
+        pdfmetrics.registerFont(UnicodeCIDFont(font_name))
+
+    sample = getSampleStyleSheet()
+    _resources = {
+        'font': font_name,
+        'styles': {
+            'title': ParagraphStyle('ReportTitle', parent=sample['Title'], fontName=font_name, fontSize=18, leading=24),
+            'heading': ParagraphStyle('ReportHeading', parent=sample['Heading2'], fontName=font_name, fontSize=12, leading=16),
+            'body': ParagraphStyle('ReportBody', parent=sample['Normal'], fontName=font_name, fontSize=9, leading=13),
+        },
+        'table_style': [
+            ('FONTNAME', (0, 0), (-1, -1), font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E8EEF7')),
+            ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor('#B0B8C4')),
+            ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ],
+    }
+    return _resources
+
+
+def _format(value):
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    if isinstance(value, (int, Decimal)) and not isinstance(value, bool):
+        return f"{value:,}"
+    return str(value)
+
+
+def _cell(value):
+    """XLSX 셀 값 (숫자는 숫자로 유지)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (str, int, float, bool, date, datetime)) or value is None:
+        return value
+    return str(value)
+
+
+def iter_sections(data):
+    """Report.data를 (제목, 머리행, 행 목록) 표들로 분해"""
+    overview = [
+        [key, value] for key, value in data.items()
+        if key not in ('report_type', 'period') and not isinstance(value, (dict, list))
+    ]
+    if overview:
+        yield 'overview', ['항목', '값'], overview
+    if data.get('totals'):
+        yield 'totals', ['항목', '값'], [[key, value] for key, value in data['totals'].items()]
+
+    series = data.get('series') or []
+    if series:
+        header = list(dict.fromkeys(key for row in series for key in row))
+        yield 'series', header, [[row.get(key) for key in header] for row in series]
+
+    for key, value in data.items():
+        if key in ('totals', 'series', 'period') or not value:
+            continue
+        if isinstance(value, list) and isinstance(value[0], dict):
+            header = list(dict.fromkeys(name for row in value for name in row))
+            yield key, header, [[row.get(name) for name in header] for row in value]
+        elif isinstance(value, dict):
+            first = next(iter(value.values()))
+            if isinstance(first, dict):
+                header = [key] + list(first)
+                yield key, header, [[name] + [row.get(column) for column in header[1:]] for name, row in value.items()]
+            else:
+                yield key, ['항목', '값'], [[name, row] for name, row in value.items()]
+
+
+def render_pdf(payload):
+    """PDF bytes와 페이지 수"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import LongTable, Paragraph, SimpleDocTemplate, Spacer, TableStyle
+
+    resources = init_worker()
+    styles = resources['styles']
+    table_style = TableStyle(resources['table_style'])
+    buffer = io.BytesIO()
+    document = SimpleDocTemplate(
+        buffer, pagesize=A4, title=payload['title'],
+        leftMargin=15 * mm, rightMargin=15 * mm, topMargin=15 * mm, bottomMargin=15 * mm,
+    )
+
+    def footer(canvas, doc):
+        canvas.saveState()
+        canvas.setFont(resources['font'], 8)
+        canvas.drawRightString(A4[0] - 15 * mm, 8 * mm, f"{payload['church']} · {doc.page}")
+        canvas.restoreState()
+
+    # Paragraph는 마크업을 해석하므로 사용자 입력(제목, 요약 등)은 이스케이프
+    story = [
+        Paragraph(escape(payload['title']), styles['title']),
+        Paragraph(escape(f"{payload['church']} | {payload['start_date']} ~ {payload['end_date']}"), styles['body']),
+    ]
+    if payload.get('summary'):
+        story += [Spacer(1, 4 * mm), Paragraph(escape(payload['summary']), styles['body'])]
+    for key, header, rows in iter_sections(payload['data']):
+        story += [Spacer(1, 6 * mm), Paragraph(escape(SECTION_LABELS.get(key, key)), styles['heading'])]
+        table = LongTable([header] + [[_format(value) for value in row] for row in rows], repeatRows=1)
+        table.setStyle(table_style)
+        story.append(table)
+
+    document.build(story, onFirstPage=footer, onLaterPages=footer)
+    return buffer.getvalue(), document.page
+
+
+def render_xlsx(payload):
+    """XLSX bytes (시트: 요약 + 표마다 하나)"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    summary = workbook.create_sheet('요약')
+    summary.append([payload['title']])
+    summary.append(['교회', payload['church']])
+    summary.append(['기간', f"{payload['start_date']} ~ {payload['end_date']}"])
+    summary.append(['요약', payload.get('summary', '')])
+    for key, header, rows in iter_sections(payload['data']):
+        sheet = workbook.create_sheet(SECTION_LABELS.get(key, key)[:31])
+        sheet.append(header)
+        for row in rows:
+            sheet.append([_cell(value) for value in row])
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def render_payload(payload, formats=FORMATS):
+    """요청한 형식 렌더링 (풀 작업자에서 실행) -> {'pdf': bytes, 'xlsx': bytes, 'pages': n}"""
+    result = {'report_id': payload['report_id']}
+    if 'pdf' in formats:
+        result['pdf'], result['pages'] = render_pdf(payload)
+    if 'xlsx' in formats:
+        result['xlsx'] = render_xlsx(payload)
+    return result
+
+
+# 부모 프로세스 쪽 (DB 접근)
+
+_executor = None
+
+
+def get_render_settings():
+    from django.conf import settings
+    return {
+        'workers': getattr(settings, 'REPORT_RENDER_WORKERS', min(4, os.cpu_count() or 1)),
+        'formats': getattr(settings, 'REPORT_RENDER_FORMATS', list(FORMATS)),
+        'font_path': getattr(settings, 'REPORT_PDF_FONT_PATH', None),
+    }
+
+
+def get_executor():
+    """프로세스 풀 (프로세스당 하나, 작업자는 글꼴을 한 번만 불러옴). 사용할 수 없으면 None"""
+    global _executor
+    options = get_render_settings()
+    if options['workers'] <= 0:
+        return None
+    if multiprocessing.current_process().daemon:
+        # 데몬 프로세스(Celery prefork 작업자 등) 안에서는 자식 프로세스를 만들 수 없음
+        # (풀은 첫 submit에서 작업자를 띄우므로 생성 시점에는 오류가 나지 않음)
+        return None
+    if _executor is None:
+        try:
+            _executor = ProcessPoolExecutor(
+                max_workers=options['workers'], initializer=init_worker, initargs=(options['font_path'],)
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Report render pool unavailable, rendering in process: {e}")
+            return None
+    return _executor
+
+
+def build_payload(report):
+    return {
+        'report_id': report.pk,
+        'title': report.title,
+        'church': report.church.name,
+        'start_date': report.start_date.isoformat(),
+        'end_date': report.end_date.isoformat(),
+        'summary': report.summary,
+        'data': report.full_data,
+    }
+
+
+def _store(report, result):
+    from django.core.files.base import ContentFile
+
+    stem = f"report-{report.pk}-{report.end_date:%Y%m%d}"
+    fields = []
+    if 'pdf' in result:
+        report.pdf_file.save(f"{stem}.pdf", ContentFile(result['pdf']), save=False)
+        fields.append('pdf_file')
+    if 'xlsx' in result:
+        report.excel_file.save(f"{stem}.xlsx", ContentFile(result['xlsx']), save=False)
+        fields.append('excel_file')
+    report.save(update_fields=fields)
+
+
+def render_reports(report_ids, formats=None):
+    """
+    완료된 리포트들의 파일 렌더링 후 저장
+
+    풀이 있으면 리포트마다 작업을 나눠 병렬로 렌더링합니다.
+    {report_id: PDF 페이지 수(PDF 없으면 0) 또는 None(실패)}
+    """
+    from .models import Report
+
+    options = get_render_settings()
+    formats = tuple(formats or options['formats'])
+    reports = {
+        report.pk: report for report in
+        Report.objects.select_related('church').filter(pk__in=report_ids, status=Report.Status.COMPLETED)
+    }
+    results = {}
+    executor = get_executor() if len(reports) else None
+
+    if executor is None:
+        init_worker(options['font_path'])
+        outcomes = ((pk, _call(render_payload, build_payload(report), formats)) for pk, report in reports.items())
+    else:
+        futures = {
+            executor.submit(render_payload, build_payload(report), formats): pk for pk, report in reports.items()
+        }
+        outcomes = ((futures[future], _result(future)) for future in as_completed(futures))
+
+    for pk, result in outcomes:
+        if result is None:
+            results[pk] = None
+            continue
+        _store(reports[pk], result)
+        results[pk] = result.get('pages', 0)
+    return results
+
+
+def _call(function, *args):
+    try:
+        return function(*args)
+    except Exception:
+        logger.exception(f"Report rendering failed for report {args[0]['report_id']}")
+        return None
+
+
+def _result(future):
+    global _executor
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        # 작업자 프로세스가 비정상 종료되면 다음 요청에서 풀을 새로 만듦
+        logger.exception("Report render pool broken")
+        _executor = None
+        return None
+    except Exception:
+        logger.exception("Report rendering failed in worker process")
+        return None
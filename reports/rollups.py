@@ -0,0 +1,477 @@
+"""
+지표 기간 집계(MetricRollup)
+
+교회별로 출석, 헌금, 신규 교인, 응답된 기도제목, 심방/돌봄 기록 지표를 하루 단위로 집계해 두고,
+주/월/분기/연 단위는 원본 테이블을 다시 훑지 않고 하위 단위 행을 합산해 만듭니다
+(주 <- 일, 월 <- 일, 분기 <- 월, 연 <- 분기).
+
+조회(series, aggregate)는 요청 구간을 저장된 가장 큰 단위들로 나눠 읽으므로
+연도별 비교도 수십 행만 읽습니다. 일 단위 행이 없는 날(아직 집계 전인 오늘, 백필 전 과거)은
+원본 테이블에서 날짜별 GROUP BY로 바로 집계해 합칩니다. 변경 표시된 날 이후의 저장 행은
+아직 다시 계산 전이므로 같은 방식으로 원본에서 집계합니다.
+
+갱신:
+- update_metric_rollups 태스크가 교회마다 마지막 집계일 다음 날부터 어제까지(교회 시간대)를 계산
+- 원본 기록이 저장/삭제되면 (커밋 후) 해당 날짜를 변경 표시해 두고 다음 실행에서 그날부터 다시 계산
+  (날짜를 바꾼 수정의 이전 날짜, bulk 작업은 ROLLUP_LOOKBACK_DAYS 범위 재계산으로 보정)
+- 과거 기간은 backfill_rollups 관리 명령으로 백필
+  (조회는 일 단위 집계가 첫날부터 마지막 날까지 끊김 없이 이어져 있다고 보므로, 기존 집계 범위와
+  떨어진 기간을 백필하면 그 사이 기간도 함께 계산)
+
+설정 (모두 선택 사항):
+    ROLLUP_LOOKBACK_DAYS = 7     # 매 실행 시 다시 계산할 최근 일수
+
+Celery beat 예시 (settings.CELERY_BEAT_SCHEDULE):
+    'update-metric-rollups': {
+        'task': 'utils.tasks.update_metric_rollups',
+        'schedule': crontab(minute=15),
+    }
+"""
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+from dateutil.relativedelta import relativedelta
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from zoneinfo import ZoneInfo
+
+from .models import MetricRollup
+from .statistics import ATTENDED_STATUSES, week_start
+import time
+
+Metric = MetricRollup.Metric
+Granularity = MetricRollup.Granularity
+
+PERIOD_LENGTHS = {
+    Granularity.DAY: relativedelta(days=1),
+    Granularity.WEEK: relativedelta(weeks=1),
+    Granularity.MONTH: relativedelta(months=1),
+    Granularity.QUARTER: relativedelta(months=3),
+    Granularity.YEAR: relativedelta(years=1),
+}
+
+# 상위 단위와 합산할 하위 단위 (순서대로 계산)
+DERIVED_LEVELS = [
+    (Granularity.WEEK, Granularity.DAY),
+    (Granularity.MONTH, Granularity.DAY),
+    (Granularity.QUARTER, Granularity.MONTH),
+    (Granularity.YEAR, Granularity.QUARTER),
+]
+
+# 조회 구간을 나눌 때 큰 단위부터 시도
+PIECE_LEVELS = [
+    Granularity.YEAR, Granularity.QUARTER, Granularity.MONTH, Granularity.WEEK, Granularity.DAY,
+]
+
+DIRTY_KEY = 'metric_rollup_dirty:{church_id}'
+DIRTY_LOCK_KEY = 'metric_rollup_dirty_lock:{church_id}'
+DIRTY_LOCK_TIMEOUT = 5
+
+
+class MetricSource:
+    """
+    지표 원본 정의
+
+    value가 None이면 기록 수를 값으로 사용하고, dimension 필드 값별로 breakdown을 만듭니다.
+    """
+
+    def __init__(self, model, date_field, value=None, filter=None, dimension=None, amount=False):
+        self.model = model
+        self.date_field = date_field
+        self.value = value
+        self.filter = filter
+        self.dimension = dimension
+        self.amount = amount
+
+    def get_model(self):
+        return apps.get_model(self.model)
+
+    def queryset(self, church_id, start, end):
+        queryset = self.get_model().objects.filter(church_id=church_id, **{f"{self.date_field}__range": (start, end)})
+        if self.filter is not None:
+            queryset = queryset.filter(self.filter)
+        return queryset
+
+
+METRICS = {
+    Metric.ATTENDANCE: MetricSource(
+        'attendance.Attendance', 'date',
+        value=Count('pk', filter=Q(status__in=ATTENDED_STATUSES)), dimension='worship_type',
+    ),
+    Metric.OFFERINGS: MetricSource('offerings.Offering', 'date', value=Sum('amount'), dimension='offering_type', amount=True),
+    Metric.NEW_MEMBERS: MetricSource('members.Member', 'registration_date', dimension='gender'),
+    Metric.PRAYERS_ANSWERED: MetricSource(
+        'prayers.Prayer', 'answered_date', filter=Q(status='answered'), dimension='prayer_type',
+    ),
+    Metric.CARE_VISITS: MetricSource('carelog.CareLog', 'date', dimension='type'),
+}
+
+
+def get_lookback_days():
+    return getattr(settings, 'ROLLUP_LOOKBACK_DAYS', 7)
+
+
+# 구간 계산
+
+def period_start(granularity, day):
+    if granularity == Granularity.DAY:
+        return day
+    if granularity == Granularity.WEEK:
+        return week_start(day)
+    if granularity == Granularity.MONTH:
+        return day.replace(day=1)
+    if granularity == Granularity.QUARTER:
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    if granularity == Granularity.YEAR:
+        return day.replace(month=1, day=1)
+    raise ValueError(f"지원하지 않는 집계 단위입니다: {granularity}")
+
+
+def period_end(granularity, day):
+    return period_start(granularity, day) + PERIOD_LENGTHS[granularity] - timedelta(days=1)
+
+
+def iter_periods(granularity, start, end):
+    """[start, end]에 걸친 구간들 (구간 시작일, 구간과 겹치는 시작일, 끝일)"""
+    current = period_start(granularity, start)
+    while current <= end:
+        last = period_end(granularity, current)
+        yield current, max(current, start), min(last, end)
+        current = last + timedelta(days=1)
+
+
+def split_pieces(start, end):
+    """[start, end]를 저장된 단위 구간들로 분해 (큰 단위 우선) -> [(단위, 구간 시작일)]"""
+    pieces = []
+    day = start
+    while day <= end:
+        for granularity in PIECE_LEVELS:
+            if period_start(granularity, day) == day and period_end(granularity, day) <= end:
+                pieces.append((granularity, day))
+                day = period_end(granularity, day) + timedelta(days=1)
+                break
+    return pieces
+
+
+# 값 합산
+
+def _bucket():
+    return {'value': Decimal(0), 'count': 0, 'breakdown': {}}
+
+
+def _add(bucket, value, count, breakdown):
+    bucket['value'] += Decimal(value or 0)
+    bucket['count'] += count
+    for key, item in breakdown.items():
+        target = bucket['breakdown'].setdefault(key, {'value': Decimal(0), 'count': 0})
+        target['value'] += Decimal(item['value'] or 0)
+        target['count'] += item['count']
+
+
+def _merge(bucket, other):
+    _add(bucket, other['value'], other['count'], other['breakdown'])
+
+
+def _shape(metric, bucket):
+    """응답용 값 (금액 외 지표는 정수)"""
+    convert = (lambda value: value) if METRICS[metric].amount else int
+    return {
+        'value': convert(bucket['value']),
+        'count': bucket['count'],
+        'breakdown': {
+            key: {'value': convert(item['value']), 'count': item['count']}
+            for key, item in sorted(bucket['breakdown'].items())
+        },
+    }
+
+
+def collect_days(church_id, metric, start, end):
+    """원본 테이블에서 날짜별 집계 {date: bucket} (날짜 x 분류 GROUP BY 한 번)"""
+    source = METRICS[metric]
+    fields = [source.date_field] + ([source.dimension] if source.dimension else [])
+    rows = source.queryset(church_id, start, end).values(*fields).annotate(
+        row_value=source.value or Count('pk'), row_count=Count('pk'),
+    ).order_by()
+
+    days = {}
+    for row in rows:
+        bucket = days.setdefault(row[source.date_field], _bucket())
+        breakdown = {}
+        if source.dimension:
+            breakdown[row[source.dimension] or ''] = {'value': row['row_value'], 'count': row['row_count']}
+        _add(bucket, row['row_value'], row['row_count'], breakdown)
+    return days
+
+
+# 저장
+
+def _save(church_id, metric, granularity, buckets):
+    """(church, metric, granularity, period_start) 기준 upsert"""
+    return MetricRollup.objects.bulk_create(
+        [
+            MetricRollup(
+                church_id=church_id, metric=metric, granularity=granularity, period_start=start,
+                value=bucket['value'], count=bucket['count'], breakdown=bucket['breakdown'],
+            )
+            for start, bucket in buckets.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['church', 'metric', 'granularity', 'period_start'],
+        update_fields=['value', 'count', 'breakdown', 'calculated_at'],
+        batch_size=1000,
+    )
+
+
+def _derive(church_id, metric, granularity, lower, start, end):
+    """start~end가 걸친 granularity 구간들을 하위 단위 행 합산으로 다시 계산"""
+    first, last = period_start(granularity, start), period_end(granularity, end)
+    buckets = {}
+    rows = MetricRollup.objects.filter(
+        church_id=church_id, metric=metric, granularity=lower, period_start__range=(first, last),
+    ).values_list('period_start', 'value', 'count', 'breakdown')
+    for day, value, count, breakdown in rows:
+        _add(buckets.setdefault(period_start(granularity, day), _bucket()), value, count, breakdown)
+    _save(church_id, metric, granularity, buckets)
+
+
+def rebuild(church_id, start, end, metrics=None):
+    """[start, end] 일 단위 집계를 다시 계산하고 걸친 주/월/분기/연 구간을 다시 합산"""
+    for metric in metrics or METRICS:
+        days = collect_days(church_id, metric, start, end)
+        # 기록이 없는 날도 0으로 저장 (마지막 집계일 판단과 빈 날 구분)
+        buckets = {
+            start + timedelta(days=offset): days.get(start + timedelta(days=offset)) or _bucket()
+            for offset in range((end - start).days + 1)
+        }
+        with transaction.atomic():
+            _save(church_id, metric, Granularity.DAY, buckets)
+            for granularity, lower in DERIVED_LEVELS:
+                _derive(church_id, metric, granularity, lower, start, end)
+
+
+def backfill(church_id, start, end, chunk_days=366):
+    """기간 백필 (chunk_days 단위로 나눠 계산, 기존 집계 범위와의 사이 기간 포함). 계산한 일수 반환"""
+    for metric in METRICS:
+        coverage = get_coverage(church_id, metric)
+        if coverage is None:
+            continue
+        # 집계 범위 사이에 빈 기간이 생기면 조회 시 저장된 0으로 읽히므로 이어서 계산
+        if end < coverage[0] - timedelta(days=1):
+            end = coverage[0] - timedelta(days=1)
+        if start > coverage[1] + timedelta(days=1):
+            start = coverage[1] + timedelta(days=1)
+
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end)
+        rebuild(church_id, chunk_start, chunk_end)
+        chunk_start = chunk_end + timedelta(days=1)
+    return (end - start).days + 1
+
+
+# 변경 추적과 정기 갱신
+
+@contextmanager
+def _dirty_lock(church_id):
+    """변경 표시 갱신/소비를 프로세스 간에 직렬화 (cache.add 잠금)"""
+    key = DIRTY_LOCK_KEY.format(church_id=church_id)
+    deadline = time.monotonic() + DIRTY_LOCK_TIMEOUT
+    # 잠금을 가진 프로세스가 비정상 종료되어도 키가 만료되므로 대기는 제한됨
+    while not cache.add(key, 1, DIRTY_LOCK_TIMEOUT) and time.monotonic() < deadline:
+        time.sleep(0.005)
+    try:
+        yield
+    finally:
+        cache.delete(key)
+
+
+def mark_dirty(church_id, day):
+    """day 이후 집계를 다음 갱신 때 다시 계산하도록 표시"""
+    key = DIRTY_KEY.format(church_id=church_id)
+    current = cache.get(key)
+    if current is not None and current <= day:
+        # 이미 더 이른 날부터 다시 계산하도록 표시됨 (소비되더라도 이 변경은 커밋 후이므로 반영됨)
+        return
+    with _dirty_lock(church_id):
+        current = cache.get(key)
+        if current is None or day < current:
+            cache.set(key, day, None)
+
+
+def peek_dirty(church_id):
+    """다시 계산 대기 중인 가장 이른 날 (없으면 None)"""
+    return cache.get(DIRTY_KEY.format(church_id=church_id))
+
+
+def pop_dirty(church_id):
+    """변경 표시를 가져오고 지움 (그 사이 표시된 날을 잃지 않도록 mark_dirty와 같은 잠금 사용)"""
+    key = DIRTY_KEY.format(church_id=church_id)
+    with _dirty_lock(church_id):
+        day = cache.get(key)
+        if day is not None:
+            cache.delete(key)
+    return day
+
+
+def get_coverage(church_id, metric):
+    """일 단위 집계가 있는 범위 (첫날, 마지막 날) 또는 None"""
+    bounds = MetricRollup.objects.filter(
+        church_id=church_id, metric=metric, granularity=Granularity.DAY,
+    ).aggregate(first=Min('period_start'), last=Max('period_start'))
+    return (bounds['first'], bounds['last']) if bounds['first'] else None
+
+
+def update_church(church, today=None):
+    """마지막 집계일(또는 최근 ROLLUP_LOOKBACK_DAYS일, 변경 표시일) 이후 어제까지 갱신. 계산한 (시작, 끝) 반환"""
+    today = today or timezone.localdate(timezone=ZoneInfo(church.timezone))
+    end = today - timedelta(days=1)
+    start = end - timedelta(days=get_lookback_days() - 1)
+
+    lasts = [coverage[1] for coverage in (get_coverage(church.pk, metric) for metric in METRICS) if coverage]
+    if lasts:
+        start = min(start, min(lasts) + timedelta(days=1))
+    dirty = pop_dirty(church.pk)
+    if dirty is not None and dirty < start:
+        start = dirty
+    if start > end:
+        return None
+
+    rebuild(church.pk, start, end)
+    return start, end
+
+
+def _make_handler(source_metrics):
+    def handler(sender, instance, **kwargs):
+        for metric in source_metrics:
+            day = getattr(instance, METRICS[metric].date_field, None)
+            church_id = getattr(instance, 'church_id', None)
+            if isinstance(day, date) and church_id:
+                # 커밋 전에 갱신이 표시를 소비하고 변경 전 데이터를 집계하지 않도록 커밋 후 표시
+                transaction.on_commit(lambda: mark_dirty(church_id, day))
+                return
+    return handler
+
+
+def connect_signals():
+    """원본 모델 저장/삭제 시 변경 표시"""
+    models = {}
+    for metric, source in METRICS.items():
+        models.setdefault(source.model, []).append(metric)
+    for label, source_metrics in models.items():
+        model = apps.get_model(label)
+        handler = _make_handler(source_metrics)
+        post_save.connect(handler, sender=model, weak=False, dispatch_uid=f"metric_rollup_save_{label}")
+        post_delete.connect(handler, sender=model, weak=False, dispatch_uid=f"metric_rollup_delete_{label}")
+
+
+# 조회
+
+def _collect(church_id, metric, ranges):
+    """{키: (시작, 끝)} 구간별 합계 bucket. 집계된 범위는 저장 행, 나머지는 원본에서 집계"""
+    coverage = get_coverage(church_id, metric)
+    dirty = peek_dirty(church_id)
+    if coverage and dirty is not None and dirty <= coverage[1]:
+        # 변경 표시일부터는 저장 행이 아직 다시 계산 전이므로 원본에서 집계
+        coverage = (coverage[0], dirty - timedelta(days=1)) if dirty > coverage[0] else None
+    results = {key: _bucket() for key in ranges}
+    stored = {}
+    live = []
+    for key, (start, end) in ranges.items():
+        if coverage and max(start, coverage[0]) <= min(end, coverage[1]):
+            covered_start, covered_end = max(start, coverage[0]), min(end, coverage[1])
+            for piece in split_pieces(covered_start, covered_end):
+                stored[piece] = key
+            if start < covered_start:
+                live.append((key, start, covered_start - timedelta(days=1)))
+            if covered_end < end:
+                live.append((key, covered_end + timedelta(days=1), end))
+        else:
+            live.append((key, start, end))
+
+    if stored:
+        condition = Q()
+        for granularity in {granularity for granularity, _ in stored}:
+            starts = [day for level, day in stored if level == granularity]
+            condition |= Q(granularity=granularity, period_start__in=starts)
+        rows = MetricRollup.objects.filter(condition, church_id=church_id, metric=metric).values_list(
+            'granularity', 'period_start', 'value', 'count', 'breakdown',
+        )
+        for granularity, day, value, count, breakdown in rows:
+            _add(results[stored[(granularity, day)]], value, count, breakdown)
+
+    if live:
+        # 집계 전 구간은 보통 범위 앞(백필 전)과 뒤(오늘)뿐이므로 이어진 구간을 묶어 한 번씩 조회
+        for span_start, span_end in _spans([(start, end) for _, start, end in live]):
+            days = collect_days(church_id, metric, span_start, span_end)
+            for key, start, end in live:
+                for day, bucket in days.items():
+                    if start <= day <= end:
+                        _merge(results[key], bucket)
+    return results
+
+
+def _spans(ranges):
+    spans = []
+    for start, end in sorted(ranges):
+        if spans and start <= spans[-1][1] + timedelta(days=1):
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+    return spans
+
+
+def aggregate(church_id, metric, start, end):
+    """기간 합계 {'value', 'count', 'breakdown'}"""
+    return aggregate_ranges(church_id, metric, {None: (start, end)})[None]
+
+
+def aggregate_ranges(church_id, metric, ranges):
+    """여러 기간 합계를 한 번에 {키: {'value', 'count', 'breakdown'}} (ranges: {키: (시작, 끝)})"""
+    return {key: _shape(metric, bucket) for key, bucket in _collect(church_id, metric, ranges).items()}
+
+
+def series(church_id, metric, granularity, start, end):
+    """구간별 값 목록 [{'period_start', 'value', 'count', 'breakdown'}] (기록 없는 구간 포함)"""
+    periods = {first: (lo, hi) for first, lo, hi in iter_periods(granularity, start, end)}
+    results = _collect(church_id, metric, periods)
+    return [dict({'period_start': first}, **_shape(metric, results[first])) for first in periods]
+
+
+def combine(rows):
+    """series 행들의 합계 {'value', 'count', 'breakdown'}"""
+    total = {'value': 0, 'count': 0, 'breakdown': {}}
+    for row in rows:
+        total['value'] += row['value']
+        total['count'] += row['count']
+        for key, item in row['breakdown'].items():
+            target = total['breakdown'].setdefault(key, {'value': 0, 'count': 0})
+            target['value'] += item['value']
+            target['count'] += item['count']
+    return total
+
+
+def year_over_year(church_id, metric, year, granularity=Granularity.MONTH, until=None):
+    """올해(until까지)와 전년 같은 기간의 구간별 값과 증감률"""
+    until = until or timezone.localdate()
+    start = date(year, 1, 1)
+    end = until if year == until.year else date(year, 12, 31)
+    current = series(church_id, metric, granularity, start, end)
+    previous = series(church_id, metric, granularity, start - relativedelta(years=1), end - relativedelta(years=1))
+
+    current_total = sum(row['value'] for row in current)
+    previous_total = sum(row['value'] for row in previous)
+    change = round((current_total - previous_total) / previous_total * 100, 1) if previous_total else None
+    return {
+        'metric': str(metric),
+        'granularity': str(granularity),
+        'current': current,
+        'previous': previous,
+        'current_total': current_total,
+        'previous_total': previous_total,
+        'change_rate': float(change) if change is not None else None,
+    }
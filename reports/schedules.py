@@ -0,0 +1,219 @@
+"""
+리포트 스케줄(ReportSchedule) 디스패처
+
+매분 실행되는 dispatch_due_schedules()가 next_run이 지난 스케줄을
+부분 인덱스(report_schedule_due_idx)로 조회하고 select_for_update(skip_locked=True)로
+배치 단위로 가져가므로 여러 워커가 동시에 돌아도 같은 스케줄을 두 번 실행하지 않으며,
+전체 스케줄 수와 무관하게 실행 대상만 읽습니다.
+
+가져간 스케줄은 리포트를 만들어 생성 엔진(reports.engine)에 넘기고, 다음 실행 시각을
+교회 시간대 기준 cron 표현식으로 계산해 둡니다. 생성이 끝나면 record_result()가
+결과를 기록하며, 실패하면 재시도 간격을 지수적으로 늘립니다(다음 정기 실행보다 늦어지지 않음).
+
+설정 (모두 선택 사항):
+    REPORT_SCHEDULE_BATCH_SIZE = 100      # 한 트랜잭션에서 가져갈 스케줄 수
+    REPORT_SCHEDULE_RETRY_BASE = 300      # 첫 재시도 대기 (초)
+    REPORT_SCHEDULE_RETRY_MAX = 86400     # 최대 재시도 대기 (초)
+    REPORT_SCHEDULE_STUCK_AFTER = 7200    # 실행중 표시가 이보다 오래되면 작업자 중단으로 간주 (초)
+
+Celery beat 예시 (settings.CELERY_BEAT_SCHEDULE):
+    'dispatch-report-schedules': {
+        'task': 'utils.tasks.dispatch_report_schedules',
+        'schedule': 60.0,
+    }
+"""
+from celery.schedules import crontab
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from zoneinfo import ZoneInfo
+import logging
+
+from .engine import enqueue_report
+from .models import Report, ReportSchedule
+
+logger = logging.getLogger(__name__)
+
+# 생성 주기별 리포트 기간 (어제까지)
+FREQUENCY_PERIODS = {
+    'daily': relativedelta(days=1),
+    'weekly': relativedelta(weeks=1),
+    'monthly': relativedelta(months=1),
+    'quarterly': relativedelta(months=3),
+    'yearly': relativedelta(years=1),
+}
+
+# 다음 실행 시각 탐색 범위 (2월 29일 같은 드문 표현식 포함)
+MAX_SEARCH_DAYS = 366 * 5
+
+
+def get_batch_size():
+    return getattr(settings, 'REPORT_SCHEDULE_BATCH_SIZE', 100)
+
+
+def get_retry_delay(error_count):
+    """연속 실패 횟수에 따른 재시도 대기 (초)"""
+    base = getattr(settings, 'REPORT_SCHEDULE_RETRY_BASE', 300)
+    limit = getattr(settings, 'REPORT_SCHEDULE_RETRY_MAX', 86400)
+    return min(base * 2 ** max(error_count - 1, 0), limit)
+
+
+def get_stuck_after():
+    return getattr(settings, 'REPORT_SCHEDULE_STUCK_AFTER', 7200)
+
+
+def parse_cron(expression):
+    """5필드 cron 표현식 (분 시 일 월 요일) 검증 및 파싱"""
+    fields = (expression or '').split()
+    if len(fields) != 5:
+        raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression!r}")
+    minute, hour, day_of_month, month_of_year, day_of_week = fields
+    return crontab(
+        minute=minute, hour=hour, day_of_month=day_of_month,
+        month_of_year=month_of_year, day_of_week=day_of_week,
+    )
+
+
+def next_run_after(expression, after, tzinfo):
+    """after 이후 첫 실행 시각 (tzinfo 기준으로 해석한 cron 표현식)"""
+    schedule = parse_cron(expression)
+    _, _, dom_field, _, dow_field = expression.split()
+    # cron 규칙: 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행
+    either_day = dom_field != '*' and dow_field != '*'
+    minutes = sorted(schedule.minute)
+    hours = sorted(schedule.hour)
+
+    start = after.astimezone(tzinfo).replace(second=0, microsecond=0, tzinfo=None) + timedelta(minutes=1)
+    day = start.date()
+    for _ in range(MAX_SEARCH_DAYS):
+        if day.month in schedule.month_of_year:
+            dom_match = day.day in schedule.day_of_month
+            dow_match = (day.weekday() + 1) % 7 in schedule.day_of_week
+            if (dom_match or dow_match) if either_day else (dom_match and dow_match):
+                for hour in hours:
+                    for minute in minutes:
+                        candidate = datetime(day.year, day.month, day.day, hour, minute)
+                        if candidate >= start:
+                            return candidate.replace(tzinfo=tzinfo)
+        day += timedelta(days=1)
+    raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식입니다: {expression!r}")
+
+
+def get_schedule_timezone(schedule):
+    return ZoneInfo(schedule.template.church.timezone)
+
+
+def report_period(template, now, tzinfo):
+    """생성 주기에 맞는 리포트 기간 (교회 시간대 기준 어제까지)"""
+    end = now.astimezone(tzinfo).date() - timedelta(days=1)
+    period = FREQUENCY_PERIODS.get(template.generate_frequency, FREQUENCY_PERIODS['weekly'])
+    return end - period + timedelta(days=1), end
+
+
+def _dispatch(schedule, now):
+    """스케줄 하나 실행: 리포트 생성 예약 후 다음 실행 시각 갱신"""
+    tzinfo = get_schedule_timezone(schedule)
+    template = schedule.template
+    schedule.last_run = now
+    schedule.next_run = next_run_after(schedule.cron_expression, now, tzinfo)
+
+    start, end = report_period(template, now, tzinfo)
+    report = Report.objects.create(
+        church_id=template.church_id,
+        template=template,
+        schedule=schedule,
+        title=f"{template.name} ({start} ~ {end})",
+        start_date=start,
+        end_date=end,
+    )
+    _, started = enqueue_report(report)
+    if not started:
+        # 같은 템플릿/기간이 이미 생성 중
+        report.delete()
+    schedule.is_running = started
+    schedule.save(update_fields=['last_run', 'next_run', 'is_running', 'updated_at'])
+    return started
+
+
+def _invalid(schedule, error):
+    """표현식 오류 스케줄은 비활성화 (매분 다시 가져가지 않도록)"""
+    logger.warning(f"Report schedule {schedule.pk} disabled: {error}")
+    schedule.is_active = False
+    schedule.last_success = False
+    schedule.save(update_fields=['is_active', 'last_success', 'updated_at'])
+
+
+def _postpone(schedule, now):
+    """예약 자체가 실패한 스케줄은 재시도 대기 후 다시 실행"""
+    schedule.is_running = False
+    schedule.last_success = False
+    schedule.error_count += 1
+    schedule.next_run = now + timedelta(seconds=get_retry_delay(schedule.error_count))
+    schedule.save(update_fields=['is_running', 'last_success', 'error_count', 'next_run', 'updated_at'])
+
+
+def claim_due_schedules(now, batch_size):
+    """실행 대상 스케줄 잠금 (다른 워커가 잠근 행은 건너뜀). 트랜잭션 안에서 호출"""
+    return list(
+        ReportSchedule.objects.select_for_update(skip_locked=True, of=('self',))
+        .select_related('template__church')
+        .filter(is_active=True, is_running=False, next_run__lte=now)
+        .order_by('next_run')[:batch_size]
+    )
+
+
+def release_stuck_schedules(now):
+    """작업자 중단 등으로 실행중 표시가 남은 스케줄을 다시 실행 대상으로"""
+    return ReportSchedule.objects.filter(
+        is_active=True, is_running=True, last_run__lt=now - timedelta(seconds=get_stuck_after())
+    ).update(is_running=False, last_success=False)
+
+
+def dispatch_due_schedules(now=None, batch_size=None, max_batches=50):
+    """실행 시각이 지난 스케줄 처리. 처리한 스케줄 수 반환"""
+    now = now or timezone.now()
+    batch_size = batch_size or get_batch_size()
+    release_stuck_schedules(now)
+
+    dispatched = 0
+    for _ in range(max_batches):
+        with transaction.atomic():
+            schedules = claim_due_schedules(now, batch_size)
+            for schedule in schedules:
+                try:
+                    with transaction.atomic():
+                        _dispatch(schedule, now)
+                except ValueError as e:
+                    _invalid(schedule, e)
+                except Exception:
+                    logger.exception(f"Report schedule {schedule.pk} dispatch failed")
+                    _postpone(schedule, now)
+        dispatched += len(schedules)
+        if len(schedules) < batch_size:
+            break
+
+    if dispatched:
+        logger.info(f"Dispatched {dispatched} report schedules")
+    return dispatched
+
+
+def record_result(report):
+    """스케줄로 생성된 리포트의 결과 기록 (실패 시 지수 백오프로 재시도 시각 앞당김)"""
+    with transaction.atomic():
+        schedule = ReportSchedule.objects.select_for_update().filter(pk=report.schedule_id).first()
+        if schedule is None:
+            return None
+
+        schedule.is_running = False
+        if report.status == Report.Status.COMPLETED:
+            schedule.last_success = True
+            schedule.error_count = 0
+        else:
+            schedule.last_success = False
+            schedule.error_count += 1
+            retry_at = timezone.now() + timedelta(seconds=get_retry_delay(schedule.error_count))
+            schedule.next_run = min(schedule.next_run, retry_at)
+        schedule.save(update_fields=['is_running', 'last_success', 'error_count', 'next_run', 'updated_at'])
+    return schedule
@@ -48,10 +48,17 @@ class ReportSerializer(serializers.ModelSerializer):
             'generated_by_name', 'generated_at', 'completed_at'
         ]
         read_only_fields = ['id', 'status', 'error_message', 'generated_at', 'completed_at']
+    
+    def to_representation(self, instance):
+        """data는 요약만 반환. 시계열은 ?include=series 요청 시에만 포함"""
+        representation = super().to_representation(instance)
+        if self.context.get('include_series'):
+            representation['series'] = instance.series
+        return representation
 
 
 class ReportListSerializer(serializers.ModelSerializer):
-    """리포트 목록용 시리얼라이저"""
+    """리포트 목록용 시리얼라이저 (data/series_blob을 읽지 않음, 뷰에서 defer)"""
     template_name = serializers.CharField(source='template.name', read_only=True)
     
     class Meta:
@@ -140,6 +147,28 @@ class ReportScheduleSerializer(serializers.ModelSerializer):
             'is_active', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'last_run', 'is_running', 'last_success', 'error_count', 'created_at', 'updated_at']
+        extra_kwargs = {'next_run': {'required': False}}
+
+    def validate_cron_expression(self, value):
+        from .schedules import parse_cron
+
+        try:
+            parse_cron(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        return value
+
+    def validate(self, attrs):
+        # 다음 실행 시각을 지정하지 않았거나 표현식이 바뀌면 교회 시간대 기준으로 계산
+        from zoneinfo import ZoneInfo
+        from .schedules import next_run_after
+
+        expression = attrs.get('cron_expression') or self.instance.cron_expression
+        cron_changed = self.instance is None or expression != self.instance.cron_expression
+        if 'next_run' not in attrs and cron_changed:
+            template = attrs.get('template') or self.instance.template
+            attrs['next_run'] = next_run_after(expression, timezone.now(), ZoneInfo(template.church.timezone))
+        return attrs
 
 
 class ExportLogSerializer(serializers.ModelSerializer):
@@ -149,7 +178,7 @@ class ExportLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = ExportLog
         fields = [
-            'id', 'export_type', 'status', 'filters', 'file_path',
+            'id', 'export_type', 'status', 'filters', 'file_format', 'file_path',
             'file_size', 'record_count', 'error_message',
             'requested_by_name', 'requested_at', 'completed_at', 'expires_at'
         ]
@@ -164,7 +193,7 @@ class ExportLogCreateSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = ExportLog
-        fields = ['export_type', 'filters']
+        fields = ['export_type', 'filters', 'file_format']
 
 
 class StatisticsOverviewSerializer(serializers.Serializer):
@@ -229,9 +258,14 @@ class MinistryReportListSerializer(serializers.ModelSerializer):
         ]
 
     def get_attachment_count(self, obj):
+        # 뷰셋 목록 쿼리에서 집계한 값이 있으면 사용
+        if hasattr(obj, 'attachment_count'):
+            return obj.attachment_count
         return obj.get_attachment_count()
 
     def get_comment_count(self, obj):
+        if hasattr(obj, 'comment_count'):
+            return obj.comment_count
         return obj.comments.filter(is_deleted=False).count()
 
 
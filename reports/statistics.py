@@ -0,0 +1,217 @@
+"""
+일별 통계 요약(StatisticsSummary) 증분 계산
+
+매일 밤 교회별로 전날 하루치 요약 한 행을 만듭니다. 전체 테이블을 다시 훑지 않고
+- 하루 단위 지표(신규 교인, 헌금, 응답된 기도제목, 출석)는 해당 날짜 구간만 인덱스 범위로 집계하고
+- 누계 지표(이번 주 출석, 이번 달 신규/헌금)는 전날 요약 행에 당일 증분을 더하며
+  (주 시작 일요일, 월 시작 1일에 초기화)
+- 현재 총량 지표(교인/그룹/기도제목 수)는 교회별 인덱스 카운트 한 번과 해당 날짜 이후
+  생성분을 빼서 구합니다.
+
+과거 기간 백필은 같은 계산을 기간 전체에 대해 날짜별 GROUP BY 한 번씩으로 처리하고
+bulk_create(update_conflicts=True)로 한 번에 upsert합니다.
+변경 이력이 없으므로 과거 날짜의 총량 지표는 현재 상태에서 역산한 근사값입니다.
+
+Celery beat 예시 (settings.CELERY_BEAT_SCHEDULE):
+    'compute-statistics-summaries': {
+        'task': 'utils.tasks.compute_statistics_summaries',
+        'schedule': crontab(hour=0, minute=30),
+    }
+"""
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from zoneinfo import ZoneInfo
+
+from .models import StatisticsSummary
+
+SUMMARY_FIELDS = [
+    'total_members', 'active_members', 'new_members_today', 'new_members_this_month',
+    'sunday_attendance', 'wednesday_attendance', 'total_attendance_this_week', 'attendance_rate',
+    'total_groups', 'active_groups',
+    'total_prayers', 'active_prayers', 'answered_prayers_today',
+    'total_offerings_today', 'total_offerings_this_month',
+]
+
+# 출석으로 인정하는 상태
+ATTENDED_STATUSES = ['present', 'late', 'early_leave']
+SUNDAY_WORSHIP_TYPES = ['sunday_morning', 'sunday_evening']
+WEDNESDAY_WORSHIP_TYPES = ['wednesday']
+
+
+def week_start(day):
+    """주 시작일 (일요일)"""
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+def _by_day(queryset, day_expression, **measures):
+    """날짜별 집계 {date: {measure: value}}"""
+    rows = queryset.annotate(day=day_expression).values('day').annotate(**measures).order_by()
+    return {row.pop('day'): row for row in rows}
+
+
+def _created_after(daily, measure, day):
+    """day 이후(다음 날부터 현재까지) 생성된 수"""
+    return sum(row[measure] for created, row in daily.items() if created > day)
+
+
+def _collect(church, window_start, end):
+    """window_start 이후 날짜별 증분과 교회별 현재 총량 집계"""
+    from attendance.models import Attendance
+    from groups.models import Group
+    from members.models import Member
+    from offerings.models import Offering
+    from prayers.models import Prayer
+
+    tzinfo = ZoneInfo(church.timezone)
+    created_day = TruncDate('created_at', tzinfo=tzinfo)
+    # __date 조회 대신 시각 범위로 걸어 created_at 인덱스를 사용
+    created_since = {'created_at__gte': datetime.combine(window_start, time.min, tzinfo=tzinfo)}
+
+    members = Member.objects.filter(church=church, is_active=True)
+    groups = Group.objects.filter(church=church)
+    prayers = Prayer.objects.filter(church=church)
+    active_member = Q(status=Member.MemberStatus.ACTIVE)
+    active_prayer = Q(status=Prayer.Status.ACTIVE)
+
+    attended = Q(status__in=ATTENDED_STATUSES)
+    return {
+        'members': _by_day(
+            members.filter(**created_since), created_day,
+            created=Count('pk'), created_active=Count('pk', filter=active_member),
+        ),
+        'groups': _by_day(
+            groups.filter(**created_since), created_day,
+            created=Count('pk'), created_active=Count('pk', filter=Q(is_active=True)),
+        ),
+        'prayers': _by_day(
+            prayers.filter(**created_since), created_day,
+            created=Count('pk'), created_active=Count('pk', filter=active_prayer),
+        ),
+        'answered': _by_day(
+            prayers.filter(answered_date__gte=window_start), F('answered_date'),
+            answered=Count('pk'),
+        ),
+        'attendance': _by_day(
+            Attendance.objects.filter(church=church, date__range=(window_start, end)), F('date'),
+            total=Count('pk', filter=attended),
+            sunday=Count('pk', filter=attended & Q(worship_type__in=SUNDAY_WORSHIP_TYPES)),
+            wednesday=Count('pk', filter=attended & Q(worship_type__in=WEDNESDAY_WORSHIP_TYPES)),
+        ),
+        'offerings': _by_day(
+            Offering.objects.filter(church=church, date__range=(window_start, end)), F('date'),
+            amount=Sum('amount'),
+        ),
+        'current': {
+            **members.aggregate(members=Count('pk'), active_members=Count('pk', filter=active_member)),
+            **groups.aggregate(groups=Count('pk'), active_groups=Count('pk', filter=Q(is_active=True))),
+            **prayers.aggregate(prayers=Count('pk'), active_prayers=Count('pk', filter=active_prayer)),
+        },
+    }
+
+
+def build_summaries(church, start, end, previous=None):
+    """
+    start~end 날짜별 요약 객체 목록 (저장하지 않음)
+
+    previous가 start 전날 요약이면 누계를 이어받고, 없으면 직전 7일(최근 주일/수요일 포함)과
+    월 시작일 중 이른 날부터 다시 누적합니다.
+    """
+    if previous is not None and previous.date != start - timedelta(days=1):
+        previous = None
+    window_start = start if previous else min(start - timedelta(days=6), start.replace(day=1))
+    data = _collect(church, window_start, end)
+    current = data['current']
+    zero = {'total': 0, 'sunday': 0, 'wednesday': 0}
+
+    running = {
+        'week_attendance': previous.total_attendance_this_week if previous else 0,
+        'month_members': previous.new_members_this_month if previous else 0,
+        'month_offerings': previous.total_offerings_this_month if previous else Decimal('0'),
+        'sunday': previous.sunday_attendance if previous else 0,
+        'wednesday': previous.wednesday_attendance if previous else 0,
+    }
+
+    summaries = []
+    day = window_start
+    while day <= end:
+        if day == week_start(day):
+            running['week_attendance'] = 0
+        if day.day == 1:
+            running['month_members'] = 0
+            running['month_offerings'] = Decimal('0')
+
+        attendance = data['attendance'].get(day, zero)
+        new_members = data['members'].get(day, {}).get('created', 0)
+        offerings = data['offerings'].get(day, {}).get('amount') or Decimal('0')
+        running['week_attendance'] += attendance['total']
+        running['month_members'] += new_members
+        running['month_offerings'] += offerings
+        # 해당 예배 요일에만 갱신하고 그 외 날짜는 직전 값 유지
+        if day.weekday() == 6:
+            running['sunday'] = attendance['sunday']
+        if day.weekday() == 2:
+            running['wednesday'] = attendance['wednesday']
+
+        if day >= start:
+            active_members = current['active_members'] - _created_after(data['members'], 'created_active', day)
+            summaries.append(StatisticsSummary(
+                church=church,
+                date=day,
+                total_members=current['members'] - _created_after(data['members'], 'created', day),
+                active_members=active_members,
+                new_members_today=new_members,
+                new_members_this_month=running['month_members'],
+                sunday_attendance=running['sunday'],
+                wednesday_attendance=running['wednesday'],
+                total_attendance_this_week=running['week_attendance'],
+                attendance_rate=round(running['sunday'] / active_members * 100, 2) if active_members > 0 else 0.0,
+                total_groups=current['groups'] - _created_after(data['groups'], 'created', day),
+                active_groups=current['active_groups'] - _created_after(data['groups'], 'created_active', day),
+                total_prayers=current['prayers'] - _created_after(data['prayers'], 'created', day),
+                # 이후에 응답된 기도제목은 해당 날짜에는 진행중이었던 것으로 간주
+                active_prayers=(
+                    current['active_prayers']
+                    - _created_after(data['prayers'], 'created_active', day)
+                    + _created_after(data['answered'], 'answered', day)
+                ),
+                answered_prayers_today=data['answered'].get(day, {}).get('answered', 0),
+                total_offerings_today=offerings,
+                total_offerings_this_month=running['month_offerings'],
+            ))
+        day += timedelta(days=1)
+
+    return summaries
+
+
+def save_summaries(summaries):
+    """(church, date) 기준 upsert"""
+    return StatisticsSummary.objects.bulk_create(
+        summaries,
+        update_conflicts=True,
+        unique_fields=['church', 'date'],
+        update_fields=SUMMARY_FIELDS + ['calculated_at'],
+    )
+
+
+def compute_daily_summary(church, day=None):
+    """하루치 요약 계산 (기본: 교회 시간대 기준 어제). 전날 요약 행이 있으면 증분만 집계"""
+    day = day or timezone.localdate(timezone=ZoneInfo(church.timezone)) - timedelta(days=1)
+    previous = StatisticsSummary.objects.filter(church=church, date=day - timedelta(days=1)).first()
+    return save_summaries(build_summaries(church, day, day, previous=previous))[0]
+
+
+def backfill_summaries(church, start, end, chunk_days=92):
+    """기간 요약 백필. chunk_days 단위로 나눠 계산하고 직전 청크의 마지막 행을 이어받음"""
+    previous = StatisticsSummary.objects.filter(church=church, date=start - timedelta(days=1)).first()
+    written = 0
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end)
+        summaries = save_summaries(build_summaries(church, chunk_start, chunk_end, previous=previous))
+        written += len(summaries)
+        previous = summaries[-1]
+        chunk_start = chunk_end + timedelta(days=1)
+    return written
@@ -1,3 +1,767 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import pytest
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from zoneinfo import ZoneInfo
+from attendance.models import Attendance
+from groups.models import Group
+from members.models import Member
+from reports import columnar, engine, exports, ministry, rendering, rollups, schedules, statistics, widgets
+from rest_framework.test import APIRequestFactory, force_authenticate
+from reports.models import (
+    Dashboard, ExportLog, MetricRollup, MinistryReport, MinistryReportComment, MinistryReportTemplate, Report,
+    ReportSchedule, ReportTemplate, StatisticsSummary,
+)
+from utils.factories import (
+    AttendanceFactory, ChurchFactory, ChurchUserFactory, GroupFactory, MemberFactory, OfferingFactory,
+)
+from volunteering.models import VolunteerAssignment, VolunteerRole
 
-# Create your tests here.
+
+@pytest.mark.django_db
+class TestReportEngine:
+    """리포트 생성 엔진 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.queued = []
+        monkeypatch.setattr('utils.tasks.generate_report.delay', self.queued.append)
+        cache.clear()
+        self.church = ChurchFactory()
+        self.end = date.today()
+        self.start = self.end - timedelta(days=60)
+
+    def make_report(self, report_type, **template_options):
+        template = ReportTemplate.objects.create(
+            church=self.church, name=f'{report_type} 리포트', report_type=report_type, **template_options
+        )
+        return Report.objects.create(
+            church=self.church, template=template, title='테스트', start_date=self.start, end_date=self.end
+        )
+
+    def test_attendance_report_data(self):
+        member = MemberFactory(church=self.church)
+        other = MemberFactory(church=self.church)
+        AttendanceFactory(church=self.church, member=member, date=self.end)
+        AttendanceFactory(church=self.church, member=other, date=self.end, status=Attendance.AttendanceStatus.ABSENT)
+        AttendanceFactory(church=self.church, member=member, date=self.start - timedelta(days=7))
+        report = self.make_report(ReportTemplate.ReportType.ATTENDANCE)
+
+        assert engine.run_report(report.pk) == Report.Status.COMPLETED
+
+        report.refresh_from_db()
+        assert report.data['totals']['records'] == 2
+        assert report.data['totals']['attendance_rate'] == 50.0
+        assert report.data['by_status']['absent'] == 1
+        assert sum(row['records'] for row in report.series) == 2
+        assert 'series' not in report.data
+        assert engine.get_progress(report.pk)['percent'] == 100
+
+    def test_weekly_granularity(self):
+        report = self.make_report(ReportTemplate.ReportType.MEMBER, config={'granularity': 'week'})
+
+        engine.run_report(report.pk)
+
+        report.refresh_from_db()
+        assert report.status == Report.Status.COMPLETED
+        assert len(report.series) >= 9
+        assert ReportTemplate.objects.get(pk=report.template_id).last_generated is not None
+
+    def test_concurrent_regeneration_deduplicated(self, django_capture_on_commit_callbacks):
+        first = self.make_report(ReportTemplate.ReportType.PRAYER)
+        second = Report.objects.create(
+            church=self.church, template=first.template, title='중복', start_date=self.start, end_date=self.end
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert engine.enqueue_report(first) == (first, True)
+            running, started = engine.enqueue_report(second)
+        assert not started and running.pk == first.pk
+        assert self.queued == [first.pk]
+
+        engine.run_report(first.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            assert engine.enqueue_report(second)[1]
+        assert self.queued == [first.pk, second.pk]
+
+    def test_series_stored_columnar(self):
+        rows = [
+            {'period': f'2024-{month:02d}', 'records': month * 1000, 'rate': month / 3, 'note': None}
+            for month in range(1, 13)
+        ]
+        report = self.make_report(ReportTemplate.ReportType.ATTENDANCE)
+        report.set_data({'totals': {'records': 78000}, 'series': rows})
+        report.save()
+
+        loaded = Report.objects.get(pk=report.pk)
+        assert loaded.data == {'totals': {'records': 78000}}
+        assert loaded.series == rows
+        assert len(loaded.series_blob) < len(json.dumps(rows))
+        assert columnar.decode_series(loaded.series_blob, ['records'])[-1] == {'records': 12000}
+
+    def test_legacy_series_in_data(self):
+        report = self.make_report(ReportTemplate.ReportType.MEMBER)
+        Report.objects.filter(pk=report.pk).update(data={'series': [{'period': '2024-01', 'new_members': 3}]})
+
+        assert Report.objects.get(pk=report.pk).series == [{'period': '2024-01', 'new_members': 3}]
+
+    def test_unsupported_type_fails(self):
+        report = self.make_report(ReportTemplate.ReportType.CUSTOM)
+
+        assert engine.run_report(report.pk) == Report.Status.FAILED
+
+        report.refresh_from_db()
+        assert report.error_message
+
+
+@pytest.mark.django_db
+class TestStatisticsSummary:
+    """일별 통계 요약 증분 계산 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.church = ChurchFactory()
+        self.today = timezone.localdate()
+        self.sunday = statistics.week_start(self.today)
+        self.members = [
+            MemberFactory(church=self.church, status=Member.MemberStatus.ACTIVE),
+            MemberFactory(church=self.church, status=Member.MemberStatus.ACTIVE),
+            MemberFactory(church=self.church, status=Member.MemberStatus.INACTIVE),
+        ]
+        for member in self.members[:2]:
+            AttendanceFactory(
+                church=self.church, member=member, date=self.sunday,
+                worship_type=Attendance.WorshipType.SUNDAY_MORNING, status=Attendance.AttendanceStatus.PRESENT,
+            )
+        OfferingFactory(church=self.church, member=self.members[0], date=self.today, amount=Decimal('10000'))
+        OfferingFactory(
+            church=self.church, member=self.members[0], date=self.today.replace(day=1), amount=Decimal('5000')
+        )
+
+    def test_daily_summary(self):
+        summary = statistics.compute_daily_summary(self.church, self.today)
+
+        assert (summary.total_members, summary.active_members, summary.new_members_today) == (3, 2, 3)
+        assert summary.sunday_attendance == 2
+        assert summary.attendance_rate == 100.0
+        assert summary.total_attendance_this_week == 2
+        expected_month = Decimal('10000') if self.today.day == 1 else Decimal('15000')
+        assert summary.total_offerings_today == Decimal('10000')
+        assert summary.total_offerings_this_month == expected_month
+
+    def test_backfill_upserts_range(self):
+        StatisticsSummary.objects.create(church=self.church, date=self.today, total_members=99)
+
+        assert statistics.backfill_summaries(self.church, self.today - timedelta(days=9), self.today, chunk_days=4) == 10
+
+        rows = StatisticsSummary.objects.filter(church=self.church).order_by('date')
+        assert rows.count() == 10
+        # 오늘 생성된 교인은 과거 날짜 총량에서 제외
+        assert rows.first().total_members == 0
+        assert rows.last().total_members == 3
+
+    def test_incremental_matches_full_recompute(self):
+        statistics.backfill_summaries(self.church, self.today - timedelta(days=3), self.today - timedelta(days=1))
+
+        incremental = statistics.compute_daily_summary(self.church, self.today)
+        full = statistics.build_summaries(self.church, self.today, self.today)[0]
+
+        for field in statistics.SUMMARY_FIELDS:
+            assert getattr(incremental, field) == getattr(full, field), field
+
+    def test_backfill_command_ends_yesterday_by_default(self):
+        from django.core.management import call_command
+
+        yesterday = date.today() - timedelta(days=1)
+        call_command(
+            'backfill_statistics', '--start', (yesterday - timedelta(days=1)).isoformat(),
+            '--church', str(self.church.pk), stdout=io.StringIO(),
+        )
+
+        dates = list(StatisticsSummary.objects.filter(church=self.church).order_by('date').values_list('date', flat=True))
+        assert dates == [yesterday - timedelta(days=1), yesterday]
+
+
+
+@pytest.mark.django_db
+class TestMetricRollups:
+    """지표 기간 집계 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.church = ChurchFactory()
+        self.member = MemberFactory(church=self.church, registration_date=date(2024, 1, 5))
+        for day, amount, offering_type in [
+            (date(2024, 1, 10), '10000', 'TITHE'),
+            (date(2024, 2, 20), '20000', 'THANKSGIVING'),
+            (date(2024, 5, 5), '30000', 'TITHE'),
+            (date(2024, 12, 31), '40000', 'TITHE'),
+        ]:
+            OfferingFactory(church=self.church, member=self.member, date=day, amount=Decimal(amount), offering_type=offering_type)
+
+    def test_levels_derived_from_days(self):
+        rollups.backfill(self.church.pk, date(2024, 1, 1), date(2024, 12, 31))
+
+        rows = MetricRollup.objects.filter(church=self.church, metric='offerings')
+        assert rows.get(granularity='month', period_start=date(2024, 1, 1)).value == Decimal('10000')
+        assert rows.get(granularity='quarter', period_start=date(2024, 1, 1)).value == Decimal('30000')
+        year = rows.get(granularity='year', period_start=date(2024, 1, 1))
+        assert (year.value, year.count) == (Decimal('100000'), 4)
+        assert year.breakdown['TITHE']['count'] == 3
+        assert rows.filter(granularity='day').count() == 366
+
+    def test_aggregate_matches_raw_with_live_tail(self, django_capture_on_commit_callbacks):
+        rollups.backfill(self.church.pk, date(2024, 1, 1), date(2024, 6, 30))
+        with django_capture_on_commit_callbacks(execute=True):
+            OfferingFactory(church=self.church, member=self.member, date=date(2024, 3, 3), amount=Decimal('5000'))
+
+        # 3월 3일(변경 표시일) 이후와 7월 이후(집계 전)는 원본에서
+        total = rollups.aggregate(self.church.pk, 'offerings', date(2024, 1, 15), date(2024, 12, 31))
+        assert (total['value'], total['count']) == (Decimal('95000'), 4)
+
+        monthly = rollups.series(self.church.pk, 'offerings', 'month', date(2024, 1, 1), date(2024, 12, 31))
+        assert len(monthly) == 12
+        assert [row['value'] for row in monthly if row['count']] == [10000, 20000, 5000, 30000, 40000]
+
+    def test_backfill_fills_gap_next_to_existing_coverage(self):
+        OfferingFactory(church=self.church, member=self.member, date=date(2023, 6, 1), amount=Decimal('100'))
+        rollups.backfill(self.church.pk, date(2025, 1, 1), date(2025, 12, 31))
+
+        # 2021년만 요청해도 2025년 집계 앞까지 이어서 계산
+        assert rollups.backfill(self.church.pk, date(2021, 1, 1), date(2021, 12, 31)) == 1461
+
+        assert rollups.get_coverage(self.church.pk, 'offerings') == (date(2021, 1, 1), date(2025, 12, 31))
+        total = rollups.aggregate(self.church.pk, 'offerings', date(2023, 1, 1), date(2023, 12, 31))
+        assert (total['value'], total['count']) == (Decimal('100'), 1)
+
+    def test_write_into_covered_day_is_visible_before_next_run(self, django_capture_on_commit_callbacks):
+        today = date(2024, 2, 3)
+        rollups.update_church(self.church, today=today)
+        yesterday = today - timedelta(days=1)
+        assert rollups.aggregate(self.church.pk, 'offerings', yesterday, yesterday)['value'] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            OfferingFactory(church=self.church, member=self.member, date=yesterday, amount=Decimal('3000'))
+
+        assert rollups.aggregate(self.church.pk, 'offerings', yesterday, yesterday)['value'] == Decimal('3000')
+        rollups.update_church(self.church, today=today)
+        assert rollups.peek_dirty(self.church.pk) is None
+        assert rollups.aggregate(self.church.pk, 'offerings', yesterday, yesterday)['value'] == Decimal('3000')
+
+    def test_mark_is_not_lost_while_pop_holds_lock(self):
+        rollups.mark_dirty(self.church.pk, date(2024, 3, 1))
+        marker = ThreadPoolExecutor(max_workers=1)
+
+        with rollups._dirty_lock(self.church.pk):
+            # pop이 잠금을 가진 동안(조회 ~ 삭제 사이) 더 이른 날 표시는 대기
+            pending = marker.submit(rollups.mark_dirty, self.church.pk, date(2024, 2, 1))
+            time.sleep(0.05)
+            assert not pending.done()
+            assert cache.get(rollups.DIRTY_KEY.format(church_id=self.church.pk)) == date(2024, 3, 1)
+            cache.delete(rollups.DIRTY_KEY.format(church_id=self.church.pk))
+        pending.result(timeout=5)
+        marker.shutdown()
+
+        assert rollups.pop_dirty(self.church.pk) == date(2024, 2, 1)
+        assert rollups.pop_dirty(self.church.pk) is None
+
+    def test_update_church_recomputes_dirty_days(self, django_capture_on_commit_callbacks):
+        rollups.backfill(self.church.pk, date(2024, 1, 1), date(2024, 1, 31))
+        rollups.pop_dirty(self.church.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            OfferingFactory(church=self.church, member=self.member, date=date(2024, 1, 20), amount=Decimal('7000'))
+
+        assert rollups.update_church(self.church, today=date(2024, 2, 3)) == (date(2024, 1, 20), date(2024, 2, 2))
+
+        month = MetricRollup.objects.get(
+            church=self.church, metric='offerings', granularity='month', period_start=date(2024, 1, 1)
+        )
+        assert month.value == Decimal('17000')
+        assert rollups.update_church(self.church, today=date(2024, 2, 3)) == (date(2024, 1, 27), date(2024, 2, 2))
+
+    def test_year_over_year_reads_few_rows(self, django_assert_max_num_queries):
+        rollups.backfill(self.church.pk, date(2023, 1, 1), date(2024, 12, 31))
+
+        with django_assert_max_num_queries(4):
+            result = rollups.year_over_year(self.church.pk, 'offerings', 2024, until=date(2025, 1, 1))
+
+        assert result['current_total'] == Decimal('100000') and result['previous_total'] == 0
+        assert len(result['current']) == len(result['previous']) == 12
+
+
+@pytest.mark.django_db
+class TestDashboardWidgets:
+    """대시보드 위젯 데이터 캐시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, monkeypatch):
+        settings.DASHBOARD_WIDGET_WORKERS = 1
+        cache.clear()
+        self.calls = []
+        self.refreshes = []
+        monkeypatch.setitem(widgets.WIDGETS, 'counter', lambda church_id, options: self.calls.append(options) or len(self.calls))
+        monkeypatch.setattr('utils.tasks.refresh_dashboard_widget.delay', lambda *args: self.refreshes.append(args))
+        self.church = ChurchFactory()
+
+    def make_dashboard(self, *widget_list, refresh_interval=300):
+        return Dashboard.objects.create(
+            church=self.church, name=f'대시보드 {Dashboard.objects.count()}',
+            widgets=list(widget_list), refresh_interval=refresh_interval,
+        )
+
+    def test_widget_results_shared_between_dashboards(self):
+        first = self.make_dashboard({'id': 'a', 'type': 'counter', 'options': {'n': 1}})
+        second = self.make_dashboard({'id': 'b', 'type': 'counter', 'options': {'n': 1}})
+
+        assert widgets.resolve_widgets(first)[0]['data'] == 1
+        result = widgets.resolve_widgets(second)[0]
+        assert (result['id'], result['data'], result['stale']) == ('b', 1, False)
+        assert len(self.calls) == 1
+
+    def test_stale_value_served_while_refresh_queued_once(self, monkeypatch, django_capture_on_commit_callbacks):
+        dashboard = self.make_dashboard({'id': 'a', 'type': 'counter'}, refresh_interval=60)
+        widgets.resolve_widgets(dashboard)
+
+        later = timezone.now() + timedelta(seconds=61)
+        monkeypatch.setattr(widgets.timezone, 'now', lambda: later)
+        for _ in range(3):
+            with django_capture_on_commit_callbacks(execute=True):
+                result = widgets.resolve_widgets(dashboard)[0]
+            assert (result['data'], result['stale']) == (1, True)
+
+        assert len(self.calls) == 1
+        assert len(self.refreshes) == 1
+
+    def test_cold_miss_waits_for_concurrent_computation(self, settings):
+        settings.DASHBOARD_WIDGET_COMPUTE_WAIT = 5
+        widget = {'id': 'a', 'type': 'counter'}
+        # 갱신 주기 0이어도 동시에 요청한 사용자끼리는 계산 결과를 공유
+        dashboard = self.make_dashboard(widget, refresh_interval=0)
+        key = widgets.widget_key(self.church.id, widget)
+        assert widgets._acquire_compute(self.church.id, widget)
+
+        def finish_other_request():
+            widgets.compute_widget(self.church.id, widget, 1)
+            cache.delete(f"{key}:computing")
+
+        timer = threading.Timer(0.1, finish_other_request)
+        timer.start()
+        result = widgets.resolve_widgets(dashboard)[0]
+        timer.join()
+
+        assert (result['data'], result['stale']) == (1, False)
+        assert len(self.calls) == 1
+
+    def test_cold_miss_returns_pending_after_wait(self, settings):
+        settings.DASHBOARD_WIDGET_COMPUTE_WAIT = 0.1
+        widget = {'id': 'a', 'type': 'counter'}
+        dashboard = self.make_dashboard(widget)
+        cache.add(f"{widgets.widget_key(self.church.id, widget)}:computing", 1, 5)
+
+        result = widgets.resolve_widgets(dashboard)[0]
+
+        assert (result['data'], result['pending']) == (None, True)
+        assert self.calls == []
+
+    def test_unknown_widget_reports_error(self):
+        dashboard = self.make_dashboard({'id': 'x', 'type': 'unknown'}, {'id': 'p', 'type': 'prayer_overview'})
+
+        unknown, prayers = widgets.resolve_widgets(dashboard)
+
+        assert 'error' in unknown
+        assert prayers['data']['total'] == 0
+
+
+@pytest.mark.django_db
+class TestReportScheduleDispatcher:
+    """리포트 스케줄 디스패처 테스트"""
+
+    seoul = ZoneInfo('Asia/Seoul')
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, django_capture_on_commit_callbacks):
+        self.queued = []
+        monkeypatch.setattr('utils.tasks.generate_report.delay', self.queued.append)
+        cache.clear()
+        self.church = ChurchFactory()
+        self.now = timezone.now()
+        self.capture = django_capture_on_commit_callbacks
+
+    def make_schedule(self, report_type=ReportTemplate.ReportType.MEMBER, cron='0 9 * * 1', **fields):
+        template = ReportTemplate.objects.create(
+            church=self.church, name=f'{report_type} {ReportSchedule.objects.count()}',
+            report_type=report_type, generate_frequency='weekly',
+        )
+        fields.setdefault('next_run', self.now - timedelta(minutes=1))
+        return ReportSchedule.objects.create(template=template, cron_expression=cron, **fields)
+
+    def dispatch(self):
+        with self.capture(execute=True):
+            return schedules.dispatch_due_schedules(now=self.now)
+
+    def test_next_run_in_church_timezone(self):
+        sunday = datetime(2024, 6, 2, 12, 0, tzinfo=self.seoul)
+
+        assert schedules.next_run_after('0 9 * * 1', sunday, self.seoul) == datetime(2024, 6, 3, 9, 0, tzinfo=self.seoul)
+        # 일/요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (6월 3일 월요일)
+        assert schedules.next_run_after('30 6 15 * 1', sunday, self.seoul).day == 3
+        assert schedules.next_run_after('*/15 * * * *', sunday, self.seoul).minute == 15
+
+    def test_dispatches_only_due_schedules(self):
+        due = self.make_schedule()
+        later = self.make_schedule(next_run=self.now + timedelta(hours=1))
+
+        assert self.dispatch() == 1
+
+        due.refresh_from_db()
+        assert due.is_running and due.last_run == self.now
+        assert due.next_run > self.now and due.next_run.astimezone(self.seoul).weekday() == 0
+        report = due.reports.get()
+        assert self.queued == [report.pk]
+        assert (report.end_date - report.start_date).days == 6
+        assert not later.reports.exists()
+        # 실행중인 스케줄은 다시 가져가지 않음
+        assert self.dispatch() == 0
+
+    def test_success_resets_errors(self):
+        schedule = self.make_schedule(error_count=2)
+        self.dispatch()
+
+        engine.run_report(schedule.reports.get().pk)
+
+        schedule.refresh_from_db()
+        assert (schedule.is_running, schedule.last_success, schedule.error_count) == (False, True, 0)
+
+    def test_failure_backs_off_exponentially(self, settings):
+        settings.REPORT_SCHEDULE_RETRY_BASE = 60
+        schedule = self.make_schedule(ReportTemplate.ReportType.CUSTOM, cron='0 9 1 1 *', error_count=2)
+        self.dispatch()
+
+        engine.run_report(schedule.reports.get().pk)
+
+        schedule.refresh_from_db()
+        assert (schedule.is_running, schedule.last_success, schedule.error_count) == (False, False, 3)
+        assert schedule.next_run <= timezone.now() + timedelta(seconds=240)
+        assert schedules.get_retry_delay(30) == 86400
+
+    def test_invalid_expression_disables_schedule(self):
+        schedule = self.make_schedule(cron='0 25 * * *')
+
+        self.dispatch()
+
+        schedule.refresh_from_db()
+        assert not schedule.is_active
+        assert not schedule.reports.exists()
+
+
+@pytest.mark.django_db
+class TestDataExport:
+    """데이터 내보내기 엔진 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.EXPORT_CHUNK_ROWS = 2
+        cache.clear()
+        self.church = ChurchFactory()
+        self.members = [MemberFactory(church=self.church) for _ in range(5)]
+        for member in self.members:
+            AttendanceFactory(church=self.church, member=member, date=date(2024, 6, 2))
+
+    def make_export(self, export_type=ExportLog.ExportType.ATTENDANCE, file_format=ExportLog.FileFormat.CSV):
+        return ExportLog.objects.create(church=self.church, export_type=export_type, file_format=file_format)
+
+    def read_lines(self, export):
+        with default_storage.open(export.file_path, 'rb') as file:
+            return gzip.decompress(file.read()).decode('utf-8').splitlines()
+
+    def test_csv_export_in_chunks(self):
+        export = self.make_export()
+
+        assert exports.run_export(export.pk) == ExportLog.Status.COMPLETED
+
+        export.refresh_from_db()
+        lines = self.read_lines(export)
+        assert lines[0].startswith('id,date,member_id,member_name')
+        assert len(lines) == 6 and export.record_count == 5
+        assert export.checkpoint['datasets']['attendance']['parts'] == 3
+        assert export.expires_at is not None
+        assert not default_storage.exists(exports._part_name(export, 'attendance', 1))
+
+    def test_resumes_from_checkpoint(self, monkeypatch):
+        export = self.make_export(file_format=ExportLog.FileFormat.NDJSON)
+        original = exports.Dataset.iter_chunk
+        calls = []
+
+        def crash_on_second_chunk(dataset, *args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise ConnectionError('작업자 중단')
+            return original(dataset, *args)
+
+        monkeypatch.setattr(exports.Dataset, 'iter_chunk', crash_on_second_chunk)
+        assert exports.run_export(export.pk) == ExportLog.Status.FAILED
+        export.refresh_from_db()
+        assert export.record_count == 2
+
+        assert exports.run_export(export.pk) == ExportLog.Status.COMPLETED
+        export.refresh_from_db()
+        # 첫 조각 다음 위치부터 다시 읽음
+        assert calls[2][2] == calls[1][2] > 0
+        ids = [json.loads(line)['id'] for line in self.read_lines(export)]
+        assert sorted(ids) == sorted(set(ids)) and len(ids) == 5
+
+    def test_full_backup_csv_is_zip_per_dataset(self):
+        export = self.make_export(ExportLog.ExportType.FULL_BACKUP)
+
+        exports.run_export(export.pk)
+
+        export.refresh_from_db()
+        with default_storage.open(export.file_path, 'rb') as file, zipfile.ZipFile(file) as archive:
+            names = archive.namelist()
+            assert 'members.csv' in names and 'prayers.csv' in names
+            assert len(archive.read('members.csv').decode('utf-8').splitlines()) == 6
+
+    def test_purge_expired_exports(self):
+        export = self.make_export(ExportLog.ExportType.MEMBER)
+        exports.run_export(export.pk)
+        export.refresh_from_db()
+        path = export.file_path
+        ExportLog.objects.filter(pk=export.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        assert exports.purge_expired_exports() == 1
+
+        export.refresh_from_db()
+        assert export.status == ExportLog.Status.EXPIRED and not export.file_path
+        assert not default_storage.exists(path)
+
+
+@pytest.mark.django_db
+class TestReportRendering:
+    """리포트 PDF/Excel 렌더링 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, tmp_path, monkeypatch):
+        pytest.importorskip('reportlab')
+        pytest.importorskip('openpyxl')
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.REPORT_RENDER_WORKERS = 0
+        self.rendered = []
+        monkeypatch.setattr('utils.tasks.render_report_files.delay', lambda *args: self.rendered.append(args))
+        cache.clear()
+        self.church = ChurchFactory()
+        self.member = MemberFactory(church=self.church)
+
+    def make_report(self):
+        template = ReportTemplate.objects.create(
+            church=self.church, name='출석 리포트', report_type=ReportTemplate.ReportType.ATTENDANCE,
+            config={'granularity': 'day'},
+        )
+        return Report.objects.create(
+            church=self.church, template=template, title='출석 현황', start_date=date.today() - timedelta(days=120),
+            end_date=date.today(),
+        )
+
+    def test_completed_report_queues_rendering(self, django_capture_on_commit_callbacks):
+        report = self.make_report()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            engine.run_report(report.pk)
+
+        assert self.rendered == [([report.pk], ['pdf', 'xlsx'])]
+
+    def test_render_reports_stores_files(self):
+        AttendanceFactory(church=self.church, member=self.member, date=date.today())
+        report = self.make_report()
+        engine.run_report(report.pk)
+
+        results = rendering.render_reports([report.pk])
+
+        report.refresh_from_db()
+        assert results[report.pk] >= 2
+        with report.pdf_file.open('rb') as file:
+            assert file.read(5) == b'%PDF-'
+        with report.excel_file.open('rb') as file:
+            assert zipfile.ZipFile(file).namelist()
+
+    def test_failed_render_does_not_store(self, monkeypatch):
+        report = self.make_report()
+        engine.run_report(report.pk)
+        monkeypatch.setattr(rendering, 'render_pdf', lambda payload: 1 / 0)
+
+        assert rendering.render_reports([report.pk], ['pdf']) == {report.pk: None}
+
+        report.refresh_from_db()
+        assert not report.pdf_file
+
+    def test_markup_in_text_is_escaped(self):
+        payload = {
+            'report_id': 1, 'title': 'Youth <b>', 'church': 'A & B 교회', 'start_date': '2024-01-01',
+            'end_date': '2024-01-31', 'summary': '<script>1 < 2</script>', 'data': {'totals': {'a<b': 1}},
+        }
+
+        content, pages = rendering.render_pdf(payload)
+
+        assert content.startswith(b'%PDF-') and pages == 1
+
+    def test_daemon_process_renders_in_process(self, settings, monkeypatch):
+        settings.REPORT_RENDER_WORKERS = 2
+        monkeypatch.setattr(rendering, '_executor', None)
+        monkeypatch.setattr(rendering.multiprocessing.current_process(), 'daemon', True, raising=False)
+
+        assert rendering.get_executor() is None
+        assert rendering._executor is None
+
+    def test_render_task_fans_out_per_report(self):
+        from utils.tasks import render_report_files
+
+        assert render_report_files.queue == 'rendering'
+        assert render_report_files([1, 2], ['pdf']) is None
+        assert self.rendered == [([1], ['pdf']), ([2], ['pdf'])]
+
+
+@pytest.mark.django_db
+class TestMinistryReportQueue:
+    """사역 보고서 목록/검토 대기열 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.church = ChurchFactory()
+        self.admin = ChurchUserFactory(church=self.church, role='church_admin')
+        now = timezone.now()
+        for index in range(5):
+            report = MinistryReport.objects.create(
+                church=self.church, reporter=self.admin, title=f'보고서 {index}', summary='요약', content='본문',
+                report_date=date.today(), attachments=[{'name': 'a.pdf'}] * index,
+                status=MinistryReport.Status.SUBMITTED if index % 2 else MinistryReport.Status.DRAFT,
+                submitted_at=now - timedelta(days=index),
+            )
+            for number in range(index):
+                MinistryReportComment.objects.create(
+                    report=report, author=self.admin, content='댓글', is_deleted=number == 0
+                )
+
+    def get_queryset(self, action_name):
+        views = pytest.importorskip('reports.views', exc_type=ImportError)
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=self.admin.user)
+        view = views.MinistryReportViewSet(
+            action_map={'get': action_name}, kwargs={'church_id': self.church.id}, format_kwarg=None
+        )
+        view.request = view.initialize_request(request)
+        return view.get_queryset()
+
+    def test_list_counts_annotated(self, django_assert_num_queries):
+        queryset = self.get_queryset('list').order_by('title')
+
+        with django_assert_num_queries(1):
+            counts = [(report.comment_count, report.attachment_count) for report in queryset]
+        assert counts == [(max(index - 1, 0), index) for index in range(5)]
+        assert 'content' in queryset.query.deferred_loading[0]
+
+    def test_detail_prefetches_comments(self):
+        report = self.get_queryset('retrieve').get(title='보고서 3')
+
+        assert not hasattr(report, 'comment_count')
+        assert len(report.comments.all()) == 3
+
+
+@pytest.mark.django_db
+class TestMinistryReportBulkCreate:
+    """사역 보고서 템플릿 일괄 생성 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.church = ChurchFactory()
+        self.template = MinistryReportTemplate.objects.create(
+            church=self.church, name='셀 주간 보고', category=MinistryReport.ReportCategory.WEEKLY,
+            fields_config={'questions': ['출석', '기도제목']}, auto_create=True, auto_create_schedule='weekly',
+        )
+        self.role = VolunteerRole.objects.create(church=self.church, name='교사', code='teacher')
+        self.teachers = [ChurchUserFactory(church=self.church) for _ in range(3)]
+        for church_user in self.teachers:
+            VolunteerAssignment.objects.create(church_user=church_user, volunteer_role=self.role)
+        self.leader = ChurchUserFactory(church=self.church)
+        for name in ('1셀', '2셀'):
+            GroupFactory(church=self.church, name=name, leader=MemberFactory(
+                church=self.church, email=self.leader.user.email, phone='',
+            ))
+        self.day = date(2026, 3, 4)
+
+    def test_creates_drafts_for_role_holders(self, django_assert_max_num_queries):
+        with django_assert_max_num_queries(6):
+            result = ministry.create_reports(self.template, self.day, volunteer_role_ids=[self.role.pk])
+
+        start, end = ministry.get_period(self.template, self.day)
+        assert result['created'] == 3
+        assert result['period'] == [start.isoformat(), end.isoformat()]
+        reports = MinistryReport.objects.filter(church=self.church)
+        assert {report.reporter_id for report in reports} == {church_user.pk for church_user in self.teachers}
+        assert all(
+            report.status == MinistryReport.Status.DRAFT and report.start_date == start
+            and report.volunteer_role_id == self.role.pk and report.custom_data == self.template.fields_config
+            for report in reports
+        )
+
+    def test_group_leaders_one_report_per_group(self):
+        result = ministry.create_reports(self.template, self.day, group_type='cell')
+
+        assert result['created'] == 2
+        assert set(MinistryReport.objects.values_list('reporter_id', 'department__name')) == {
+            (self.leader.pk, '1셀'), (self.leader.pk, '2셀'),
+        }
+
+    def test_group_leader_email_matches_case_insensitively(self):
+        leader = ChurchUserFactory(church=self.church, user__email='Cell.Leader@Example.com')
+        group = GroupFactory(church=self.church, name='3셀', leader=MemberFactory(
+            church=self.church, email='cell.leader@example.com', phone='',
+        ))
+
+        targets = ministry.leader_targets(self.church, Group.objects.filter(pk=group.pk))
+
+        assert [(church_user.pk, target_group.pk) for church_user, target_group, _ in targets] == [(leader.pk, group.pk)]
+
+    def test_skips_existing_reports_in_period(self):
+        self.template.create_report_for_user(self.teachers[0], self.day - timedelta(days=1))
+
+        first = ministry.create_reports(self.template, self.day, volunteer_role_ids=[self.role.pk])
+        second = ministry.create_reports(self.template, self.day + timedelta(days=1), volunteer_role_ids=[self.role.pk])
+
+        assert (first['created'], first['skipped']) == (2, 1)
+        assert (second['created'], second['skipped']) == (0, 3)
+        assert MinistryReport.objects.count() == 3
+
+    def test_scheduled_task_uses_template_targets_on_period_start(self):
+        self.template.target_roles.add(self.role)
+        start, _ = ministry.get_period(self.template, self.day)
+
+        assert ministry.create_scheduled_reports(today=start + timedelta(days=1)) == {}
+        assert ministry.create_scheduled_reports(today=start) == {self.template.pk: 3}
+
+    @pytest.mark.parametrize('volunteer_roles', [5, '5', {'id': 5}, ['a']])
+    def test_view_rejects_invalid_volunteer_roles(self, volunteer_roles):
+        views = pytest.importorskip('reports.views', exc_type=ImportError)
+        admin = ChurchUserFactory(church=self.church, role='church_admin')
+        request = APIRequestFactory().post(
+            '/', {'volunteer_roles': volunteer_roles, 'report_date': self.day.isoformat()}, format='json'
+        )
+        force_authenticate(request, user=admin.user)
+
+        response = views.MinistryReportTemplateViewSet.as_view({'post': 'bulk_create_reports'})(
+            request, pk=self.template.pk, church_id=self.church.id
+        )
+
+        assert response.status_code == 400
+        assert MinistryReport.objects.count() == 0
@@ -3,7 +3,11 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Sum, Avg, Q
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Count, Sum, Avg, Q, Func, IntegerField, Value
+from django.db.models.functions import Coalesce
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils import timezone
 from datetime import date, timedelta
 from .models import (
@@ -22,12 +26,20 @@ from .serializers import (
     MinistryReportUpdateSerializer, MinistryReportTemplateSerializer,
     MinistryReportCommentSerializer, MinistryReportStatusUpdateSerializer
 )
+from .columnar import iter_series, stream_json_array
+from .engine import enqueue_report, get_progress
+from .rendering import FORMATS
+from .widgets import resolve_widgets
 from church_core.unified_permissions import UnifiedPermission
+from church_core.permission_scope import PermissionScopedQuerysetMixin
+from church_core.church_context import ChurchContextMixin
+from church_core.db_router import ReplicaReadMixin
+from church_core.stats import Dimension, StatsSpec
 from users.models import ChurchUser
 from church.models import Church
 
 
-class ReportTemplateViewSet(viewsets.ModelViewSet):
+class ReportTemplateViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """리포트 템플릿 ViewSet"""
     resource_name = 'reporttemplate'
     queryset = ReportTemplate.objects.all()
@@ -43,23 +55,10 @@ class ReportTemplateViewSet(viewsets.ModelViewSet):
         return ReportTemplateSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -70,7 +69,7 @@ class ReportTemplateViewSet(viewsets.ModelViewSet):
             serializer.save(created_by=self.request.user)
 
 
-class ReportViewSet(viewsets.ModelViewSet):
+class ReportViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """리포트 ViewSet"""
     resource_name = 'report'
     queryset = Report.objects.all()
@@ -87,46 +86,109 @@ class ReportViewSet(viewsets.ModelViewSet):
             return ReportCreateSerializer
         return ReportSerializer
     
+    def include_series(self):
+        return 'series' in self.request.query_params.get('include', '').split(',')
+    
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
+        queryset = self.filter_by_user_churches(self.queryset)
+        # 목록은 리포트 데이터를 읽지 않고, 상세는 요청할 때만 시계열 blob을 읽음
+        if self.action == 'list':
+            return queryset.defer('data', 'series_blob')
+        if self.action != 'series' and not (self.action == 'retrieve' and self.include_series()):
+            return queryset.defer('series_blob')
         return queryset
     
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['include_series'] = self.action == 'retrieve' and self.include_series()
+        return context
+    
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
-            serializer.save(
+            report = serializer.save(
                 church=church_user.church,
                 generated_by=self.request.user
             )
         else:
-            serializer.save(generated_by=self.request.user)
+            report = serializer.save(generated_by=self.request.user)
+        
+        enqueue_report(report)
     
     @action(detail=True, methods=['post'])
-    def regenerate(self, request, pk=None):
+    def regenerate(self, request, pk=None, church_id=None):
         """리포트 재생성"""
         report = self.get_object()
         
-        # 리포트 재생성 로직 (비동기 처리 권장)
-        report.status = Report.Status.GENERATING
-        report.save()
+        # 같은 템플릿/기간이 이미 생성 중이면 새로 시작하지 않음
+        target, started = enqueue_report(report)
+        
+        return Response({
+            "message": "리포트 재생성이 시작되었습니다." if started else "같은 기간의 리포트가 이미 생성 중입니다.",
+            "report_id": target.id,
+            "status": target.status,
+            "progress": get_progress(target.id)
+        }, status=status.HTTP_202_ACCEPTED)
+    
+    @action(detail=True, methods=['get'])
+    def progress(self, request, pk=None, church_id=None):
+        """리포트 생성 진행 상황"""
+        report = self.get_object()
+        
+        return Response({
+            "report_id": report.id,
+            "status": report.status,
+            "progress": get_progress(report.id),
+            "error_message": report.error_message
+        })
+    
+    @action(detail=True, methods=['get'])
+    def series(self, request, pk=None, church_id=None):
+        """리포트 시계열 스트리밍 (JSON 배열, ?columns=period,attended 로 열 선택)"""
+        report = self.get_object()
+        columns = [name for name in request.query_params.get('columns', '').split(',') if name]
+        
+        if report.series_blob:
+            rows = iter_series(report.series_blob, columns or None)
+        else:
+            rows = (
+                {name: row.get(name) for name in columns} if columns else row
+                for row in report.data.get('series', [])
+            )
+        
+        response = StreamingHttpResponse(stream_json_array(rows), content_type='application/json')
+        response['X-Report-Id'] = str(report.id)
+        return response
+    
+    @action(detail=True, methods=['post'])
+    def render(self, request, pk=None, church_id=None):
+        """리포트 PDF/Excel 파일 다시 만들기"""
+        from utils.tasks import render_report_files
+        report = self.get_object()
+        
+        if report.status != Report.Status.COMPLETED:
+            return Response(
+                {"error": "완료된 리포트만 파일로 만들 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        formats = request.data.get('formats') or list(FORMATS)
+        if isinstance(formats, str) or not set(formats) <= set(FORMATS):
+            return Response(
+                {"error": f"formats는 {list(FORMATS)} 중에서 선택해야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        return Response({"message": "리포트 재생성이 시작되었습니다."})
+        transaction.on_commit(lambda: render_report_files.delay([report.id], list(formats)))
+        return Response({
+            "message": "리포트 파일 생성이 시작되었습니다.",
+            "report_id": report.id,
+            "formats": formats
+        }, status=status.HTTP_202_ACCEPTED)
 
 
-class DashboardViewSet(viewsets.ModelViewSet):
+class DashboardViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """대시보드 ViewSet"""
     resource_name = 'dashboard'
     queryset = Dashboard.objects.all()
@@ -142,23 +204,10 @@ class DashboardViewSet(viewsets.ModelViewSet):
         return DashboardSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
             serializer.save(
@@ -168,8 +217,19 @@ class DashboardViewSet(viewsets.ModelViewSet):
         else:
             serializer.save(created_by=self.request.user)
 
+    @action(detail=True, methods=['get'])
+    def data(self, request, pk=None, church_id=None):
+        """대시보드 위젯 데이터 (위젯별 refresh_interval 동안 캐시 공유)"""
+        dashboard = self.get_object()
 
-class StatisticsSummaryViewSet(viewsets.ReadOnlyModelViewSet):
+        return Response({
+            "dashboard_id": dashboard.id,
+            "refresh_interval": dashboard.refresh_interval,
+            "widgets": resolve_widgets(dashboard)
+        })
+
+
+class StatisticsSummaryViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """통계 요약 ViewSet"""
     resource_name = 'statisticssummary'
     queryset = StatisticsSummary.objects.all()
@@ -180,30 +240,19 @@ class StatisticsSummaryViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['-date']
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     @action(detail=False, methods=['get'])
-    def overview(self, request):
+    def overview(self, request, church_id=None):
         """통계 개요"""
-        church_id = self.kwargs.get('church_id')
         today = date.today()
-        
-        # 최근 7일간의 통계
+
+        # 최근 7일 내 가장 최신 요약 한 행 ((church, date) 인덱스 역순 조회)
+        # 요약 행은 reports.statistics에서 매일 밤 미리 계산됨
         recent_stats = self.get_queryset().filter(
+            church_id=church_id,
             date__gte=today - timedelta(days=7)
-        ).first()
+        ).order_by('-date').first()
         
         if not recent_stats:
             return Response({"detail": "통계 데이터가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
@@ -241,7 +290,7 @@ class StatisticsSummaryViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
-class ReportScheduleViewSet(viewsets.ModelViewSet):
+class ReportScheduleViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """리포트 스케줄 ViewSet"""
     resource_name = 'reportschedule'
     queryset = ReportSchedule.objects.all()
@@ -252,23 +301,11 @@ class ReportScheduleViewSet(viewsets.ModelViewSet):
     ordering = ['next_run']
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            # 스케줄은 템플릿을 통해 교회별로 필터링
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(template__church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(template__church_id=church_id)
-        
-        return queryset
+        # 스케줄은 템플릿을 통해 교회별로 필터링
+        return self.filter_by_user_churches(self.queryset, field='template__church')
 
 
-class ExportLogViewSet(viewsets.ModelViewSet):
+class ExportLogViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """내보내기 로그 ViewSet"""
     resource_name = 'exportlog'
     queryset = ExportLog.objects.all()
@@ -283,31 +320,47 @@ class ExportLogViewSet(viewsets.ModelViewSet):
         return ExportLogSerializer
     
     def get_queryset(self):
-        user = self.request.user
-        church_id = self.kwargs.get('church_id')
-        
-        if user.is_superuser:
-            queryset = self.queryset
-        else:
-            user_churches = user.church_users.values_list('church', flat=True)
-            queryset = self.queryset.filter(church__in=user_churches)
-        
-        if church_id:
-            queryset = queryset.filter(church_id=church_id)
-        
-        return queryset
+        return self.filter_by_user_churches(self.queryset)
     
     def perform_create(self, serializer):
-        church_id = self.kwargs.get('church_id')
-        church_user = self.request.user.church_users.filter(church_id=church_id).first()
+        church_user = self.get_church_user()
         
         if church_user:
-            serializer.save(
+            export = serializer.save(
                 church=church_user.church,
                 requested_by=self.request.user
             )
         else:
-            serializer.save(requested_by=self.request.user)
+            export = serializer.save(requested_by=self.request.user)
+        
+        from utils.tasks import run_data_export
+        transaction.on_commit(lambda: run_data_export.delay(export.pk))
+    
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None, church_id=None):
+        """내보내기 파일 다운로드 (저장소에서 스트리밍)"""
+        export = self.get_object()
+        
+        if export.status != ExportLog.Status.COMPLETED or not export.file_path:
+            return Response({"detail": "다운로드할 수 있는 파일이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        
+        return FileResponse(
+            default_storage.open(export.file_path, 'rb'),
+            as_attachment=True,
+            filename=export.file_path.rsplit('/', 1)[-1]
+        )
+    
+    @action(detail=True, methods=['post'])
+    def resume(self, request, pk=None, church_id=None):
+        """실패한 내보내기 재시도 (저장된 체크포인트부터 이어서 처리)"""
+        export = self.get_object()
+        
+        if export.status != ExportLog.Status.FAILED:
+            return Response({"detail": "실패한 내보내기만 재시도할 수 있습니다."}, status=status.HTTP_400_BAD_REQUEST)
+        
+        from utils.tasks import run_data_export
+        transaction.on_commit(lambda: run_data_export.delay(export.pk))
+        return Response({"message": "내보내기를 다시 시작합니다.", "record_count": export.record_count}, status=status.HTTP_202_ACCEPTED)
     
     @action(detail=False, methods=['get'])
     def my_exports(self, request):
@@ -324,7 +377,49 @@ class ExportLogViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class MinistryReportViewSet(viewsets.ModelViewSet):
+MINISTRY_REPORT_STATS = StatsSpec(
+    'reports.ministry_statistics',
+    measures={
+        'total_reports': Count('pk'),
+        'pending_reviews': Count('pk', filter=Q(
+            status__in=[MinistryReport.Status.SUBMITTED, MinistryReport.Status.REVIEWED]
+        )),
+        'this_month': lambda: Count('pk', filter=Q(
+            report_date__year=timezone.now().year,
+            report_date__month=timezone.now().month
+        )),
+        'recent_activity': lambda: Count('pk', filter=Q(
+            created_at__gte=timezone.now() - timezone.timedelta(days=7)
+        )),
+    },
+    dimensions={
+        'by_status': Dimension('status', choices=MinistryReport.Status),
+        'by_category': Dimension('category', choices=MinistryReport.ReportCategory),
+    },
+    cache_domains=['reports'],
+)
+
+
+class JSONArrayLength(Func):
+    """JSON 배열 길이 (첨부 파일 수를 행마다 불러오지 않고 DB에서 계산)"""
+    function = 'JSON_ARRAY_LENGTH'
+    output_field = IntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, function='JSONB_ARRAY_LENGTH', **extra_context)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, function='JSON_LENGTH', **extra_context)
+
+
+# 목록/검토 대기열에서 쓰지 않는 긴 본문 필드 (상세 조회에서만 불러옴)
+MINISTRY_REPORT_LIST_DEFERRED = (
+    'content', 'achievements', 'challenges', 'next_plans', 'prayer_requests',
+    'custom_data', 'attachments', 'review_comments',
+)
+
+
+class MinistryReportViewSet(ChurchContextMixin, PermissionScopedQuerysetMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """사역 보고서 ViewSet"""
     resource_name = 'ministryreport'
     permission_classes = [permissions.IsAuthenticated, UnifiedPermission]
@@ -335,17 +430,29 @@ class MinistryReportViewSet(viewsets.ModelViewSet):
     ordering = ['-report_date', '-created_at']
 
     def get_church(self):
-        """교회 ID 가져오기"""
-        church_id = self.kwargs.get('church_id')
-        return Church.objects.get(id=church_id)
+        """교회 가져오기 (요청 단위 교회 컨텍스트 재사용)"""
+        church = self.church_context.church
+        if church is None:
+            church = Church.objects.get(id=self.kwargs.get('church_id'))
+        return church
+
+    # 목록용 시리얼라이저를 쓰는 액션 (댓글/첨부 수를 쿼리에서 집계)
+    list_actions = ('list', 'my_reports', 'pending_reviews')
 
     def get_queryset(self):
         queryset = MinistryReport.objects.filter(church=self.get_church()).select_related(
             'reporter', 'department', 'volunteer_role', 'reviewer'
-        ).prefetch_related('comments__author')
+        )
+        if self.action in self.list_actions:
+            queryset = queryset.defer(*MINISTRY_REPORT_LIST_DEFERRED).annotate(
+                comment_count=Count('comments', filter=Q(comments__is_deleted=False)),
+                attachment_count=Coalesce(JSONArrayLength('attachments'), Value(0)),
+            )
+        else:
+            queryset = queryset.prefetch_related('comments__author')
         
-        # UnifiedPermission이 객체 수준에서 처리
-        return queryset
+        # UnifiedPermission의 권한 범위를 목록에도 동일하게 적용
+        return self.apply_permission_scope(queryset)
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -363,7 +470,7 @@ class MinistryReportViewSet(viewsets.ModelViewSet):
         """보고서 생성"""
         serializer.save(
             church=self.get_church(),
-            reporter=self.request.user.church_user
+            reporter=self.get_church_user()
         )
 
     # perform_update는 UnifiedPermission에서 처리
@@ -389,7 +496,7 @@ class MinistryReportViewSet(viewsets.ModelViewSet):
         """보고서 제출"""
         report = self.get_object()
         
-        if report.reporter != request.user.church_user:
+        if report.reporter != self.get_church_user():
             return Response(
                 {'error': '본인 작성 보고서만 제출할 수 있습니다.'},
                 status=status.HTTP_403_FORBIDDEN
@@ -419,7 +526,7 @@ class MinistryReportViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        report.approve(request.user.church_user, comments)
+        report.approve(self.get_church_user(), comments)
         return Response({
             'status': 'approved',
             'message': '보고서가 승인되었습니다.'
@@ -443,71 +550,54 @@ class MinistryReportViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        report.reject(request.user.church_user, comments)
+        report.reject(self.get_church_user(), comments)
         return Response({
             'status': 'rejected',
             'message': '보고서가 반려되었습니다.'
         })
 
     @action(detail=False, methods=['get'])
-    def my_reports(self, request):
+    def my_reports(self, request, church_id=None):
         """내가 작성한 보고서 목록"""
-        queryset = self.get_queryset().filter(reporter=request.user.church_user)
+        queryset = self.get_queryset().filter(reporter=self.get_church_user())
         queryset = self.filter_queryset(queryset)
         
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = MinistryReportListSerializer(page, many=True)
+            serializer = MinistryReportListSerializer(page, many=True, context=self.get_serializer_context())
             return self.get_paginated_response(serializer.data)
         
-        serializer = MinistryReportListSerializer(queryset, many=True)
+        serializer = MinistryReportListSerializer(queryset, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
-    def pending_reviews(self, request):
-        """검토 대기 보고서 목록 (관리자용)"""
+    def pending_reviews(self, request, church_id=None):
+        """검토 대기 보고서 목록 (관리자용, 먼저 제출된 순)"""
         # UnifiedPermission에서 권한 확인
+        # 제출/검토 상태 부분 인덱스 (church, submitted_at, id)로 정렬 없이 제출 순서대로 읽음
         queryset = self.get_queryset().filter(
             status__in=[MinistryReport.Status.SUBMITTED, MinistryReport.Status.REVIEWED]
-        )
+        ).order_by('submitted_at', 'pk')
         
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = MinistryReportListSerializer(page, many=True)
+            serializer = MinistryReportListSerializer(page, many=True, context=self.get_serializer_context())
             return self.get_paginated_response(serializer.data)
         
-        serializer = MinistryReportListSerializer(queryset, many=True)
+        serializer = MinistryReportListSerializer(queryset, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
-    def statistics(self, request):
+    def statistics(self, request, church_id=None):
         """보고서 통계"""
         church = self.get_church()
         queryset = MinistryReport.objects.filter(church=church)
-        
-        stats = {
-            'total_reports': queryset.count(),
-            'by_status': {
-                status_code: queryset.filter(status=status_code).count()
-                for status_code, _ in MinistryReport.Status.choices
-            },
-            'by_category': {
-                category_code: queryset.filter(category=category_code).count()
-                for category_code, _ in MinistryReport.ReportCategory.choices
-            },
-            'this_month': queryset.filter(
-                report_date__year=timezone.now().year,
-                report_date__month=timezone.now().month
-            ).count(),
-            'recent_activity': queryset.filter(
-                created_at__gte=timezone.now() - timezone.timedelta(days=7)
-            ).count()
-        }
+        stats = MINISTRY_REPORT_STATS.evaluate(queryset, church_id=church.id)
         
         return Response(stats)
 
 
-class MinistryReportCommentViewSet(viewsets.ModelViewSet):
+class MinistryReportCommentViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """사역 보고서 댓글 ViewSet"""
     resource_name = 'ministryreportcomment'
     serializer_class = MinistryReportCommentSerializer
@@ -525,13 +615,13 @@ class MinistryReportCommentViewSet(viewsets.ModelViewSet):
         report_id = self.kwargs.get('report_pk')
         serializer.save(
             report_id=report_id,
-            author=self.request.user.church_user
+            author=self.get_church_user()
         )
 
     # perform_destroy는 UnifiedPermission에서 처리
 
 
-class MinistryReportTemplateViewSet(viewsets.ModelViewSet):
+class MinistryReportTemplateViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """사역 보고서 템플릿 ViewSet"""
     serializer_class = MinistryReportTemplateSerializer
     permission_classes = [permissions.IsAuthenticated, UnifiedPermission]
@@ -541,9 +631,11 @@ class MinistryReportTemplateViewSet(viewsets.ModelViewSet):
     ordering = ['name']
 
     def get_church(self):
-        """교회 ID 가져오기"""
-        church_id = self.kwargs.get('church_id')
-        return Church.objects.get(id=church_id)
+        """교회 가져오기 (요청 단위 교회 컨텍스트 재사용)"""
+        church = self.church_context.church
+        if church is None:
+            church = Church.objects.get(id=self.kwargs.get('church_id'))
+        return church
 
     def get_queryset(self):
         return MinistryReportTemplate.objects.filter(
@@ -557,9 +649,51 @@ class MinistryReportTemplateViewSet(viewsets.ModelViewSet):
         report_date = request.data.get('report_date', timezone.now().date())
         
         report = template.create_report_for_user(
-            request.user.church_user,
+            self.get_church_user(),
             report_date
         )
         
         serializer = MinistryReportDetailSerializer(report)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['post'])
+    def bulk_create_reports(self, request, pk=None, church_id=None):
+        """
+        대상별 임시저장 보고서 일괄 생성
+        volunteer_roles(봉사 역할 ID 목록) 또는 group_type(그룹 유형)을 지정하지 않으면 템플릿의 적용 대상 사용
+        """
+        from groups.models import Group
+        from .ministry import create_reports
+        template = self.get_object()
+        
+        report_date = request.data.get('report_date')
+        if report_date:
+            try:
+                report_date = date.fromisoformat(str(report_date))
+            except ValueError:
+                return Response(
+                    {"error": "report_date는 YYYY-MM-DD 형식이어야 합니다."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        role_ids = request.data.get('volunteer_roles')
+        if role_ids is not None:
+            if not isinstance(role_ids, list) or not all(str(role_id).isdigit() for role_id in role_ids):
+                return Response(
+                    {"error": "volunteer_roles는 봉사 역할 ID 목록이어야 합니다."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            role_ids = [int(role_id) for role_id in role_ids]
+        
+        group_type = request.data.get('group_type')
+        if group_type is not None and group_type not in Group.GroupType.values:
+            return Response(
+                {"error": f"group_type은 {Group.GroupType.values} 중에서 선택해야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        result = create_reports(template, report_date, role_ids, group_type)
+        return Response({
+            "message": f"보고서 {result['created']}개가 생성되었습니다.",
+            **result
+        }, status=status.HTTP_201_CREATED if result['created'] else status.HTTP_200_OK)
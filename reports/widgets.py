@@ -0,0 +1,324 @@
+"""
+대시보드 위젯 데이터
+
+Dashboard.widgets의 각 항목을 등록된 위젯 타입으로 계산합니다.
+
+    widgets = [
+        {'id': 'members', 'type': 'statistics_summary'},
+        {'id': 'attendance', 'type': 'attendance_trend', 'options': {'weeks': 12}, 'refresh_interval': 600},
+    ]
+
+출석/헌금 추이와 metric_trend, year_over_year 위젯은 지표 집계(reports.rollups)에서 읽습니다.
+
+위젯 결과는 (교회, 타입, 옵션) 단위로 캐시되어 같은 위젯을 쓰는 모든 대시보드/사용자가 공유합니다.
+- refresh_interval(위젯 값 없으면 대시보드 값) 동안은 캐시 값을 그대로 반환
+- 그 이후 DASHBOARD_WIDGET_MAX_STALE 초까지는 이전 값을 반환하면서(stale-while-revalidate)
+  갱신 태스크를 한 번만 등록
+- 캐시에 값이 없으면 요청 안에서 계산하되, 여러 위젯을 스레드 풀에서 동시에 계산
+  (refresh_interval 0은 캐시 값을 쓰지 않고 매번 계산)
+- 같은 위젯을 여러 요청이 동시에 계산하지 않도록 계산 잠금(cache.add)을 잡은 요청만 계산하고,
+  나머지는 DASHBOARD_WIDGET_COMPUTE_WAIT 초까지 그 결과를 기다린 뒤 계산 중 표시(pending)를 반환
+
+설정 (모두 선택 사항):
+    DASHBOARD_WIDGET_WORKERS = 4        # 동시 계산 스레드 수
+    DASHBOARD_WIDGET_MAX_STALE = 3600   # 갱신 주기 이후 이전 값을 제공할 최대 시간 (초)
+    DASHBOARD_WIDGET_COMPUTE_WAIT = 10  # 다른 요청의 계산 결과를 기다릴 최대 시간 (초)
+    DASHBOARD_WIDGETS = {...}           # 위젯 타입 추가/대체 (타입: 'dotted.path')
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from church_core.stats import StatsSpec
+import contextvars
+import hashlib
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+WIDGET_KEY = 'dashboard_widget:{church_id}:{widget_type}:{params}'
+
+WIDGETS = {}
+
+
+class WidgetError(Exception):
+    """위젯 설정 오류"""
+
+
+def register(widget_type):
+    """위젯 계산 함수 등록 데코레이터: loader(church_id, options) -> JSON 직렬화 가능한 값"""
+    def decorator(loader):
+        WIDGETS[widget_type] = loader
+        return loader
+    return decorator
+
+
+def get_loader(widget_type):
+    overrides = getattr(settings, 'DASHBOARD_WIDGETS', {})
+    if widget_type in overrides:
+        return import_string(overrides[widget_type])
+    if widget_type not in WIDGETS:
+        raise WidgetError(f"지원하지 않는 위젯 타입입니다: {widget_type}")
+    return WIDGETS[widget_type]
+
+
+def get_max_workers():
+    return getattr(settings, 'DASHBOARD_WIDGET_WORKERS', 4)
+
+
+def get_max_stale():
+    return getattr(settings, 'DASHBOARD_WIDGET_MAX_STALE', 3600)
+
+
+def get_compute_wait():
+    return getattr(settings, 'DASHBOARD_WIDGET_COMPUTE_WAIT', 10)
+
+
+def widget_key(church_id, widget):
+    options = json.dumps(widget.get('options') or {}, sort_keys=True, default=str)
+    params = hashlib.md5(options.encode('utf-8')).hexdigest()
+    return WIDGET_KEY.format(church_id=church_id, widget_type=widget.get('type'), params=params)
+
+
+def compute_widget(church_id, widget, refresh_interval):
+    """위젯 계산 후 캐시에 저장한 항목"""
+    from church_core.db_router import read_from_replica
+
+    with read_from_replica():
+        data = get_loader(widget.get('type'))(church_id, widget.get('options') or {})
+    now = timezone.now()
+    entry = {
+        'data': data,
+        'computed_at': now.isoformat(),
+        'fresh_until': (now + timedelta(seconds=refresh_interval)).timestamp(),
+    }
+    key = widget_key(church_id, widget)
+    cache.set(key, entry, refresh_interval + get_max_stale())
+    cache.delete(f"{key}:refreshing")
+    return entry
+
+
+def _schedule_refresh(church_id, widget, refresh_interval):
+    """만료된 위젯 갱신 태스크 등록 (동시에 여러 요청이 와도 한 번만)"""
+    key = widget_key(church_id, widget)
+    if not cache.add(f"{key}:refreshing", 1, refresh_interval):
+        return
+    from utils.tasks import refresh_dashboard_widget
+
+    transaction.on_commit(
+        lambda: refresh_dashboard_widget.delay(church_id, widget, refresh_interval)
+    )
+
+
+def _acquire_compute(church_id, widget):
+    """캐시에 없는 위젯 계산 잠금 (잡은 요청만 계산, 잠금은 대기 시간이 지나면 만료)"""
+    return cache.add(f"{widget_key(church_id, widget)}:computing", 1, get_compute_wait())
+
+
+def _run_isolated(function, *args):
+    """스레드에서 실행 (요청 컨텍스트 복제, 종료 시 스레드의 DB 연결 정리)"""
+    context = contextvars.copy_context()
+
+    def run():
+        try:
+            return context.run(function, *args)
+        finally:
+            connections.close_all()
+    return run
+
+
+def resolve_widgets(dashboard):
+    """
+    대시보드의 모든 위젯 결과 목록
+
+    각 항목: {'id', 'type', 'data', 'computed_at', 'stale'}, 오류 시 {'id', 'type', 'error'},
+    다른 요청의 계산을 기다리다 시간이 초과되면 {'id', 'type', 'data': None, 'pending': True, ...}
+    """
+    church_id = dashboard.church_id
+    widgets = [widget for widget in dashboard.widgets or [] if isinstance(widget, dict)]
+    results = {}
+    missing = []
+    waiting = []
+
+    for index, widget in enumerate(widgets):
+        refresh_interval = int(widget.get('refresh_interval') or dashboard.refresh_interval or 0)
+        entry = cache.get(widget_key(church_id, widget)) if refresh_interval > 0 else None
+        if entry is None:
+            if _acquire_compute(church_id, widget):
+                missing.append((index, widget, refresh_interval))
+            else:
+                waiting.append((index, widget, refresh_interval))
+            continue
+        stale = timezone.now().timestamp() >= entry['fresh_until']
+        if stale:
+            _schedule_refresh(church_id, widget, refresh_interval)
+        results[index] = dict(entry, stale=stale)
+
+    def compute(widget, refresh_interval):
+        try:
+            return dict(compute_widget(church_id, widget, max(refresh_interval, 1)), stale=False)
+        except WidgetError as exc:
+            return {'error': str(exc)}
+        except Exception:
+            logger.exception(f"Dashboard widget failed: {widget.get('type')} (church {church_id})")
+            return {'error': '위젯 데이터를 계산하지 못했습니다.'}
+        finally:
+            cache.delete(f"{widget_key(church_id, widget)}:computing")
+
+    workers = min(get_max_workers(), len(missing))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                index: executor.submit(_run_isolated(compute, widget, refresh_interval))
+                for index, widget, refresh_interval in missing
+            }
+            for index, future in futures.items():
+                results[index] = future.result()
+    else:
+        for index, widget, refresh_interval in missing:
+            results[index] = compute(widget, refresh_interval)
+
+    # 다른 요청이 계산 중인 위젯은 계산 잠금이 풀릴 때까지 기다렸다가 그 결과를 사용
+    deadline = time.monotonic() + get_compute_wait()
+    while waiting:
+        still_waiting = []
+        for index, widget, refresh_interval in waiting:
+            key = widget_key(church_id, widget)
+            if cache.get(f"{key}:computing") is None:
+                entry = cache.get(key)
+                if entry is not None:
+                    results[index] = dict(entry, stale=False)
+                    continue
+                # 먼저 계산하던 요청이 실패한 경우 직접 계산
+                if _acquire_compute(church_id, widget):
+                    results[index] = compute(widget, refresh_interval)
+                    continue
+            still_waiting.append((index, widget, refresh_interval))
+        waiting = still_waiting
+        if waiting and time.monotonic() >= deadline:
+            for index, widget, refresh_interval in waiting:
+                results[index] = {'data': None, 'computed_at': None, 'stale': True, 'pending': True}
+            break
+        if waiting:
+            time.sleep(0.05)
+
+    resolved = []
+    for index, widget in enumerate(widgets):
+        entry = results[index]
+        entry.pop('fresh_until', None)
+        resolved.append(dict({'id': widget.get('id', index), 'type': widget.get('type')}, **entry))
+    return resolved
+
+
+# 기본 위젯
+
+@register('statistics_summary')
+def statistics_summary(church_id, options):
+    """최신 일별 통계 요약 한 행"""
+    from .models import StatisticsSummary
+    from .statistics import SUMMARY_FIELDS
+
+    return StatisticsSummary.objects.filter(church_id=church_id).order_by('-date').values(
+        'date', *SUMMARY_FIELDS
+    ).first()
+
+
+@register('attendance_trend')
+def attendance_trend(church_id, options):
+    """최근 N주 주별 출석 (options: weeks, worship_type). 지표 집계(MetricRollup)에서 읽음"""
+    from .models import MetricRollup
+    from .rollups import series
+
+    today = date.today()
+    rows = series(
+        church_id, MetricRollup.Metric.ATTENDANCE, 'week',
+        today - timedelta(weeks=int(options.get('weeks', 12))), today,
+    )
+    worship_type = options.get('worship_type')
+    trend = []
+    for row in rows:
+        item = row['breakdown'].get(worship_type, {'value': 0, 'count': 0}) if worship_type else row
+        trend.append({'week': row['period_start'], 'present': item['value'], 'records': item['count']})
+    return {'records': sum(row['records'] for row in trend), 'series': trend}
+
+
+@register('offering_trend')
+def offering_trend(church_id, options):
+    """최근 N개월 월별 헌금 (options: months). 지표 집계(MetricRollup)에서 읽음"""
+    from .models import MetricRollup
+    from .rollups import combine, series
+
+    today = date.today()
+    start = today.replace(day=1) - relativedelta(months=int(options.get('months', 12)) - 1)
+    rows = series(church_id, MetricRollup.Metric.OFFERINGS, 'month', start, today)
+    total = combine(rows)
+    return {
+        'total': total['value'],
+        'series': [{'month': row['period_start'], 'total': row['value'], 'count': row['count']} for row in rows],
+        'by_type': {key: {'total': item['value']} for key, item in total['breakdown'].items()},
+    }
+
+
+@register('metric_trend')
+def metric_trend(church_id, options):
+    """지표 구간별 추이 (options: metric, granularity(day|week|month|quarter|year), periods)"""
+    from .models import MetricRollup
+    from .rollups import PERIOD_LENGTHS, period_start, series
+
+    metric = options.get('metric', MetricRollup.Metric.ATTENDANCE)
+    granularity = options.get('granularity', 'month')
+    if metric not in MetricRollup.Metric.values or granularity not in PERIOD_LENGTHS:
+        raise WidgetError(f"지원하지 않는 지표/단위입니다: {metric}/{granularity}")
+    today = date.today()
+    start = period_start(granularity, today) - PERIOD_LENGTHS[granularity] * (min(int(options.get('periods', 12)), 366) - 1)
+    return series(church_id, metric, granularity, start, today)
+
+
+@register('year_over_year')
+def year_over_year(church_id, options):
+    """올해와 전년 같은 기간 비교 (options: metric, granularity)"""
+    from .models import MetricRollup
+    from . import rollups
+
+    metric = options.get('metric', MetricRollup.Metric.OFFERINGS)
+    granularity = options.get('granularity', 'month')
+    if metric not in MetricRollup.Metric.values or granularity not in rollups.PERIOD_LENGTHS:
+        raise WidgetError(f"지원하지 않는 지표/단위입니다: {metric}/{granularity}")
+    return rollups.year_over_year(church_id, metric, date.today().year, granularity)
+
+
+PRAYER_OVERVIEW = StatsSpec(
+    'widgets.prayer_overview',
+    measures={
+        'total': Count('pk'),
+        'active': Count('pk', filter=Q(status='active')),
+        'answered_this_month': lambda: Count('pk', filter=Q(answered_date__gte=date.today().replace(day=1))),
+    },
+)
+
+
+@register('prayer_overview')
+def prayer_overview(church_id, options):
+    """기도제목 현황"""
+    from prayers.models import Prayer
+
+    return PRAYER_OVERVIEW.compute(PRAYER_OVERVIEW.prepare(Prayer.objects.filter(church_id=church_id)))
+
+
+@register('recent_members')
+def recent_members(church_id, options):
+    """최근 등록 교인 (options: limit)"""
+    from members.models import Member
+
+    limit = min(int(options.get('limit', 5)), 50)
+    return list(
+        Member.objects.filter(church_id=church_id, is_active=True)
+        .order_by('-created_at').values('id', 'name', 'status', 'created_at')[:limit]
+    )
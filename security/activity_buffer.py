@@ -0,0 +1,197 @@
+"""
+ActivityLog 지연 일괄 저장 (write-behind)
+
+요청 처리 중에는 로그 레코드를 프로세스 내 버퍼에 넣기만 하고,
+백그라운드 스레드가 ACTIVITY_LOG_BATCH_SIZE건 또는 ACTIVITY_LOG_FLUSH_INTERVAL_MS
+밀리초마다 bulk_create로 저장합니다.
+
+설정 (모두 선택 사항):
+    ACTIVITY_LOG_WRITE_MODE = 'buffer'      # 'buffer' | 'celery' | 'sync'
+    ACTIVITY_LOG_BATCH_SIZE = 200
+    ACTIVITY_LOG_FLUSH_INTERVAL_MS = 1000
+    ACTIVITY_LOG_MAX_QUEUE = 10000          # 초과 시 새 레코드는 버려지고 dropped 증가
+
+'celery' 모드에서는 모은 배치를 persist_activity_logs 태스크로 넘깁니다.
+프로세스 종료 시(atexit) 남은 레코드를 동기적으로 저장합니다.
+"""
+from django.conf import settings
+from django.db import close_old_connections, transaction
+import atexit
+import os
+import queue
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def persist_records(records):
+    """레코드(dict) 목록을 한 번의 bulk_create로 저장"""
+    from security.models import ActivityLog
+
+    if not records:
+        return 0
+    # 요청 트랜잭션 안(동기 모드)에서 실패해도 바깥 트랜잭션이 깨지지 않도록 세이브포인트 사용
+    with transaction.atomic():
+        ActivityLog.objects.bulk_create([ActivityLog(**record) for record in records])
+    return len(records)
+
+
+class ActivityLogBuffer:
+    """프로세스 내 ActivityLog 버퍼"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue = None
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._stats = {
+            'enqueued': 0, 'written': 0, 'dispatched': 0,
+            'dropped': 0, 'failed': 0, 'batches': 0,
+        }
+
+    @property
+    def write_mode(self):
+        return getattr(settings, 'ACTIVITY_LOG_WRITE_MODE', 'buffer')
+
+    @property
+    def batch_size(self):
+        return getattr(settings, 'ACTIVITY_LOG_BATCH_SIZE', 200)
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, 'ACTIVITY_LOG_FLUSH_INTERVAL_MS', 1000) / 1000
+
+    @property
+    def max_queue(self):
+        return getattr(settings, 'ACTIVITY_LOG_MAX_QUEUE', 10000)
+
+    def add(self, record):
+        """레코드 추가 (버퍼가 가득 차면 버리고 False 반환)"""
+        if self.write_mode == 'sync':
+            self._write([record])
+            return True
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._increment('dropped')
+            return False
+
+        self._increment('enqueued')
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def flush(self):
+        """버퍼에 남은 레코드를 모두 저장"""
+        if self._queue is None:
+            return 0
+        written = 0
+        while True:
+            batch = self._drain()
+            if not batch:
+                return written
+            written += self._dispatch(batch)
+
+    def shutdown(self):
+        """플러시 스레드를 멈추고 남은 레코드 저장"""
+        self._stopping.set()
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=self.flush_interval + 5)
+        # 스레드가 처리하지 못한 나머지는 현재 스레드에서 직접 저장
+        if self.write_mode == 'celery':
+            self._flush_direct()
+        else:
+            self.flush()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats['pending'] = self._queue.qsize() if self._queue is not None else 0
+        return stats
+
+    def _ensure_started(self):
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid:
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid:
+                return
+            # fork 이후 부모의 스레드/큐는 사용할 수 없으므로 새로 시작
+            self._queue = queue.Queue(maxsize=self.max_queue)
+            self._stopping.clear()
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name='activity-log-flusher', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Activity log flush failed: {e}")
+            finally:
+                close_old_connections()
+
+    def _drain(self):
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _dispatch(self, batch):
+        if self.write_mode == 'celery':
+            try:
+                from utils.tasks import persist_activity_logs
+                persist_activity_logs.delay(batch)
+                self._increment('dispatched', len(batch))
+                return len(batch)
+            except Exception as e:
+                # 브로커 장애 시 직접 저장
+                logger.warning(f"Activity log task dispatch failed, writing directly: {e}")
+        return self._write(batch)
+
+    def _flush_direct(self):
+        written = 0
+        while True:
+            batch = self._drain() if self._queue is not None else []
+            if not batch:
+                return written
+            written += self._write(batch)
+
+    def _write(self, batch):
+        try:
+            written = persist_records(batch)
+        except Exception as e:
+            logger.error(f"Activity log bulk write failed ({len(batch)} records): {e}")
+            # 잘못된 레코드 하나 때문에 배치 전체를 잃지 않도록 개별 저장
+            written = 0
+            for record in batch:
+                try:
+                    written += persist_records([record])
+                except Exception:
+                    self._increment('failed')
+        self._increment('written', written)
+        self._increment('batches')
+        return written
+
+    def _increment(self, name, amount=1):
+        with self._lock:
+            self._stats[name] += amount
+
+
+activity_log_buffer = ActivityLogBuffer()
+atexit.register(activity_log_buffer.shutdown)
@@ -0,0 +1,367 @@
+"""
+ActivityLog 월 단위 파티션 저장소
+
+- PostgreSQL에서 partition_activity_logs 명령으로 전환한 경우: activity_logs를
+  created_at 기준 RANGE 파티션 테이블로 사용하며 월별 파티션(activity_logs_pYYYYMM)을
+  미리 만들어 둡니다.
+- 그 외(SQLite 등, 전환 전 PostgreSQL): activity_logs에는 이번 달 로그만 두고,
+  지난 달 로그는 보관 테이블(activity_logs_aYYYYMM_YYYYMM, [시작월, 종료월))로 옮깁니다.
+
+보존 기간(ACTIVITY_LOG_RETENTION_MONTHS, 기본 12개월)이 지난 파티션/보관 테이블은
+행 단위 삭제 없이 테이블째 삭제합니다. 기간 조회는 get_activity_log_querysets()로
+해당 기간에 걸치는 테이블만 골라 조회합니다.
+"""
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from datetime import datetime, timedelta
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = 'activity_logs'
+PARTITION_PATTERN = re.compile(r'^activity_logs_p(\d{4})(\d{2})$')
+ARCHIVE_PATTERN = re.compile(r'^activity_logs_a(\d{4})(\d{2})_(\d{4})(\d{2})$')
+
+_archive_models = {}
+
+
+def get_retention_months():
+    return getattr(settings, 'ACTIVITY_LOG_RETENTION_MONTHS', 12)
+
+
+def month_start(value):
+    """해당 시각이 속한 달의 시작 (기본 시간대 기준)"""
+    value = timezone.localtime(value) if timezone.is_aware(value) else value
+    start = value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if timezone.is_naive(start):
+        start = timezone.make_aware(start)
+    return start
+
+
+def add_months(value, months):
+    """달 단위 이동 (value는 월 시작 시각)"""
+    month_index = value.year * 12 + (value.month - 1) + months
+    naive = datetime(month_index // 12, month_index % 12 + 1, 1)
+    return timezone.make_aware(naive)
+
+
+def partition_name(start):
+    return f"{PARENT_TABLE}_p{start:%Y%m}"
+
+
+def archive_name(start, end):
+    return f"{PARENT_TABLE}_a{start:%Y%m}_{end:%Y%m}"
+
+
+def _parse_month(year, month):
+    return timezone.make_aware(datetime(int(year), int(month), 1))
+
+
+def is_native_partitioning():
+    """activity_logs가 PostgreSQL 파티션 테이블로 전환되어 있는지"""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [PARENT_TABLE]
+        )
+        return cursor.fetchone() is not None
+
+
+def convert_to_partitioned(now=None):
+    """
+    PostgreSQL: activity_logs를 created_at RANGE 파티션 테이블로 전환
+
+    기존 테이블의 지난 달 이전 로그는 보관 테이블(activity_logs_aYYYYMM_YYYYMM)로
+    남기고, 이번 달 로그만 새 파티션 테이블로 옮깁니다. 테이블을 새로 만드는
+    작업이므로 마이그레이션에서 자동 실행하지 않고 partition_activity_logs 명령으로만
+    실행합니다. 일반 테이블로 되돌리는 작업은 지원하지 않습니다.
+    """
+    if connection.vendor != 'postgresql':
+        raise ValueError('activity_logs 파티션 전환은 PostgreSQL에서만 지원합니다.')
+    if is_native_partitioning():
+        return None
+
+    current = month_start(now or timezone.now())
+    quote = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(created_at), MAX(id) FROM {quote(PARENT_TABLE)}")
+        oldest, max_id = cursor.fetchone()
+        legacy = f"{PARENT_TABLE}_legacy"
+        if oldest is not None and oldest < current:
+            legacy = archive_name(month_start(oldest), current)
+
+        cursor.execute(f"ALTER TABLE {quote(PARENT_TABLE)} RENAME TO {quote(legacy)}")
+        cursor.execute(f"ALTER TABLE {quote(legacy)} RENAME CONSTRAINT activity_logs_pkey TO {quote(legacy + '_pkey')}")
+        for index in ('activity_lo_user_id_d23b30_idx', 'activity_lo_church__d0645d_idx', 'activity_lo_action_0f3584_idx'):
+            cursor.execute(f"ALTER INDEX IF EXISTS {index} RENAME TO {quote(legacy + '_' + index[12:])}")
+        # 보관 테이블은 사용자/교회 삭제와 무관하게 유지
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'", [legacy]
+        )
+        for (constraint,) in cursor.fetchall():
+            cursor.execute(f"ALTER TABLE {quote(legacy)} DROP CONSTRAINT {quote(constraint)}")
+
+        cursor.execute("CREATE SEQUENCE IF NOT EXISTS activity_logs_id_seq")
+        cursor.execute("SELECT setval('activity_logs_id_seq', %s)", [(max_id or 0) + 1])
+        cursor.execute(
+            f"CREATE TABLE {quote(PARENT_TABLE)} (LIKE {quote(legacy)} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (created_at)"
+        )
+        cursor.execute("ALTER TABLE activity_logs ALTER COLUMN id SET DEFAULT nextval('activity_logs_id_seq')")
+        cursor.execute("ALTER SEQUENCE activity_logs_id_seq OWNED BY activity_logs.id")
+        cursor.execute("ALTER TABLE activity_logs ADD CONSTRAINT activity_logs_pkey PRIMARY KEY (id, created_at)")
+        cursor.execute(
+            "ALTER TABLE activity_logs ADD CONSTRAINT activity_logs_user_id_fk "
+            "FOREIGN KEY (user_id) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED"
+        )
+        cursor.execute(
+            "ALTER TABLE activity_logs ADD CONSTRAINT activity_logs_church_id_fk "
+            "FOREIGN KEY (church_id) REFERENCES churches (id) DEFERRABLE INITIALLY DEFERRED"
+        )
+        cursor.execute("CREATE INDEX activity_lo_user_id_d23b30_idx ON activity_logs (user_id, created_at)")
+        cursor.execute("CREATE INDEX activity_lo_church__d0645d_idx ON activity_logs (church_id, created_at)")
+        cursor.execute("CREATE INDEX activity_lo_action_0f3584_idx ON activity_logs (action, created_at)")
+
+        # 범위를 벗어난 쓰기를 받아 줄 기본 파티션과 이번 달부터 3개월치 파티션
+        cursor.execute("CREATE TABLE activity_logs_default PARTITION OF activity_logs DEFAULT")
+        for offset in range(3):
+            create_partition(add_months(current, offset))
+
+        cursor.execute(f"INSERT INTO activity_logs SELECT * FROM {quote(legacy)} WHERE created_at >= %s", [current])
+        moved = cursor.rowcount
+        cursor.execute(f"DELETE FROM {quote(legacy)} WHERE created_at >= %s", [current])
+        if legacy == f"{PARENT_TABLE}_legacy":
+            # 지난 달 이전 로그가 없었으면 보관할 필요 없음
+            cursor.execute(f"DROP TABLE {quote(legacy)}")
+            legacy = None
+
+    logger.info(f"Converted {PARENT_TABLE} to a partitioned table ({moved} rows moved, archive={legacy})")
+    return legacy
+
+
+def list_partitions():
+    """PostgreSQL 월별 파티션 목록 [(테이블명, 시작, 끝)]"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = %s",
+            [PARENT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = PARTITION_PATTERN.match(name)
+        if match:
+            start = _parse_month(*match.groups())
+            partitions.append((name, start, add_months(start, 1)))
+    return sorted(partitions, key=lambda item: item[1])
+
+
+def list_archives():
+    """보관 테이블 목록 [(테이블명, 시작, 끝)]"""
+    with connection.cursor() as cursor:
+        names = connection.introspection.table_names(cursor)
+
+    archives = []
+    for name in names:
+        match = ARCHIVE_PATTERN.match(name)
+        if match:
+            year, month, end_year, end_month = match.groups()
+            archives.append((name, _parse_month(year, month), _parse_month(end_year, end_month)))
+    return sorted(archives, key=lambda item: item[1])
+
+
+def create_partition(start):
+    """PostgreSQL 월별 파티션 생성 (이미 있으면 무시)"""
+    end = add_months(start, 1)
+    name = partition_name(start)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{PARENT_TABLE}" '
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+    return name
+
+
+def ensure_partitions(months_ahead=2, now=None):
+    """이번 달부터 months_ahead개월 뒤까지 파티션 준비 (파티션 전환된 PostgreSQL 전용)"""
+    if not is_native_partitioning():
+        return []
+    current = month_start(now or timezone.now())
+    return [create_partition(add_months(current, offset)) for offset in range(months_ahead + 1)]
+
+
+def get_archive_model(table):
+    """보관 테이블용 비관리 모델 (FK 제약 없이 ActivityLog와 같은 필드)"""
+    model = _archive_models.get(table)
+    if model is not None:
+        return model
+
+    from security.models import ActivityLog
+
+    attrs = {'__module__': __name__}
+    for field in ActivityLog._meta.local_fields:
+        name, path, args, kwargs = field.deconstruct()
+        if field.is_relation:
+            # 보관 테이블은 원본 행 삭제와 무관하게 유지
+            kwargs.update(related_name='+', db_constraint=False, on_delete=models.DO_NOTHING)
+        attrs[name] = type(field)(*args, **kwargs)
+
+    attrs['Meta'] = type('Meta', (), {
+        'db_table': table,
+        'managed': False,
+        'app_label': 'security',
+        'ordering': ['-created_at'],
+    })
+    suffix = table[len(PARENT_TABLE) + 1:]
+    model = type(f"ActivityLogArchive_{suffix}", (models.Model,), attrs)
+    _archive_models[table] = model
+    return model
+
+
+def rotate_tables(now=None):
+    """
+    지난 달 이전 로그를 월별 보관 테이블로 이동 (파티션 테이블이 아닌 경우)
+
+    보관 테이블은 FK 제약 없이 생성되므로 사용자/교회 삭제와 무관하게 남고,
+    보존 기간이 지나면 테이블째 삭제됩니다.
+    """
+    from security.models import ActivityLog
+
+    if is_native_partitioning():
+        return []
+
+    current = month_start(now or timezone.now())
+    months = ActivityLog.objects.filter(created_at__lt=current).dates('created_at', 'month')
+    rotated = []
+    for month in months:
+        start = month_start(datetime(month.year, month.month, 1))
+        rotated.append(_rotate_month(start, add_months(start, 1)))
+    return rotated
+
+
+def _rotate_month(start, end):
+    from security.models import ActivityLog
+
+    table = archive_name(start, end)
+    columns = ', '.join(
+        connection.ops.quote_name(field.column) for field in ActivityLog._meta.concrete_fields
+    )
+
+    # 지연 저장된 로그가 나중에 들어온 경우 기존 보관 테이블에 추가
+    if table not in [name for name, _, _ in list_archives()]:
+        # SQLite 스키마 편집은 트랜잭션 밖에서 수행해야 함
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(get_archive_model(table))
+            schema_editor.execute(
+                f"CREATE INDEX {connection.ops.quote_name(table + '_user_idx')} "
+                f"ON {connection.ops.quote_name(table)} (user_id, created_at)"
+            )
+
+    bounds = [connection.ops.adapt_datetimefield_value(start), connection.ops.adapt_datetimefield_value(end)]
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {connection.ops.quote_name(table)} ({columns}) "
+                f"SELECT {columns} FROM {connection.ops.quote_name(PARENT_TABLE)} "
+                f"WHERE created_at >= %s AND created_at < %s",
+                bounds,
+            )
+            moved = cursor.rowcount
+            cursor.execute(
+                f"DELETE FROM {connection.ops.quote_name(PARENT_TABLE)} "
+                f"WHERE created_at >= %s AND created_at < %s",
+                bounds,
+            )
+
+    logger.info(f"Rotated {moved} activity log rows into {table}")
+    return table
+
+
+def drop_expired(retention_months=None, now=None):
+    """보존 기간이 지난 파티션/보관 테이블 삭제 (테이블 단위)"""
+    retention_months = get_retention_months() if retention_months is None else retention_months
+    cutoff = add_months(month_start(now or timezone.now()), -retention_months)
+
+    dropped = []
+    with connection.cursor() as cursor:
+        if is_native_partitioning():
+            for name, start, end in list_partitions():
+                if end <= cutoff:
+                    cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{name}"')
+                    cursor.execute(f'DROP TABLE "{name}"')
+                    dropped.append(name)
+
+        for name, start, end in list_archives():
+            if end <= cutoff:
+                cursor.execute(f"DROP TABLE {connection.ops.quote_name(name)}")
+                dropped.append(name)
+
+    if dropped:
+        logger.info(f"Dropped expired activity log tables: {', '.join(dropped)}")
+    return dropped
+
+
+def get_activity_log_querysets(start=None, end=None):
+    """
+    기간에 걸치는 테이블별 쿼리셋 목록
+
+    파티션 테이블에서는 파티션 프루닝이 적용되는 ActivityLog 쿼리셋 하나를,
+    그 외에는 activity_logs와 기간이 겹치는 보관 테이블 쿼리셋을 반환합니다.
+    """
+    from security.models import ActivityLog
+
+    def bounded(queryset):
+        if start is not None:
+            queryset = queryset.filter(created_at__gte=start)
+        if end is not None:
+            queryset = queryset.filter(created_at__lt=end)
+        return queryset
+
+    querysets = [bounded(ActivityLog.objects.all())]
+    for name, archive_start, archive_end in list_archives():
+        if (end is None or archive_start < end) and (start is None or archive_end > start):
+            querysets.append(bounded(get_archive_model(name).objects.all()))
+    return querysets
+
+
+def rollup_hour(hour):
+    """한 시간 구간의 사용자/교회/리소스별 요청 수 집계 (재실행 시 덮어씀)"""
+    from security.models import ActivityLogHourlyRollup
+
+    hour = hour.replace(minute=0, second=0, microsecond=0)
+    next_hour = hour + timedelta(hours=1)
+    write_filter = ~(
+        Q(action__startswith='GET ') | Q(action__startswith='HEAD ') | Q(action__startswith='OPTIONS ')
+    )
+
+    totals = {}
+    for queryset in get_activity_log_querysets(hour, next_hour):
+        rows = queryset.order_by().values('user_id', 'church_id', 'resource').annotate(
+            request_count=Count('id'),
+            write_count=Count('id', filter=write_filter),
+        )
+        for row in rows:
+            key = (row['user_id'], row['church_id'], row['resource'])
+            counts = totals.setdefault(key, [0, 0])
+            counts[0] += row['request_count']
+            counts[1] += row['write_count']
+
+    with transaction.atomic():
+        ActivityLogHourlyRollup.objects.filter(hour=hour).delete()
+        ActivityLogHourlyRollup.objects.bulk_create([
+            ActivityLogHourlyRollup(
+                hour=hour, user_id=user_id, church_id=church_id, resource=resource,
+                request_count=request_count, write_count=write_count,
+            )
+            for (user_id, church_id, resource), (request_count, write_count) in totals.items()
+        ])
+    return len(totals)
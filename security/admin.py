@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import UserSecurityProfile, JWTBlacklist, ActivityLog
+from .models import UserSecurityProfile, JWTBlacklist, ActivityLog, ActivityLogHourlyRollup
 
 
 @admin.register(UserSecurityProfile)
@@ -134,6 +134,7 @@ class ActivityLogAdmin(admin.ModelAdmin):
     list_display = ['user_email', 'action_display', 'resource', 'church_name', 'ip_address', 'created_at']
     list_filter = ['action', 'resource', 'created_at', 'church']
     search_fields = ['user__email', 'user__username', 'action', 'resource', 'ip_address']
+    list_select_related = ['user', 'church']
     readonly_fields = ['user', 'church', 'action', 'resource', 'resource_id', 'ip_address', 'user_agent', 'created_at']
     date_hierarchy = 'created_at'
     
@@ -196,3 +197,21 @@ class ActivityLogAdmin(admin.ModelAdmin):
     def has_delete_permission(self, request, obj=None):
         """로그 삭제 허용 (정리 목적)"""
         return request.user.is_superuser
+
+
+@admin.register(ActivityLogHourlyRollup)
+class ActivityLogHourlyRollupAdmin(admin.ModelAdmin):
+    """시간대별 활동 집계 관리"""
+    list_display = ['hour', 'user', 'church', 'resource', 'request_count', 'write_count']
+    list_filter = ['resource', 'church']
+    search_fields = ['user__email', 'user__username', 'resource']
+    list_select_related = ['user', 'church']
+    date_hierarchy = 'hour'
+
+    def has_add_permission(self, request):
+        """집계 추가 금지"""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """집계 수정 금지"""
+        return False
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from security.activity_partitions import convert_to_partitioned, is_native_partitioning
+
+
+class Command(BaseCommand):
+    help = 'PostgreSQL의 activity_logs를 월 단위 RANGE 파티션 테이블로 전환합니다. (되돌릴 수 없음)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--yes', action='store_true', help='확인 없이 실행')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('activity_logs 파티션 전환은 PostgreSQL에서만 지원합니다.')
+        if is_native_partitioning():
+            self.stdout.write('activity_logs는 이미 파티션 테이블입니다.')
+            return
+        if not options['yes']:
+            raise CommandError(
+                '기존 activity_logs 테이블을 새로 만드는 작업입니다. 백업 후 --yes 옵션과 함께 실행하세요.'
+            )
+
+        archive = convert_to_partitioned()
+        if archive:
+            self.stdout.write(f'지난 달 이전 로그를 {archive} 보관 테이블로 남겼습니다.')
+        self.stdout.write(self.style.SUCCESS('activity_logs 파티션 전환 완료'))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.1 on 2026-10-19 00:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('church', '0001_initial'),
+        ('security', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityLogHourlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(verbose_name='집계 시간')),
+                ('resource', models.CharField(max_length=100, verbose_name='리소스')),
+                ('request_count', models.PositiveIntegerField(default=0, verbose_name='요청 수')),
+                ('write_count', models.PositiveIntegerField(default=0, verbose_name='변경 요청 수')),
+                ('church', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='church.church', verbose_name='교회')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollups', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '시간대별 활동 집계',
+                'verbose_name_plural': '시간대별 활동 집계들',
+                'db_table': 'activity_log_hourly_rollups',
+                'indexes': [models.Index(fields=['hour', 'resource'], name='activity_lo_hour_5dae38_idx'), models.Index(fields=['user', 'hour'], name='activity_lo_user_id_90551d_idx'), models.Index(fields=['church', 'hour'], name='activity_lo_church__8203c9_idx')],
+            },
+        ),
+    ]
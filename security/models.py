@@ -127,4 +127,26 @@ class ActivityLog(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.user.username} - {self.action} - {self.created_at}"
\ No newline at end of file
+        return f"{self.user.username} - {self.action} - {self.created_at}"
+
+class ActivityLogHourlyRollup(models.Model):
+    """시간대별 사용자/리소스 활동 집계 (관리자 대시보드용)"""
+    hour = models.DateTimeField(verbose_name='집계 시간')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activity_rollups', verbose_name='사용자')
+    church = models.ForeignKey('church.Church', on_delete=models.CASCADE, null=True, blank=True, verbose_name='교회')
+    resource = models.CharField(max_length=100, verbose_name='리소스')
+    request_count = models.PositiveIntegerField(default=0, verbose_name='요청 수')
+    write_count = models.PositiveIntegerField(default=0, verbose_name='변경 요청 수')
+
+    class Meta:
+        db_table = 'activity_log_hourly_rollups'
+        verbose_name = '시간대별 활동 집계'
+        verbose_name_plural = '시간대별 활동 집계들'
+        indexes = [
+            models.Index(fields=['hour', 'resource']),
+            models.Index(fields=['user', 'hour']),
+            models.Index(fields=['church', 'hour']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.resource} - {self.hour:%Y-%m-%d %H}시 ({self.request_count})"
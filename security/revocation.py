@@ -0,0 +1,187 @@
+"""
+JWT 토큰 폐기(블랙리스트) 확인 계층
+
+1. 프로세스 로컬 블룸 필터: 폐기되지 않은 토큰은 여기서 즉시 통과 (DB 조회 없음)
+2. 공유 캐시: 블룸 필터 양성일 때 jti별 폐기 여부 확인
+3. DB(JWTBlacklist): 캐시에도 없을 때만 조회
+
+blacklist_token()이 새 항목을 캐시에 발행하면 각 프로세스는
+JWT_BLACKLIST_SYNC_INTERVAL(기본 2초) 이내에 블룸 필터에 반영합니다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+import hashlib
+import math
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'jwt_blacklist_version'
+ENTRY_KEY = 'jwt_blacklist_entry_{version}'
+JTI_KEY = 'jwt_blacklist_jti_{jti}'
+
+# 블룸 필터 거짓 양성 확인 결과를 캐시하는 시간 (초)
+NEGATIVE_CACHE_TIMEOUT = 60
+# 증분 동기화로 따라잡을 수 있는 최대 버전 차이 (초과 시 DB에서 재구성)
+MAX_INCREMENTAL_SYNC = 1000
+
+
+class BloomFilter:
+    """간단한 블룸 필터 (bytearray 기반)"""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(int(capacity), 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class RevocationChecker:
+    """프로세스 단위 JWT 폐기 확인기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._version = 0
+        self._built_at = 0.0
+        self._synced_at = 0.0
+
+    @property
+    def sync_interval(self):
+        return getattr(settings, 'JWT_BLACKLIST_SYNC_INTERVAL', 2)
+
+    @property
+    def rebuild_interval(self):
+        return getattr(settings, 'JWT_BLACKLIST_REBUILD_INTERVAL', 300)
+
+    def is_revoked(self, jti):
+        """토큰 jti가 폐기되었는지 확인"""
+        bloom = self._get_bloom()
+        if jti not in bloom:
+            return False
+
+        cached = cache.get(JTI_KEY.format(jti=jti))
+        if cached is not None:
+            return cached
+
+        from security.models import JWTBlacklist
+        revoked = JWTBlacklist.is_blacklisted(jti)
+        if revoked:
+            entry = JWTBlacklist.objects.filter(token_jti=jti).values('expires_at').first()
+            _cache_revocation(jti, entry['expires_at'] if entry else None)
+        else:
+            # add: 조회 도중 발행된 폐기(True)를 덮어쓰지 않음
+            cache.add(JTI_KEY.format(jti=jti), False, NEGATIVE_CACHE_TIMEOUT)
+        return revoked
+
+    def _get_bloom(self):
+        now = time.monotonic()
+        if self._bloom is None or now - self._built_at >= self.rebuild_interval:
+            with self._lock:
+                if self._bloom is None or now - self._built_at >= self.rebuild_interval:
+                    self._rebuild()
+        elif now - self._synced_at >= self.sync_interval:
+            with self._lock:
+                if now - self._synced_at >= self.sync_interval:
+                    self._sync()
+        return self._bloom
+
+    def _rebuild(self):
+        """DB의 유효한 블랙리스트 전체로 블룸 필터 재구성"""
+        from security.models import JWTBlacklist
+
+        version = _get_version()
+        jtis = list(JWTBlacklist.objects.filter(
+            expires_at__gt=timezone.now()
+        ).values_list('token_jti', flat=True))
+
+        # 재구성 사이에 추가될 항목을 위한 여유 공간 확보
+        bloom = BloomFilter(capacity=max(len(jtis) * 2, 1024))
+        for jti in jtis:
+            bloom.add(jti)
+
+        self._bloom = bloom
+        self._version = version
+        self._built_at = self._synced_at = time.monotonic()
+        logger.debug(f"JWT blacklist bloom filter rebuilt with {len(jtis)} entries")
+
+    def _sync(self):
+        """캐시에 발행된 신규 폐기 항목을 블룸 필터에 반영"""
+        self._synced_at = time.monotonic()
+        version = _get_version()
+        if version == self._version:
+            return
+        if version < self._version or version - self._version > MAX_INCREMENTAL_SYNC:
+            # 캐시가 초기화되었거나 너무 많이 밀린 경우
+            self._rebuild()
+            return
+
+        keys = [ENTRY_KEY.format(version=v) for v in range(self._version + 1, version + 1)]
+        entries = cache.get_many(keys)
+        if len(entries) != len(keys):
+            # 일부 항목이 캐시에서 제거됨
+            self._rebuild()
+            return
+
+        for jti in entries.values():
+            self._bloom.add(jti)
+        self._version = version
+
+    def reset(self):
+        with self._lock:
+            self._bloom = None
+            self._version = 0
+            self._built_at = self._synced_at = 0.0
+
+
+def _get_version():
+    return cache.get(VERSION_KEY) or 0
+
+
+def _cache_revocation(jti, expires_at):
+    """jti 폐기 여부를 토큰 만료 시점까지 캐시"""
+    timeout = None
+    if expires_at is not None:
+        timeout = max(int((expires_at - timezone.now()).total_seconds()), 1)
+    cache.set(JTI_KEY.format(jti=jti), True, timeout)
+
+
+def publish_revocation(jti, expires_at):
+    """새로 폐기된 jti를 공유 캐시에 발행 (다른 프로세스가 수 초 내 반영)"""
+    _cache_revocation(jti, expires_at)
+    cache.add(VERSION_KEY, 0, None)
+    try:
+        version = cache.incr(VERSION_KEY)
+    except ValueError:
+        # 키가 그 사이 제거된 경우
+        cache.set(VERSION_KEY, 1, None)
+        version = 1
+    cache.set(ENTRY_KEY.format(version=version), jti, max(revocation_checker.rebuild_interval * 2, 600))
+    # 현재 프로세스는 즉시 반영
+    if revocation_checker._bloom is not None:
+        revocation_checker._bloom.add(jti)
+
+
+revocation_checker = RevocationChecker()
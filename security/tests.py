@@ -1,3 +1,309 @@
-from django.test import TestCase
+import pytest
+from datetime import datetime, timedelta
+from django.core.cache import cache
+from django.utils import timezone
+from security import activity_buffer, activity_partitions, revocation
+from security.models import ActivityLog, ActivityLogHourlyRollup, JWTBlacklist
+from utils.factories import UserFactory
 
-# Create your tests here.
+
+@pytest.mark.django_db
+class TestRevocationChecker:
+    """JWT 폐기 확인 계층 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        settings.JWT_BLACKLIST_SYNC_INTERVAL = 0
+        cache.clear()
+        revocation.revocation_checker.reset()
+        self.user = UserFactory()
+        self.expires_at = timezone.now() + timedelta(hours=1)
+        yield
+        revocation.revocation_checker.reset()
+
+    def revoke(self, jti):
+        JWTBlacklist.objects.create(token_jti=jti, user=self.user, reason='logout', expires_at=self.expires_at)
+        revocation.publish_revocation(jti, self.expires_at)
+
+    def test_bloom_negative_needs_no_queries(self, django_assert_num_queries):
+        checker = revocation.revocation_checker
+        checker.is_revoked('warm-up')
+
+        with django_assert_num_queries(0):
+            assert checker.is_revoked('valid-token') is False
+
+    def test_bloom_positive_hits_db_once(self, django_assert_num_queries):
+        self.revoke('revoked-token')
+        checker = revocation.RevocationChecker()
+        cache.delete(revocation.JTI_KEY.format(jti='revoked-token'))
+
+        with django_assert_num_queries(3):
+            # 블룸 필터 구성 + 블랙리스트 확인 + 만료 시각 조회
+            assert checker.is_revoked('revoked-token') is True
+        with django_assert_num_queries(0):
+            assert checker.is_revoked('revoked-token') is True
+
+    def test_bloom_false_positive_cached_negative(self, django_assert_num_queries):
+        checker = revocation.revocation_checker
+        checker.is_revoked('warm-up')
+        checker._bloom.add('false-positive')
+
+        with django_assert_num_queries(1):
+            assert checker.is_revoked('false-positive') is False
+        with django_assert_num_queries(0):
+            assert checker.is_revoked('false-positive') is False
+
+    def test_negative_entry_does_not_overwrite_concurrent_revocation(self, monkeypatch):
+        checker = revocation.revocation_checker
+        checker.is_revoked('warm-up')
+        checker._bloom.add('racing-token')
+
+        def committed_during_lookup(jti):
+            # DB를 읽은 뒤, 음성 결과를 캐시하기 전에 다른 요청이 폐기를 발행
+            revocation.publish_revocation(jti, self.expires_at)
+            return False
+
+        monkeypatch.setattr(JWTBlacklist, 'is_blacklisted', committed_during_lookup)
+        assert checker.is_revoked('racing-token') is False
+        assert cache.get(revocation.JTI_KEY.format(jti='racing-token')) is True
+
+    def test_revocation_propagates_to_other_process(self):
+        other_process = revocation.RevocationChecker()
+        assert other_process.is_revoked('stolen-token') is False
+
+        self.revoke('stolen-token')
+
+        # 다른 프로세스는 다음 동기화에서 발행된 항목을 블룸 필터에 반영
+        assert 'stolen-token' in other_process._get_bloom()
+        assert other_process.is_revoked('stolen-token') is True
+
+
+class _IdleThread:
+    """플러시 스레드 대신 사용 (테스트에서 add/flush/shutdown을 직접 호출)"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+    def is_alive(self):
+        return False
+
+
+@pytest.mark.django_db
+class TestActivityLogBuffer:
+    """ActivityLog 지연 일괄 저장 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, monkeypatch):
+        settings.ACTIVITY_LOG_WRITE_MODE = 'buffer'
+        settings.ACTIVITY_LOG_BATCH_SIZE = 3
+        settings.ACTIVITY_LOG_FLUSH_INTERVAL_MS = 10
+        settings.ACTIVITY_LOG_MAX_QUEUE = 100
+        monkeypatch.setattr(activity_buffer.threading, 'Thread', _IdleThread)
+        # 테스트 트랜잭션 안에서 연결을 닫지 않도록
+        monkeypatch.setattr(activity_buffer, 'close_old_connections', lambda: None)
+        self.buffer = activity_buffer.ActivityLogBuffer()
+        self.user = UserFactory()
+
+    def record(self, index=0):
+        return {
+            'user_id': self.user.pk, 'action': 'GET', 'resource': f'/api/v1/items/{index}/',
+            'ip_address': '127.0.0.1', 'user_agent': 'pytest',
+        }
+
+    def test_batch_size_wakes_flusher_and_writes_in_batches(self):
+        for index in range(2):
+            self.buffer.add(self.record(index))
+        assert not self.buffer._wakeup.is_set()
+        self.buffer.add(self.record(2))
+        assert self.buffer._wakeup.is_set()
+        for index in range(3, 7):
+            self.buffer.add(self.record(index))
+
+        assert self.buffer.flush() == 7
+
+        assert ActivityLog.objects.count() == 7
+        stats = self.buffer.stats()
+        assert (stats['written'], stats['batches'], stats['pending']) == (7, 3, 0)
+
+    def test_interval_flushes_partial_batch(self, monkeypatch):
+        self.buffer.add(self.record())
+        flush = self.buffer.flush
+
+        def flush_once():
+            # 한 번 주기를 돈 뒤 스레드 루프 종료
+            self.buffer._stopping.set()
+            return flush()
+
+        monkeypatch.setattr(self.buffer, 'flush', flush_once)
+        self.buffer._run()
+
+        assert ActivityLog.objects.count() == 1
+
+    def test_full_queue_drops_records(self, settings):
+        settings.ACTIVITY_LOG_MAX_QUEUE = 2
+
+        results = [self.buffer.add(self.record(index)) for index in range(3)]
+
+        assert results == [True, True, False]
+        assert self.buffer.stats()['dropped'] == 1
+        assert self.buffer.stats()['pending'] == 2
+
+    def test_celery_mode_dispatches_batches(self, settings, monkeypatch):
+        settings.ACTIVITY_LOG_WRITE_MODE = 'celery'
+        dispatched = []
+        monkeypatch.setattr('utils.tasks.persist_activity_logs.delay', dispatched.append)
+        for index in range(4):
+            self.buffer.add(self.record(index))
+
+        assert self.buffer.flush() == 4
+
+        assert [len(batch) for batch in dispatched] == [3, 1]
+        assert ActivityLog.objects.count() == 0
+        assert self.buffer.stats()['dispatched'] == 4
+
+    def test_celery_dispatch_failure_writes_directly(self, settings, monkeypatch):
+        settings.ACTIVITY_LOG_WRITE_MODE = 'celery'
+
+        def broker_down(batch):
+            raise ConnectionError('broker unavailable')
+
+        monkeypatch.setattr('utils.tasks.persist_activity_logs.delay', broker_down)
+        self.buffer.add(self.record())
+
+        assert self.buffer.flush() == 1
+        assert ActivityLog.objects.count() == 1
+
+    def test_shutdown_writes_pending_records(self, settings, monkeypatch):
+        settings.ACTIVITY_LOG_WRITE_MODE = 'celery'
+        dispatched = []
+        monkeypatch.setattr('utils.tasks.persist_activity_logs.delay', dispatched.append)
+        for index in range(2):
+            self.buffer.add(self.record(index))
+
+        self.buffer.shutdown()
+
+        # 종료 시에는 브로커를 거치지 않고 직접 저장
+        assert dispatched == []
+        assert ActivityLog.objects.count() == 2
+        assert self.buffer.stats()['pending'] == 0
+
+    def test_bad_record_does_not_lose_batch(self):
+        self.buffer.add(self.record())
+        self.buffer.add(dict(self.record(), user_id=None))
+
+        assert self.buffer.flush() == 1
+        assert self.buffer.stats()['failed'] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+class TestActivityLogPartitions:
+    """ActivityLog 월별 보관 테이블 / 시간대별 집계 테스트 (SQLite 보관 테이블 방식)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.user = UserFactory()
+        self.now = timezone.make_aware(datetime(2026, 3, 15, 12, 0))
+        yield
+        # 보관 테이블은 테스트 DB 초기화(flush)로 지워지지 않으므로 직접 삭제
+        activity_partitions.drop_expired(retention_months=0, now=timezone.make_aware(datetime(2100, 1, 1)))
+
+    def log(self, created_at, action='GET /api/v1/members/', resource='member'):
+        return ActivityLog.objects.create(
+            user=self.user, action=action, resource=resource, created_at=created_at,
+            ip_address='127.0.0.1', user_agent='pytest',
+        )
+
+    def at(self, month, day=1, hour=9):
+        return timezone.make_aware(datetime(2026, month, day, hour, 0))
+
+    def archive_tables(self):
+        return [name for name, _, _ in activity_partitions.list_archives()]
+
+    def test_rotate_moves_past_months_into_archive_tables(self):
+        self.log(self.at(1, 10))
+        self.log(self.at(2, 5))
+        self.log(self.at(2, 20))
+        self.log(self.at(3, 2))
+
+        rotated = activity_partitions.rotate_tables(now=self.now)
+
+        assert rotated == ['activity_logs_a202601_202602', 'activity_logs_a202602_202603']
+        assert self.archive_tables() == rotated
+        assert ActivityLog.objects.count() == 1
+        february = activity_partitions.get_archive_model('activity_logs_a202602_202603')
+        assert february.objects.count() == 2
+
+    def test_rotate_appends_late_rows_to_existing_archive(self):
+        self.log(self.at(2, 5))
+        activity_partitions.rotate_tables(now=self.now)
+        self.log(self.at(2, 6))
+
+        activity_partitions.rotate_tables(now=self.now)
+
+        february = activity_partitions.get_archive_model('activity_logs_a202602_202603')
+        assert february.objects.count() == 2
+        assert ActivityLog.objects.count() == 0
+
+    def test_querysets_cover_only_overlapping_tables(self):
+        self.log(self.at(1, 10))
+        self.log(self.at(2, 5))
+        self.log(self.at(3, 2))
+        activity_partitions.rotate_tables(now=self.now)
+
+        querysets = activity_partitions.get_activity_log_querysets(self.at(2, 1, 0), self.at(4, 1, 0))
+
+        assert [queryset.model._meta.db_table for queryset in querysets] == [
+            'activity_logs', 'activity_logs_a202602_202603',
+        ]
+        assert sum(queryset.count() for queryset in querysets) == 2
+
+    def test_rollup_hour_counts_live_and_archived_rows(self):
+        hour = self.at(2, 5, 9)
+        self.log(hour)
+        self.log(hour + timedelta(minutes=30), action='POST /api/v1/members/')
+        self.log(hour + timedelta(minutes=59), resource='group')
+        self.log(hour + timedelta(hours=1))
+        activity_partitions.rotate_tables(now=self.now)
+        # 보관 이후 지연 저장된 로그
+        self.log(hour + timedelta(minutes=10))
+
+        assert activity_partitions.rollup_hour(hour + timedelta(minutes=15)) == 2
+
+        rollups = {
+            rollup.resource: (rollup.request_count, rollup.write_count)
+            for rollup in ActivityLogHourlyRollup.objects.filter(hour=hour, user=self.user)
+        }
+        assert rollups == {'member': (3, 1), 'group': (1, 0)}
+
+    def test_rollup_hour_rerun_replaces_rows(self):
+        hour = self.at(3, 2, 9)
+        self.log(hour)
+        activity_partitions.rollup_hour(hour)
+        self.log(hour + timedelta(minutes=5))
+
+        activity_partitions.rollup_hour(hour)
+
+        rollup = ActivityLogHourlyRollup.objects.get(hour=hour)
+        assert rollup.request_count == 2
+
+    def test_drop_expired_drops_whole_tables_past_retention(self):
+        self.log(self.at(1, 10))
+        self.log(self.at(2, 5))
+        activity_partitions.rotate_tables(now=self.now)
+
+        dropped = activity_partitions.drop_expired(retention_months=1, now=self.now)
+
+        assert dropped == ['activity_logs_a202601_202602']
+        assert self.archive_tables() == ['activity_logs_a202602_202603']
+
+    def test_partition_command_requires_postgresql(self):
+        from django.core.management import CommandError, call_command
+
+        assert activity_partitions.is_native_partitioning() is False
+        with pytest.raises(CommandError):
+            call_command('partition_activity_logs', '--yes')
+        with pytest.raises(ValueError):
+            activity_partitions.convert_to_partitioned()
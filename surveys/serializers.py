@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Survey, Question, Answer
+from church_core.church_context import get_church_context
 from members.serializers import MemberSerializer
 from users.serializers import UserSerializer
 
@@ -145,7 +146,7 @@ class SurveyListSerializer(serializers.ModelSerializer):
         if request and hasattr(request, 'user') and request.user.is_authenticated:
             try:
                 church_id = self.context.get('church_id')
-                church_user = request.user.church_users.get(church_id=church_id)
+                church_user = get_church_context(request, church_id).church_user
                 member = church_user.member
                 return Answer.objects.filter(question__survey=obj, member=member).exists()
             except:
@@ -191,7 +192,7 @@ class SurveyDetailSerializer(serializers.ModelSerializer):
         if request and hasattr(request, 'user') and request.user.is_authenticated:
             try:
                 church_id = self.context.get('church_id')
-                church_user = request.user.church_users.get(church_id=church_id)
+                church_user = get_church_context(request, church_id).church_user
                 member = church_user.member
                 return Answer.objects.filter(question__survey=obj, member=member).exists()
             except:
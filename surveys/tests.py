@@ -1,3 +1,34 @@
-from django.test import TestCase
+import pytest
+from datetime import date
+from surveys.models import Answer, Question, Survey
+from surveys.views import SURVEY_RESPONSE_STATS
+from utils.factories import ChurchFactory, MemberFactory
 
-# Create your tests here.
+
+@pytest.mark.django_db
+class TestSurveyResponseStats:
+    """설문 응답 통계 테스트"""
+
+    def test_total_responses_counts_members_like_baseline_query(self):
+        church = ChurchFactory()
+        survey = Survey.objects.create(church=church, title='새가족 설문', start_date=date.today(), end_date=date.today())
+        questions = [
+            Question.objects.create(survey=survey, question_text=f'질문 {index}', question_type='TEXT')
+            for index in range(2)
+        ]
+        members = [MemberFactory(church=church) for _ in range(3)]
+        for member in members:
+            Answer.objects.create(question=questions[0], member=member, answer_text='네')
+        Answer.objects.create(question=questions[1], member=members[0], answer_text='네')
+        # 다른 교회 응답은 제외
+        other = MemberFactory()
+        other_survey = Survey.objects.create(church=other.church, title='다른 교회', start_date=date.today(), end_date=date.today())
+        Answer.objects.create(
+            question=Question.objects.create(survey=other_survey, question_text='질문', question_type='TEXT'),
+            member=other,
+        )
+
+        answers = Answer.objects.filter(question__survey__church_id=church.id)
+        stats = SURVEY_RESPONSE_STATS.evaluate(answers, church_id=church.id)
+
+        assert stats['total_responses'] == answers.values('member').distinct().count() == 3
@@ -19,9 +19,40 @@ from .serializers import (
     AnswerCreateSerializer
 )
 from church_core.unified_permissions import UnifiedPermission
+from church_core.church_context import ChurchContextMixin
+from church_core.permission_scope import PermissionScopedQuerysetMixin
+from church_core.db_router import ReplicaReadMixin
+from church_core.stats import StatsSpec, TimeBucket
 
 
-class SurveyViewSet(viewsets.ModelViewSet):
+SURVEY_STATS = StatsSpec(
+    'surveys.statistics',
+    measures={
+        'total_surveys': Count('pk'),
+        'active_surveys': lambda: Count('pk', filter=Q(start_date__lte=date.today(), end_date__gte=date.today())),
+        'upcoming_surveys': lambda: Count('pk', filter=Q(start_date__gt=date.today())),
+        'completed_surveys': lambda: Count('pk', filter=Q(end_date__lt=date.today())),
+    },
+    dimensions={
+        # 올해 월별 설문조사 생성 수
+        'monthly_surveys': TimeBucket(
+            'created_at', 'month', extract=True, values=range(1, 13),
+            filter=lambda: Q(created_at__year=date.today().year),
+        ),
+    },
+    cache_domains=['surveys'],
+)
+
+SURVEY_RESPONSE_STATS = StatsSpec(
+    'surveys.responses',
+    # 응답한 교인 수 (values('member').distinct().count()와 같은 값)
+    # Count(distinct)는 NULL을 세지 않지만 Answer.member는 NOT NULL이므로 차이가 없음
+    measures={'total_responses': Count('member', distinct=True)},
+    cache_domains=['surveys'],
+)
+
+
+class SurveyViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """설문조사 관리 API ViewSet"""
     resource_name = 'survey'
     queryset = Survey.objects.all()
@@ -106,7 +137,7 @@ class SurveyViewSet(viewsets.ModelViewSet):
         
         # 사용자의 교회 멤버 정보 가져오기
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
@@ -193,34 +224,20 @@ class SurveyViewSet(viewsets.ModelViewSet):
     def statistics(self, request, church_id=None):
         """설문조사 통계 (관리자 전용)"""
         # UnifiedPermission에서 권한 확인
-        queryset = self.get_queryset()
-        today = date.today()
-        
-        # 기본 통계
-        total_surveys = queryset.count()
-        active_surveys = queryset.filter(start_date__lte=today, end_date__gte=today).count()
-        upcoming_surveys = queryset.filter(start_date__gt=today).count()
-        completed_surveys = queryset.filter(end_date__lt=today).count()
+        stats = SURVEY_STATS.evaluate(self.get_queryset(), church_id=church_id)
         
         # 응답 통계
-        total_responses = Answer.objects.filter(
-            question__survey__church_id=church_id
-        ).values('member').distinct().count()
-        
-        # 월별 설문조사 생성 수
-        monthly_surveys = queryset.filter(
-            created_at__year=today.year
-        ).extra(
-            select={'month': 'EXTRACT(month FROM created_at)'}
-        ).values('month').annotate(count=Count('id')).order_by('month')
+        responses = SURVEY_RESPONSE_STATS.evaluate(
+            Answer.objects.filter(question__survey__church_id=church_id), church_id=church_id
+        )
         
         return Response({
-            'total_surveys': total_surveys,
-            'active_surveys': active_surveys,
-            'upcoming_surveys': upcoming_surveys,
-            'completed_surveys': completed_surveys,
-            'total_responses': total_responses,
-            'monthly_surveys': list(monthly_surveys)
+            'total_surveys': stats['total_surveys'],
+            'active_surveys': stats['active_surveys'],
+            'upcoming_surveys': stats['upcoming_surveys'],
+            'completed_surveys': stats['completed_surveys'],
+            'total_responses': responses['total_responses'],
+            'monthly_surveys': stats['monthly_surveys']
         })
 
     @action(detail=True, methods=['get'])
@@ -230,7 +247,7 @@ class SurveyViewSet(viewsets.ModelViewSet):
         
         # 사용자의 교회 멤버 정보 가져오기
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
@@ -250,7 +267,7 @@ class SurveyViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class QuestionViewSet(viewsets.ModelViewSet):
+class QuestionViewSet(ChurchContextMixin, viewsets.ModelViewSet):
     """질문 관리 API ViewSet"""
     resource_name = 'question'
     queryset = Question.objects.all()
@@ -280,7 +297,7 @@ class QuestionViewSet(viewsets.ModelViewSet):
     # create, update, destroy는 UnifiedPermission에서 처리합니다.
 
 
-class AnswerViewSet(viewsets.ModelViewSet):
+class AnswerViewSet(ChurchContextMixin, PermissionScopedQuerysetMixin, viewsets.ModelViewSet):
     """답변 관리 API ViewSet"""
     resource_name = 'answer'
     queryset = Answer.objects.all()
@@ -298,8 +315,8 @@ class AnswerViewSet(viewsets.ModelViewSet):
             'question', 'question__survey', 'member'
         )
         
-        # UnifiedPermission이 객체 수준 권한을 처리하므로, 수동 필터링 제거
-        return queryset
+        # UnifiedPermission의 권한 범위(.all/.own_group/.own)를 쿼리셋에 적용
+        return self.apply_permission_scope(queryset)
 
     def get_serializer_class(self):
         """액션별 시리얼라이저 선택"""
@@ -309,9 +326,8 @@ class AnswerViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """답변 생성 시 멤버 정보 자동 설정"""
-        church_id = self.kwargs.get('church_id')
         try:
-            church_user = self.request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
             serializer.save(member=member)
         except:
@@ -323,7 +339,7 @@ class AnswerViewSet(viewsets.ModelViewSet):
     def my_answers(self, request, church_id=None):
         """내 답변 목록"""
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
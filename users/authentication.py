@@ -1,7 +1,10 @@
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError, AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
 from django.contrib.auth import get_user_model
 from security.models import JWTBlacklist
+from security.revocation import revocation_checker, publish_revocation
+from users.snapshot import get_user_snapshot
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,35 +18,49 @@ class CustomJWTAuthentication(JWTAuthentication):
         """토큰 검증 시 블랙리스트 확인"""
         validated_token = super().get_validated_token(raw_token)
         
-        # JTI 추출
+        # JTI 추출 (블룸 필터 -> 캐시 -> DB 순으로 확인)
+        jti = validated_token.get('jti')
         try:
-            jti = validated_token.get('jti')
-            if jti and JWTBlacklist.is_blacklisted(jti):
-                raise InvalidToken('Token is blacklisted')
+            revoked = bool(jti) and revocation_checker.is_revoked(jti)
         except Exception as e:
             logger.warning(f"JWT blacklist check failed: {e}")
             # 블랙리스트 확인 실패 시에도 계속 진행 (가용성 우선)
-            
+            revoked = False
+
+        if revoked:
+            raise InvalidToken('Token is blacklisted')
+
         return validated_token
 
     def get_user(self, validated_token):
-        """사용자 정보 조회 시 계정 잠금 확인"""
-        user = super().get_user(validated_token)
-        
-        # 보안 프로필 확인
+        """사용자 정보 조회 시 계정 잠금 확인 (사용자 스냅샷 캐시 사용)"""
         try:
-            security_profile = user.security_profile
-            if security_profile.is_locked:
-                raise InvalidToken('Account is locked')
-                
-            if security_profile.password_expired:
-                logger.info(f"User {user.id} password expired")
-                # 비밀번호 만료 시에도 로그인 허용하되 경고만 로깅
-        except AttributeError:
-            # 보안 프로필이 없는 경우 생성
-            from security.models import UserSecurityProfile
-            UserSecurityProfile.objects.get_or_create(user=user)
-            
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        snapshot = get_user_snapshot(user_id)
+        if snapshot is None:
+            raise AuthenticationFailed('User not found', code='user_not_found')
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not snapshot.is_active:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != snapshot.password_digest:
+                raise AuthenticationFailed("The user's password has been changed.", code='password_changed')
+
+        # 보안 프로필 확인
+        if snapshot.is_locked:
+            raise InvalidToken('Account is locked')
+
+        if snapshot.password_expired:
+            logger.info(f"User {snapshot.user_id} password expired")
+            # 비밀번호 만료 시에도 로그인 허용하되 경고만 로깅
+
+        # 교회 컨텍스트 조회에서 재사용
+        user = snapshot.build_user()
+        user.snapshot = snapshot
         return user
 
 
@@ -72,6 +89,9 @@ def blacklist_token(token, reason='logout'):
                 'expires_at': expires_at
             }
         )
+
+        # 다른 프로세스의 블룸 필터에 전파
+        publish_revocation(jti, expires_at)
         
         logger.info(f"Token blacklisted for user {user_id}: {reason}")
         return True
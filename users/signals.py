@@ -0,0 +1,34 @@
+"""
+사용자 스냅샷 캐시 무효화 시그널
+
+무효화는 트랜잭션 커밋 후에 실행합니다. 커밋 전에 버전을 올리면 동시 요청이
+커밋 전 상태를 새 버전으로 다시 캐시할 수 있기 때문입니다.
+"""
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from security.models import UserSecurityProfile
+from users.models import ChurchUser
+from users.snapshot import invalidate_user_snapshot
+
+User = get_user_model()
+
+
+def _invalidate_on_commit(user_id):
+    transaction.on_commit(lambda: invalidate_user_snapshot(user_id))
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_on_user_change(sender, instance, **kwargs):
+    _invalidate_on_commit(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=UserSecurityProfile)
+def invalidate_on_security_profile_change(sender, instance, **kwargs):
+    _invalidate_on_commit(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=ChurchUser)
+def invalidate_on_church_user_change(sender, instance, **kwargs):
+    _invalidate_on_commit(instance.user_id)
@@ -0,0 +1,175 @@
+"""
+인증 사용자 스냅샷 캐시
+
+JWT 인증마다 반복되는 User / UserSecurityProfile / ChurchUser 조회를
+사용자 ID와 프로필 버전으로 키를 만든 짧은 TTL 캐시로 대체합니다.
+프로필/보안 정보가 변경되면 signals에서 (트랜잭션 커밋 후) 버전을 올려 이전 스냅샷을 무효화합니다.
+
+공유 캐시에는 인증에 필요한 필드만 저장합니다. 비밀번호 해시는 저장하지 않고
+토큰 폐기 확인용 다이제스트만 저장하며, 요청 사용자는 저장된 필드로 만든 User 인스턴스
+(나머지 필드는 처음 접근할 때 DB에서 지연 로드)입니다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from datetime import timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'user_profile_version_{user_id}'
+SNAPSHOT_KEY = 'user_snapshot_{user_id}_{version}'
+
+PASSWORD_EXPIRY_DAYS = 90
+
+# 스냅샷에 저장하는 User 필드 (그 외 필드는 지연 로드)
+USER_FIELDS = (
+    'id', 'username', 'email', 'first_name', 'last_name',
+    'is_active', 'is_staff', 'is_superuser', 'is_verified',
+)
+
+
+def get_snapshot_timeout():
+    return getattr(settings, 'USER_SNAPSHOT_TIMEOUT', 60)
+
+
+class UserSnapshot:
+    """
+    인증 시점에 필요한 사용자 정보 묶음
+
+    - user_fields: USER_FIELDS 값 ({필드명: 값})
+    - password_digest: 비밀번호 해시의 MD5 (토큰 폐기 확인용)
+    - locked_until / password_changed_at: 보안 프로필 상태
+    - memberships: {church_id: is_active} 소속 교회 목록
+    - roles: {church_id: role} 교회별 역할
+    """
+
+    def __init__(self, user_fields, password_digest, locked_until, password_changed_at, memberships, roles=None):
+        self.user_fields = user_fields
+        self.password_digest = password_digest
+        self.locked_until = locked_until
+        self.password_changed_at = password_changed_at
+        self.memberships = memberships
+        self.roles = roles or {}
+
+    @property
+    def user_id(self):
+        return self.user_fields['id']
+
+    @property
+    def is_active(self):
+        return self.user_fields['is_active']
+
+    def build_user(self):
+        """저장된 필드로 User 인스턴스 생성 (나머지 필드는 접근 시 지연 로드)"""
+        from django.contrib.auth import get_user_model
+        from django.db import router
+
+        User = get_user_model()
+        names = [field.attname for field in User._meta.concrete_fields if field.attname in self.user_fields]
+        return User.from_db(router.db_for_read(User), names, [self.user_fields[name] for name in names])
+
+    @property
+    def is_locked(self):
+        """계정 잠금 여부 (조회 시점 기준)"""
+        return bool(self.locked_until and timezone.now() < self.locked_until)
+
+    @property
+    def password_expired(self):
+        """비밀번호 만료 여부 (90일)"""
+        if self.password_changed_at is None:
+            return False
+        return timezone.now() > self.password_changed_at + timedelta(days=PASSWORD_EXPIRY_DAYS)
+
+    @property
+    def church_ids(self):
+        """소속 교회 ID 목록 (비활성 포함)"""
+        return list(self.memberships)
+
+    @property
+    def active_church_ids(self):
+        """활성 소속 교회 ID 목록"""
+        return [church_id for church_id, is_active in self.memberships.items() if is_active]
+
+    def has_membership(self, church_id):
+        return int(church_id) in self.memberships
+
+    def get_role(self, church_id):
+        """활성 소속 교회에서의 역할 (없으면 None)"""
+        church_id = int(church_id)
+        if not self.memberships.get(church_id):
+            return None
+        return self.roles.get(church_id)
+
+
+def _get_version(user_id):
+    return cache.get(VERSION_KEY.format(user_id=user_id)) or 0
+
+
+def _load_snapshot(user_id):
+    from django.contrib.auth import get_user_model
+    from rest_framework_simplejwt.utils import get_md5_hash_password
+    from security.models import UserSecurityProfile
+    from users.models import ChurchUser
+
+    User = get_user_model()
+    user = User.objects.select_related('security_profile').filter(pk=user_id).first()
+    if user is None:
+        return None
+
+    try:
+        profile = user.security_profile
+    except UserSecurityProfile.DoesNotExist:
+        # 보안 프로필이 없는 경우 생성
+        profile, _ = UserSecurityProfile.objects.get_or_create(user=user)
+
+    rows = ChurchUser.objects.filter(user_id=user_id).order_by('pk').values_list(
+        'church_id', 'is_active', 'role'
+    )
+    memberships = {}
+    roles = {}
+    for church_id, is_active, role in rows:
+        memberships[church_id] = is_active
+        roles[church_id] = role
+    return UserSnapshot(
+        user_fields={name: getattr(user, name) for name in USER_FIELDS},
+        password_digest=get_md5_hash_password(user.password),
+        locked_until=profile.locked_until,
+        password_changed_at=profile.password_changed_at,
+        memberships=memberships,
+        roles=roles,
+    )
+
+
+def get_user_snapshot(user_id):
+    """사용자 스냅샷 조회 (캐시 미스 시 DB에서 로드, 사용자가 없으면 None)"""
+    version = _get_version(user_id)
+    cache_key = SNAPSHOT_KEY.format(user_id=user_id, version=version)
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        snapshot = _load_snapshot(user_id)
+        if snapshot is None:
+            return None
+        cache.set(cache_key, snapshot, get_snapshot_timeout())
+    return snapshot
+
+
+def get_request_user_snapshot(user):
+    """요청 사용자에 연결된 스냅샷 (JWT 인증 시 재사용, 없으면 조회)"""
+    snapshot = getattr(user, 'snapshot', None)
+    if snapshot is None and getattr(user, 'is_authenticated', False):
+        snapshot = get_user_snapshot(user.pk)
+        if snapshot is not None:
+            user.snapshot = snapshot
+    return snapshot
+
+
+def invalidate_user_snapshot(user_id):
+    """프로필 버전을 올려 캐시된 스냅샷 무효화"""
+    version_key = VERSION_KEY.format(user_id=user_id)
+    cache.add(version_key, 0, None)
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        # 키가 그 사이 제거된 경우
+        cache.set(version_key, 1, None)
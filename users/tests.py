@@ -1,3 +1,95 @@
-from django.test import TestCase
+import pickle
+import pytest
+from datetime import timedelta
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+from security.models import UserSecurityProfile
+from users import authentication, snapshot
+from users.authentication import CustomJWTAuthentication
+from utils.factories import ChurchUserFactory, UserFactory
 
-# Create your tests here.
+
+@pytest.mark.django_db
+class TestUserSnapshot:
+    """인증 사용자 스냅샷 캐시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.church_user = ChurchUserFactory(role='church_staff')
+        self.user = self.church_user.user
+        cache.clear()
+
+    def authenticate(self, user=None):
+        token = AccessToken.for_user(user or self.user)
+        return CustomJWTAuthentication().get_user(token)
+
+    def test_snapshot_cached_without_password_hash(self, django_assert_num_queries):
+        loaded = snapshot.get_user_snapshot(self.user.pk)
+        with django_assert_num_queries(0):
+            cached = snapshot.get_user_snapshot(self.user.pk)
+
+        assert cached.memberships == {self.church_user.church_id: True}
+        assert cached.get_role(self.church_user.church_id) == 'church_staff'
+        assert 'password' not in cached.user_fields
+        assert self.user.password.encode() not in pickle.dumps(loaded)
+
+    def test_get_user_uses_snapshot(self, django_assert_num_queries):
+        self.authenticate()
+
+        with django_assert_num_queries(0):
+            user = self.authenticate()
+        assert (user.pk, user.username, user.is_authenticated) == (self.user.pk, self.user.username, True)
+        assert user.snapshot.has_membership(self.church_user.church_id)
+        # 스냅샷에 없는 필드는 접근할 때 불러옴
+        with django_assert_num_queries(1):
+            assert user.password == self.user.password
+
+    def test_invalidated_after_commit(self, django_capture_on_commit_callbacks):
+        assert snapshot.get_user_snapshot(self.user.pk).is_active
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            self.user.is_active = False
+            self.user.save()
+            # 커밋 전에는 이전 스냅샷 유지 (커밋 전 상태가 새 버전으로 캐시되지 않도록)
+            assert snapshot._get_version(self.user.pk) == 0
+        for callback in callbacks:
+            callback()
+
+        assert snapshot._get_version(self.user.pk) == 1
+        with pytest.raises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_locked_account_rejected(self, django_capture_on_commit_callbacks):
+        self.authenticate()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            UserSecurityProfile.objects.update_or_create(
+                user=self.user, defaults={'locked_until': timezone.now() + timedelta(minutes=30)}
+            )
+
+        with pytest.raises(InvalidToken):
+            self.authenticate()
+
+    def test_password_change_revokes_token(self, monkeypatch, django_capture_on_commit_callbacks):
+        # simplejwt는 설정 변경 시 api_settings를 새 객체로 바꾸므로 모듈이 가진 객체를 직접 수정
+        monkeypatch.setattr(authentication.api_settings, 'CHECK_REVOKE_TOKEN', True)
+        token = AccessToken.for_user(self.user)
+        assert CustomJWTAuthentication().get_user(token).pk == self.user.pk
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.user.set_password('new-password')
+            self.user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            CustomJWTAuthentication().get_user(token)
+
+    def test_unknown_user(self):
+        user = UserFactory()
+        token = AccessToken.for_user(user)
+        user.delete()
+
+        with pytest.raises(AuthenticationFailed):
+            CustomJWTAuthentication().get_user(token)
@@ -0,0 +1,214 @@
+"""
+API 성능 벤치마크 스위트
+
+교회 단위 라우트에서 목록(list), 컬렉션 GET 액션(statistics, overview 등),
+대량 처리(bulk_*) 엔드포인트를 자동으로 찾아 실제 미들웨어/인증 경로로 호출하고
+엔드포인트별 실행 시간(ms, 중앙값), 쿼리 수, 최대 메모리(KB)를 기록합니다.
+결과를 JSON 기준선(baseline)과 비교하여 허용 범위를 넘는 회귀를 찾아냅니다.
+
+실행은 utils/management/commands/benchmark_api.py 참고.
+"""
+from datetime import date, timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+from rest_framework.test import APIClient
+import django
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+DEFAULT_TOLERANCES = {
+    'time_ratio': 1.25,       # 기준선 대비 허용 실행 시간 비율
+    'time_floor_ms': 5.0,     # 이보다 작은 시간 차이는 측정 오차로 간주
+    'queries': 0,             # 허용 쿼리 수 증가분
+    'memory_ratio': 1.25,
+    'memory_floor_kb': 256.0,
+}
+
+
+def _last_sunday():
+    today = date.today()
+    return today - timedelta(days=(today.weekday() + 1) % 7)
+
+
+def _attendance_bulk_payload(dataset):
+    from attendance.models import Attendance
+    from members.models import Member
+
+    member_ids = Member.objects.filter(church=dataset.church).values_list('id', flat=True)[:200]
+    return {
+        'date': _last_sunday().isoformat(),
+        'worship_type': Attendance.WorshipType.SUNDAY_MORNING,
+        'attendances': [{'member_id': member_id, 'status': 'present'} for member_id in member_ids],
+    }
+
+
+# URL 이름별 요청 데이터 (dataset -> dict)
+# GET은 쿼리 파라미터, POST는 본문. 본문이 등록되지 않은 bulk 엔드포인트는 건너뜁니다.
+ENDPOINT_PARAMS = {
+    'attendance-bulk-create': _attendance_bulk_payload,
+}
+
+
+class Endpoint:
+    """벤치마크 대상 엔드포인트"""
+
+    def __init__(self, name, method, action, view):
+        self.name = name
+        self.method = method
+        self.action = action
+        self.view = view
+
+    @property
+    def key(self):
+        return f"{self.method} {self.name}"
+
+    def request(self, client, dataset):
+        url = reverse(self.name, kwargs={'church_id': dataset.church.pk})
+        params = ENDPOINT_PARAMS[self.name](dataset) if self.name in ENDPOINT_PARAMS else {}
+        if self.method == 'GET':
+            return client.get(url, params)
+        return client.post(url, params, format='json')
+
+
+def _iter_patterns(patterns, prefix=''):
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            yield from _iter_patterns(entry.url_patterns, prefix + str(entry.pattern))
+        else:
+            yield prefix + str(entry.pattern), entry
+
+
+def discover_endpoints():
+    """교회 단위 ViewSet 라우트에서 목록/컬렉션 GET 액션/bulk POST 엔드포인트 수집"""
+    endpoints = {}
+    for route, pattern in _iter_patterns(get_resolver().url_patterns):
+        actions = getattr(pattern.callback, 'actions', None)
+        # 상세(pk) 라우트와 format 접미사 라우트 제외
+        if not actions or not pattern.name or 'church_id' not in route or pattern.pattern.regex.groupindex:
+            continue
+        for method, action in actions.items():
+            method = method.upper()
+            if method == 'GET' or (method == 'POST' and action.startswith('bulk')):
+                endpoint = Endpoint(pattern.name, method, action, pattern.callback.cls.__name__)
+                endpoints.setdefault(endpoint.key, endpoint)
+    return sorted(endpoints.values(), key=lambda endpoint: endpoint.key)
+
+
+def measure(client, endpoint, dataset, repeat=3, cold=True):
+    """
+    엔드포인트 측정
+
+    cold=True이면 매 호출 전에 캐시를 비워 캐시되지 않은 경로를 측정합니다.
+    메모리는 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 별도 1회 호출로 측정합니다.
+    """
+    timings = []
+    for _ in range(repeat):
+        if cold:
+            cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = endpoint.request(client, dataset)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    if cold:
+        cache.clear()
+    tracemalloc.start()
+    try:
+        endpoint.request(client, dataset)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'method': endpoint.method,
+        'view': endpoint.view,
+        'action': endpoint.action,
+        'status': response.status_code,
+        'time_ms': round(statistics.median(timings), 2),
+        'queries': len(queries),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def run_suite(dataset, endpoints=None, repeat=3, cold=True, log=None):
+    """dataset 교회에 대해 엔드포인트 전체를 측정한 결과(기준선 형식)"""
+    # 500 응답도 결과로 기록 (예외로 스위트가 중단되지 않도록)
+    client = APIClient(raise_request_exception=False)
+    client.force_authenticate(user=dataset.admin)
+
+    results = {}
+    for endpoint in endpoints if endpoints is not None else discover_endpoints():
+        if endpoint.method != 'GET' and endpoint.name not in ENDPOINT_PARAMS:
+            continue
+        results[endpoint.key] = measure(client, endpoint, dataset, repeat=repeat, cold=cold)
+        if log:
+            result = results[endpoint.key]
+            log(
+                f"{endpoint.key:<55}{result['status']:>5}{result['time_ms']:>10.1f}ms"
+                f"{result['queries']:>6}q{result['peak_memory_kb']:>10.0f}KB"
+            )
+
+    return {
+        'meta': {
+            'scale': dataset.scale,
+            'counts': dataset.counts,
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'repeat': repeat,
+            'cold': cold,
+        },
+        'endpoints': results,
+    }
+
+
+def compare(results, baseline, tolerances=None):
+    """
+    기준선 대비 회귀 목록
+
+    각 항목: {'endpoint', 'metric', 'baseline', 'current'}
+    기준선에 없는 엔드포인트는 비교하지 않습니다.
+    """
+    limits = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+    regressions = []
+
+    for key, current in results['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(key)
+        if previous is None:
+            continue
+
+        def flag(metric):
+            regressions.append({
+                'endpoint': key, 'metric': metric,
+                'baseline': previous[metric], 'current': current[metric],
+            })
+
+        if current['status'] != previous['status']:
+            flag('status')
+        if current['queries'] > previous['queries'] + limits['queries']:
+            flag('queries')
+        if (current['time_ms'] > previous['time_ms'] * limits['time_ratio']
+                and current['time_ms'] - previous['time_ms'] > limits['time_floor_ms']):
+            flag('time_ms')
+        if (current['peak_memory_kb'] > previous['peak_memory_kb'] * limits['memory_ratio']
+                and current['peak_memory_kb'] - previous['peak_memory_kb'] > limits['memory_floor_kb']):
+            flag('peak_memory_kb')
+
+    return regressions
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def save_results(path, results):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, ensure_ascii=False, indent=2, sort_keys=True)
+        file.write('\n')
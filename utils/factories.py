@@ -0,0 +1,335 @@
+"""
+벤치마크/테스트용 factory-boy 팩토리와 대형 교회 합성 데이터 생성기
+
+팩토리는 단건 생성(테스트)과 build()로 만든 인스턴스의 대량 저장(벤치마크)에 모두 사용합니다.
+출석/헌금처럼 수백만 건이 될 수 있는 시계열 데이터는 생성 속도를 위해
+모델 인스턴스를 직접 만들어 주 단위로 bulk_create 합니다.
+
+    builder = SyntheticChurchBuilder(**SCALES['mega'])   # 교인 5만 명, 5년치 주간 데이터
+    dataset = builder.build()
+    dataset.church, dataset.admin, dataset.counts
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from django.db import transaction
+from attendance.models import Attendance
+from church.models import Church
+from groups.models import Group, GroupMember
+from members.models import FamilyRelationship, Member
+from offerings.models import Offering
+from prayers.models import Prayer
+from users.models import ChurchUser, User
+import factory
+import factory.random
+import random
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 규모 프리셋 (SyntheticChurchBuilder 인자)
+SCALES = {
+    'tiny': {'members': 60, 'years': 1, 'prayers_per_member': 0.5},
+    'small': {'members': 2000, 'years': 1},
+    'medium': {'members': 10000, 'years': 2},
+    'mega': {'members': 50000, 'years': 5},
+}
+
+POSITIONS = ['성도', '성도', '성도', '집사', '권사', '장로']
+SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임']
+
+
+class ChurchFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Church
+
+    name = factory.Sequence(lambda n: f'벤치마크교회{n}')
+    code = factory.Sequence(lambda n: f'BENCH{n:05d}')
+    denomination = '장로회'
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = User
+        django_get_or_create = ('username',)
+
+    username = factory.Sequence(lambda n: f'bench_user{n}')
+    email = factory.LazyAttribute(lambda obj: f'{obj.username}@example.com')
+    password = factory.django.Password('benchmark-password')
+
+
+class ChurchUserFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = ChurchUser
+
+    user = factory.SubFactory(UserFactory)
+    church = factory.SubFactory(ChurchFactory)
+    role = 'member'
+    name = factory.Sequence(lambda n: f'사용자{n}')
+    phone = factory.Sequence(lambda n: f'010-{n % 10000:04d}-{(n * 7) % 10000:04d}')
+
+
+class MemberFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Member
+
+    church = factory.SubFactory(ChurchFactory)
+    member_code = factory.Sequence(lambda n: f'M{n:07d}')
+    name = factory.Sequence(lambda n: f'{SURNAMES[n % len(SURNAMES)]}교인{n}')
+    gender = factory.Iterator(Member.Gender.values)
+    birth_date = factory.Sequence(lambda n: date(1940, 1, 1) + timedelta(days=(n * 137) % 27000))
+    phone = factory.Sequence(lambda n: f'010-{n % 10000:04d}-{(n * 7) % 10000:04d}')
+    position = factory.Iterator(POSITIONS)
+    registration_date = factory.Sequence(lambda n: date.today() - timedelta(days=n % 3650))
+    status = Member.MemberStatus.ACTIVE
+
+
+class FamilyRelationshipFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = FamilyRelationship
+
+    from_member = factory.SubFactory(MemberFactory)
+    to_member = factory.SubFactory(MemberFactory, church=factory.SelfAttribute('..from_member.church'))
+    church = factory.SelfAttribute('from_member.church')
+    relationship = FamilyRelationship.RelationshipType.SPOUSE
+    is_confirmed = True
+
+
+class GroupFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Group
+
+    church = factory.SubFactory(ChurchFactory)
+    name = factory.Sequence(lambda n: f'그룹{n}')
+    code = factory.Sequence(lambda n: f'G{n:06d}')
+    group_type = Group.GroupType.CELL
+
+
+class GroupMemberFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = GroupMember
+
+    group = factory.SubFactory(GroupFactory)
+    member = factory.SubFactory(MemberFactory, church=factory.SelfAttribute('..group.church'))
+    role = GroupMember.MemberRole.MEMBER
+
+
+class AttendanceFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Attendance
+
+    church = factory.SubFactory(ChurchFactory)
+    member = factory.SubFactory(MemberFactory, church=factory.SelfAttribute('..church'))
+    date = factory.LazyFunction(date.today)
+    worship_type = Attendance.WorshipType.SUNDAY_MORNING
+    status = Attendance.AttendanceStatus.PRESENT
+
+
+class OfferingFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Offering
+
+    church = factory.SubFactory(ChurchFactory)
+    member = factory.SubFactory(MemberFactory, church=factory.SelfAttribute('..church'))
+    amount = factory.Sequence(lambda n: Decimal((n % 50 + 1) * 10000))
+    offering_type = factory.Iterator(Offering.OfferingType.values)
+    date = factory.LazyFunction(date.today)
+
+
+class PrayerFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Prayer
+
+    church = factory.SubFactory(ChurchFactory)
+    member = factory.SubFactory(MemberFactory, church=factory.SelfAttribute('..church'))
+    title = factory.Sequence(lambda n: f'기도제목 {n}')
+    content = factory.Sequence(lambda n: f'기도제목 {n}의 내용입니다.')
+    prayer_type = factory.Iterator(Prayer.PrayerType.values)
+    priority = factory.Iterator(Prayer.Priority.values)
+    status = factory.Iterator([Prayer.Status.ACTIVE, Prayer.Status.ACTIVE, Prayer.Status.ANSWERED])
+    is_public = True
+
+
+class SyntheticDataset:
+    """생성된 교회 데이터 요약"""
+
+    def __init__(self, church, admin, counts, scale):
+        self.church = church
+        self.admin = admin
+        self.counts = counts
+        self.scale = scale
+
+
+class SyntheticChurchBuilder:
+    """
+    대형 교회 합성 데이터 생성기
+
+    같은 seed와 인자로 생성하면 같은 분포의 데이터가 만들어지므로
+    벤치마크 기준선(baseline) 비교에 사용할 수 있습니다.
+    - 교인 3~4명 단위 가정(household + 배우자/자녀 관계)
+    - 교구(district) > 셀(cell) 그룹 구조와 셀 소속
+    - years년치 주일 출석(attendance_rate 비율)과 주간 헌금(offering_rate 비율)
+    - 교인당 prayers_per_member건의 기도제목
+    """
+
+    def __init__(self, members=2000, years=1, attendance_rate=0.6, offering_rate=0.3,
+                 prayers_per_member=0.3, cell_size=12, cells_per_district=40, seed=20240101,
+                 batch_size=2000, church=None, log=None):
+        self.members = members
+        self.years = years
+        self.attendance_rate = attendance_rate
+        self.offering_rate = offering_rate
+        self.prayers_per_member = prayers_per_member
+        self.cell_size = cell_size
+        self.cells_per_district = cells_per_district
+        self.seed = seed
+        self.batch_size = batch_size
+        self.church = church
+        self.log = log or logger.info
+        self.random = random.Random(seed)
+        self.counts = {}
+
+    @property
+    def scale(self):
+        return {
+            'members': self.members,
+            'years': self.years,
+            'attendance_rate': self.attendance_rate,
+            'offering_rate': self.offering_rate,
+            'prayers_per_member': self.prayers_per_member,
+            'seed': self.seed,
+        }
+
+    def build(self):
+        factory.random.reseed_random(self.seed)
+        with transaction.atomic():
+            church = self.church or ChurchFactory()
+            admin = self._build_admin(church)
+            members = self._step('members', self.build_members, church)
+            self._step('families', self.build_families, church, members)
+            self._step('groups', self.build_groups, church, members)
+            self._step('prayers', self.build_prayers, church, members)
+        # 시계열 데이터는 주 단위로 커밋하여 트랜잭션이 과도하게 커지지 않도록 함
+        self._step('attendance', self.build_attendance, church, members)
+        self._step('offerings', self.build_offerings, church, members)
+        return SyntheticDataset(church, admin, dict(self.counts), self.scale)
+
+    def _step(self, name, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        self.log(f"{name}: {self.counts.get(name, 0)}건 ({time.perf_counter() - started:.1f}s)")
+        return result
+
+    def _bulk_create(self, name, model, objects):
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.counts[name] = self.counts.get(name, 0) + len(objects)
+        return objects
+
+    def _build_admin(self, church):
+        """벤치마크 요청에 사용할 교회 관리자 (슈퍼유저)"""
+        user = UserFactory(username=f'bench_admin_{church.pk}', is_superuser=True, is_staff=True)
+        ChurchUserFactory(user=user, church=church, role='church_admin', name='벤치마크 관리자')
+        return user
+
+    def build_members(self, church):
+        members = [MemberFactory.build(church=church) for _ in range(self.members)]
+        return self._bulk_create('members', Member, members)
+
+    def build_families(self, church, members):
+        """3~4명 단위 가정: 첫 교인이 세대주, 두 번째가 배우자, 나머지는 자녀"""
+        households = []
+        relationships = []
+        Type = FamilyRelationship.RelationshipType
+        index = 0
+        while index < len(members):
+            size = self.random.choice((1, 2, 3, 3, 4))
+            family = members[index:index + size]
+            index += size
+            head = family[0]
+            for member in family:
+                member.household = head
+                households.append(member)
+            if len(family) > 1:
+                relationships += self._relationship_pair(church, head, family[1], Type.SPOUSE, Type.SPOUSE)
+            for child in family[2:]:
+                relationships += self._relationship_pair(church, head, child, Type.PARENT, Type.CHILD)
+
+        Member.objects.bulk_update(households, ['household'], batch_size=self.batch_size)
+        self._bulk_create('families', FamilyRelationship, relationships)
+
+    def _relationship_pair(self, church, from_member, to_member, relationship, reverse):
+        # save()의 역방향 관계 자동 생성을 bulk_create에서 대신 수행
+        return [
+            FamilyRelationshipFactory.build(
+                church=church, from_member=from_member, to_member=to_member, relationship=relationship
+            ),
+            FamilyRelationshipFactory.build(
+                church=church, from_member=to_member, to_member=from_member, relationship=reverse
+            ),
+        ]
+
+    def build_groups(self, church, members):
+        cell_count = max(1, len(members) // self.cell_size)
+        district_count = max(1, -(-cell_count // self.cells_per_district))
+
+        districts = self._bulk_create('groups', Group, [
+            GroupFactory.build(church=church, name=f'{number + 1}교구', group_type=Group.GroupType.DISTRICT)
+            for number in range(district_count)
+        ])
+        cells = self._bulk_create('groups', Group, [
+            GroupFactory.build(
+                church=church, name=f'{number + 1}셀', group_type=Group.GroupType.CELL,
+                parent_group=districts[number % district_count], max_members=self.cell_size + 2,
+            )
+            for number in range(cell_count)
+        ])
+
+        memberships = []
+        for index, member in enumerate(members):
+            role = GroupMember.MemberRole.LEADER if index < cell_count else GroupMember.MemberRole.MEMBER
+            memberships.append(GroupMemberFactory.build(group=cells[index % cell_count], member=member, role=role))
+        self._bulk_create('group_members', GroupMember, memberships)
+
+    def build_prayers(self, church, members):
+        count = int(len(members) * self.prayers_per_member)
+        prayers = [
+            PrayerFactory.build(
+                church=church, member=self.random.choice(members),
+                prayer_date=date.today() - timedelta(days=self.random.randrange(365 * self.years)),
+            )
+            for _ in range(count)
+        ]
+        self._bulk_create('prayers', Prayer, prayers)
+
+    def sundays(self):
+        """오늘 이전 years년치 주일 목록 (오래된 순)"""
+        today = date.today()
+        last_sunday = today - timedelta(days=(today.weekday() + 1) % 7)
+        return [last_sunday - timedelta(weeks=week) for week in reversed(range(52 * self.years))]
+
+    def build_attendance(self, church, members):
+        Status = Attendance.AttendanceStatus
+        for sunday in self.sundays():
+            with transaction.atomic():
+                self._bulk_create('attendance', Attendance, [
+                    Attendance(
+                        church=church, member=member, date=sunday,
+                        worship_type=Attendance.WorshipType.SUNDAY_MORNING,
+                        status=Status.PRESENT if self.random.random() < self.attendance_rate else Status.ABSENT,
+                    )
+                    for member in members
+                ])
+
+    def build_offerings(self, church, members):
+        types = Offering.OfferingType.values
+        for sunday in self.sundays():
+            givers = self.random.sample(members, int(len(members) * self.offering_rate))
+            with transaction.atomic():
+                self._bulk_create('offerings', Offering, [
+                    Offering(
+                        church=church, member=member, date=sunday,
+                        amount=Decimal(self.random.randrange(1, 100) * 10000),
+                        offering_type=types[self.random.randrange(len(types))],
+                    )
+                    for member in givers
+                ])
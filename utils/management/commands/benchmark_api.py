@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from pathlib import Path
+from utils import benchmark
+from utils.factories import SCALES, SyntheticChurchBuilder
+
+# 벤치마크 중 요청 제한에 걸리지 않도록 충분히 큰 한도 사용
+UNLIMITED = {'limit': 10 ** 9, 'window': 60}
+
+
+class Command(BaseCommand):
+    help = (
+        '합성 대형 교회 데이터로 목록/통계/대량 처리 API를 측정하고 기준선과 비교합니다. '
+        '테스트 데이터베이스(SQLite 설정이면 메모리 DB)를 새로 만들어 사용하므로 별도 서비스가 필요 없습니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=sorted(SCALES), default='small', help='데이터 규모 프리셋')
+        parser.add_argument('--members', type=int, help='교인 수 (프리셋 값 대체)')
+        parser.add_argument('--years', type=int, help='출석/헌금 데이터 기간(년) (프리셋 값 대체)')
+        parser.add_argument('--seed', type=int, default=20240101)
+        parser.add_argument('--repeat', type=int, default=3, help='엔드포인트당 측정 횟수 (중앙값 사용)')
+        parser.add_argument('--warm', action='store_true', help='캐시를 비우지 않고 측정')
+        parser.add_argument('--endpoint', action='append', default=[], help='URL 이름에 포함된 문자열로 대상 제한')
+        parser.add_argument(
+            '--baseline', default=str(Path(settings.BASE_DIR) / 'benchmarks' / 'baseline.json'),
+            help='비교할 기준선 JSON 경로',
+        )
+        parser.add_argument('--update-baseline', action='store_true', help='측정 결과를 기준선으로 저장')
+        parser.add_argument('--output', help='측정 결과 JSON 저장 경로')
+        parser.add_argument('--time-ratio', type=float, default=benchmark.DEFAULT_TOLERANCES['time_ratio'])
+        parser.add_argument('--allowed-extra-queries', type=int, default=benchmark.DEFAULT_TOLERANCES['queries'])
+
+    def handle(self, *args, **options):
+        scale = dict(SCALES[options['scale']], seed=options['seed'])
+        for name in ('members', 'years'):
+            if options[name] is not None:
+                scale[name] = options[name]
+
+        old_config = setup_databases(verbosity=0, interactive=False, aliases=set(connections))
+        try:
+            with override_settings(RATE_LIMIT_POLICIES={
+                'anonymous': UNLIMITED, 'authenticated': UNLIMITED, 'roles': {}, 'churches': {},
+            }):
+                results = self.run(scale, options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        if options['output']:
+            benchmark.save_results(Path(options['output']), results)
+
+        baseline_path = Path(options['baseline'])
+        if options['update_baseline']:
+            benchmark.save_results(baseline_path, results)
+            self.stdout.write(self.style.SUCCESS(f'기준선 저장: {baseline_path}'))
+            return
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING(f'기준선이 없습니다 (--update-baseline으로 생성): {baseline_path}'))
+            return
+
+        self.check_regressions(results, benchmark.load_baseline(baseline_path), options)
+
+    def run(self, scale, options):
+        self.stdout.write(f"데이터 생성: {scale}")
+        dataset = SyntheticChurchBuilder(**scale, log=self.stdout.write).build()
+
+        endpoints = benchmark.discover_endpoints()
+        if options['endpoint']:
+            endpoints = [
+                endpoint for endpoint in endpoints
+                if any(text in endpoint.name for text in options['endpoint'])
+            ]
+
+        self.stdout.write(f"{'endpoint':<55}{'status':>5}{'time':>12}{'q':>7}{'peak':>12}")
+        return benchmark.run_suite(
+            dataset, endpoints, repeat=options['repeat'], cold=not options['warm'], log=self.stdout.write,
+        )
+
+    def check_regressions(self, results, baseline, options):
+        if baseline.get('meta', {}).get('scale') != results['meta']['scale']:
+            self.stdout.write(self.style.WARNING('기준선과 데이터 규모가 달라 비교 결과가 정확하지 않을 수 있습니다.'))
+
+        regressions = benchmark.compare(results, baseline, {
+            'time_ratio': options['time_ratio'],
+            'queries': options['allowed_extra_queries'],
+        })
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS('기준선 대비 회귀 없음'))
+            return
+
+        for regression in regressions:
+            self.stdout.write(self.style.ERROR(
+                f"{regression['endpoint']}: {regression['metric']} "
+                f"{regression['baseline']} -> {regression['current']}"
+            ))
+        raise CommandError(f'{len(regressions)}개 항목에서 성능 회귀가 발견되었습니다.')
@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from church_core.renderers import FastJSONParser, FastJSONRenderer, orjson
+import io
+import json
+import timeit
+
+
+def build_payloads(rows):
+    """실제 API 응답과 같은 형태의 페이로드 생성"""
+    now = timezone.now()
+    today = date.today()
+    positions = ['성도', '집사', '권사', '장로']
+
+    members = [
+        {
+            'id': i,
+            'name': f'홍길동{i}',
+            'member_code': f'M{i:06d}',
+            'gender': 'M' if i % 2 else 'F',
+            'age': 20 + i % 60,
+            'phone': f'010-{i % 10000:04d}-{(i * 7) % 10000:04d}',
+            'position': positions[i % len(positions)],
+            'group_name': f'{i % 30 + 1}구역',
+            'is_active': True,
+            'created_at': (now - timedelta(days=i)).isoformat(),
+        }
+        for i in range(rows)
+    ]
+    attendance = {
+        'date': today,
+        'worship_type': 'sunday_morning',
+        'records': [
+            {
+                'id': i,
+                'member': i,
+                'member_name': f'홍길동{i}',
+                'date': today - timedelta(days=7 * (i % 52)),
+                'is_present': i % 5 != 0,
+                'checked_at': now - timedelta(minutes=i),
+                'note': '',
+            }
+            for i in range(rows)
+        ],
+    }
+    offerings = {
+        'total_amount': Decimal('123456789.50'),
+        'monthly': {
+            month: {
+                'total_amount': Decimal(f'{month * 1234567}.{month:02d}'),
+                'average_amount': Decimal('35000.00'),
+                'count': month * 41,
+            }
+            for month in range(1, 13)
+        },
+        'records': [
+            {
+                'id': i,
+                'member_name': f'홍길동{i}',
+                'amount': Decimal(f'{(i % 500 + 1) * 1000}.00'),
+                'offering_type': 'tithe',
+                'date': today - timedelta(days=i % 365),
+            }
+            for i in range(rows)
+        ],
+    }
+    return {'members': members, 'attendance': attendance, 'offerings': offerings}
+
+
+class Command(BaseCommand):
+    help = 'stdlib JSON과 orjson 기반 렌더러/파서 성능을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='페이로드당 행 수')
+        parser.add_argument('--iterations', type=int, default=50, help='측정 반복 횟수')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson이 설치되지 않아 두 경로 모두 stdlib json을 사용합니다.'))
+
+        iterations = options['iterations']
+        payloads = build_payloads(options['rows'])
+        renderers = (JSONRenderer(), FastJSONRenderer())
+        parsers = (JSONParser(), FastJSONParser())
+
+        self.stdout.write(f"{'payload':<12}{'step':<8}{'stdlib(ms)':>12}{'fast(ms)':>12}{'speedup':>10}")
+        for name, data in payloads.items():
+            rendered = [renderer.render(data) for renderer in renderers]
+            if json.loads(rendered[0]) != json.loads(rendered[1]):
+                self.stdout.write(self.style.ERROR(f'{name}: 두 렌더러의 출력이 다릅니다.'))
+
+            render_times = [
+                self._measure(lambda renderer=renderer: renderer.render(data), iterations)
+                for renderer in renderers
+            ]
+            parse_times = [
+                self._measure(lambda parser=parser: parser.parse(io.BytesIO(rendered[0])), iterations)
+                for parser in parsers
+            ]
+            self._report(name, 'render', render_times)
+            self._report(name, 'parse', parse_times)
+
+    def _measure(self, func, iterations):
+        """반복 측정 중 가장 빠른 1회 실행 시간 (ms)"""
+        return min(timeit.repeat(func, number=1, repeat=iterations)) * 1000
+
+    def _report(self, name, step, times):
+        stdlib_ms, fast_ms = times
+        speedup = stdlib_ms / fast_ms if fast_ms else 0
+        self.stdout.write(f"{name:<12}{step:<8}{stdlib_ms:>12.2f}{fast_ms:>12.2f}{speedup:>9.1f}x")
@@ -283,4 +283,250 @@ def check_system_health():
         logger.warning(f"High memory usage: {health_status['memory_usage']}%")
     
     logger.info(f"System health check completed: {health_status}")
-    return health_status
\ No newline at end of file
+    return health_status
+
+@shared_task
+def persist_activity_logs(records):
+    """
+    웹 프로세스 버퍼에서 넘어온 활동 로그 배치 저장
+    """
+    from security.activity_buffer import persist_records
+
+    written = persist_records(records)
+    logger.debug(f"Persisted {written} activity log records")
+    return written
+
+
+@shared_task
+def rollup_activity_logs(hours=2):
+    """
+    최근 완료된 시간대의 활동 로그 집계 (매시 실행)
+    지연 저장된 로그를 반영하도록 직전 여러 시간을 다시 집계
+    """
+    from security.activity_partitions import rollup_hour
+
+    current_hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+    total = 0
+    for offset in range(hours, 0, -1):
+        total += rollup_hour(current_hour - timedelta(hours=offset))
+
+    logger.info(f"Activity log rollup completed: {total} rows for last {hours} hours")
+    return total
+
+
+@shared_task
+def maintain_activity_log_storage():
+    """
+    활동 로그 파티션 관리 (매일 실행)
+    다음 달 파티션 준비, 지난 달 로그 보관, 보존 기간 지난 파티션 삭제
+    """
+    from security.activity_partitions import ensure_partitions, rotate_tables, drop_expired
+
+    created = ensure_partitions()
+    rotated = rotate_tables()
+    dropped = drop_expired()
+
+    logger.info(
+        f"Activity log storage maintenance: partitions={created}, rotated={rotated}, dropped={dropped}"
+    )
+    return {'partitions': created, 'rotated': rotated, 'dropped': dropped}
+
+
+@shared_task(bind=True)
+def generate_report(self, report_id):
+    """
+    리포트 데이터 생성
+    같은 템플릿/기간 중복 요청은 reports.engine.enqueue_report에서 걸러짐
+    """
+    from reports.engine import run_report
+
+    def progress(current, total, step):
+        if self.request.id:
+            self.update_state(state='PROGRESS', meta={'current': current, 'total': total, 'step': step})
+
+    status = run_report(report_id, progress=progress)
+    logger.info(f"Report {report_id} generation finished: {status}")
+    return status
+
+
+@shared_task
+def compute_statistics_summaries(target_date=None):
+    """
+    교회별 일별 통계 요약 계산 (매일 실행)
+    교회마다 별도 태스크로 나눠 워커들이 병렬로 처리
+    """
+    from church.models import Church
+
+    church_ids = list(Church.objects.filter(is_active=True).values_list('id', flat=True))
+    for church_id in church_ids:
+        compute_church_statistics_summary.delay(church_id, target_date)
+
+    logger.info(f"Statistics summary tasks queued for {len(church_ids)} churches")
+    return len(church_ids)
+
+
+@shared_task
+def compute_church_statistics_summary(church_id, target_date=None):
+    """
+    교회 하루치 통계 요약 계산 (기본: 교회 시간대 기준 어제)
+    """
+    from church.models import Church
+    from reports.statistics import compute_daily_summary
+
+    church = Church.objects.get(pk=church_id)
+    day = date.fromisoformat(target_date) if target_date else None
+    summary = compute_daily_summary(church, day)
+    return summary.date.isoformat()
+
+
+@shared_task
+def backfill_statistics_summaries(church_id, start, end):
+    """
+    기간 통계 요약 백필 (날짜별 GROUP BY 후 일괄 upsert)
+    """
+    from church.models import Church
+    from reports.statistics import backfill_summaries
+
+    church = Church.objects.get(pk=church_id)
+    written = backfill_summaries(church, date.fromisoformat(start), date.fromisoformat(end))
+    logger.info(f"Statistics summaries backfilled for church {church_id}: {written} days")
+    return written
+
+
+@shared_task
+def refresh_dashboard_widget(church_id, widget, refresh_interval):
+    """
+    갱신 주기가 지난 대시보드 위젯 재계산 (요청은 이전 값을 먼저 받음)
+    """
+    from reports.widgets import compute_widget
+
+    entry = compute_widget(church_id, widget, refresh_interval)
+    return entry['computed_at']
+
+
+@shared_task
+def dispatch_report_schedules():
+    """
+    실행 시각이 지난 리포트 스케줄 처리 (매분 실행)
+    """
+    from reports.schedules import dispatch_due_schedules
+
+    return dispatch_due_schedules()
+
+
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True)
+def run_data_export(self, export_id):
+    """
+    데이터 내보내기 실행
+    작업자가 중단되면 메시지가 다시 전달되어 마지막 체크포인트부터 이어서 처리
+    """
+    from reports.exports import run_export
+
+    def progress(dataset, records):
+        if self.request.id:
+            self.update_state(state='PROGRESS', meta={'dataset': dataset, 'records': records})
+
+    status = run_export(export_id, progress=progress)
+    logger.info(f"Export {export_id} finished: {status}")
+    return status
+
+
+@shared_task
+def resume_stalled_exports():
+    """
+    중단된 내보내기 재개 (주기 실행)
+    """
+    from reports.exports import find_stalled_exports
+
+    export_ids = find_stalled_exports()
+    for export_id in export_ids:
+        run_data_export.delay(export_id)
+
+    if export_ids:
+        logger.info(f"Resumed {len(export_ids)} stalled exports")
+    return len(export_ids)
+
+
+@shared_task
+def purge_expired_exports():
+    """
+    만료된 내보내기 파일 정리 (매일 실행)
+    """
+    from reports.exports import purge_expired_exports as purge
+
+    purged = purge()
+    logger.info(f"Purged {purged} expired export files")
+    return purged
+
+
+@shared_task(queue='rendering')
+def render_report_files(report_ids, formats=None):
+    """
+    리포트 PDF/Excel 렌더링 (CPU 작업이므로 rendering 큐에서 처리)
+    여러 리포트는 리포트마다 별도 태스크로 나눠 작업자들이 병렬로 렌더링
+    """
+    from reports.rendering import render_reports
+
+    if len(report_ids) > 1:
+        for report_id in report_ids:
+            render_report_files.delay([report_id], formats)
+        logger.info(f"Report render tasks queued for {len(report_ids)} reports")
+        return None
+
+    results = render_reports(report_ids, formats)
+    failed = [pk for pk, pages in results.items() if pages is None]
+    logger.info(f"Rendered {len(results)} reports ({len(failed)} failed)")
+    return {str(pk): pages for pk, pages in results.items()}
+
+
+@shared_task
+def update_metric_rollups():
+    """
+    교회별 지표 기간 집계 갱신 (주기 실행)
+    교회마다 별도 태스크로 나눠 워커들이 병렬로 처리
+    """
+    from church.models import Church
+
+    church_ids = list(Church.objects.filter(is_active=True).values_list('id', flat=True))
+    for church_id in church_ids:
+        update_church_metric_rollups.delay(church_id)
+
+    logger.info(f"Metric rollup tasks queued for {len(church_ids)} churches")
+    return len(church_ids)
+
+
+@shared_task
+def update_church_metric_rollups(church_id):
+    """
+    교회 지표 집계 갱신 (마지막 집계일 또는 변경된 날짜부터 어제까지)
+    """
+    from church.models import Church
+    from reports.rollups import update_church
+
+    updated = update_church(Church.objects.get(pk=church_id))
+    return [day.isoformat() for day in updated] if updated else None
+
+
+@shared_task
+def backfill_metric_rollups(church_id, start, end):
+    """
+    기간 지표 집계 백필
+    """
+    from reports.rollups import backfill
+
+    days = backfill(church_id, date.fromisoformat(start), date.fromisoformat(end))
+    logger.info(f"Metric rollups backfilled for church {church_id}: {days} days")
+    return days
+
+
+@shared_task
+def create_scheduled_ministry_reports():
+    """
+    자동 생성 사역 보고서 템플릿의 기간별 보고서 일괄 생성 (매일 실행, 기간 첫날에 생성)
+    """
+    from reports.ministry import create_scheduled_reports
+
+    results = create_scheduled_reports()
+    logger.info(f"Scheduled ministry reports created: {sum(results.values())} for {len(results)} templates")
+    return {str(template_id): created for template_id, created in results.items()}
+
@@ -1,3 +1,61 @@
-from django.test import TestCase
+import pytest
+from attendance.models import Attendance
+from members.models import FamilyRelationship, Member
+from utils import benchmark
+from utils.factories import MemberFactory, SyntheticChurchBuilder
 
-# Create your tests here.
+
+@pytest.mark.django_db
+class TestSyntheticChurchBuilder:
+    """합성 교회 데이터 생성기 테스트"""
+
+    def test_builds_requested_scale(self):
+        dataset = SyntheticChurchBuilder(members=40, years=1, attendance_rate=0.5).build()
+
+        assert Member.objects.filter(church=dataset.church).count() == 40
+        assert Attendance.objects.filter(church=dataset.church).count() == 40 * 52
+        assert dataset.counts['members'] == 40
+        assert dataset.admin.church_users.filter(church=dataset.church).exists()
+
+    def test_families_link_households_both_ways(self):
+        dataset = SyntheticChurchBuilder(members=30, years=1).build()
+
+        assert not Member.objects.filter(church=dataset.church, household__isnull=True).exists()
+        for relation in FamilyRelationship.objects.filter(church=dataset.church):
+            assert FamilyRelationship.objects.filter(
+                from_member=relation.to_member, to_member=relation.from_member
+            ).exists()
+
+    def test_member_factory_creates_valid_member(self):
+        member = MemberFactory()
+        member.full_clean(exclude=['created_by'])
+
+
+class TestBenchmarkCompare:
+    """벤치마크 기준선 비교 테스트"""
+
+    baseline = {'endpoints': {
+        'GET member-list': {'status': 200, 'time_ms': 40.0, 'queries': 3, 'peak_memory_kb': 500.0},
+    }}
+
+    def results(self, **changes):
+        return {'endpoints': {'GET member-list': dict(self.baseline['endpoints']['GET member-list'], **changes)}}
+
+    def test_within_tolerance(self):
+        assert benchmark.compare(self.results(time_ms=45.0, peak_memory_kb=600.0), self.baseline) == []
+
+    def test_flags_each_regressed_metric(self):
+        regressions = benchmark.compare(
+            self.results(status=500, time_ms=80.0, queries=4, peak_memory_kb=2000.0), self.baseline
+        )
+        assert {regression['metric'] for regression in regressions} == {
+            'status', 'time_ms', 'queries', 'peak_memory_kb'
+        }
+
+    def test_small_absolute_time_change_ignored(self):
+        baseline = {'endpoints': {'GET member-list': dict(self.baseline['endpoints']['GET member-list'], time_ms=2.0)}}
+        assert benchmark.compare(self.results(time_ms=4.0), baseline) == []
+
+    def test_new_endpoint_not_compared(self):
+        results = {'endpoints': {'GET prayer-list': self.results()['endpoints']['GET member-list']}}
+        assert benchmark.compare(results, self.baseline) == []
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import VolunteerApplication, VolunteerRole, VolunteerAssignment, DEFAULT_VOLUNTEER_ROLES
+from church_core.church_context import get_church_context
 from members.serializers import MemberSerializer
 from users.models import DetailedPermission
 
@@ -39,7 +40,7 @@ class VolunteerApplicationListSerializer(serializers.ModelSerializer):
         if request and hasattr(request, 'user') and request.user.is_authenticated:
             try:
                 church_id = self.context.get('church_id')
-                church_user = request.user.church_users.get(church_id=church_id)
+                church_user = get_church_context(request, church_id).church_user
                 member = church_user.member
                 return obj.applicants.filter(id=member.id).exists()
             except:
@@ -85,7 +86,7 @@ class VolunteerApplicationDetailSerializer(serializers.ModelSerializer):
         if request and hasattr(request, 'user') and request.user.is_authenticated:
             try:
                 church_id = self.context.get('church_id')
-                church_user = request.user.church_users.get(church_id=church_id)
+                church_user = get_church_context(request, church_id).church_user
                 member = church_user.member
                 return obj.applicants.filter(id=member.id).exists()
             except:
@@ -98,7 +99,7 @@ class VolunteerApplicationDetailSerializer(serializers.ModelSerializer):
         if request and hasattr(request, 'user'):
             # 관리자만 신청자 목록 볼 수 있음
             try:
-                church_user = request.user.church_users.get(church_id=obj.church_id)
+                church_user = get_church_context(request, obj.church_id).church_user
                 if church_user.role in ['CHURCH_ADMIN', 'CHURCH_STAFF'] or request.user.is_superuser:
                     applicants = obj.applicants.all()
                     return [{
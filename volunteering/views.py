@@ -18,9 +18,11 @@ from .serializers import (
     VolunteerRoleTemplateSerializer
 )
 from church_core.unified_permissions import UnifiedPermission
+from church_core.church_context import ChurchContextMixin
+from church_core.db_router import ReplicaReadMixin
 
 
-class VolunteerApplicationViewSet(viewsets.ModelViewSet):
+class VolunteerApplicationViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """봉사 신청 관리 API ViewSet"""
     resource_name = 'volunteerapplication'
     queryset = VolunteerApplication.objects.all()
@@ -79,7 +81,7 @@ class VolunteerApplicationViewSet(viewsets.ModelViewSet):
     def my_applications(self, request, church_id=None):
         """내가 신청한 봉사 목록"""
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
@@ -114,7 +116,7 @@ class VolunteerApplicationViewSet(viewsets.ModelViewSet):
         
         # 사용자의 교회 멤버 정보 가져오기
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
@@ -141,7 +143,7 @@ class VolunteerApplicationViewSet(viewsets.ModelViewSet):
         
         # 사용자의 교회 멤버 정보 가져오기
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
             member = church_user.member
         except:
             return Response(
@@ -273,7 +275,7 @@ class VolunteerApplicationViewSet(viewsets.ModelViewSet):
             )
 
 
-class VolunteerRoleViewSet(viewsets.ModelViewSet):
+class VolunteerRoleViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """봉사 역할 관리 API ViewSet"""
     resource_name = 'volunteerrole'
     queryset = VolunteerRole.objects.all()
@@ -426,7 +428,7 @@ class VolunteerRoleViewSet(viewsets.ModelViewSet):
         })
 
 
-class VolunteerAssignmentViewSet(viewsets.ModelViewSet):
+class VolunteerAssignmentViewSet(ChurchContextMixin, ReplicaReadMixin, viewsets.ModelViewSet):
     """봉사 할당 관리 API ViewSet"""
     resource_name = 'volunteerassignment'
     queryset = VolunteerAssignment.objects.all()
@@ -456,7 +458,7 @@ class VolunteerAssignmentViewSet(viewsets.ModelViewSet):
     def my_assignments(self, request, church_id=None):
         """내 봉사 할당 목록"""
         try:
-            church_user = request.user.church_users.get(church_id=church_id)
+            church_user = self.get_church_user()
         except:
             return Response(
                 {"detail": "교회 멤버 정보를 찾을 수 없습니다."}, 
@@ -12,9 +12,10 @@ from .serializers import (
     WorshipRecordCreateSerializer
 )
 from church_core.unified_permissions import UnifiedPermission
+from church_core.db_router import ReplicaReadMixin
 
 
-class WorshipRecordViewSet(viewsets.ModelViewSet):
+class WorshipRecordViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """예배 기록 관리 API ViewSet"""
     resource_name = 'worshiprecord'
     queryset = WorshipRecord.objects.all()